@@ -0,0 +1,417 @@
+from typing import Dict, Set, List, Tuple, Iterable, TypeVar
+
+from exceptions.element_not_found_error import ElementNotFoundError
+from access_manager_event_processor import AccessManagerEventProcessor
+from access_manager_query_processor import AccessManagerQueryProcessor
+
+TKey = TypeVar("TKey")
+TValue = TypeVar("TValue")
+
+class AccessGraph(AccessManagerEventProcessor[str, str, str, str], AccessManagerQueryProcessor[str, str, str, str]):
+    """In-memory copy of the elements and mappings in an AccessManager instance, with all elements stored as strings (i.e. as converted by UniqueStringifierBase implementations).
+
+    Mappings are indexed in both directions, so that queries are answered with dictionary and set lookups, and indirect mappings are resolved by traversing the group to group mappings.  Event methods modify only the graph, and add any elements in a mapping which don't exist (since events are expected to have already been validated by the AccessManager instance).  Query methods raise an ElementNotFoundError if a user, group or entity type in the query doesn't exist, except for the 'has_access_*' methods which return False.
+
+    The class is not thread-safe, and concurrent access must be synchronized by the caller.
+
+    Attributes:
+        users:
+            Returns a collection of all users in the graph.
+        groups:
+            Returns a collection of all groups in the graph.
+        entity_types:
+            Returns a collection of all entity types in the graph.
+    """
+
+    @property
+    def users(self) -> Iterable[str]:
+        return list(self._users)
+
+    @property
+    def groups(self) -> Iterable[str]:
+        return list(self._groups)
+
+    @property
+    def entity_types(self) -> Iterable[str]:
+        return list(self._entities.keys())
+
+    def __init__(self) -> None:
+        """Initialises a new instance of the AccessGraph class."""
+        self._users: Set[str] = set()
+        self._groups: Set[str] = set()
+        # Maps entity types to their entities
+        self._entities: Dict[str, Set[str]] = dict()
+        self._user_to_group_map: Dict[str, Set[str]] = dict()
+        self._group_to_user_map: Dict[str, Set[str]] = dict()
+        self._group_to_group_map: Dict[str, Set[str]] = dict()
+        self._group_to_group_reverse_map: Dict[str, Set[str]] = dict()
+        self._user_to_application_component_map: Dict[str, Set[Tuple[str, str]]] = dict()
+        self._application_component_to_user_map: Dict[Tuple[str, str], Set[str]] = dict()
+        self._group_to_application_component_map: Dict[str, Set[Tuple[str, str]]] = dict()
+        self._application_component_to_group_map: Dict[Tuple[str, str], Set[str]] = dict()
+        self._user_to_entity_map: Dict[str, Set[Tuple[str, str]]] = dict()
+        self._entity_to_user_map: Dict[Tuple[str, str], Set[str]] = dict()
+        self._group_to_entity_map: Dict[str, Set[Tuple[str, str]]] = dict()
+        self._entity_to_group_map: Dict[Tuple[str, str], Set[str]] = dict()
+
+    #region Event Methods
+
+    def add_user(self, user: str) -> None:
+        self._users.add(user)
+
+    def remove_user(self, user: str) -> None:
+        self._users.discard(user)
+        for current_group in self._user_to_group_map.pop(user, set()):
+            self._remove_from_map(self._group_to_user_map, current_group, user)
+        for current_application_component in self._user_to_application_component_map.pop(user, set()):
+            self._remove_from_map(self._application_component_to_user_map, current_application_component, user)
+        for current_entity in self._user_to_entity_map.pop(user, set()):
+            self._remove_from_map(self._entity_to_user_map, current_entity, user)
+
+    def add_group(self, group: str) -> None:
+        self._groups.add(group)
+
+    def remove_group(self, group: str) -> None:
+        self._groups.discard(group)
+        for current_user in self._group_to_user_map.pop(group, set()):
+            self._remove_from_map(self._user_to_group_map, current_user, group)
+        for current_to_group in self._group_to_group_map.pop(group, set()):
+            self._remove_from_map(self._group_to_group_reverse_map, current_to_group, group)
+        for current_from_group in self._group_to_group_reverse_map.pop(group, set()):
+            self._remove_from_map(self._group_to_group_map, current_from_group, group)
+        for current_application_component in self._group_to_application_component_map.pop(group, set()):
+            self._remove_from_map(self._application_component_to_group_map, current_application_component, group)
+        for current_entity in self._group_to_entity_map.pop(group, set()):
+            self._remove_from_map(self._entity_to_group_map, current_entity, group)
+
+    def add_user_to_group_mapping(self, user: str, group: str) -> None:
+        self._users.add(user)
+        self._groups.add(group)
+        self._add_to_map(self._user_to_group_map, user, group)
+        self._add_to_map(self._group_to_user_map, group, user)
+
+    def remove_user_to_group_mapping(self, user: str, group: str) -> None:
+        self._remove_from_map(self._user_to_group_map, user, group)
+        self._remove_from_map(self._group_to_user_map, group, user)
+
+    def add_group_to_group_mapping(self, from_group: str, to_group: str) -> None:
+        self._groups.add(from_group)
+        self._groups.add(to_group)
+        self._add_to_map(self._group_to_group_map, from_group, to_group)
+        self._add_to_map(self._group_to_group_reverse_map, to_group, from_group)
+
+    def remove_group_to_group_mapping(self, from_group: str, to_group: str) -> None:
+        self._remove_from_map(self._group_to_group_map, from_group, to_group)
+        self._remove_from_map(self._group_to_group_reverse_map, to_group, from_group)
+
+    def add_user_to_application_component_and_access_level_mapping(self, user: str, application_component: str, access_level: str) -> None:
+        self._users.add(user)
+        self._add_to_map(self._user_to_application_component_map, user, (application_component, access_level))
+        self._add_to_map(self._application_component_to_user_map, (application_component, access_level), user)
+
+    def remove_user_to_application_component_and_access_level_mapping(self, user: str, application_component: str, access_level: str) -> None:
+        self._remove_from_map(self._user_to_application_component_map, user, (application_component, access_level))
+        self._remove_from_map(self._application_component_to_user_map, (application_component, access_level), user)
+
+    def add_group_to_application_component_and_access_level_mapping(self, group: str, application_component: str, access_level: str) -> None:
+        self._groups.add(group)
+        self._add_to_map(self._group_to_application_component_map, group, (application_component, access_level))
+        self._add_to_map(self._application_component_to_group_map, (application_component, access_level), group)
+
+    def remove_group_to_application_component_and_access_level_mapping(self, group: str, application_component: str, access_level: str) -> None:
+        self._remove_from_map(self._group_to_application_component_map, group, (application_component, access_level))
+        self._remove_from_map(self._application_component_to_group_map, (application_component, access_level), group)
+
+    def add_entity_type(self, entity_type: str) -> None:
+        if (entity_type not in self._entities):
+            self._entities[entity_type] = set()
+
+    def remove_entity_type(self, entity_type: str) -> None:
+        for current_entity in self._entities.pop(entity_type, set()):
+            self._remove_entity_mappings(entity_type, current_entity)
+
+    def add_entity(self, entity_type: str, entity: str) -> None:
+        self._add_to_map(self._entities, entity_type, entity)
+
+    def remove_entity(self, entity_type: str, entity: str) -> None:
+        if (entity_type in self._entities):
+            self._entities[entity_type].discard(entity)
+        self._remove_entity_mappings(entity_type, entity)
+
+    def add_user_to_entity_mapping(self, user: str, entity_type: str, entity: str) -> None:
+        self._users.add(user)
+        self._add_to_map(self._entities, entity_type, entity)
+        self._add_to_map(self._user_to_entity_map, user, (entity_type, entity))
+        self._add_to_map(self._entity_to_user_map, (entity_type, entity), user)
+
+    def remove_user_to_entity_mapping(self, user: str, entity_type: str, entity: str) -> None:
+        self._remove_from_map(self._user_to_entity_map, user, (entity_type, entity))
+        self._remove_from_map(self._entity_to_user_map, (entity_type, entity), user)
+
+    def add_group_to_entity_mapping(self, group: str, entity_type: str, entity: str) -> None:
+        self._groups.add(group)
+        self._add_to_map(self._entities, entity_type, entity)
+        self._add_to_map(self._group_to_entity_map, group, (entity_type, entity))
+        self._add_to_map(self._entity_to_group_map, (entity_type, entity), group)
+
+    def remove_group_to_entity_mapping(self, group: str, entity_type: str, entity: str) -> None:
+        self._remove_from_map(self._group_to_entity_map, group, (entity_type, entity))
+        self._remove_from_map(self._entity_to_group_map, (entity_type, entity), group)
+
+    #endregion
+
+    #region Query Methods
+
+    def contains_user(self, user: str) -> bool:
+        return user in self._users
+
+    def contains_group(self, group: str) -> bool:
+        return group in self._groups
+
+    def get_user_to_group_mappings(self, user: str, include_indirect_mappings: bool) -> Iterable[str]:
+        self._raise_error_if_user_doesnt_exist(user)
+        direct_groups: Set[str] = self._user_to_group_map.get(user, set())
+        if (include_indirect_mappings == False):
+            return list(direct_groups)
+        else:
+            return list(self._get_groups_reachable_from(direct_groups))
+
+    def get_group_to_user_mappings(self, group: str, include_indirect_mappings: bool) -> Iterable[str]:
+        self._raise_error_if_group_doesnt_exist(group)
+        if (include_indirect_mappings == False):
+            return list(self._group_to_user_map.get(group, set()))
+        else:
+            return list(self._get_users_mapped_to_groups(self._get_groups_reaching({ group })))
+
+    def get_group_to_group_mappings(self, group: str, include_indirect_mappings: bool) -> Iterable[str]:
+        self._raise_error_if_group_doesnt_exist(group)
+        direct_groups: Set[str] = self._group_to_group_map.get(group, set())
+        if (include_indirect_mappings == False):
+            return list(direct_groups)
+        else:
+            return list(self._get_groups_reachable_from(direct_groups))
+
+    def get_group_to_group_reverse_mappings(self, group: str, include_indirect_mappings: bool) -> Iterable[str]:
+        self._raise_error_if_group_doesnt_exist(group)
+        direct_groups: Set[str] = self._group_to_group_reverse_map.get(group, set())
+        if (include_indirect_mappings == False):
+            return list(direct_groups)
+        else:
+            return list(self._get_groups_reaching(direct_groups))
+
+    def get_user_to_application_component_and_access_level_mappings(self, user: str) -> Iterable[Tuple[str, str]]:
+        self._raise_error_if_user_doesnt_exist(user)
+
+        return list(self._user_to_application_component_map.get(user, set()))
+
+    def get_application_component_and_access_level_to_user_mappings(self, application_component: str, accesss_level: str, include_indirect_mappings: bool) -> Iterable[str]:
+        users: Set[str] = set(self._application_component_to_user_map.get((application_component, accesss_level), set()))
+        if (include_indirect_mappings == True):
+            groups: Set[str] = self._get_groups_reaching(self._application_component_to_group_map.get((application_component, accesss_level), set()))
+            users.update(self._get_users_mapped_to_groups(groups))
+
+        return list(users)
+
+    def get_group_to_application_component_and_access_level_mappings(self, group: str) -> Iterable[Tuple[str, str]]:
+        self._raise_error_if_group_doesnt_exist(group)
+
+        return list(self._group_to_application_component_map.get(group, set()))
+
+    def get_application_component_and_access_level_to_group_mappings(self, application_component: str, accesss_level: str, include_indirect_mappings: bool) -> Iterable[str]:
+        groups: Set[str] = self._application_component_to_group_map.get((application_component, accesss_level), set())
+        if (include_indirect_mappings == False):
+            return list(groups)
+        else:
+            return list(self._get_groups_reaching(groups))
+
+    def contains_entity_type(self, entity_type: str) -> bool:
+        return entity_type in self._entities
+
+    def get_entities(self, entity_type: str) -> Iterable[str]:
+        self._raise_error_if_entity_type_doesnt_exist(entity_type)
+
+        return list(self._entities[entity_type])
+
+    def contains_entity(self, entity_type: str, entity: str) -> bool:
+        return entity_type in self._entities and entity in self._entities[entity_type]
+
+    def get_user_to_entity_mappings(self, user: str) -> Iterable[Tuple[str, str]]:
+        self._raise_error_if_user_doesnt_exist(user)
+
+        return list(self._user_to_entity_map.get(user, set()))
+
+    def get_user_to_entity_mappings_for_type(self, user: str, entity_type: str) -> Iterable[str]:
+        self._raise_error_if_user_doesnt_exist(user)
+        self._raise_error_if_entity_type_doesnt_exist(entity_type)
+
+        return [ current_entity for current_entity_type, current_entity in self._user_to_entity_map.get(user, set()) if current_entity_type == entity_type ]
+
+    def get_entity_to_user_mappings(self, entity_type: str, entity: str, include_indirect_mappings: bool) -> Iterable[str]:
+        self._raise_error_if_entity_doesnt_exist(entity_type, entity)
+        users: Set[str] = set(self._entity_to_user_map.get((entity_type, entity), set()))
+        if (include_indirect_mappings == True):
+            groups: Set[str] = self._get_groups_reaching(self._entity_to_group_map.get((entity_type, entity), set()))
+            users.update(self._get_users_mapped_to_groups(groups))
+
+        return list(users)
+
+    def get_group_to_entity_mappings(self, group: str) -> Iterable[Tuple[str, str]]:
+        self._raise_error_if_group_doesnt_exist(group)
+
+        return list(self._group_to_entity_map.get(group, set()))
+
+    def get_group_to_entity_mappings_for_type(self, group: str, entity_type: str) -> Iterable[str]:
+        self._raise_error_if_group_doesnt_exist(group)
+        self._raise_error_if_entity_type_doesnt_exist(entity_type)
+
+        return [ current_entity for current_entity_type, current_entity in self._group_to_entity_map.get(group, set()) if current_entity_type == entity_type ]
+
+    def get_entity_to_group_mappings(self, entity_type: str, entity: str, include_indirect_mappings: bool) -> Iterable[str]:
+        self._raise_error_if_entity_doesnt_exist(entity_type, entity)
+        groups: Set[str] = self._entity_to_group_map.get((entity_type, entity), set())
+        if (include_indirect_mappings == False):
+            return list(groups)
+        else:
+            return list(self._get_groups_reaching(groups))
+
+    def has_access_to_application_component(self, user: str, application_component: str, access_level: str) -> bool:
+        if ((application_component, access_level) in self._user_to_application_component_map.get(user, set())):
+            return True
+        for current_group in self._get_groups_reachable_from(self._user_to_group_map.get(user, set())):
+            if ((application_component, access_level) in self._group_to_application_component_map.get(current_group, set())):
+                return True
+
+        return False
+
+    def has_access_to_entity(self, user: str, entity_type: str, entity: str) -> bool:
+        if ((entity_type, entity) in self._user_to_entity_map.get(user, set())):
+            return True
+        for current_group in self._get_groups_reachable_from(self._user_to_group_map.get(user, set())):
+            if ((entity_type, entity) in self._group_to_entity_map.get(current_group, set())):
+                return True
+
+        return False
+
+    def get_application_components_accesible_by_user(self, user: str) -> Set[Tuple[str, str]]:
+        self._raise_error_if_user_doesnt_exist(user)
+        results: Set[Tuple[str, str]] = set(self._user_to_application_component_map.get(user, set()))
+        for current_group in self._get_groups_reachable_from(self._user_to_group_map.get(user, set())):
+            results.update(self._group_to_application_component_map.get(current_group, set()))
+
+        return results
+
+    def get_application_components_accesible_by_group(self, group: str) -> Set[Tuple[str, str]]:
+        self._raise_error_if_group_doesnt_exist(group)
+        results: Set[Tuple[str, str]] = set()
+        for current_group in self._get_groups_reachable_from({ group }):
+            results.update(self._group_to_application_component_map.get(current_group, set()))
+
+        return results
+
+    def get_entities_accessible_by_user(self, user: str) -> Set[Tuple[str, str]]:
+        self._raise_error_if_user_doesnt_exist(user)
+        results: Set[Tuple[str, str]] = set(self._user_to_entity_map.get(user, set()))
+        for current_group in self._get_groups_reachable_from(self._user_to_group_map.get(user, set())):
+            results.update(self._group_to_entity_map.get(current_group, set()))
+
+        return results
+
+    def get_entities_of_type_accessible_by_user(self, user: str, entity_type: str) -> Set[str]:
+        self._raise_error_if_entity_type_doesnt_exist(entity_type)
+
+        return { current_entity for current_entity_type, current_entity in self.get_entities_accessible_by_user(user) if current_entity_type == entity_type }
+
+    def get_entities_accessible_by_group(self, group: str) -> Set[Tuple[str, str]]:
+        self._raise_error_if_group_doesnt_exist(group)
+        results: Set[Tuple[str, str]] = set()
+        for current_group in self._get_groups_reachable_from({ group }):
+            results.update(self._group_to_entity_map.get(current_group, set()))
+
+        return results
+
+    def get_entities_of_type_accessible_by_group(self, group: str, entity_type: str) -> Set[str]:
+        self._raise_error_if_entity_type_doesnt_exist(entity_type)
+
+        return { current_entity for current_entity_type, current_entity in self.get_entities_accessible_by_group(group) if current_entity_type == entity_type }
+
+    #endregion
+
+    #region Private/Protected Methods
+
+    def _get_groups_reachable_from(self, start_groups: Iterable[str]) -> Set[str]:
+        """Gets the specified groups, and all groups they are directly or indirectly mapped to.
+
+        Args:
+            start_groups:
+                The groups to start from.
+
+        Returns:
+            The groups.
+        """
+        return self._traverse(start_groups, self._group_to_group_map)
+
+    def _get_groups_reaching(self, start_groups: Iterable[str]) -> Set[str]:
+        """Gets the specified groups, and all groups which are directly or indirectly mapped to them.
+
+        Args:
+            start_groups:
+                The groups to start from.
+
+        Returns:
+            The groups.
+        """
+        return self._traverse(start_groups, self._group_to_group_reverse_map)
+
+    def _traverse(self, start_groups: Iterable[str], group_map: Dict[str, Set[str]]) -> Set[str]:
+        visited_groups: Set[str] = set(start_groups)
+        groups_to_visit: List[str] = list(visited_groups)
+        while (len(groups_to_visit) > 0):
+            for current_group in group_map.get(groups_to_visit.pop(), set()):
+                if (current_group not in visited_groups):
+                    visited_groups.add(current_group)
+                    groups_to_visit.append(current_group)
+
+        return visited_groups
+
+    def _get_users_mapped_to_groups(self, groups: Iterable[str]) -> Set[str]:
+        users: Set[str] = set()
+        for current_group in groups:
+            users.update(self._group_to_user_map.get(current_group, set()))
+
+        return users
+
+    def _remove_entity_mappings(self, entity_type: str, entity: str) -> None:
+        for current_user in self._entity_to_user_map.pop((entity_type, entity), set()):
+            self._remove_from_map(self._user_to_entity_map, current_user, (entity_type, entity))
+        for current_group in self._entity_to_group_map.pop((entity_type, entity), set()):
+            self._remove_from_map(self._group_to_entity_map, current_group, (entity_type, entity))
+
+    def _add_to_map(self, map: Dict[TKey, Set[TValue]], key: TKey, value: TValue) -> None:
+        if (key not in map):
+            map[key] = set()
+        map[key].add(value)
+
+    def _remove_from_map(self, map: Dict[TKey, Set[TValue]], key: TKey, value: TValue) -> None:
+        if (key in map):
+            map[key].discard(value)
+            if (len(map[key]) == 0):
+                del map[key]
+
+    def _raise_error_if_user_doesnt_exist(self, user: str) -> None:
+        if (user not in self._users):
+            raise ElementNotFoundError("User '{0}' does not exist.".format(user), "User", user)
+
+    def _raise_error_if_group_doesnt_exist(self, group: str) -> None:
+        if (group not in self._groups):
+            raise ElementNotFoundError("Group '{0}' does not exist.".format(group), "Group", group)
+
+    def _raise_error_if_entity_type_doesnt_exist(self, entity_type: str) -> None:
+        if (entity_type not in self._entities):
+            raise ElementNotFoundError("Entity type '{0}' does not exist.".format(entity_type), "EntityType", entity_type)
+
+    def _raise_error_if_entity_doesnt_exist(self, entity_type: str, entity: str) -> None:
+        self._raise_error_if_entity_type_doesnt_exist(entity_type)
+        if (entity not in self._entities[entity_type]):
+            raise ElementNotFoundError("Entity '{0}' does not exist.".format(entity), "Entity", entity)
+
+    #endregion
@@ -0,0 +1,161 @@
+from typing import Dict, List, Tuple, Callable, BinaryIO
+from array import array
+import mmap
+import os
+import struct
+import sys
+import time
+
+from exceptions.deserialization_error import DeserializationError
+from access_manager_query_processor import AccessManagerQueryProcessor
+from access_graph import AccessGraph
+
+class AccessGraphSnapshotSerializer:
+    """Serializes the elements and mappings of an AccessGraph to and from a compact binary snapshot file, which is read via a read-only memory map.
+
+    The snapshot consists of a header (containing the change feed position the snapshot was taken at, and the time it was taken), a table of all distinct strings, and sections of elements and mappings stored as arrays of little-endian 32 bit indices into the string table.
+    """
+
+    _MAGIC: bytes = b"AMGRAPH\x00"
+    _FORMAT_VERSION: int = 1
+    # Magic, format version, change feed position, creation time
+    _HEADER_FORMAT: str = "<8sIQd"
+    _COUNT_FORMAT: str = "<I"
+    _INDEX_SIZE: int = 4
+
+    def serialize(self, graph: AccessManagerQueryProcessor[str, str, str, str], position: int, file_path: str) -> None:
+        """Writes a snapshot of the specified graph to a file.  The snapshot is written to a temporary file which then replaces the specified file, so readers never see a partially written snapshot.
+
+        Args:
+            graph:
+                The graph to serialize (e.g. an AccessGraph).
+            position:
+                The position in the change feed of the last event reflected in the graph.
+            file_path:
+                The path of the snapshot file.
+        """
+        string_indices: Dict[str, int] = dict()
+        users: List[str] = list(graph.users)
+        groups: List[str] = list(graph.groups)
+        entity_types: List[str] = list(graph.entity_types)
+        sections: List[List[Tuple[str, ...]]] = [
+            [ (current_user, ) for current_user in users ],
+            [ (current_group, ) for current_group in groups ],
+            [ (current_entity_type, ) for current_entity_type in entity_types ],
+            [ (current_entity_type, current_entity) for current_entity_type in entity_types for current_entity in graph.get_entities(current_entity_type) ],
+            [ (current_user, current_group) for current_user in users for current_group in graph.get_user_to_group_mappings(current_user, False) ],
+            [ (current_from_group, current_to_group) for current_from_group in groups for current_to_group in graph.get_group_to_group_mappings(current_from_group, False) ],
+            [ (current_user, ) + current_mapping for current_user in users for current_mapping in graph.get_user_to_application_component_and_access_level_mappings(current_user) ],
+            [ (current_group, ) + current_mapping for current_group in groups for current_mapping in graph.get_group_to_application_component_and_access_level_mappings(current_group) ],
+            [ (current_user, ) + current_mapping for current_user in users for current_mapping in graph.get_user_to_entity_mappings(current_user) ],
+            [ (current_group, ) + current_mapping for current_group in groups for current_mapping in graph.get_group_to_entity_mappings(current_group) ]
+        ]
+        for current_section in sections:
+            for current_record in current_section:
+                for current_string in current_record:
+                    if (current_string not in string_indices):
+                        string_indices[current_string] = len(string_indices)
+
+        temporary_file_path: str = file_path + ".tmp"
+        with open(temporary_file_path, "wb") as snapshot_file:
+            snapshot_file.write(struct.pack(self._HEADER_FORMAT, self._MAGIC, self._FORMAT_VERSION, position, time.time()))
+            self._write_string_table(snapshot_file, string_indices)
+            for current_section in sections:
+                snapshot_file.write(struct.pack(self._COUNT_FORMAT, len(current_section)))
+                self._write_indices(snapshot_file, [ string_indices[current_string] for current_record in current_section for current_string in current_record ])
+            snapshot_file.flush()
+            os.fsync(snapshot_file.fileno())
+        os.replace(temporary_file_path, file_path)
+
+    def deserialize(self, file_path: str) -> Tuple[AccessGraph, int, float]:
+        """Reads a snapshot file into a new AccessGraph.
+
+        Args:
+            file_path:
+                The path of the snapshot file.
+
+        Returns:
+            A tuple containing the graph, the change feed position stored in the snapshot, and the time (as returned by time.time()) the snapshot was taken.
+
+        Raises:
+            DeserializationError: The file is not a valid snapshot.
+        """
+        try:
+            with open(file_path, "rb") as snapshot_file:
+                with mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ) as snapshot_map:
+                    return self._read_snapshot(snapshot_map)
+        except (struct.error, IndexError, UnicodeDecodeError, ValueError) as exc:
+            raise DeserializationError("Failed to deserialize snapshot file '{0}'.  The file is empty, truncated or corrupt.".format(file_path)) from exc
+
+    #region Private/Protected Methods
+
+    def _write_string_table(self, snapshot_file: BinaryIO, string_indices: Dict[str, int]) -> None:
+        encoded_strings: List[bytes] = [ current_string.encode("utf-8") for current_string in string_indices.keys() ]
+        offsets: List[int] = [ 0 ]
+        for current_encoded_string in encoded_strings:
+            offsets.append(offsets[-1] + len(current_encoded_string))
+        snapshot_file.write(struct.pack(self._COUNT_FORMAT, len(encoded_strings)))
+        self._write_indices(snapshot_file, offsets)
+        string_data: bytes = b"".join(encoded_strings)
+        # Pad the string data so the following sections are aligned to the index size
+        snapshot_file.write(string_data + b"\x00" * (-len(string_data) % self._INDEX_SIZE))
+
+    def _write_indices(self, snapshot_file: BinaryIO, indices: List[int]) -> None:
+        index_array: array = array("I", indices)
+        if (sys.byteorder != "little"):
+            index_array.byteswap()
+        snapshot_file.write(index_array.tobytes())
+
+    def _read_snapshot(self, snapshot_map: mmap.mmap) -> Tuple[AccessGraph, int, float]:
+        magic, format_version, position, creation_time = struct.unpack_from(self._HEADER_FORMAT, snapshot_map, 0)
+        if (magic != self._MAGIC):
+            raise DeserializationError("Failed to deserialize snapshot.  The file does not contain a snapshot.")
+        if (format_version != self._FORMAT_VERSION):
+            raise DeserializationError("Failed to deserialize snapshot.  Format version {0} is not supported.".format(format_version))
+        offset: int = struct.calcsize(self._HEADER_FORMAT)
+
+        string_count: int = struct.unpack_from(self._COUNT_FORMAT, snapshot_map, offset)[0]
+        offset += self._INDEX_SIZE
+        string_offsets: array = self._read_indices(snapshot_map, offset, string_count + 1)
+        offset += self._INDEX_SIZE * (string_count + 1)
+        string_data: bytes = snapshot_map[offset:offset + string_offsets[-1]]
+        if (len(string_data) != string_offsets[-1]):
+            raise IndexError("String data is truncated.")
+        strings: List[str] = [ string_data[string_offsets[i]:string_offsets[i + 1]].decode("utf-8") for i in range(string_count) ]
+        offset += string_offsets[-1] + (-string_offsets[-1] % self._INDEX_SIZE)
+
+        graph: AccessGraph = AccessGraph()
+        section_actions: List[Tuple[int, Callable[..., None]]] = [
+            (1, graph.add_user),
+            (1, graph.add_group),
+            (1, graph.add_entity_type),
+            (2, graph.add_entity),
+            (2, graph.add_user_to_group_mapping),
+            (2, graph.add_group_to_group_mapping),
+            (3, graph.add_user_to_application_component_and_access_level_mapping),
+            (3, graph.add_group_to_application_component_and_access_level_mapping),
+            (3, graph.add_user_to_entity_mapping),
+            (3, graph.add_group_to_entity_mapping)
+        ]
+        for record_size, add_action in section_actions:
+            record_count: int = struct.unpack_from(self._COUNT_FORMAT, snapshot_map, offset)[0]
+            offset += self._INDEX_SIZE
+            indices: array = self._read_indices(snapshot_map, offset, record_count * record_size)
+            offset += self._INDEX_SIZE * record_count * record_size
+            for i in range(0, len(indices), record_size):
+                add_action(*[ strings[indices[j]] for j in range(i, i + record_size) ])
+
+        return (graph, position, creation_time)
+
+    def _read_indices(self, snapshot_map: mmap.mmap, offset: int, count: int) -> array:
+        index_array: array = array("I")
+        index_bytes: bytes = snapshot_map[offset:offset + self._INDEX_SIZE * count]
+        if (len(index_bytes) != self._INDEX_SIZE * count):
+            raise IndexError("Section is truncated.")
+        index_array.frombytes(index_bytes)
+        if (sys.byteorder != "little"):
+            index_array.byteswap()
+
+        return index_array
+
+    #endregion
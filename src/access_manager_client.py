@@ -1,4 +1,8 @@
-from typing import Dict, Set, List, TypeVar, Iterable, Generic, Tuple
+from typing import Dict, Set, List, Deque, TypeVar, Iterable, Iterator, Generic, Tuple, Union, Callable, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
 
 from src.json_array_to_iterable_converter import JsonArrayToIterableConverter
 from unique_stringifier_base import UniqueStringifierBase
@@ -6,6 +10,16 @@ from string_unique_stringifier import StringUniqueStringifier
 from access_manager_client_base import AccessManagerClientBase
 from access_manager_event_processor import AccessManagerEventProcessor
 from access_manager_query_processor import AccessManagerQueryProcessor
+from response_body_decoder_base import ResponseBodyDecoderBase
+from url_route_template import UrlRouteTemplate
+from event_write_ahead_log import EventWriteAheadLog
+from request_concurrency_limiter import RequestConcurrencyLimiter
+from query_result_cache_base import QueryResultCacheBase
+from element_existence_filter import ElementExistenceFilter
+from http_method import HTTPMethod
+from models.access_manager_change_event import AccessManagerChangeEvent
+from models.bulk_event_failure import BulkEventFailure
+from models.bulk_event_result import BulkEventResult
 
 TUser = TypeVar("TUser")
 TGroup = TypeVar("TGroup")
@@ -32,6 +46,18 @@ class AccessManagerClient(AccessManagerClientBase, AccessManagerEventProcessor,
             Returns a collection of all groups in the access manager.
         entity_types:
             Returns a collection of all entity types in the access manager.
+        stale_result_count:
+            The number of stale results (i.e. which exceeded the query result cache's time-to-live) returned from the query result cache (see constructor parameter 'stale_while_revalidate_time').
+        background_refresh_count:
+            The number of cached results successfully refreshed in the background.
+        background_refresh_failure_count:
+            The number of times refreshing a cached result in the background failed.
+        is_degraded:
+            Whether the client is in degraded mode, i.e. whether 'degraded_mode_failure_threshold' consecutive queries failed because the AccessManager instance was unavailable, and no query has succeeded since (see constructor parameters 'degraded_mode_result_cache' and 'degraded_mode_failure_threshold').
+        last_result_was_degraded:
+            Whether the result of the last 'has_access_*', 'get_*_mappings' or 'get_*_accessible_by_*' query called on the current thread was a retained result returned in degraded mode, rather than a current result.
+        degraded_result_count:
+            The number of retained results returned in degraded mode.
     
     """
 
@@ -43,9 +69,17 @@ class AccessManagerClient(AccessManagerClientBase, AccessManagerEventProcessor,
     _ACCESS_LEVEL_JSON_NAME: str = "accessLevel"
     _ENTITY_TYPE_JSON_NAME: str = "entityType"
     _ENTITY_JSON_NAME: str = "entity"
+    # Tag for cached query results which list the users or groups mapped (directly or indirectly) to an element, and hence depend on the whole group hierarchy below the element
+    _GROUP_HIERARCHY_CACHE_TAG: Tuple[str, ...] = ("groupHierarchy", )
+    # Tag for cached query results which depend on the groups a user or group is (directly or indirectly) mapped to, where those groups are not known
+    _UNRESOLVED_GROUP_DEPENDENCIES_CACHE_TAG: Tuple[str, ...] = ("unresolvedGroupDependencies", )
+    # Tag type for cached query results which depend on the groups a group is directly mapped to
+    _GROUP_MAPPINGS_CACHE_TAG_TYPE: str = "groupMappings"
+    # Tag type for cached query results which depend on the application component and entity mappings of a group
+    _GROUP_ACCESS_CACHE_TAG_TYPE: str = "groupAccess"
 
     def __init__(
-            self,
+            self, 
             base_url: str, 
             user_stringifier: UniqueStringifierBase[TUser], 
             group_stringifier: UniqueStringifierBase[TGroup], 
@@ -56,12 +90,29 @@ class AccessManagerClient(AccessManagerClientBase, AccessManagerEventProcessor,
             timeout=65536, 
             proxies=None, 
             verify=None, 
-            cert=None
+            cert=None, 
+            response_body_decoders: Union[List[ResponseBodyDecoderBase], None]=None, 
+            url_component_cache_size: int=4096, 
+            event_write_ahead_log: Union[EventWriteAheadLog, None]=None, 
+            event_write_ahead_log_retry_interval: float=5.0, 
+            request_concurrency_limiter: Union[RequestConcurrencyLimiter, None]=None, 
+            conditional_request_cache_size: int=0, 
+            query_result_cache: Union[QueryResultCacheBase, None]=None, 
+            track_group_dependencies: bool=False, 
+            contains_negative_result_cache: Union[QueryResultCacheBase, None]=None, 
+            element_existence_filter: Union[ElementExistenceFilter, None]=None, 
+            refresh_ahead_time: float=0.0, 
+            stale_while_revalidate_time: float=0.0, 
+            max_background_refresh_concurrency: int=1, 
+            degraded_mode_result_cache: Union[QueryResultCacheBase, None]=None, 
+            degraded_mode_failure_threshold: int=3, 
+            degraded_mode_retry_interval: float=5.0
         ) -> None:
         """Initialises a new instance of the AccessManagerClient class.
 
         Optionsl parameters ('auth', 'timeout', 'proxies', etc...) when set, are passed directly to the underlying requests.request() methods.  
         See the requests documentation (https://requests.readthedocs.io/) for documentation, type definitions, and usage examples of these parameters.
+        Stringifiers with expensive conversions can be wrapped in a CachingUniqueStringifier, as the elements in each query response are converted individually.
         
         Args:
             base_url:
@@ -76,6 +127,38 @@ class AccessManagerClient(AccessManagerClientBase, AccessManagerEventProcessor,
                 A string converter for access levels.  Used to convert strings sent to and received from the web API from/to TAccess instances.
             headers:
                 An optional Dict containing HTTP header neam/value pairs to send with each request to the AccessManager instance.
+            response_body_decoders:
+                An optional List of decoders for binary response body formats (e.g. MessagePackResponseBodyDecoder or CborResponseBodyDecoder), in order of preference.  The content types of the decoders are sent in the 'Accept' header of each request, with JSON always accepted as a fallback with the lowest preference.
+            url_component_cache_size:
+                The maximum number of encoded URL components (e.g. users, groups, entities) to retain in a least-recently-used cache, to avoid repeatedly encoding the same values.  Set to 0 to disable caching.
+            event_write_ahead_log:
+                An optional durable log to record event requests (i.e. calls to 'add_*' and 'remove_*' methods) in.  When set, event methods append their request to the log and return immediately, and a background thread replays the logged requests in order, retrying while the AccessManager instance is unavailable.  Query results are not stored in the query result cache, contains negative result cache or degraded mode result cache while logged requests are waiting to be replayed.  The close() method should be called to stop the background thread.
+            event_write_ahead_log_retry_interval:
+                The time in seconds to wait before retrying after replaying a request from parameter 'event_write_ahead_log' fails.
+            request_concurrency_limiter:
+                An optional limiter for the number of concurrent requests.  Requests which wait longer than the limiter's queue time budget for a concurrency slot are rejected with a QueueTimeBudgetExceededError, allowing callers to fall back rather than adding to the load on an overloaded AccessManager instance.
+            conditional_request_cache_size:
+                The maximum number of URLs (least recently used first) for which to retain the 'ETag' or 'Last-Modified' validator and deserialized body of the last successful GET response.  Subsequent GET requests to the URL (e.g. from the 'users', 'groups' and 'entity_types' properties and the get_entities() method) are sent with an 'If-None-Match' or 'If-Modified-Since' header, and the retained body is reused if the AccessManager instance returns a 304 (not modified) status.  Set to 0 to disable conditional requests.
+            query_result_cache:
+                An optional cache for the results of the 'has_access_*', 'get_*_mappings' and 'get_*_accessible_by_*' methods (e.g. a QueryResultCache, a WindowTinyLfuQueryResultCache to prevent results used only once from evicting frequently used results, a SharedMemoryQueryResultCache to share results between the processes on a host, or a TwoTierQueryResultCache with a persistent SqliteQueryResultCache second tier to retain results across restarts).  Results are keyed on the stringified method parameters, and are invalidated when event methods (e.g. 'add_*' and 'remove_*') called on the client change an element the result depends on.
+            track_group_dependencies:
+                Whether to retrieve the groups a user or group is directly and indirectly mapped to (via get_user_to_group_mappings() or get_group_to_group_mappings()) when caching a result which depends on the mappings of those groups (e.g. 'has_access_*' and 'get_*_accessible_by_*' results).  This allows a change to a group's mappings to invalidate only the results of users and groups mapped to that group.  If not set, the groups are only known if those methods were called with 'include_indirect_mappings' set and their results are still cached, otherwise the result is invalidated by any change to the mappings of any group.
+            contains_negative_result_cache:
+                An optional cache for False results of the 'contains_*' methods (i.e. elements which don't exist), allowing repeated lookups of the same non-existent elements to be answered without a request.  Results are invalidated when event methods called on the client add the element.
+            element_existence_filter:
+                An optional filter recording the users, groups, entity types and entities which exist, allowing 'contains_*' lookups of elements which definitely don't exist to be answered without a request.  The filter is rebuilt periodically from the 'users', 'groups', 'entity_types' properties and the get_entities() method on a background thread, and elements added via the client's event methods are recorded immediately.  The close() method should be called to stop the background thread.
+            refresh_ahead_time:
+                The time in seconds before a result in the query result cache expires (i.e. reaches the cache's time-to-live), within which retrieving the result from the cache also starts a refresh of the result in the background.  This allows frequently retrieved results to be kept in the cache rather than all expiring at the same time.  Set to 0 to disable refresh-ahead.
+            stale_while_revalidate_time:
+                The time in seconds after a result in the query result cache expires, during which the result is retained in the cache as a stale result.  Stale results are still returned, and retrieving one starts a refresh of the result in the background, so that callers don't all wait for the result to be retrieved when it expires.  Set to 0 to disable.
+            max_background_refresh_concurrency:
+                The maximum number of results refreshed in the background at the same time.  Refreshes which would exceed this are skipped (the result is refreshed by a subsequent retrieval, or retrieved from the AccessManager instance once it expires).
+            degraded_mode_result_cache:
+                An optional cache to retain the last successfully retrieved result of each 'has_access_*', 'get_*_mappings' and 'get_*_accessible_by_*' query in (separate from 'query_result_cache').  When a query fails because the AccessManager instance is unavailable (e.g. the request times out, a 5xx status is received, or the request is rejected by the request concurrency limiter), the retained result is returned instead of raising an exception, provided it was retrieved within the cache's time-to-live (i.e. the time-to-live sets the maximum staleness of results returned in degraded mode).  Retained results are invalidated by event methods called on the client in the same way as 'query_result_cache'.  Whether the client is in degraded mode, and whether the last query result returned on the calling thread was served in degraded mode, are available from the 'is_degraded' and 'last_result_was_degraded' properties.
+            degraded_mode_failure_threshold:
+                The number of consecutive queries which must fail because the AccessManager instance is unavailable for the client to enter degraded mode.  While in degraded mode, queries with a retained result in parameter 'degraded_mode_result_cache' are answered from it without sending a request (so callers don't wait for requests to time out), except for one trial request every 'degraded_mode_retry_interval' seconds.  Queries without a retained result are still sent.  Degraded mode ends when a query succeeds.
+            degraded_mode_retry_interval:
+                The time in seconds between trial requests while in degraded mode.
         """
         super().__init__(
             base_url, 
@@ -88,9 +171,135 @@ class AccessManagerClient(AccessManagerClientBase, AccessManagerEventProcessor,
             timeout=timeout, 
             proxies=proxies, 
             verify=verify, 
-            cert=cert
+            cert=cert, 
+            response_body_decoders=response_body_decoders, 
+            url_component_cache_size=url_component_cache_size, 
+            event_write_ahead_log=event_write_ahead_log, 
+            event_write_ahead_log_retry_interval=event_write_ahead_log_retry_interval, 
+            request_concurrency_limiter=request_concurrency_limiter, 
+            conditional_request_cache_size=conditional_request_cache_size
         )
         self._json_to_iterable_converter: JsonArrayToIterableConverter = JsonArrayToIterableConverter()
+        self._query_result_cache: Union[QueryResultCacheBase, None] = query_result_cache
+        self._track_group_dependencies: bool = track_group_dependencies
+        self._contains_negative_result_cache: Union[QueryResultCacheBase, None] = contains_negative_result_cache
+        self._element_existence_filter: Union[ElementExistenceFilter, None] = element_existence_filter
+        self._background_refresh_executor: Union[ThreadPoolExecutor, None] = None
+        # The ages (in seconds since being retrieved) of cached results at which a background refresh is started, and at which they're stale (i.e. have exceeded the query result cache's time-to-live)
+        self._background_refresh_age: float = float("inf")
+        self._stale_result_age: float = float("inf")
+        # The time-to-live to store results in the query result cache with, so that stale results are retained, or None to use the cache's time-to-live
+        self._query_result_time_to_live: Union[float, None] = None
+        if (refresh_ahead_time < 0.0):
+            raise ValueError("Parameter 'refresh_ahead_time' with value {0} must be greater than or equal to 0.".format(refresh_ahead_time))
+        if (stale_while_revalidate_time < 0.0):
+            raise ValueError("Parameter 'stale_while_revalidate_time' with value {0} must be greater than or equal to 0.".format(stale_while_revalidate_time))
+        if (max_background_refresh_concurrency < 1):
+            raise ValueError("Parameter 'max_background_refresh_concurrency' with value {0} must be greater than or equal to 1.".format(max_background_refresh_concurrency))
+        if (query_result_cache is not None and (refresh_ahead_time > 0.0 or stale_while_revalidate_time > 0.0)):
+            if (refresh_ahead_time >= query_result_cache.time_to_live):
+                raise ValueError("Parameter 'refresh_ahead_time' with value {0} must be less than the time-to-live of parameter 'query_result_cache'.".format(refresh_ahead_time))
+            self._stale_result_age = query_result_cache.time_to_live
+            self._background_refresh_age = self._stale_result_age - refresh_ahead_time
+            if (stale_while_revalidate_time > 0.0):
+                self._query_result_time_to_live = query_result_cache.time_to_live + stale_while_revalidate_time
+            self._background_refresh_executor = ThreadPoolExecutor(max_workers=max_background_refresh_concurrency, thread_name_prefix="AccessManagerClientRefresh")
+        self._max_background_refresh_concurrency: int = max_background_refresh_concurrency
+        self._background_refresh_lock: threading.Lock = threading.Lock()
+        # The cache keys of results currently being refreshed
+        self._background_refresh_keys: Set[Tuple[str, ...]] = set()
+        self._stale_result_count: int = 0
+        self._background_refresh_count: int = 0
+        self._background_refresh_failure_count: int = 0
+        if (degraded_mode_failure_threshold < 1):
+            raise ValueError("Parameter 'degraded_mode_failure_threshold' with value {0} must be greater than or equal to 1.".format(degraded_mode_failure_threshold))
+        if (degraded_mode_retry_interval <= 0.0):
+            raise ValueError("Parameter 'degraded_mode_retry_interval' with value {0} must be greater than 0.".format(degraded_mode_retry_interval))
+        self._degraded_mode_result_cache: Union[QueryResultCacheBase, None] = degraded_mode_result_cache
+        self._degraded_mode_failure_threshold: int = degraded_mode_failure_threshold
+        self._degraded_mode_retry_interval: float = degraded_mode_retry_interval
+        self._degraded_mode_lock: threading.Lock = threading.Lock()
+        self._is_degraded: bool = False
+        self._consecutive_failure_count: int = 0
+        # The time.monotonic() the last trial request was sent in degraded mode
+        self._last_trial_request_time: float = 0.0
+        self._degraded_result_count: int = 0
+        # Serializes recording invalidations with storing results in the caches, so that a result retrieved before an invalidation of an element it depends on is never stored after the invalidation
+        self._invalidation_lock: threading.Lock = threading.Lock()
+        self._invalidation_sequence_number: int = 0
+        # Invalidations made while requests whose results are to be cached are in flight, as tuples containing the sequence number of the invalidation, and the invalidated tags (or None if all results were invalidated)
+        self._recent_invalidations: Deque[Tuple[int, Union[Set[Tuple[str, ...]], None]]] = deque()
+        # Maps the invalidation sequence number at the time requests whose results are to be cached were sent, to the number of those requests still in flight
+        self._in_flight_request_counts: Dict[int, int] = dict()
+        # Holds whether the last query result returned on each thread was served in degraded mode
+        self._thread_local_state: threading.local = threading.local()
+        # Maps the names of the AccessManagerEventProcessor methods which change events can correspond to, to the functions which return the cache tags of the event given its stringified arguments
+        self._event_cache_tag_functions: Dict[str, Callable[..., List[Tuple[str, ...]]]] = {
+            "add_user": self._get_user_event_cache_tags, 
+            "remove_user": self._get_user_event_cache_tags, 
+            "add_group": self._get_group_event_cache_tags, 
+            "remove_group": self._get_group_removal_cache_tags, 
+            "add_user_to_group_mapping": self._get_user_to_group_mapping_event_cache_tags, 
+            "remove_user_to_group_mapping": self._get_user_to_group_mapping_event_cache_tags, 
+            "add_group_to_group_mapping": self._get_group_to_group_mapping_event_cache_tags, 
+            "remove_group_to_group_mapping": self._get_group_to_group_mapping_event_cache_tags, 
+            "add_user_to_application_component_and_access_level_mapping": self._get_user_to_application_component_and_access_level_mapping_event_cache_tags, 
+            "remove_user_to_application_component_and_access_level_mapping": self._get_user_to_application_component_and_access_level_mapping_event_cache_tags, 
+            "add_group_to_application_component_and_access_level_mapping": self._get_group_to_application_component_and_access_level_mapping_event_cache_tags, 
+            "remove_group_to_application_component_and_access_level_mapping": self._get_group_to_application_component_and_access_level_mapping_event_cache_tags, 
+            "add_entity_type": self._get_entity_type_event_cache_tags, 
+            "remove_entity_type": self._get_entity_type_event_cache_tags, 
+            "add_entity": self._get_entity_event_cache_tags, 
+            "remove_entity": self._get_entity_event_cache_tags, 
+            "add_user_to_entity_mapping": self._get_user_to_entity_mapping_event_cache_tags, 
+            "remove_user_to_entity_mapping": self._get_user_to_entity_mapping_event_cache_tags, 
+            "add_group_to_entity_mapping": self._get_group_to_entity_mapping_event_cache_tags, 
+            "remove_group_to_entity_mapping": self._get_group_to_entity_mapping_event_cache_tags
+        }
+        self._initialize_url_route_templates()
+        if (self._element_existence_filter is not None):
+            self._element_existence_filter.start(self._load_existing_elements)
+
+
+    def close(self) -> None:
+        """Stops any background processing (e.g. replaying of requests from the event write-ahead log, rebuilding the element existence filter, or refreshing cached results).
+        """
+        if (self._element_existence_filter is not None):
+            self._element_existence_filter.stop()
+        with self._background_refresh_lock:
+            background_refresh_executor: Union[ThreadPoolExecutor, None] = self._background_refresh_executor
+            self._background_refresh_executor = None
+        if (background_refresh_executor is not None):
+            background_refresh_executor.shutdown(wait=True)
+        super().close()
+
+
+    def invalidate_cached_results(self, event: AccessManagerChangeEvent) -> None:
+        """Invalidates any cached query results dependent on the elements affected by an event which was made outside of the client (e.g. read from a change feed), without sending the event to the AccessManager instance.  Elements added by the event are also recorded in any element existence filter.
+
+        Args:
+            event:
+                The event.
+        """
+        cache_tag_function: Union[Callable[..., List[Tuple[str, ...]]], None] = self._event_cache_tag_functions.get(event.event_type)
+        if (cache_tag_function is None):
+            raise ValueError("Change event at position {0} has unrecognized type '{1}'.".format(event.position, event.event_type))
+        cache_tags: List[Tuple[str, ...]] = cache_tag_function(*event.arguments)
+        if (event.event_type.startswith("add_") == True):
+            self._add_to_element_existence_filter(cache_tags)
+        self._invalidate_cached_results(cache_tags)
+
+
+    def clear_cached_results(self) -> None:
+        """Removes all results from the query result cache, contains negative result cache, and degraded mode result cache (e.g. when changes made outside of the client may have been missed).
+        """
+        self._record_invalidation(None)
+        if (self._query_result_cache is not None):
+            self._query_result_cache.clear()
+        if (self._contains_negative_result_cache is not None):
+            self._contains_negative_result_cache.clear()
+        if (self._degraded_mode_result_cache is not None):
+            self._degraded_mode_result_cache.clear()
 
 
     @property
@@ -122,153 +331,211 @@ class AccessManagerClient(AccessManagerClientBase, AccessManagerEventProcessor,
         return raw_results
 
 
+    @property
+    def stale_result_count(self) -> int:
+        """The number of stale results (i.e. which exceeded the query result cache's time-to-live) returned from the query result cache (see constructor parameter 'stale_while_revalidate_time')."""
+        return self._stale_result_count
+
+
+    @property
+    def background_refresh_count(self) -> int:
+        """The number of cached results successfully refreshed in the background."""
+        return self._background_refresh_count
+
+
+    @property
+    def background_refresh_failure_count(self) -> int:
+        """The number of times refreshing a cached result in the background failed."""
+        return self._background_refresh_failure_count
+
+
+    @property
+    def is_degraded(self) -> bool:
+        """Whether the client is in degraded mode, i.e. whether 'degraded_mode_failure_threshold' consecutive queries failed because the AccessManager instance was unavailable, and no query has succeeded since (see constructor parameters 'degraded_mode_result_cache' and 'degraded_mode_failure_threshold')."""
+        with self._degraded_mode_lock:
+            return self._is_degraded
+
+
+    @property
+    def last_result_was_degraded(self) -> bool:
+        """Whether the result of the last 'has_access_*', 'get_*_mappings' or 'get_*_accessible_by_*' query called on the current thread was a retained result returned in degraded mode, rather than a current result."""
+        return getattr(self._thread_local_state, "last_result_was_degraded", False)
+
+
+    @property
+    def degraded_result_count(self) -> int:
+        """The number of retained results returned in degraded mode."""
+        return self._degraded_result_count
+
+
     def add_user(self, user: TUser) -> None:
-        url: str = self._base_url + "users/{0}".format(
-            self._encode_url_component(self._user_stringifier.to_string(user))
-            )
+        user_string: str = self._user_stringifier.to_string(user)
+        url: str = self._user_route.build(
+            user_string
+        )
 
-        self._send_post_request(url)
+        self._process_event(HTTPMethod.POST, url, self._get_user_event_cache_tags(user_string))
 
 
     def contains_user(self, user: TUser) -> bool:
-        url: str = self._base_url + "users/{0}".format(
-            self._encode_url_component(self._user_stringifier.to_string(user))
-            )
-        
-        return self._send_get_request_for_contains_method(url)
+        user_string: str = self._user_stringifier.to_string(user)
+
+        return self._send_filtered_contains_request(self._user_route, (user_string, ), (self._USER_JSON_NAME, user_string))
 
 
     def remove_user(self, user: TUser) -> None:
-        url: str = self._base_url + "users/{0}".format(
-            self._encode_url_component(self._user_stringifier.to_string(user))
-            )
+        user_string: str = self._user_stringifier.to_string(user)
+        url: str = self._user_route.build(
+            user_string
+        )
+
+        self._process_event(HTTPMethod.DELETE, url, self._get_user_event_cache_tags(user_string))
 
-        self._send_delete_request(url)
-    
 
     def add_group(self, group: TGroup) -> None:
-        url: str = self._base_url + "groups/{0}".format(
-            self._encode_url_component(self._group_stringifier.to_string(group))
-            )
+        group_string: str = self._group_stringifier.to_string(group)
+        url: str = self._group_route.build(
+            group_string
+        )
+
+        self._process_event(HTTPMethod.POST, url, self._get_group_event_cache_tags(group_string))
 
-        self._send_post_request(url)
-    
 
     def contains_group(self, group: TGroup) -> bool:
-        url: str = self._base_url + "groups/{0}".format(
-            self._encode_url_component(self._group_stringifier.to_string(group))
-            )
+        group_string: str = self._group_stringifier.to_string(group)
+
+        return self._send_filtered_contains_request(self._group_route, (group_string, ), (self._GROUP_JSON_NAME, group_string))
 
-        return self._send_get_request_for_contains_method(url)
-    
 
     def remove_group(self, group: TGroup) -> None:
-        url: str = self._base_url + "groups/{0}".format(
-            self._encode_url_component(self._group_stringifier.to_string(group))
-            )
+        group_string: str = self._group_stringifier.to_string(group)
+        url: str = self._group_route.build(
+            group_string
+        )
+
+        self._process_event(HTTPMethod.DELETE, url, self._get_group_removal_cache_tags(group_string))
 
-        self._send_delete_request(url)
-    
 
     def add_user_to_group_mapping(self, user: TUser, group: TGroup) -> None:
-        url: str = self._base_url + "userToGroupMappings/user/{0}/group/{1}".format(
-            self._encode_url_component(self._user_stringifier.to_string(user)), 
-            self._encode_url_component(self._group_stringifier.to_string(group))
+        user_string: str = self._user_stringifier.to_string(user)
+        group_string: str = self._group_stringifier.to_string(group)
+        url: str = self._user_to_group_mapping_route.build(
+            user_string, 
+            group_string
         )
 
-        self._send_post_request(url)
-    
+        self._process_event(HTTPMethod.POST, url, self._get_user_to_group_mapping_event_cache_tags(user_string, group_string))
+
 
     def get_user_to_group_mappings(self, user: TUser, include_indirect_mappings: bool) -> Iterable[TGroup]:
-        url: str = self._base_url + "userToGroupMappings/user/{0}?includeIndirectMappings={1}".format(
-            self._encode_url_component(self._user_stringifier.to_string(user)), 
-            str.lower(str(include_indirect_mappings))
+        user_string: str = self._user_stringifier.to_string(user)
+        raw_results = self._send_cached_get_request(
+            self._user_to_group_mappings_route, 
+            (user_string, self._bool_to_query_string_value(include_indirect_mappings)), 
+            [ (self._USER_JSON_NAME, user_string) ], 
+            lambda raw_results: self._get_element_cache_tags(raw_results, self._GROUP_MAPPINGS_CACHE_TAG_TYPE, self._GROUP_JSON_NAME)
         )
-        raw_results = self._send_get_request(url)
         assert isinstance(raw_results, List)
         results: Iterable[TGroup] = self._json_to_iterable_converter.convert_to_iterable(raw_results, self._group_stringifier, self._GROUP_JSON_NAME)
-        
+
         return results
-    
+
 
     def get_group_to_user_mappings(self, group: TGroup, include_indirect_mappings: bool) -> Iterable[TUser]:
-        url: str = self._base_url + "userToGroupMappings/group/{0}?includeIndirectMappings={1}".format(
-            self._encode_url_component(self._group_stringifier.to_string(group)), 
-            str.lower(str(include_indirect_mappings))
+        group_string: str = self._group_stringifier.to_string(group)
+        raw_results = self._send_cached_get_request(
+            self._group_to_user_mappings_route, 
+            (group_string, self._bool_to_query_string_value(include_indirect_mappings)), 
+            [ (self._GROUP_JSON_NAME, group_string) ] + self._get_indirect_mapping_cache_tags(include_indirect_mappings), 
+            lambda raw_results: self._get_element_cache_tags(raw_results, self._USER_JSON_NAME, self._USER_JSON_NAME)
         )
-        raw_results = self._send_get_request(url)
         assert isinstance(raw_results, List)
         results: Iterable[TUser] = self._json_to_iterable_converter.convert_to_iterable(raw_results, self._user_stringifier, self._USER_JSON_NAME)
-        
+
         return results
-    
+
 
     def remove_user_to_group_mapping(self, user: TUser, group: TGroup) -> None:
-        url: str = self._base_url + "userToGroupMappings/user/{0}/group/{1}".format(
-            self._encode_url_component(self._user_stringifier.to_string(user)), 
-            self._encode_url_component(self._group_stringifier.to_string(group))
+        user_string: str = self._user_stringifier.to_string(user)
+        group_string: str = self._group_stringifier.to_string(group)
+        url: str = self._user_to_group_mapping_route.build(
+            user_string, 
+            group_string
         )
 
-        self._send_delete_request(url)
-    
+        self._process_event(HTTPMethod.DELETE, url, self._get_user_to_group_mapping_event_cache_tags(user_string, group_string))
+
 
     def add_group_to_group_mapping(self, from_group: TGroup, to_group: TGroup) -> None:
-        url: str = self._base_url + "groupToGroupMappings/fromGroup/{0}/toGroup/{1}".format(
-            self._encode_url_component(self._group_stringifier.to_string(from_group)), 
-            self._encode_url_component(self._group_stringifier.to_string(to_group))
+        from_group_string: str = self._group_stringifier.to_string(from_group)
+        to_group_string: str = self._group_stringifier.to_string(to_group)
+        url: str = self._group_to_group_mapping_route.build(
+            from_group_string, 
+            to_group_string
         )
 
-        self._send_post_request(url)
-    
+        self._process_event(HTTPMethod.POST, url, self._get_group_to_group_mapping_event_cache_tags(from_group_string, to_group_string))
+
 
     def get_group_to_group_mappings(self, group: TGroup, include_indirect_mappings: bool) -> Iterable[TGroup]:
-        url: str = self._base_url + "groupToGroupMappings/group/{0}?includeIndirectMappings={1}".format(
-            self._encode_url_component(self._group_stringifier.to_string(group)), 
-            str.lower(str(include_indirect_mappings))
+        group_string: str = self._group_stringifier.to_string(group)
+        raw_results = self._send_cached_get_request(
+            self._group_to_group_mappings_route, 
+            (group_string, self._bool_to_query_string_value(include_indirect_mappings)), 
+            [ (self._GROUP_MAPPINGS_CACHE_TAG_TYPE, group_string) ], 
+            lambda raw_results: self._get_element_cache_tags(raw_results, self._GROUP_MAPPINGS_CACHE_TAG_TYPE, self._TO_GROUP_JSON_NAME)
         )
-        raw_results = self._send_get_request(url)
         assert isinstance(raw_results, List)
         results: Iterable[TGroup] = self._json_to_iterable_converter.convert_to_iterable(raw_results, self._group_stringifier, self._TO_GROUP_JSON_NAME)
-        
+
         return results
-    
+
 
     def get_group_to_group_reverse_mappings(self, group: TGroup, include_indirect_mappings: bool) -> Iterable[TGroup]:
-        url: str = self._base_url + "groupToGroupReverseMappings/group/{0}?includeIndirectMappings={1}".format(
-            self._encode_url_component(self._group_stringifier.to_string(group)), 
-            str.lower(str(include_indirect_mappings))
+        group_string: str = self._group_stringifier.to_string(group)
+        raw_results = self._send_cached_get_request(
+            self._group_to_group_reverse_mappings_route, 
+            (group_string, self._bool_to_query_string_value(include_indirect_mappings)), 
+            [ (self._GROUP_JSON_NAME, group_string) ] + self._get_indirect_mapping_cache_tags(include_indirect_mappings), 
+            lambda raw_results: self._get_element_cache_tags(raw_results, self._GROUP_JSON_NAME, self._FROM_GROUP_JSON_NAME)
         )
-        raw_results = self._send_get_request(url)
         assert isinstance(raw_results, List)
         results: Iterable[TGroup] = self._json_to_iterable_converter.convert_to_iterable(raw_results, self._group_stringifier, self._FROM_GROUP_JSON_NAME)
-        
+
         return results
-    
+
 
     def remove_group_to_group_mapping(self, from_group: TGroup, to_group: TGroup) -> None:
-        url: str = self._base_url + "groupToGroupMappings/fromGroup/{0}/toGroup/{1}".format(
-            self._encode_url_component(self._group_stringifier.to_string(from_group)), 
-            self._encode_url_component(self._group_stringifier.to_string(to_group))
+        from_group_string: str = self._group_stringifier.to_string(from_group)
+        to_group_string: str = self._group_stringifier.to_string(to_group)
+        url: str = self._group_to_group_mapping_route.build(
+            from_group_string, 
+            to_group_string
         )
 
-        self._send_delete_request(url)
-    
+        self._process_event(HTTPMethod.DELETE, url, self._get_group_to_group_mapping_event_cache_tags(from_group_string, to_group_string))
+
 
     def add_user_to_application_component_and_access_level_mapping(self, user: TUser, application_component: TComponent, access_level: TAccess) -> None:
-        url: str = self._base_url + "userToApplicationComponentAndAccessLevelMappings/user/{0}/applicationComponent/{1}/accessLevel/{2}".format(
-            self._encode_url_component(self._user_stringifier.to_string(user)), 
-            self._encode_url_component(self._application_component_stringifier.to_string(application_component)), 
-            self._encode_url_component(self._access_level_stringifier.to_string(access_level))
+        user_string: str = self._user_stringifier.to_string(user)
+        application_component_string: str = self._application_component_stringifier.to_string(application_component)
+        access_level_string: str = self._access_level_stringifier.to_string(access_level)
+        url: str = self._user_to_application_component_and_access_level_mapping_route.build(
+            user_string, 
+            application_component_string, 
+            access_level_string
         )
 
-        self._send_post_request(url)
-    
+        self._process_event(HTTPMethod.POST, url, self._get_user_to_application_component_and_access_level_mapping_event_cache_tags(user_string, application_component_string, access_level_string))
+
 
     def get_user_to_application_component_and_access_level_mappings(self, user: TUser) -> Iterable[Tuple[TComponent, TAccess]]:
-        url: str = self._base_url + "userToApplicationComponentAndAccessLevelMappings/user/{0}?includeIndirectMappings=false".format(
-            self._encode_url_component(self._user_stringifier.to_string(user))
+        user_string: str = self._user_stringifier.to_string(user)
+        raw_results = self._send_cached_get_request(
+            self._user_to_application_component_and_access_level_mappings_route, 
+            (user_string, ), 
+            [ (self._USER_JSON_NAME, user_string) ]
         )
-        raw_results = self._send_get_request(url)
         results: Iterable[Tuple[TComponent, TAccess]] = self._json_to_iterable_converter.convert_to_iterable_of_tuples(
             raw_results, # type: ignore[assignment]
             self._APPLICATION_COMPONENT_JSON_NAME, 
@@ -276,48 +543,58 @@ class AccessManagerClient(AccessManagerClientBase, AccessManagerEventProcessor,
             self._application_component_stringifier, 
             self._access_level_stringifier
             )
-        
+
         return results
-    
+
 
     def get_application_component_and_access_level_to_user_mappings(self, application_component: TComponent, accesss_level: TAccess, include_indirect_mappings: bool) -> Iterable[TUser]:
-        url: str = self._base_url + "userToApplicationComponentAndAccessLevelMappings/applicationComponent/{0}/accessLevel/{1}?includeIndirectMappings={2}".format(
-            self._encode_url_component(self._application_component_stringifier.to_string(application_component)), 
-            self._encode_url_component(self._access_level_stringifier.to_string(accesss_level)), 
-            str.lower(str(include_indirect_mappings))
+        application_component_string: str = self._application_component_stringifier.to_string(application_component)
+        access_level_string: str = self._access_level_stringifier.to_string(accesss_level)
+        raw_results = self._send_cached_get_request(
+            self._application_component_and_access_level_to_user_mappings_route, 
+            (application_component_string, access_level_string, self._bool_to_query_string_value(include_indirect_mappings)), 
+            [ (self._APPLICATION_COMPONENT_JSON_NAME, application_component_string, access_level_string) ] + self._get_indirect_mapping_cache_tags(include_indirect_mappings), 
+            lambda raw_results: self._get_element_cache_tags(raw_results, self._USER_JSON_NAME, self._USER_JSON_NAME)
         )
-        raw_results = self._send_get_request(url)
         assert isinstance(raw_results, List)
         results: Iterable[TUser] = self._json_to_iterable_converter.convert_to_iterable(raw_results, self._user_stringifier, self._USER_JSON_NAME)
-        
+
         return results
-    
-    
+
+
     def remove_user_to_application_component_and_access_level_mapping(self, user: TUser, application_component: TComponent, access_level: TAccess) -> None:
-        url: str = self._base_url + "userToApplicationComponentAndAccessLevelMappings/user/{0}/applicationComponent/{1}/accessLevel/{2}".format(
-            self._encode_url_component(self._user_stringifier.to_string(user)), 
-            self._encode_url_component(self._application_component_stringifier.to_string(application_component)), 
-            self._encode_url_component(self._access_level_stringifier.to_string(access_level))
+        user_string: str = self._user_stringifier.to_string(user)
+        application_component_string: str = self._application_component_stringifier.to_string(application_component)
+        access_level_string: str = self._access_level_stringifier.to_string(access_level)
+        url: str = self._user_to_application_component_and_access_level_mapping_route.build(
+            user_string, 
+            application_component_string, 
+            access_level_string
         )
 
-        self._send_delete_request(url)
+        self._process_event(HTTPMethod.DELETE, url, self._get_user_to_application_component_and_access_level_mapping_event_cache_tags(user_string, application_component_string, access_level_string))
 
 
     def add_group_to_application_component_and_access_level_mapping(self, group: TGroup, application_component: TComponent, access_level: TAccess) -> None:
-        url: str = self._base_url + "groupToApplicationComponentAndAccessLevelMappings/group/{0}/applicationComponent/{1}/accessLevel/{2}".format(
-            self._encode_url_component(self._group_stringifier.to_string(group)), 
-            self._encode_url_component(self._application_component_stringifier.to_string(application_component)), 
-            self._encode_url_component(self._access_level_stringifier.to_string(access_level))
+        group_string: str = self._group_stringifier.to_string(group)
+        application_component_string: str = self._application_component_stringifier.to_string(application_component)
+        access_level_string: str = self._access_level_stringifier.to_string(access_level)
+        url: str = self._group_to_application_component_and_access_level_mapping_route.build(
+            group_string, 
+            application_component_string, 
+            access_level_string
         )
 
-        self._send_post_request(url)
-    
+        self._process_event(HTTPMethod.POST, url, self._get_group_to_application_component_and_access_level_mapping_event_cache_tags(group_string, application_component_string, access_level_string))
+
 
     def get_group_to_application_component_and_access_level_mappings(self, group: TGroup) -> Iterable[Tuple[TComponent, TAccess]]:
-        url: str = self._base_url + "groupToApplicationComponentAndAccessLevelMappings/group/{0}?includeIndirectMappings=false".format(
-            self._encode_url_component(self._group_stringifier.to_string(group))
+        group_string: str = self._group_stringifier.to_string(group)
+        raw_results = self._send_cached_get_request(
+            self._group_to_application_component_and_access_level_mappings_route, 
+            (group_string, ), 
+            [ (self._GROUP_JSON_NAME, group_string) ]
         )
-        raw_results = self._send_get_request(url)
         results: Iterable[Tuple[TComponent, TAccess]] = self._json_to_iterable_converter.convert_to_iterable_of_tuples(
             raw_results, # type: ignore[assignment]
             self._APPLICATION_COMPONENT_JSON_NAME, 
@@ -325,110 +602,110 @@ class AccessManagerClient(AccessManagerClientBase, AccessManagerEventProcessor,
             self._application_component_stringifier, 
             self._access_level_stringifier
             )
-        
+
         return results
-    
+
 
     def get_application_component_and_access_level_to_group_mappings(self, application_component: TComponent, accesss_level: TAccess, include_indirect_mappings: bool) -> Iterable[TGroup]:
-        url: str = self._base_url + "groupToApplicationComponentAndAccessLevelMappings/applicationComponent/{0}/accessLevel/{1}?includeIndirectMappings={2}".format(
-            self._encode_url_component(self._application_component_stringifier.to_string(application_component)), 
-            self._encode_url_component(self._access_level_stringifier.to_string(accesss_level)), 
-            str.lower(str(include_indirect_mappings))
+        application_component_string: str = self._application_component_stringifier.to_string(application_component)
+        access_level_string: str = self._access_level_stringifier.to_string(accesss_level)
+        raw_results = self._send_cached_get_request(
+            self._application_component_and_access_level_to_group_mappings_route, 
+            (application_component_string, access_level_string, self._bool_to_query_string_value(include_indirect_mappings)), 
+            [ (self._APPLICATION_COMPONENT_JSON_NAME, application_component_string, access_level_string) ] + self._get_indirect_mapping_cache_tags(include_indirect_mappings), 
+            lambda raw_results: self._get_element_cache_tags(raw_results, self._GROUP_JSON_NAME, self._GROUP_JSON_NAME)
         )
-        raw_results = self._send_get_request(url)
         assert isinstance(raw_results, List)
         results: Iterable[TGroup] = self._json_to_iterable_converter.convert_to_iterable(raw_results, self._group_stringifier, self._GROUP_JSON_NAME)
-        
+
         return results
-    
+
 
     def remove_group_to_application_component_and_access_level_mapping(self, group: TGroup, application_component: TComponent, access_level: TAccess) -> None:
-        url: str = self._base_url + "groupToApplicationComponentAndAccessLevelMappings/group/{0}/applicationComponent/{1}/accessLevel/{2}".format(
-            self._encode_url_component(self._group_stringifier.to_string(group)), 
-            self._encode_url_component(self._application_component_stringifier.to_string(application_component)), 
-            self._encode_url_component(self._access_level_stringifier.to_string(access_level))
+        group_string: str = self._group_stringifier.to_string(group)
+        application_component_string: str = self._application_component_stringifier.to_string(application_component)
+        access_level_string: str = self._access_level_stringifier.to_string(access_level)
+        url: str = self._group_to_application_component_and_access_level_mapping_route.build(
+            group_string, 
+            application_component_string, 
+            access_level_string
         )
 
-        self._send_delete_request(url)
-    
+        self._process_event(HTTPMethod.DELETE, url, self._get_group_to_application_component_and_access_level_mapping_event_cache_tags(group_string, application_component_string, access_level_string))
+
 
     def add_entity_type(self, entity_type: str) -> None:
-        url: str = self._base_url + "entityTypes/{0}".format(
-            self._encode_url_component(entity_type)
-            )
+        url: str = self._entity_type_route.build(
+            entity_type
+        )
 
-        self._send_post_request(url)
-    
+        self._process_event(HTTPMethod.POST, url, self._get_entity_type_event_cache_tags(entity_type))
 
-    def contains_entity_type(self, entity_type: str) -> bool:
-        url: str = self._base_url + "entityTypes/{0}".format(
-            self._encode_url_component(entity_type)
-            )
 
-        return self._send_get_request_for_contains_method(url)
+    def contains_entity_type(self, entity_type: str) -> bool:
+        return self._send_filtered_contains_request(self._entity_type_route, (entity_type, ), (self._ENTITY_TYPE_JSON_NAME, entity_type))
 
 
     def remove_entity_type(self, entity_type: str) -> None:
-        url: str = self._base_url + "entityTypes/{0}".format(
-            self._encode_url_component(entity_type)
-            )
+        url: str = self._entity_type_route.build(
+            entity_type
+        )
 
-        self._send_delete_request(url)
+        self._process_event(HTTPMethod.DELETE, url, self._get_entity_type_event_cache_tags(entity_type))
 
 
     def add_entity(self, entity_type: str, entity: str) -> None:
-        url: str = self._base_url + "entityTypes/{0}/entities/{1}".format(
-            self._encode_url_component(entity_type), 
-            self._encode_url_component(entity)
+        url: str = self._entity_route.build(
+            entity_type, 
+            entity
         )
 
-        self._send_post_request(url)
+        self._process_event(HTTPMethod.POST, url, self._get_entity_event_cache_tags(entity_type, entity))
 
 
-    def get_entities(self, entity_type: str) -> Iterable[str]:  
-        url: str = self._base_url + "entityTypes/{0}/entities".format(
-            self._encode_url_component(entity_type)
+    def get_entities(self, entity_type: str) -> Iterable[str]:
+        url: str = self._entities_route.build(
+            entity_type
         )
         raw_results = self._send_get_request(url)
         assert isinstance(raw_results, List)
         results: Iterable[str] = self._json_to_iterable_converter.convert_to_iterable(raw_results, StringUniqueStringifier(), self._ENTITY_JSON_NAME)
-        
+
         return results
 
 
     def contains_entity(self, entity_type: str, entity: str) -> bool:
-        url: str = self._base_url + "entityTypes/{0}/entities/{1}".format(
-            self._encode_url_component(entity_type), 
-            self._encode_url_component(entity)
-        )
+        return self._send_filtered_contains_request(self._entity_route, (entity_type, entity), (self._ENTITY_JSON_NAME, entity_type, entity))
 
-        return self._send_get_request_for_contains_method(url)
 
-    
     def remove_entity(self, entity_type: str, entity: str) -> None:
-        url: str = self._base_url + "entityTypes/{0}/entities/{1}".format(
-            self._encode_url_component(entity_type), 
-            self._encode_url_component(entity)
+        url: str = self._entity_route.build(
+            entity_type, 
+            entity
         )
 
-        self._send_delete_request(url)
+        self._process_event(HTTPMethod.DELETE, url, self._get_entity_event_cache_tags(entity_type, entity))
+
 
-    
     def add_user_to_entity_mapping(self, user: TUser, entity_type: str, entity: str) -> None:
-        url: str = self._base_url + "userToEntityMappings/user/{0}/entityType/{1}/entity/{2}".format(
-            self._encode_url_component(self._user_stringifier.to_string(user)), 
-            self._encode_url_component(entity_type), 
-            self._encode_url_component(entity)
+        user_string: str = self._user_stringifier.to_string(user)
+        url: str = self._user_to_entity_mapping_route.build(
+            user_string, 
+            entity_type, 
+            entity
         )
 
-        self._send_post_request(url)
+        self._process_event(HTTPMethod.POST, url, self._get_user_to_entity_mapping_event_cache_tags(user_string, entity_type, entity))
 
 
     def get_user_to_entity_mappings(self, user: TUser) -> Iterable[Tuple[str, str]]:
-        url: str = self._base_url + "userToEntityMappings/user/{0}?includeIndirectMappings=false".format(
-            self._encode_url_component(self._user_stringifier.to_string(user))
+        user_string: str = self._user_stringifier.to_string(user)
+        raw_results = self._send_cached_get_request(
+            self._user_to_entity_mappings_route, 
+            (user_string, ), 
+            [ (self._USER_JSON_NAME, user_string) ], 
+            self._get_entity_cache_tags
         )
-        raw_results = self._send_get_request(url)
         results: Iterable[Tuple[str, str]] = self._json_to_iterable_converter.convert_to_iterable_of_tuples(
             raw_results, # type: ignore[assignment]
             self._ENTITY_TYPE_JSON_NAME, 
@@ -436,60 +713,67 @@ class AccessManagerClient(AccessManagerClientBase, AccessManagerEventProcessor,
             StringUniqueStringifier(), 
             StringUniqueStringifier()
             )
-        
+
         return results
 
 
     def get_user_to_entity_mappings_for_type(self, user: TUser, entity_type: str) -> Iterable[str]:
-        url: str = self._base_url + "userToEntityMappings/user/{0}/entityType/{1}?includeIndirectMappings=false".format(
-            self._encode_url_component(self._user_stringifier.to_string(user)), 
-            self._encode_url_component(entity_type)
+        user_string: str = self._user_stringifier.to_string(user)
+        raw_results = self._send_cached_get_request(
+            self._user_to_entity_mappings_for_type_route, 
+            (user_string, entity_type), 
+            [ (self._USER_JSON_NAME, user_string), (self._ENTITY_TYPE_JSON_NAME, entity_type) ], 
+            lambda raw_results: self._get_entity_cache_tags(raw_results, entity_type)
         )
-        raw_results = self._send_get_request(url)
         assert isinstance(raw_results, List)
         results: Iterable[str] = self._json_to_iterable_converter.convert_to_iterable(raw_results, StringUniqueStringifier(), self._ENTITY_JSON_NAME)
-        
+
         return results
 
 
     def get_entity_to_user_mappings(self, entity_type: str, entity: str, include_indirect_mappings: bool) -> Iterable[TUser]:
-        url: str = self._base_url + "userToEntityMappings/entityType/{0}/entity/{1}?includeIndirectMappings={2}".format(
-            self._encode_url_component(entity_type), 
-            self._encode_url_component(entity), 
-            str.lower(str(include_indirect_mappings))
+        raw_results = self._send_cached_get_request(
+            self._entity_to_user_mappings_route, 
+            (entity_type, entity, self._bool_to_query_string_value(include_indirect_mappings)), 
+            [ (self._ENTITY_TYPE_JSON_NAME, entity_type), (self._ENTITY_JSON_NAME, entity_type, entity) ] + self._get_indirect_mapping_cache_tags(include_indirect_mappings), 
+            lambda raw_results: self._get_element_cache_tags(raw_results, self._USER_JSON_NAME, self._USER_JSON_NAME)
         )
-        raw_results = self._send_get_request(url)
         assert isinstance(raw_results, List)
         results: Iterable[TUser] = self._json_to_iterable_converter.convert_to_iterable(raw_results, self._user_stringifier, self._USER_JSON_NAME)
-        
+
         return results
 
 
     def remove_user_to_entity_mapping(self, user: TUser, entity_type: str, entity: str) -> None:
-        url: str = self._base_url + "userToEntityMappings/user/{0}/entityType/{1}/entity/{2}".format(
-            self._encode_url_component(self._user_stringifier.to_string(user)), 
-            self._encode_url_component(entity_type), 
-            self._encode_url_component(entity)
+        user_string: str = self._user_stringifier.to_string(user)
+        url: str = self._user_to_entity_mapping_route.build(
+            user_string, 
+            entity_type, 
+            entity
         )
 
-        self._send_delete_request(url)
+        self._process_event(HTTPMethod.DELETE, url, self._get_user_to_entity_mapping_event_cache_tags(user_string, entity_type, entity))
 
 
     def add_group_to_entity_mapping(self, group: TGroup, entity_type: str, entity: str) -> None:
-        url: str = self._base_url + "groupToEntityMappings/group/{0}/entityType/{1}/entity/{2}".format(
-            self._encode_url_component(self._group_stringifier.to_string(group)), 
-            self._encode_url_component(entity_type), 
-            self._encode_url_component(entity)
+        group_string: str = self._group_stringifier.to_string(group)
+        url: str = self._group_to_entity_mapping_route.build(
+            group_string, 
+            entity_type, 
+            entity
         )
 
-        self._send_post_request(url)
+        self._process_event(HTTPMethod.POST, url, self._get_group_to_entity_mapping_event_cache_tags(group_string, entity_type, entity))
 
 
     def get_group_to_entity_mappings(self, group: TGroup) -> Iterable[Tuple[str, str]]:
-        url: str = self._base_url + "groupToEntityMappings/group/{0}?includeIndirectMappings=false".format(
-            self._encode_url_component(self._group_stringifier.to_string(group))
+        group_string: str = self._group_stringifier.to_string(group)
+        raw_results = self._send_cached_get_request(
+            self._group_to_entity_mappings_route, 
+            (group_string, ), 
+            [ (self._GROUP_JSON_NAME, group_string) ], 
+            self._get_entity_cache_tags
         )
-        raw_results = self._send_get_request(url)
         results: Iterable[Tuple[str, str]] = self._json_to_iterable_converter.convert_to_iterable_of_tuples(
             raw_results, # type: ignore[assignment]
             self._ENTITY_TYPE_JSON_NAME, 
@@ -497,74 +781,265 @@ class AccessManagerClient(AccessManagerClientBase, AccessManagerEventProcessor,
             StringUniqueStringifier(), 
             StringUniqueStringifier()
             )
-        
+
         return results
 
 
     def get_group_to_entity_mappings_for_type(self, group: TGroup, entity_type: str) -> Iterable[str]:
-        url: str = self._base_url + "groupToEntityMappings/group/{0}/entityType/{1}?includeIndirectMappings=false".format(
-            self._encode_url_component(self._group_stringifier.to_string(group)), 
-            self._encode_url_component(entity_type)
+        group_string: str = self._group_stringifier.to_string(group)
+        raw_results = self._send_cached_get_request(
+            self._group_to_entity_mappings_for_type_route, 
+            (group_string, entity_type), 
+            [ (self._GROUP_JSON_NAME, group_string), (self._ENTITY_TYPE_JSON_NAME, entity_type) ], 
+            lambda raw_results: self._get_entity_cache_tags(raw_results, entity_type)
         )
-        raw_results = self._send_get_request(url)
         assert isinstance(raw_results, List)
         results: Iterable[str] = self._json_to_iterable_converter.convert_to_iterable(raw_results, StringUniqueStringifier(), self._ENTITY_JSON_NAME)
-        
+
         return results
 
 
     def get_entity_to_group_mappings(self, entity_type: str, entity: str, include_indirect_mappings: bool) -> Iterable[TGroup]:
-        url: str = self._base_url + "groupToEntityMappings/entityType/{0}/entity/{1}?includeIndirectMappings={2}".format(
-            self._encode_url_component(entity_type), 
-            self._encode_url_component(entity), 
-            str.lower(str(include_indirect_mappings))
+        raw_results = self._send_cached_get_request(
+            self._entity_to_group_mappings_route, 
+            (entity_type, entity, self._bool_to_query_string_value(include_indirect_mappings)), 
+            [ (self._ENTITY_TYPE_JSON_NAME, entity_type), (self._ENTITY_JSON_NAME, entity_type, entity) ] + self._get_indirect_mapping_cache_tags(include_indirect_mappings), 
+            lambda raw_results: self._get_element_cache_tags(raw_results, self._GROUP_JSON_NAME, self._GROUP_JSON_NAME)
         )
-        raw_results = self._send_get_request(url)
         assert isinstance(raw_results, List)
         results: Iterable[TGroup] = self._json_to_iterable_converter.convert_to_iterable(raw_results, self._group_stringifier, self._GROUP_JSON_NAME)
-        
+
         return results
 
 
     def remove_group_to_entity_mapping(self, group: TGroup, entity_type: str, entity: str) -> None:
-        url: str = self._base_url + "groupToEntityMappings/group/{0}/entityType/{1}/entity/{2}".format(
-            self._encode_url_component(self._group_stringifier.to_string(group)), 
-            self._encode_url_component(entity_type), 
-            self._encode_url_component(entity)
+        group_string: str = self._group_stringifier.to_string(group)
+        url: str = self._group_to_entity_mapping_route.build(
+            group_string, 
+            entity_type, 
+            entity
         )
 
-        self._send_delete_request(url)
+        self._process_event(HTTPMethod.DELETE, url, self._get_group_to_entity_mapping_event_cache_tags(group_string, entity_type, entity))
 
-    
-    def has_access_to_application_component(self, user: TUser, application_component: TComponent, access_level: TAccess) -> bool:
-        url: str = self._base_url + "dataElementAccess/applicationComponent/user/{0}/applicationComponent/{1}/accessLevel/{2}".format(
-            self._encode_url_component(self._user_stringifier.to_string(user)), 
-            self._encode_url_component(self._application_component_stringifier.to_string(application_component)), 
-            self._encode_url_component(self._access_level_stringifier.to_string(access_level)), 
+
+    def add_users(self, users: Iterable[TUser], max_concurrency: int=4) -> BulkEventResult:
+        """Adds multiple users, sending the events concurrently.  Failed events don't stop the remaining events from being sent, and are reported in the result.
+
+        Args:
+            users:
+                The users to add.
+            max_concurrency:
+                The maximum number of events sent at the same time.
+
+        Returns:
+            The outcome of the events.
+        """
+        return self._process_bulk_events(users, lambda user: self.add_user(user), max_concurrency)
+
+
+    def add_groups(self, groups: Iterable[TGroup], max_concurrency: int=4) -> BulkEventResult:
+        """Adds multiple groups, sending the events concurrently.  Failed events don't stop the remaining events from being sent, and are reported in the result.
+
+        Args:
+            groups:
+                The groups to add.
+            max_concurrency:
+                The maximum number of events sent at the same time.
+
+        Returns:
+            The outcome of the events.
+        """
+        return self._process_bulk_events(groups, lambda group: self.add_group(group), max_concurrency)
+
+
+    def add_user_to_group_mappings(self, mappings: Iterable[Tuple[TUser, TGroup]], max_concurrency: int=4) -> BulkEventResult:
+        """Adds multiple mappings between users and groups, sending the events concurrently.  Failed events don't stop the remaining events from being sent, and are reported in the result.
+
+        Args:
+            mappings:
+                The mappings to add, each a tuple containing the user and group.
+            max_concurrency:
+                The maximum number of events sent at the same time.
+
+        Returns:
+            The outcome of the events.
+        """
+        return self._process_bulk_events(mappings, lambda mapping: self.add_user_to_group_mapping(mapping[0], mapping[1]), max_concurrency)
+
+
+    def add_group_to_group_mappings(self, mappings: Iterable[Tuple[TGroup, TGroup]], max_concurrency: int=4) -> BulkEventResult:
+        """Adds multiple mappings between groups, sending the events concurrently.  Failed events don't stop the remaining events from being sent, and are reported in the result.
+
+        Args:
+            mappings:
+                The mappings to add, each a tuple containing the 'from' group and 'to' group.
+            max_concurrency:
+                The maximum number of events sent at the same time.
+
+        Returns:
+            The outcome of the events.
+        """
+        return self._process_bulk_events(mappings, lambda mapping: self.add_group_to_group_mapping(mapping[0], mapping[1]), max_concurrency)
+
+
+    def add_user_to_application_component_and_access_level_mappings(self, mappings: Iterable[Tuple[TUser, TComponent, TAccess]], max_concurrency: int=4) -> BulkEventResult:
+        """Adds multiple mappings between users and application components at specified levels of access, sending the events concurrently.  Failed events don't stop the remaining events from being sent, and are reported in the result.
+
+        Args:
+            mappings:
+                The mappings to add, each a tuple containing the user, application component and access level.
+            max_concurrency:
+                The maximum number of events sent at the same time.
+
+        Returns:
+            The outcome of the events.
+        """
+        return self._process_bulk_events(mappings, lambda mapping: self.add_user_to_application_component_and_access_level_mapping(mapping[0], mapping[1], mapping[2]), max_concurrency)
+
+
+    def add_group_to_application_component_and_access_level_mappings(self, mappings: Iterable[Tuple[TGroup, TComponent, TAccess]], max_concurrency: int=4) -> BulkEventResult:
+        """Adds multiple mappings between groups and application components at specified levels of access, sending the events concurrently.  Failed events don't stop the remaining events from being sent, and are reported in the result.
+
+        Args:
+            mappings:
+                The mappings to add, each a tuple containing the group, application component and access level.
+            max_concurrency:
+                The maximum number of events sent at the same time.
+
+        Returns:
+            The outcome of the events.
+        """
+        return self._process_bulk_events(mappings, lambda mapping: self.add_group_to_application_component_and_access_level_mapping(mapping[0], mapping[1], mapping[2]), max_concurrency)
+
+
+    def add_entities(self, entity_type: str, entities: Iterable[str], max_concurrency: int=4) -> BulkEventResult:
+        """Adds multiple entities of the same type, sending the events concurrently.  Failed events don't stop the remaining events from being sent, and are reported in the result.
+
+        Args:
+            entity_type:
+                The type of the entities.
+            entities:
+                The entities to add.
+            max_concurrency:
+                The maximum number of events sent at the same time.
+
+        Returns:
+            The outcome of the events.
+        """
+        return self._process_bulk_events(entities, lambda entity: self.add_entity(entity_type, entity), max_concurrency)
+
+
+    def add_user_to_entity_mappings(self, mappings: Iterable[Tuple[TUser, str, str]], max_concurrency: int=4) -> BulkEventResult:
+        """Adds multiple mappings between users and entities, sending the events concurrently.  Failed events don't stop the remaining events from being sent, and are reported in the result.
+
+        Args:
+            mappings:
+                The mappings to add, each a tuple containing the user, entity type and entity.
+            max_concurrency:
+                The maximum number of events sent at the same time.
+
+        Returns:
+            The outcome of the events.
+        """
+        return self._process_bulk_events(mappings, lambda mapping: self.add_user_to_entity_mapping(mapping[0], mapping[1], mapping[2]), max_concurrency)
+
+
+    def add_group_to_entity_mappings(self, mappings: Iterable[Tuple[TGroup, str, str]], max_concurrency: int=4) -> BulkEventResult:
+        """Adds multiple mappings between groups and entities, sending the events concurrently.  Failed events don't stop the remaining events from being sent, and are reported in the result.
+
+        Args:
+            mappings:
+                The mappings to add, each a tuple containing the group, entity type and entity.
+            max_concurrency:
+                The maximum number of events sent at the same time.
+
+        Returns:
+            The outcome of the events.
+        """
+        return self._process_bulk_events(mappings, lambda mapping: self.add_group_to_entity_mapping(mapping[0], mapping[1], mapping[2]), max_concurrency)
+
+
+    def has_access_to_application_component(self, user: TUser, application_component: TComponent, access_level: TAccess, bypass_cache: bool=False) -> bool:
+        """Checks whether the specified user (or a group that the user is a member of) has access to an application component at the specified level of access.
+
+        Args:
+            user:
+                The user to check for.
+            application_component:
+                The application component.
+            access_level:
+                The level of access to the component.
+            bypass_cache:
+                Whether to bypass any configured query result cache and always query the AccessManager instance (the result received is still stored in the cache).
+
+        Returns:
+            True if the user has access the component.  False otherwise.
+        """
+        user_string: str = self._user_stringifier.to_string(user)
+        application_component_string: str = self._application_component_stringifier.to_string(application_component)
+        access_level_string: str = self._access_level_stringifier.to_string(access_level)
+        results = self._send_cached_get_request(
+            self._application_component_access_route, 
+            (user_string, application_component_string, access_level_string), 
+            [ (self._USER_JSON_NAME, user_string) ], 
+            lambda raw_results: self._get_user_group_dependency_cache_tags(user_string), 
+            bypass_cache
         )
-        results = self._send_get_request(url)
         assert isinstance(results, bool)
 
         return results
 
 
-    def has_access_to_entity(self, user: TUser, entity_type: str, entity: str) -> bool:
-        url: str = self._base_url + "dataElementAccess/entity/user/{0}/entityType/{1}/entity/{2}".format(
-            self._encode_url_component(self._user_stringifier.to_string(user)), 
-            self._encode_url_component(entity_type), 
-            self._encode_url_component(entity), 
+    def has_access_to_entity(self, user: TUser, entity_type: str, entity: str, bypass_cache: bool=False) -> bool:
+        """Checks whether the specified user (or a group that the user is a member of) has access to the specified entity.
+
+        Args:
+            user:
+                The user to check for.
+            entity_type:
+                The type of the entity.
+            entity:
+                The entity.
+            bypass_cache:
+                Whether to bypass any configured query result cache and always query the AccessManager instance (the result received is still stored in the cache).
+
+        Returns:
+            True if the user has access the entity.  False otherwise.
+        """
+        user_string: str = self._user_stringifier.to_string(user)
+        results = self._send_cached_get_request(
+            self._entity_access_route, 
+            (user_string, entity_type, entity), 
+            [ (self._USER_JSON_NAME, user_string), (self._ENTITY_TYPE_JSON_NAME, entity_type), (self._ENTITY_JSON_NAME, entity_type, entity) ], 
+            lambda raw_results: self._get_user_group_dependency_cache_tags(user_string), 
+            bypass_cache
         )
-        results = self._send_get_request(url)
         assert isinstance(results, bool)
 
         return results
 
 
-    def get_application_components_accesible_by_user(self, user: TUser) -> Set[Tuple[TComponent, TAccess]]:
-        url: str = self._base_url + "userToApplicationComponentAndAccessLevelMappings/user/{0}?includeIndirectMappings=true".format(
-            self._encode_url_component(self._user_stringifier.to_string(user))
+    def get_application_components_accesible_by_user(self, user: TUser, bypass_cache: bool=False) -> Set[Tuple[TComponent, TAccess]]:
+        """Gets all application components and levels of access that the specified user (or a group that the user is a member of) has access to.
+
+        Args:
+            user:
+                The user to retrieve the application components and levels of access for.
+            bypass_cache:
+                Whether to bypass any configured query result cache and always query the AccessManager instance (the result received is still stored in the cache).
+
+        Returns:
+            The application components and levels of access to those application components that the user has access to.
+        """
+        user_string: str = self._user_stringifier.to_string(user)
+        raw_results = self._send_cached_get_request(
+            self._application_components_accessible_by_user_route, 
+            (user_string, ), 
+            [ (self._USER_JSON_NAME, user_string) ], 
+            lambda raw_results: self._get_user_group_dependency_cache_tags(user_string), 
+            bypass_cache
         )
-        raw_results = self._send_get_request(url)
         results: Iterable[Tuple[TComponent, TAccess]] = self._json_to_iterable_converter.convert_to_iterable_of_tuples(
             raw_results, # type: ignore[assignment]
             self._APPLICATION_COMPONENT_JSON_NAME, 
@@ -572,15 +1047,18 @@ class AccessManagerClient(AccessManagerClientBase, AccessManagerEventProcessor,
             self._application_component_stringifier, 
             self._access_level_stringifier
             )
-        
+
         return set(results)
 
 
     def get_application_components_accesible_by_group(self, group: TGroup) -> Set[Tuple[TComponent, TAccess]]:
-        url: str = self._base_url + "groupToApplicationComponentAndAccessLevelMappings/group/{0}?includeIndirectMappings=true".format(
-            self._encode_url_component(self._group_stringifier.to_string(group))
+        group_string: str = self._group_stringifier.to_string(group)
+        raw_results = self._send_cached_get_request(
+            self._application_components_accessible_by_group_route, 
+            (group_string, ), 
+            [ (self._GROUP_JSON_NAME, group_string) ], 
+            lambda raw_results: self._get_group_group_dependency_cache_tags(group_string)
         )
-        raw_results = self._send_get_request(url)
         results: Iterable[Tuple[TComponent, TAccess]] = self._json_to_iterable_converter.convert_to_iterable_of_tuples(
             raw_results, # type: ignore[assignment]
             self._APPLICATION_COMPONENT_JSON_NAME, 
@@ -588,15 +1066,30 @@ class AccessManagerClient(AccessManagerClientBase, AccessManagerEventProcessor,
             self._application_component_stringifier, 
             self._access_level_stringifier
             )
-        
+
         return set(results)
 
 
-    def get_entities_accessible_by_user(self, user: TUser) -> Set[Tuple[str, str]]:
-        url: str = self._base_url + "userToEntityMappings/user/{0}?includeIndirectMappings=true".format(
-            self._encode_url_component(self._user_stringifier.to_string(user))
+    def get_entities_accessible_by_user(self, user: TUser, bypass_cache: bool=False) -> Set[Tuple[str, str]]:
+        """Gets all entities that the specified user (or a group that the user is a member of) has access to.
+
+        Args:
+            user:
+                The user to retrieve the entities for.
+            bypass_cache:
+                Whether to bypass any configured query result cache and always query the AccessManager instance (the result received is still stored in the cache).
+
+        Returns:
+            A collection of Tuples containing the entity type and entity that the user has access to.
+        """
+        user_string: str = self._user_stringifier.to_string(user)
+        raw_results = self._send_cached_get_request(
+            self._entities_accessible_by_user_route, 
+            (user_string, ), 
+            [ (self._USER_JSON_NAME, user_string) ], 
+            lambda raw_results: self._get_entity_cache_tags(raw_results) + self._get_user_group_dependency_cache_tags(user_string), 
+            bypass_cache
         )
-        raw_results = self._send_get_request(url)
         results: Iterable[Tuple[str, str]] = self._json_to_iterable_converter.convert_to_iterable_of_tuples(
             raw_results, # type: ignore[assignment]
             self._ENTITY_TYPE_JSON_NAME, 
@@ -604,27 +1097,32 @@ class AccessManagerClient(AccessManagerClientBase, AccessManagerEventProcessor,
             StringUniqueStringifier(), 
             StringUniqueStringifier()
             )
-        
+
         return set(results)
 
 
     def get_entities_of_type_accessible_by_user(self, user: TUser, entity_type: str) -> Set[str]:
-        url: str = self._base_url + "userToEntityMappings/user/{0}/entityType/{1}?includeIndirectMappings=true".format(
-            self._encode_url_component(self._user_stringifier.to_string(user)), 
-            self._encode_url_component(entity_type)
+        user_string: str = self._user_stringifier.to_string(user)
+        raw_results = self._send_cached_get_request(
+            self._entities_of_type_accessible_by_user_route, 
+            (user_string, entity_type), 
+            [ (self._USER_JSON_NAME, user_string), (self._ENTITY_TYPE_JSON_NAME, entity_type) ], 
+            lambda raw_results: self._get_entity_cache_tags(raw_results, entity_type) + self._get_user_group_dependency_cache_tags(user_string)
         )
-        raw_results = self._send_get_request(url)
         assert isinstance(raw_results, List)
-        results: Iterable[str] = self._json_to_iterable_converter.convert_to_iterable(raw_results, self._group_stringifier, self._ENTITY_JSON_NAME)
-        
+        results: Iterable[str] = self._json_to_iterable_converter.convert_to_iterable(raw_results, StringUniqueStringifier(), self._ENTITY_JSON_NAME)
+
         return set(results)
 
 
     def get_entities_accessible_by_group(self, group: TGroup) -> Set[Tuple[str, str]]:
-        url: str = self._base_url + "groupToEntityMappings/group/{0}?includeIndirectMappings=true".format(
-            self._encode_url_component(self._group_stringifier.to_string(group))
+        group_string: str = self._group_stringifier.to_string(group)
+        raw_results = self._send_cached_get_request(
+            self._entities_accessible_by_group_route, 
+            (group_string, ), 
+            [ (self._GROUP_JSON_NAME, group_string) ], 
+            lambda raw_results: self._get_entity_cache_tags(raw_results) + self._get_group_group_dependency_cache_tags(group_string)
         )
-        raw_results = self._send_get_request(url)
         results: Iterable[Tuple[str, str]] = self._json_to_iterable_converter.convert_to_iterable_of_tuples(
             raw_results, # type: ignore[assignment]
             self._ENTITY_TYPE_JSON_NAME, 
@@ -632,22 +1130,832 @@ class AccessManagerClient(AccessManagerClientBase, AccessManagerEventProcessor,
             StringUniqueStringifier(), 
             StringUniqueStringifier()
             )
-        
+
         return set(results)
 
 
     def get_entities_of_type_accessible_by_group(self, group: TGroup, entity_type: str) -> Set[str]:
-        url: str = self._base_url + "groupToEntityMappings/group/{0}/entityType/{1}?includeIndirectMappings=true".format(
-            self._encode_url_component(self._group_stringifier.to_string(group)), 
-            self._encode_url_component(entity_type)
+        group_string: str = self._group_stringifier.to_string(group)
+        raw_results = self._send_cached_get_request(
+            self._entities_of_type_accessible_by_group_route, 
+            (group_string, entity_type), 
+            [ (self._GROUP_JSON_NAME, group_string), (self._ENTITY_TYPE_JSON_NAME, entity_type) ], 
+            lambda raw_results: self._get_entity_cache_tags(raw_results, entity_type) + self._get_group_group_dependency_cache_tags(group_string)
         )
-        raw_results = self._send_get_request(url)
         assert isinstance(raw_results, List)
-        results: Iterable[str] = self._json_to_iterable_converter.convert_to_iterable(raw_results, self._group_stringifier, self._ENTITY_JSON_NAME)
-        
+        results: Iterable[str] = self._json_to_iterable_converter.convert_to_iterable(raw_results, StringUniqueStringifier(), self._ENTITY_JSON_NAME)
+
         return set(results)
 
 
+    #region Private/Protected Methods
+
+    def _initialize_url_route_templates(self) -> None:
+        """Precompiles the UrlRouteTemplate members used to build request URLs.
+        """
+        self._user_route: UrlRouteTemplate = self._create_url_route_template("users/{0}")
+        self._group_route: UrlRouteTemplate = self._create_url_route_template("groups/{0}")
+        self._user_to_group_mapping_route: UrlRouteTemplate = self._create_url_route_template("userToGroupMappings/user/{0}/group/{1}")
+        self._user_to_group_mappings_route: UrlRouteTemplate = self._create_url_route_template("userToGroupMappings/user/{0}?includeIndirectMappings={1}")
+        self._group_to_user_mappings_route: UrlRouteTemplate = self._create_url_route_template("userToGroupMappings/group/{0}?includeIndirectMappings={1}")
+        self._group_to_group_mapping_route: UrlRouteTemplate = self._create_url_route_template("groupToGroupMappings/fromGroup/{0}/toGroup/{1}")
+        self._group_to_group_mappings_route: UrlRouteTemplate = self._create_url_route_template("groupToGroupMappings/group/{0}?includeIndirectMappings={1}")
+        self._group_to_group_reverse_mappings_route: UrlRouteTemplate = self._create_url_route_template("groupToGroupReverseMappings/group/{0}?includeIndirectMappings={1}")
+        self._user_to_application_component_and_access_level_mapping_route: UrlRouteTemplate = self._create_url_route_template("userToApplicationComponentAndAccessLevelMappings/user/{0}/applicationComponent/{1}/accessLevel/{2}")
+        self._user_to_application_component_and_access_level_mappings_route: UrlRouteTemplate = self._create_url_route_template("userToApplicationComponentAndAccessLevelMappings/user/{0}?includeIndirectMappings=false")
+        self._application_component_and_access_level_to_user_mappings_route: UrlRouteTemplate = self._create_url_route_template("userToApplicationComponentAndAccessLevelMappings/applicationComponent/{0}/accessLevel/{1}?includeIndirectMappings={2}")
+        self._group_to_application_component_and_access_level_mapping_route: UrlRouteTemplate = self._create_url_route_template("groupToApplicationComponentAndAccessLevelMappings/group/{0}/applicationComponent/{1}/accessLevel/{2}")
+        self._group_to_application_component_and_access_level_mappings_route: UrlRouteTemplate = self._create_url_route_template("groupToApplicationComponentAndAccessLevelMappings/group/{0}?includeIndirectMappings=false")
+        self._application_component_and_access_level_to_group_mappings_route: UrlRouteTemplate = self._create_url_route_template("groupToApplicationComponentAndAccessLevelMappings/applicationComponent/{0}/accessLevel/{1}?includeIndirectMappings={2}")
+        self._entity_type_route: UrlRouteTemplate = self._create_url_route_template("entityTypes/{0}")
+        self._entity_route: UrlRouteTemplate = self._create_url_route_template("entityTypes/{0}/entities/{1}")
+        self._entities_route: UrlRouteTemplate = self._create_url_route_template("entityTypes/{0}/entities")
+        self._user_to_entity_mapping_route: UrlRouteTemplate = self._create_url_route_template("userToEntityMappings/user/{0}/entityType/{1}/entity/{2}")
+        self._user_to_entity_mappings_route: UrlRouteTemplate = self._create_url_route_template("userToEntityMappings/user/{0}?includeIndirectMappings=false")
+        self._user_to_entity_mappings_for_type_route: UrlRouteTemplate = self._create_url_route_template("userToEntityMappings/user/{0}/entityType/{1}?includeIndirectMappings=false")
+        self._entity_to_user_mappings_route: UrlRouteTemplate = self._create_url_route_template("userToEntityMappings/entityType/{0}/entity/{1}?includeIndirectMappings={2}")
+        self._group_to_entity_mapping_route: UrlRouteTemplate = self._create_url_route_template("groupToEntityMappings/group/{0}/entityType/{1}/entity/{2}")
+        self._group_to_entity_mappings_route: UrlRouteTemplate = self._create_url_route_template("groupToEntityMappings/group/{0}?includeIndirectMappings=false")
+        self._group_to_entity_mappings_for_type_route: UrlRouteTemplate = self._create_url_route_template("groupToEntityMappings/group/{0}/entityType/{1}?includeIndirectMappings=false")
+        self._entity_to_group_mappings_route: UrlRouteTemplate = self._create_url_route_template("groupToEntityMappings/entityType/{0}/entity/{1}?includeIndirectMappings={2}")
+        self._application_component_access_route: UrlRouteTemplate = self._create_url_route_template("dataElementAccess/applicationComponent/user/{0}/applicationComponent/{1}/accessLevel/{2}")
+        self._entity_access_route: UrlRouteTemplate = self._create_url_route_template("dataElementAccess/entity/user/{0}/entityType/{1}/entity/{2}")
+        self._application_components_accessible_by_user_route: UrlRouteTemplate = self._create_url_route_template("userToApplicationComponentAndAccessLevelMappings/user/{0}?includeIndirectMappings=true")
+        self._application_components_accessible_by_group_route: UrlRouteTemplate = self._create_url_route_template("groupToApplicationComponentAndAccessLevelMappings/group/{0}?includeIndirectMappings=true")
+        self._entities_accessible_by_user_route: UrlRouteTemplate = self._create_url_route_template("userToEntityMappings/user/{0}?includeIndirectMappings=true")
+        self._entities_of_type_accessible_by_user_route: UrlRouteTemplate = self._create_url_route_template("userToEntityMappings/user/{0}/entityType/{1}?includeIndirectMappings=true")
+        self._entities_accessible_by_group_route: UrlRouteTemplate = self._create_url_route_template("groupToEntityMappings/group/{0}?includeIndirectMappings=true")
+        self._entities_of_type_accessible_by_group_route: UrlRouteTemplate = self._create_url_route_template("groupToEntityMappings/group/{0}/entityType/{1}?includeIndirectMappings=true")
+
+
+    def _send_cached_get_request(
+            self, 
+            route: UrlRouteTemplate, 
+            components: Tuple[str, ...], 
+            cache_tags: List[Tuple[str, ...]], 
+            result_cache_tags_function: Union[Callable[[Any], List[Tuple[str, ...]]], None]=None, 
+            bypass_cache: bool=False
+        ) -> Any:
+        """Returns the result of a GET request from the query result cache if it exists there, otherwise sends the request and stores the result in the cache.  Starts a background refresh of a cached result which is due to be refreshed ahead of becoming stale, or which is stale.
+
+        Args:
+            route:
+                The route of the request.
+            components:
+                The (unencoded) URL components to build the request URL from.  The route template and components also form the key of the result in the cache.
+            cache_tags:
+                Tags identifying the elements the result depends on, used to invalidate the result when one of the elements changes.
+            result_cache_tags_function:
+                Optional function which returns additional tags for the elements contained in the result (e.g. users returned by a group to user mapping query), accepting the deserialized response body.
+            bypass_cache:
+                Whether to skip reading the result from the cache (the result of the request is still stored).
+
+        Returns:
+            The response body deserialized to a JSON-compatible type.
+        """
+        self._thread_local_state.last_result_was_degraded = False
+        if (self._query_result_cache is None and self._degraded_mode_result_cache is None):
+            return self._send_get_request(route.build(*components))
+        cache_key: Tuple[str, ...] = (route.template, ) + components
+        if (self._query_result_cache is not None and bypass_cache == False):
+            found, cached_result = self._query_result_cache.try_get(cache_key)
+            if (found == True):
+                age: float = time.time() - cached_result[1]
+                if (age >= self._background_refresh_age):
+                    if (age >= self._stale_result_age):
+                        with self._background_refresh_lock:
+                            self._stale_result_count += 1
+                    self._start_background_refresh(route, components, cache_tags, result_cache_tags_function)
+                return cached_result[0]
+        if (self._degraded_mode_result_cache is None):
+            return self._send_and_cache_get_request(route, components, cache_tags, result_cache_tags_function)
+        if (self._should_send_request_in_degraded_mode() == False):
+            found, cached_result = self._degraded_mode_result_cache.try_get(cache_key)
+            if (found == True):
+                return self._return_degraded_result(cached_result[0])
+
+        try:
+            result = self._send_and_cache_get_request(route, components, cache_tags, result_cache_tags_function)
+        except Exception as exc:
+            # Errors from the AccessManager instance rejecting the request (e.g. because an element doesn't exist) are raised as ValueError
+            if (isinstance(exc, ValueError) == True):
+                self._record_query_outcome(True)
+                raise
+            self._record_query_outcome(False)
+            found, cached_result = self._degraded_mode_result_cache.try_get(cache_key)
+            if (found == False):
+                raise
+            return self._return_degraded_result(cached_result[0])
+        self._record_query_outcome(True)
+
+        return result
+
+
+    def _should_send_request_in_degraded_mode(self) -> bool:
+        """Checks whether a query should be sent to the AccessManager instance rather than answered from the degraded mode result cache, i.e. whether the client is not in degraded mode, or a trial request is due.
+
+        Returns:
+            Whether the query should be sent.
+        """
+        with self._degraded_mode_lock:
+            if (self._is_degraded == False):
+                return True
+            if (time.monotonic() - self._last_trial_request_time >= self._degraded_mode_retry_interval):
+                self._last_trial_request_time = time.monotonic()
+                return True
+
+            return False
+
+
+    def _record_query_outcome(self, available: bool) -> None:
+        """Records whether the AccessManager instance was available to answer a query, entering degraded mode after 'degraded_mode_failure_threshold' consecutive failures, and leaving it after a success.
+
+        Args:
+            available:
+                Whether the AccessManager instance was available.
+        """
+        with self._degraded_mode_lock:
+            if (available == True):
+                self._consecutive_failure_count = 0
+                self._is_degraded = False
+            else:
+                self._consecutive_failure_count += 1
+                if (self._is_degraded == False and self._consecutive_failure_count >= self._degraded_mode_failure_threshold):
+                    self._is_degraded = True
+                    # The failed request counts as the first trial request
+                    self._last_trial_request_time = time.monotonic()
+
+
+    def _return_degraded_result(self, result: Any) -> Any:
+        """Records that a retained result is being returned in degraded mode.
+
+        Args:
+            result:
+                The retained result.
+
+        Returns:
+            The result.
+        """
+        with self._degraded_mode_lock:
+            self._degraded_result_count += 1
+        self._thread_local_state.last_result_was_degraded = True
+
+        return result
+
+
+    def _send_and_cache_get_request(
+            self, 
+            route: UrlRouteTemplate, 
+            components: Tuple[str, ...], 
+            cache_tags: List[Tuple[str, ...]], 
+            result_cache_tags_function: Union[Callable[[Any], List[Tuple[str, ...]]], None]
+        ) -> Any:
+        """Sends a GET request and stores the result in the query result cache and degraded mode result cache, along with the time it was retrieved.  The result is not stored if any of the elements it depends on were invalidated while the request was in flight, as it may not reflect the change.
+
+        Args:
+            route:
+                The route of the request.
+            components:
+                The (unencoded) URL components to build the request URL from.
+            cache_tags:
+                Tags identifying the elements the result depends on.
+            result_cache_tags_function:
+                Optional function which returns additional tags for the elements contained in the result.
+
+        Returns:
+            The response body deserialized to a JSON-compatible type.
+        """
+        # Record the time before sending, so the age of the result is never underestimated
+        retrieved_time: float = time.time()
+        invalidation_sequence_number: int = self._begin_cacheable_request()
+        try:
+            result = self._send_get_request(route.build(*components))
+            if (result_cache_tags_function is not None):
+                cache_tags = cache_tags + result_cache_tags_function(result)
+            with self._invalidation_lock:
+                if (self._can_cache_result(invalidation_sequence_number, cache_tags) == True):
+                    if (self._query_result_cache is not None):
+                        self._query_result_cache.set((route.template, ) + components, (result, retrieved_time), cache_tags, self._query_result_time_to_live)
+                    if (self._degraded_mode_result_cache is not None):
+                        self._degraded_mode_result_cache.set((route.template, ) + components, (result, retrieved_time), cache_tags)
+        finally:
+            self._end_cacheable_request(invalidation_sequence_number)
+
+        return result
+
+
+    def _start_background_refresh(
+            self, 
+            route: UrlRouteTemplate, 
+            components: Tuple[str, ...], 
+            cache_tags: List[Tuple[str, ...]], 
+            result_cache_tags_function: Union[Callable[[Any], List[Tuple[str, ...]]], None]
+        ) -> None:
+        """Starts refreshing a cached result in the background, unless it's already being refreshed or the maximum number of concurrent refreshes are in progress.
+
+        Args:
+            route:
+                The route of the request.
+            components:
+                The (unencoded) URL components to build the request URL from.
+            cache_tags:
+                Tags identifying the elements the result depends on.
+            result_cache_tags_function:
+                Optional function which returns additional tags for the elements contained in the result.
+        """
+        cache_key: Tuple[str, ...] = (route.template, ) + components
+        with self._background_refresh_lock:
+            if (self._background_refresh_executor is None or cache_key in self._background_refresh_keys or len(self._background_refresh_keys) >= self._max_background_refresh_concurrency):
+                return
+            self._background_refresh_keys.add(cache_key)
+            self._background_refresh_executor.submit(self._refresh_cached_result, route, components, cache_tags, result_cache_tags_function)
+
+
+    def _refresh_cached_result(
+            self, 
+            route: UrlRouteTemplate, 
+            components: Tuple[str, ...], 
+            cache_tags: List[Tuple[str, ...]], 
+            result_cache_tags_function: Union[Callable[[Any], List[Tuple[str, ...]]], None]
+        ) -> None:
+        try:
+            self._send_and_cache_get_request(route, components, cache_tags, result_cache_tags_function)
+            with self._background_refresh_lock:
+                self._background_refresh_count += 1
+        except Exception:
+            # The cached result is still returned until it expires
+            with self._background_refresh_lock:
+                self._background_refresh_failure_count += 1
+        finally:
+            with self._background_refresh_lock:
+                self._background_refresh_keys.discard((route.template, ) + components)
+
+
+    def _process_event(self, http_method: HTTPMethod, request_url: str, cache_tags: List[Tuple[str, ...]]) -> None:
+        """Sends an HTTP POST or DELETE request representing an event, and invalidates any cached query results dependent on the elements affected by the event.
+
+        Cached results are invalidated even if the request fails, as the outcome of a failed request (e.g. timed out) may not be known.  If the request is appended to the event write-ahead log, cached results are invalidated when it's appended, and results are not cached until all logged requests have been replayed.
+
+        Args:
+            http_method:
+                The HTTP method of the request.
+            request_url:
+                The URL of the request.
+            cache_tags:
+                Tags identifying the elements affected by the event.
+        """
+        if (http_method == HTTPMethod.POST):
+            # Record added elements before sending, so they're never reported as not existing after the request succeeds
+            self._add_to_element_existence_filter(cache_tags)
+        try:
+            if (http_method == HTTPMethod.POST):
+                self._send_post_request(request_url)
+            else:
+                self._send_delete_request(request_url)
+        finally:
+            self._invalidate_cached_results(cache_tags)
+
+
+    def _send_event_request_immediately(self, http_method: HTTPMethod, request_url: str) -> None:
+        try:
+            super()._send_event_request_immediately(http_method, request_url)
+        finally:
+            # Called when replaying a request from the event write-ahead log, so prevent results of requests in flight before the AccessManager instance was changed from being cached
+            self._record_invalidation(None)
+
+
+    def _process_bulk_events(self, items: Iterable[Any], event_action: Callable[[Any], None], max_concurrency: int) -> BulkEventResult:
+        """Calls an event method for each of a set of items on a pool of worker threads, recording any failures.
+
+        The items are read lazily by the worker threads, so that large iterables aren't held in memory.
+
+        Args:
+            items:
+                The items.
+            event_action:
+                Action which calls the event method for an item.
+            max_concurrency:
+                The number of worker threads.
+
+        Returns:
+            The outcome of the events.
+        """
+        if (max_concurrency < 1):
+            raise ValueError("Parameter 'max_concurrency' with value {0} must be greater than or equal to 1.".format(max_concurrency))
+        item_iterator: Iterator[Tuple[int, Any]] = enumerate(items)
+        item_lock: threading.Lock = threading.Lock()
+        failures: List[BulkEventFailure] = []
+        item_count: List[int] = [ 0 ]
+
+        def process_items() -> None:
+            while (True):
+                with item_lock:
+                    next_item: Union[Tuple[int, Any], None] = next(item_iterator, None)
+                    if (next_item is None):
+                        return
+                    item_count[0] += 1
+                try:
+                    event_action(next_item[1])
+                except Exception as e:
+                    with item_lock:
+                        failures.append(BulkEventFailure(next_item[0], next_item[1], e))
+
+        with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="AccessManagerClientBulkEvent") as executor:
+            worker_futures = [ executor.submit(process_items) for i in range(max_concurrency) ]
+            for current_future in worker_futures:
+                # Propagate any exception raised reading the items
+                current_future.result()
+
+        return BulkEventResult(item_count[0], failures)
+
+
+    def _invalidate_cached_results(self, cache_tags: List[Tuple[str, ...]]) -> None:
+        """Invalidates any cached query results dependent on the elements identified by the specified tags.
+
+        Args:
+            cache_tags:
+                Tags identifying the elements affected by an event.
+        """
+        self._record_invalidation(cache_tags)
+        if (self._query_result_cache is not None):
+            self._query_result_cache.invalidate(cache_tags)
+        if (self._contains_negative_result_cache is not None):
+            self._contains_negative_result_cache.invalidate(cache_tags)
+        if (self._degraded_mode_result_cache is not None):
+            self._degraded_mode_result_cache.invalidate(cache_tags)
+
+
+    def _record_invalidation(self, cache_tags: Union[List[Tuple[str, ...]], None]) -> None:
+        """Records an invalidation, so that results of requests in flight at the time which depend on the invalidated elements are not stored in the caches.
+
+        Args:
+            cache_tags:
+                Tags identifying the invalidated elements, or None if all results were invalidated.
+        """
+        with self._invalidation_lock:
+            self._invalidation_sequence_number += 1
+            if (len(self._in_flight_request_counts) > 0):
+                self._recent_invalidations.append((self._invalidation_sequence_number, None if cache_tags is None else set(cache_tags)))
+
+
+    def _begin_cacheable_request(self) -> int:
+        """Records that a request whose result is to be cached is about to be sent.
+
+        Returns:
+            The current invalidation sequence number, to pass to _can_cache_result() and _end_cacheable_request().
+        """
+        with self._invalidation_lock:
+            sequence_number: int = self._invalidation_sequence_number
+            self._in_flight_request_counts[sequence_number] = self._in_flight_request_counts.get(sequence_number, 0) + 1
+
+        return sequence_number
+
+
+    def _can_cache_result(self, invalidation_sequence_number: int, cache_tags: List[Tuple[str, ...]]) -> bool:
+        """Checks whether the result of a request can be stored in the caches, i.e. that none of the elements it depends on were invalidated since the request was sent.  Must be called while holding '_invalidation_lock', which must also be held while storing the result.
+
+        Args:
+            invalidation_sequence_number:
+                The invalidation sequence number returned by _begin_cacheable_request() before sending the request.
+            cache_tags:
+                Tags identifying the elements the result depends on.
+
+        Returns:
+            Whether the result can be stored.
+        """
+        if (self._event_write_ahead_log is not None and self._event_write_ahead_log.backlog_size > 0):
+            # Logged events which haven't been replayed yet will change the AccessManager instance after the result was retrieved, and their tags are not known when they're replayed
+            return False
+        for current_sequence_number, current_tags in self._recent_invalidations:
+            if (current_sequence_number > invalidation_sequence_number and (current_tags is None or current_tags.isdisjoint(cache_tags) == False)):
+                return False
+
+        return True
+
+
+    def _end_cacheable_request(self, invalidation_sequence_number: int) -> None:
+        """Records that a request whose result is to be cached has completed, and discards recorded invalidations which can no longer affect requests in flight.
+
+        Args:
+            invalidation_sequence_number:
+                The invalidation sequence number returned by _begin_cacheable_request() before sending the request.
+        """
+        with self._invalidation_lock:
+            self._in_flight_request_counts[invalidation_sequence_number] -= 1
+            if (self._in_flight_request_counts[invalidation_sequence_number] == 0):
+                del self._in_flight_request_counts[invalidation_sequence_number]
+            if (len(self._in_flight_request_counts) == 0):
+                self._recent_invalidations.clear()
+            else:
+                oldest_sequence_number: int = min(self._in_flight_request_counts.keys())
+                while (len(self._recent_invalidations) > 0 and self._recent_invalidations[0][0] <= oldest_sequence_number):
+                    self._recent_invalidations.popleft()
+
+
+    def _send_filtered_contains_request(self, route: UrlRouteTemplate, components: Tuple[str, ...], element: Tuple[str, ...]) -> bool:
+        """Checks whether an element exists, answering from the element existence filter or the contains negative result cache where possible, otherwise sending an HTTP GET request.
+
+        Args:
+            route:
+                The route of the request.
+            components:
+                The (unencoded) URL components to build the request URL from.
+            element:
+                The element to check for, in the same form as its cache tag (e.g. ('user', 'user1')).
+
+        Returns:
+            Whether the element exists.
+        """
+        if (self._element_existence_filter is not None and self._element_existence_filter.might_contain(element) == False):
+            return False
+        cache_key: Tuple[str, ...] = (route.template, ) + components
+        if (self._contains_negative_result_cache is not None):
+            found, result = self._contains_negative_result_cache.try_get(cache_key)
+            if (found == True):
+                return False
+        if (self._contains_negative_result_cache is None):
+            return self._send_get_request_for_contains_method(route.build(*components))
+        invalidation_sequence_number: int = self._begin_cacheable_request()
+        try:
+            result = self._send_get_request_for_contains_method(route.build(*components))
+            if (result == False):
+                with self._invalidation_lock:
+                    if (self._can_cache_result(invalidation_sequence_number, [ element ]) == True):
+                        self._contains_negative_result_cache.set(cache_key, False, [ element ])
+        finally:
+            self._end_cacheable_request(invalidation_sequence_number)
+
+        return result
+
+
+    def _load_existing_elements(self) -> List[Tuple[str, ...]]:
+        """Retrieves all users, groups, entity types and entities from the AccessManager instance, in the same form as their cache tags.
+
+        Returns:
+            The elements.
+        """
+        elements: List[Tuple[str, ...]] = []
+        elements.extend(self._get_element_cache_tags(self._send_get_request(self._base_url + "users"), self._USER_JSON_NAME, self._USER_JSON_NAME))
+        elements.extend(self._get_element_cache_tags(self._send_get_request(self._base_url + "groups"), self._GROUP_JSON_NAME, self._GROUP_JSON_NAME))
+        entity_types: List[Tuple[str, ...]] = self._get_element_cache_tags(self._send_get_request(self._base_url + "entityTypes"), self._ENTITY_TYPE_JSON_NAME, self._ENTITY_TYPE_JSON_NAME)
+        elements.extend(entity_types)
+        for current_entity_type in entity_types:
+            raw_results = self._send_get_request(self._entities_route.build(current_entity_type[1]))
+            elements.extend(self._get_entity_cache_tags(raw_results, current_entity_type[1]))
+
+        return elements
+
+
+    def _get_user_event_cache_tags(self, user_string: str) -> List[Tuple[str, ...]]:
+        """Gets the cache tags of an event which adds or removes a user.
+
+        Args:
+            user_string:
+                The stringified user.
+
+        Returns:
+            The tags.
+        """
+        return [ (self._USER_JSON_NAME, user_string) ]
+
+
+    def _get_group_event_cache_tags(self, group_string: str) -> List[Tuple[str, ...]]:
+        """Gets the cache tags of an event which adds a group.
+
+        Args:
+            group_string:
+                The stringified group.
+
+        Returns:
+            The tags.
+        """
+        return [ (self._GROUP_JSON_NAME, group_string) ]
+
+
+    def _get_group_removal_cache_tags(self, group_string: str) -> List[Tuple[str, ...]]:
+        """Gets the cache tags of an event which removes a group (which also removes its mappings).
+
+        Args:
+            group_string:
+                The stringified group.
+
+        Returns:
+            The tags.
+        """
+        return [ (self._GROUP_JSON_NAME, group_string), (self._GROUP_MAPPINGS_CACHE_TAG_TYPE, group_string), (self._GROUP_ACCESS_CACHE_TAG_TYPE, group_string), self._GROUP_HIERARCHY_CACHE_TAG, self._UNRESOLVED_GROUP_DEPENDENCIES_CACHE_TAG ]
+
+
+    def _get_user_to_group_mapping_event_cache_tags(self, user_string: str, group_string: str) -> List[Tuple[str, ...]]:
+        """Gets the cache tags of an event which adds or removes a user to group mapping.
+
+        Args:
+            user_string:
+                The stringified user.
+            group_string:
+                The stringified group.
+
+        Returns:
+            The tags.
+        """
+        return [ (self._USER_JSON_NAME, user_string), (self._GROUP_JSON_NAME, group_string), self._GROUP_HIERARCHY_CACHE_TAG ]
+
+
+    def _get_group_to_group_mapping_event_cache_tags(self, from_group_string: str, to_group_string: str) -> List[Tuple[str, ...]]:
+        """Gets the cache tags of an event which adds or removes a group to group mapping.
+
+        Args:
+            from_group_string:
+                The stringified 'from' group.
+            to_group_string:
+                The stringified 'to' group.
+
+        Returns:
+            The tags.
+        """
+        return [ (self._GROUP_JSON_NAME, from_group_string), (self._GROUP_JSON_NAME, to_group_string), (self._GROUP_MAPPINGS_CACHE_TAG_TYPE, from_group_string), (self._GROUP_ACCESS_CACHE_TAG_TYPE, from_group_string), self._GROUP_HIERARCHY_CACHE_TAG, self._UNRESOLVED_GROUP_DEPENDENCIES_CACHE_TAG ]
+
+
+    def _get_user_to_application_component_and_access_level_mapping_event_cache_tags(self, user_string: str, application_component_string: str, access_level_string: str) -> List[Tuple[str, ...]]:
+        """Gets the cache tags of an event which adds or removes a user to application component and access level mapping.
+
+        Args:
+            user_string:
+                The stringified user.
+            application_component_string:
+                The stringified application component.
+            access_level_string:
+                The stringified access level.
+
+        Returns:
+            The tags.
+        """
+        return [ (self._USER_JSON_NAME, user_string), (self._APPLICATION_COMPONENT_JSON_NAME, application_component_string, access_level_string) ]
+
+
+    def _get_group_to_application_component_and_access_level_mapping_event_cache_tags(self, group_string: str, application_component_string: str, access_level_string: str) -> List[Tuple[str, ...]]:
+        """Gets the cache tags of an event which adds or removes a group to application component and access level mapping.
+
+        Args:
+            group_string:
+                The stringified group.
+            application_component_string:
+                The stringified application component.
+            access_level_string:
+                The stringified access level.
+
+        Returns:
+            The tags.
+        """
+        return [ (self._GROUP_JSON_NAME, group_string), (self._APPLICATION_COMPONENT_JSON_NAME, application_component_string, access_level_string), (self._GROUP_ACCESS_CACHE_TAG_TYPE, group_string), self._UNRESOLVED_GROUP_DEPENDENCIES_CACHE_TAG ]
+
+
+    def _get_entity_type_event_cache_tags(self, entity_type: str) -> List[Tuple[str, ...]]:
+        """Gets the cache tags of an event which adds or removes an entity type.
+
+        Args:
+            entity_type:
+                The entity type.
+
+        Returns:
+            The tags.
+        """
+        return [ (self._ENTITY_TYPE_JSON_NAME, entity_type) ]
+
+
+    def _get_entity_event_cache_tags(self, entity_type: str, entity: str) -> List[Tuple[str, ...]]:
+        """Gets the cache tags of an event which adds or removes an entity.
+
+        Args:
+            entity_type:
+                The type of the entity.
+            entity:
+                The entity.
+
+        Returns:
+            The tags.
+        """
+        return [ (self._ENTITY_JSON_NAME, entity_type, entity) ]
+
+
+    def _get_user_to_entity_mapping_event_cache_tags(self, user_string: str, entity_type: str, entity: str) -> List[Tuple[str, ...]]:
+        """Gets the cache tags of an event which adds or removes a user to entity mapping.
+
+        Args:
+            user_string:
+                The stringified user.
+            entity_type:
+                The type of the entity.
+            entity:
+                The entity.
+
+        Returns:
+            The tags.
+        """
+        return [ (self._USER_JSON_NAME, user_string), (self._ENTITY_JSON_NAME, entity_type, entity) ]
+
+
+    def _get_group_to_entity_mapping_event_cache_tags(self, group_string: str, entity_type: str, entity: str) -> List[Tuple[str, ...]]:
+        """Gets the cache tags of an event which adds or removes a group to entity mapping.
+
+        Args:
+            group_string:
+                The stringified group.
+            entity_type:
+                The type of the entity.
+            entity:
+                The entity.
+
+        Returns:
+            The tags.
+        """
+        return [ (self._GROUP_JSON_NAME, group_string), (self._ENTITY_JSON_NAME, entity_type, entity), (self._GROUP_ACCESS_CACHE_TAG_TYPE, group_string), self._UNRESOLVED_GROUP_DEPENDENCIES_CACHE_TAG ]
+
+
+    def _add_to_element_existence_filter(self, cache_tags: List[Tuple[str, ...]]) -> None:
+        """Records the elements which exist after an 'add_*' event in any element existence filter.
+
+        Args:
+            cache_tags:
+                The cache tags of the event.
+        """
+        if (self._element_existence_filter is not None):
+            for current_element in self._get_existing_elements_from_cache_tags(cache_tags):
+                self._element_existence_filter.add(current_element)
+
+
+    def _get_existing_elements_from_cache_tags(self, cache_tags: List[Tuple[str, ...]]) -> List[Tuple[str, ...]]:
+        """Gets the elements which exist after an 'add_*' event, from the cache tags of the event.
+
+        Args:
+            cache_tags:
+                The cache tags of the event.
+
+        Returns:
+            The elements, in the same form as their cache tags.
+        """
+        elements: List[Tuple[str, ...]] = []
+        for current_tag in cache_tags:
+            if (current_tag[0] == self._USER_JSON_NAME or current_tag[0] == self._GROUP_JSON_NAME or current_tag[0] == self._ENTITY_TYPE_JSON_NAME):
+                elements.append(current_tag)
+            elif (current_tag[0] == self._ENTITY_JSON_NAME):
+                elements.append((self._ENTITY_TYPE_JSON_NAME, current_tag[1]))
+                elements.append(current_tag)
+
+        return elements
+
+
+    def _get_indirect_mapping_cache_tags(self, include_indirect_mappings: bool) -> List[Tuple[str, ...]]:
+        """Gets the additional cache tags for a query result which lists the users or groups mapped to an element, and which includes mappings resolved through the group hierarchy.
+
+        Args:
+            include_indirect_mappings:
+                Whether the query includes indirect mappings.
+
+        Returns:
+            The tags.
+        """
+        if (include_indirect_mappings == True):
+            return [ self._GROUP_HIERARCHY_CACHE_TAG ]
+        else:
+            return []
+
+
+    def _get_user_group_dependency_cache_tags(self, user_string: str) -> List[Tuple[str, ...]]:
+        """Gets cache tags for the groups that a user is directly or indirectly mapped to, for a query result which depends on the mappings of those groups.
+
+        The groups are taken from the cached result of get_user_to_group_mappings() with indirect mappings included.  If that result is not cached, it is retrieved from the AccessManager instance if the client was constructed with 'track_group_dependencies' set, otherwise a tag indicating unresolved dependencies is returned.
+
+        Args:
+            user_string:
+                The stringified user.
+
+        Returns:
+            The tags.
+        """
+        return self._get_group_dependency_cache_tags(self._user_to_group_mappings_route, (self._USER_JSON_NAME, user_string), self._GROUP_JSON_NAME)
+
+
+    def _get_group_group_dependency_cache_tags(self, group_string: str) -> List[Tuple[str, ...]]:
+        """Gets cache tags for the groups that a group is directly or indirectly mapped to, for a query result which depends on the mappings of those groups.
+
+        The groups are taken from the cached result of get_group_to_group_mappings() with indirect mappings included.  If that result is not cached, it is retrieved from the AccessManager instance if the client was constructed with 'track_group_dependencies' set, otherwise a tag indicating unresolved dependencies is returned.
+
+        Args:
+            group_string:
+                The stringified group.
+
+        Returns:
+            The tags.
+        """
+        return self._get_group_dependency_cache_tags(self._group_to_group_mappings_route, (self._GROUP_MAPPINGS_CACHE_TAG_TYPE, group_string), self._TO_GROUP_JSON_NAME)
+
+
+    def _get_group_dependency_cache_tags(self, route: UrlRouteTemplate, element_tag: Tuple[str, ...], json_name: str) -> List[Tuple[str, ...]]:
+        """Gets cache tags for the application component and entity mappings of the groups that a user or group is directly or indirectly mapped to.
+
+        Args:
+            route:
+                The route of the query which returns the groups the element is directly and indirectly mapped to.
+            element_tag:
+                The tag of the query result for the user or group.
+            json_name:
+                The name of the property containing each group in the result of the query.
+
+        Returns:
+            The tags.
+        """
+        components: Tuple[str, ...] = (element_tag[1], self._bool_to_query_string_value(True))
+        found: bool = False
+        if (self._query_result_cache is not None):
+            found, cached_result = self._query_result_cache.try_peek((route.template, ) + components)
+        if (found == True and time.time() - cached_result[1] < self._stale_result_age):
+            raw_results = cached_result[0]
+        else:
+            if (self._track_group_dependencies == False):
+                return [ self._UNRESOLVED_GROUP_DEPENDENCIES_CACHE_TAG ]
+            try:
+                raw_results = self._send_cached_get_request(
+                    route, 
+                    components, 
+                    [ element_tag ], 
+                    lambda raw_results: self._get_element_cache_tags(raw_results, self._GROUP_MAPPINGS_CACHE_TAG_TYPE, json_name)
+                )
+            except Exception:
+                return [ self._UNRESOLVED_GROUP_DEPENDENCIES_CACHE_TAG ]
+
+        return self._get_element_cache_tags(raw_results, self._GROUP_ACCESS_CACHE_TAG_TYPE, json_name)
+
+
+    def _get_element_cache_tags(self, raw_results: Any, tag_type: str, json_name: str) -> List[Tuple[str, ...]]:
+        """Gets cache tags for the elements (e.g. users or groups) contained in a deserialized response body.
+
+        Args:
+            raw_results:
+                The deserialized response body, either a List of strings, or of Dicts containing the element in property 'json_name'.
+            tag_type:
+                The type of the elements, used as the first item of each tag.
+            json_name:
+                The name of the property containing the element, when the response body is a List of Dicts.
+
+        Returns:
+            The tags.
+        """
+        tags: List[Tuple[str, ...]] = []
+        if (isinstance(raw_results, List) == True):
+            for current_element in raw_results:
+                if (isinstance(current_element, str) == True):
+                    tags.append((tag_type, current_element))
+                elif (isinstance(current_element, dict) == True and isinstance(current_element.get(json_name), str) == True):
+                    tags.append((tag_type, current_element[json_name]))
+
+        return tags
+
+
+    def _get_entity_cache_tags(self, raw_results: Any, entity_type: Union[str, None]=None) -> List[Tuple[str, ...]]:
+        """Gets cache tags for the entities (and their types) contained in a deserialized response body.
+
+        Args:
+            raw_results:
+                The deserialized response body, either a List of Dicts containing entity type and entity properties, or of Dicts containing only an entity property or strings.
+            entity_type:
+                The type of the entities, when the response body contains only entities.
+
+        Returns:
+            The tags.
+        """
+        tags: List[Tuple[str, ...]] = []
+        if (isinstance(raw_results, List) == True):
+            for current_element in raw_results:
+                if (isinstance(current_element, str) == True and entity_type is not None):
+                    tags.append((self._ENTITY_TYPE_JSON_NAME, entity_type))
+                    tags.append((self._ENTITY_JSON_NAME, entity_type, current_element))
+                elif (isinstance(current_element, dict) == True):
+                    current_entity_type: Union[str, None] = current_element.get(self._ENTITY_TYPE_JSON_NAME, entity_type)
+                    current_entity: Union[str, None] = current_element.get(self._ENTITY_JSON_NAME)
+                    if (isinstance(current_entity_type, str) == True and isinstance(current_entity, str) == True):
+                        tags.append((self._ENTITY_TYPE_JSON_NAME, current_entity_type))
+                        tags.append((self._ENTITY_JSON_NAME, current_entity_type, current_entity))
+
+        return tags
+
+
+    def _bool_to_query_string_value(self, value: bool) -> str:
+        """Converts a boolean to its representation in a URL query string.
+
+        Args:
+            value:
+                The boolean to convert.
+
+        Returns:
+            The converted boolean ('true' or 'false').
+        """
+        if (value == True):
+            return "true"
+        else:
+            return "false"
+
+    #endregion
+
 
     __doc__ += AccessManagerEventProcessor.__doc__ # type: ignore
     __doc__ += AccessManagerQueryProcessor.__doc__ # type: ignore
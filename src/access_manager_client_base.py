@@ -1,10 +1,13 @@
-from typing import TypeVar, Generic, Dict, List, Callable, Union, Any
+from typing import TypeVar, Generic, Dict, List, Tuple, Callable, Union, Any
 from abc import ABC
+from collections import OrderedDict
+import threading
 import json
 from http import HTTPStatus
 import requests
 from requests import Response
 import urllib.parse
+import functools
 
 from exceptions.deserialization_error import DeserializationError
 from exceptions.not_found_error import NotFoundError
@@ -13,6 +16,12 @@ from http_method import HTTPMethod
 from http_error_response_json_serializer import HttpErrorResponseJsonSerializer
 from models.http_error_response import HttpErrorResponse
 from unique_stringifier_base import UniqueStringifierBase
+from response_body_decoder_base import ResponseBodyDecoderBase
+from json_response_body_decoder import JsonResponseBodyDecoder
+from url_route_template import UrlRouteTemplate
+from event_write_ahead_log import EventWriteAheadLog
+from request_concurrency_limiter import RequestConcurrencyLimiter
+from event_write_ahead_log_replayer import EventWriteAheadLogReplayer
 
 TUser = TypeVar("TUser")
 TGroup = TypeVar("TGroup")
@@ -45,7 +54,13 @@ class AccessManagerClientBase(Generic[TUser, TGroup, TComponent, TAccess], ABC):
             timeout=65536, 
             proxies=None, 
             verify=None, 
-            cert=None
+            cert=None, 
+            response_body_decoders: Union[List[ResponseBodyDecoderBase], None]=None, 
+            url_component_cache_size: int=4096, 
+            event_write_ahead_log: Union[EventWriteAheadLog, None]=None, 
+            event_write_ahead_log_retry_interval: float=5.0, 
+            request_concurrency_limiter: Union[RequestConcurrencyLimiter, None]=None, 
+            conditional_request_cache_size: int=0
         ) -> None:
         """Initialises a new instance of the AccessManagerClientBase class.
 
@@ -65,42 +80,93 @@ class AccessManagerClientBase(Generic[TUser, TGroup, TComponent, TAccess], ABC):
                 A string converter for access levels.  Used to convert strings sent to and received from the web API from/to TAccess instances.
             headers:
                 An optional Dict containing HTTP header neam/value pairs to send with each request to the AccessManager instance.
+            response_body_decoders:
+                An optional List of decoders for binary response body formats (e.g. MessagePack or CBOR), in order of preference.  The content types of the decoders are sent in the 'Accept' header of each request, with JSON always accepted as a fallback with the lowest preference.
+            url_component_cache_size:
+                The maximum number of encoded URL components (e.g. users, groups, entities) to retain in a least-recently-used cache, to avoid repeatedly encoding the same values.  Set to 0 to disable caching.
+            event_write_ahead_log:
+                An optional durable log to record event requests (i.e. calls to 'add_*' and 'remove_*' methods) in.  When set, event methods append their request to the log and return immediately, and a background thread replays the logged requests in order, retrying while the AccessManager instance is unavailable.  The close() method should be called to stop the background thread.
+            event_write_ahead_log_retry_interval:
+                The time in seconds to wait before retrying after replaying a request from parameter 'event_write_ahead_log' fails.
+            request_concurrency_limiter:
+                An optional limiter for the number of concurrent requests.  Requests which wait longer than the limiter's queue time budget for a concurrency slot are rejected with a QueueTimeBudgetExceededError, allowing callers to fall back rather than adding to the load on an overloaded AccessManager instance.
+            conditional_request_cache_size:
+                The maximum number of URLs (least recently used first) for which to retain the 'ETag' or 'Last-Modified' validator and deserialized body of the last successful GET response.  Subsequent GET requests to the URL are sent with an 'If-None-Match' or 'If-Modified-Since' header, and the retained body is reused if the AccessManager instance returns a 304 (not modified) status.  Set to 0 to disable conditional requests.
         """
         if (base_url[len(base_url) - 1] != "/"):
             raise ValueError("Parameter 'base_url' with value '{0}' must have a trailing forward slash character.".format(base_url))
 
+        if (url_component_cache_size < 0):
+            raise ValueError("Parameter 'url_component_cache_size' with value {0} must be greater than or equal to 0.".format(url_component_cache_size))
+        if (conditional_request_cache_size < 0):
+            raise ValueError("Parameter 'conditional_request_cache_size' with value {0} must be greater than or equal to 0.".format(conditional_request_cache_size))
+
         self._error_response_deserializer = HttpErrorResponseJsonSerializer()
+        self._cached_url_component_encoder: Callable[[str], str] = functools.lru_cache(maxsize=url_component_cache_size)(self._quote_url_component)
         self._initialize_base_url(base_url)
         self._user_stringifier = user_stringifier
         self._group_stringifier = group_stringifier
         self._application_component_stringifier = application_component_stringifier
         self._access_level_stringifier = access_level_stringifier
-        self._headers: Dict[str, str] = headers
-        self._headers["Accept"] = "application/json"
+        self._headers: Dict[str, str] = dict(headers)
+        self._initialize_response_body_decoders(response_body_decoders)
+        self._headers["Accept"] = self._accept_header_value
         self._auth = auth
         self._timeout = timeout
         self._proxies = proxies
         self._verify = verify
         self._cert = cert
+        self._request_concurrency_limiter: Union[RequestConcurrencyLimiter, None] = request_concurrency_limiter
+        self._conditional_request_cache_size: int = conditional_request_cache_size
+        self._conditional_request_cache_lock: threading.Lock = threading.Lock()
+        # Maps URLs to tuples containing the name and value of the conditional request header to send, and the deserialized body of the last successful response, ordered from least to most recently used
+        self._conditional_request_cache: OrderedDict[str, Tuple[str, str, Any]] = OrderedDict()
         self._initialize_status_code_to_exception_throwing_action_map()
+        self._event_write_ahead_log: Union[EventWriteAheadLog, None] = event_write_ahead_log
+        self._event_write_ahead_log_replayer: Union[EventWriteAheadLogReplayer, None] = None
+        if (event_write_ahead_log is not None):
+            self._event_write_ahead_log_replayer = EventWriteAheadLogReplayer(event_write_ahead_log, self._send_event_request_immediately, event_write_ahead_log_retry_interval)
+            self._event_write_ahead_log_replayer.start()
+
+
+    def close(self) -> None:
+        """Stops any background processing (e.g. replaying of requests from the event write-ahead log).  Requests which have not been replayed remain in the log, and are replayed when a new client is created with the same log.
+        """
+        if (self._event_write_ahead_log_replayer is not None):
+            self._event_write_ahead_log_replayer.stop()
+            self._event_write_ahead_log_replayer = None
 
 
     #region Private/Protected Methods
 
-    def _send_get_request(self, request_url: str) -> Union[str, List[str], Dict[str, Any]]:
-        """Sends an HTTP GET request, expecting a 200 status returned to indicate success, and attempting to deserialize the response body to a Dict containing JSON (e.g. created by json.loads()).
+    def _send_http_request(self, http_method: HTTPMethod, request_url: str, additional_headers: Union[Dict[str, str], None]=None) -> Response:
+        """Sends an HTTP request, waiting for a slot from the request concurrency limiter if one is configured.
 
         Args:
-            request_url: The URL of the request.
+            http_method:
+                The HTTP method of the request.
+            request_url:
+                The URL of the request.
+            additional_headers:
+                Optional headers to send with the request in addition to the client's headers.
 
         Returns:
-            The response body deserialized to a JSON-compatible type.
+            The response.
+
+        Raises:
+            QueueTimeBudgetExceededError: The request waited longer than the limiter's queue time budget for a concurrency slot.
         """
+        headers: Dict[str, str] = self._headers
+        if (additional_headers is not None):
+            headers = dict(self._headers)
+            headers.update(additional_headers)
+        if (self._request_concurrency_limiter is not None):
+            self._request_concurrency_limiter.acquire("Call to URL '{0}' with '{1}' method".format(request_url, str(http_method.name)))
         try:
-            response: Response = requests.request(
-                str(HTTPMethod.GET.name), 
+            return requests.request(
+                str(http_method.name), 
                 request_url, 
-                headers=self._headers, 
+                headers=headers, 
                 auth=self._auth, 
                 timeout=self._timeout, 
                 proxies=self._proxies, 
@@ -108,18 +174,77 @@ class AccessManagerClientBase(Generic[TUser, TGroup, TComponent, TAccess], ABC):
                 cert=self._cert
             )
         except Exception as exc:
-            raise Exception("Failed to call URL '{0}' with '{1}' method.".format(request_url, str(HTTPMethod.GET.name))) from exc
+            raise Exception("Failed to call URL '{0}' with '{1}' method.".format(request_url, str(http_method.name))) from exc
+        finally:
+            if (self._request_concurrency_limiter is not None):
+                self._request_concurrency_limiter.release()
+
+
+    def _send_get_request(self, request_url: str) -> Union[str, List[str], Dict[str, Any]]:
+        """Sends an HTTP GET request, expecting a 200 status returned to indicate success, and attempting to deserialize the response body to a Dict containing JSON (e.g. created by json.loads()).
+
+        If conditional requests are enabled and a previous response for the URL included an 'ETag' or 'Last-Modified' header, the request is sent with the corresponding 'If-None-Match' or 'If-Modified-Since' header, and the previously deserialized body is returned if a 304 status is received.  The returned object is then shared between calls, so should not be modified.
+
+        Args:
+            request_url: The URL of the request.
+
+        Returns:
+            The response body deserialized to a JSON-compatible type.
+        """
+        conditional_request_entry: Union[Tuple[str, str, Any], None] = None
+        if (self._conditional_request_cache_size > 0):
+            with self._conditional_request_cache_lock:
+                conditional_request_entry = self._conditional_request_cache.get(request_url)
+        if (conditional_request_entry is None):
+            response: Response = self._send_http_request(HTTPMethod.GET, request_url)
+        else:
+            response = self._send_http_request(HTTPMethod.GET, request_url, { conditional_request_entry[0]: conditional_request_entry[1] })
+            if (response.status_code == 304):
+                with self._conditional_request_cache_lock:
+                    if (request_url in self._conditional_request_cache):
+                        self._conditional_request_cache.move_to_end(request_url)
+
+                return conditional_request_entry[2]
 
         if (response.status_code != 200):
             self._handle_non_success_response_status(HTTPMethod.GET, request_url, HTTPStatus(response.status_code), response.text)
+        response_body_decoder: ResponseBodyDecoderBase = self._get_response_body_decoder(response)
         try:
-            response_json: Union[str, List[str], Dict[str, Any]] = response.json()
+            response_json: Union[str, List[str], Dict[str, Any]] = response_body_decoder.decode(response.content) # type: ignore[assignment]
         except Exception as exc:
-            raise Exception("Failed to call URL '{0}' with '{1}' method.  Error deserializing response body from JSON to Dict.".format(request_url, str(HTTPMethod.GET.name))) from exc
+            raise Exception("Failed to call URL '{0}' with '{1}' method.  Error deserializing response body with content type '{2}'.".format(request_url, str(HTTPMethod.GET.name), response_body_decoder.content_type)) from exc
+        if (self._conditional_request_cache_size > 0):
+            self._store_conditional_request_validator(request_url, response, response_json)
         
         return response_json
 
 
+    def _store_conditional_request_validator(self, request_url: str, response: Response, response_json: Any) -> None:
+        """Stores the validator ('ETag' or 'Last-Modified' header) and deserialized body of a successful GET response, for use in subsequent conditional requests to the same URL.
+
+        Args:
+            request_url:
+                The URL of the request.
+            response:
+                The response.
+            response_json:
+                The deserialized body of the response.
+        """
+        validator: Union[Tuple[str, str], None] = None
+        if ("ETag" in response.headers):
+            validator = ("If-None-Match", response.headers["ETag"])
+        elif ("Last-Modified" in response.headers):
+            validator = ("If-Modified-Since", response.headers["Last-Modified"])
+        with self._conditional_request_cache_lock:
+            if (validator is None):
+                self._conditional_request_cache.pop(request_url, None)
+            else:
+                self._conditional_request_cache[request_url] = (validator[0], validator[1], response_json)
+                self._conditional_request_cache.move_to_end(request_url)
+                if (len(self._conditional_request_cache) > self._conditional_request_cache_size):
+                    self._conditional_request_cache.popitem(last=False)
+
+
     def _send_get_request_for_contains_method(self, request_url: str) -> bool:
         """Sends an HTTP GET request, expecting either a 200 or 404 status returned, and converting the status to an equivalent boolean value.
 
@@ -130,19 +255,7 @@ class AccessManagerClientBase(Generic[TUser, TGroup, TComponent, TAccess], ABC):
             True in the case a 200 response status is received, or false in the case a 404 status is received.
         """
         return_value: bool = False
-        try:
-            response: Response = requests.request(
-                str(HTTPMethod.GET.name), 
-                request_url, 
-                headers=self._headers, 
-                auth=self._auth, 
-                timeout=self._timeout, 
-                proxies=self._proxies, 
-                verify=self._verify, 
-                cert=self._cert
-            )
-        except Exception as exc:
-            raise Exception("Failed to call URL '{0}' with '{1}' method.".format(request_url, str(HTTPMethod.GET.name))) from exc
+        response: Response = self._send_http_request(HTTPMethod.GET, request_url)
         if (not(response.status_code == 200 or response.status_code == 404)):
             self._handle_non_success_response_status(HTTPMethod.GET, request_url, HTTPStatus(response.status_code), response.text)
         if (response.status_code == 200):
@@ -152,53 +265,87 @@ class AccessManagerClientBase(Generic[TUser, TGroup, TComponent, TAccess], ABC):
     
 
     def _send_post_request(self, request_url: str) -> None:
+        """Sends an HTTP POST request, expecting a 201 status returned to indicate success, or appends the request to the event write-ahead log if one is configured.
+
+        Args:
+            request_url:
+                The URL of the request.
+        """
+        if (self._event_write_ahead_log is not None):
+            self._append_to_event_write_ahead_log(HTTPMethod.POST, request_url)
+        else:
+            self._send_post_request_immediately(request_url)
+
+
+    def _send_post_request_immediately(self, request_url: str) -> None:
         """Sends an HTTP POST request, expecting a 201 status returned to indicate success.
 
         Args:
             request_url:
                 The URL of the request.
         """
-        try:
-            response: Response = requests.request(
-                str(HTTPMethod.POST.name), 
-                request_url, 
-                headers=self._headers, 
-                auth=self._auth, 
-                timeout=self._timeout, 
-                proxies=self._proxies, 
-                verify=self._verify, 
-                cert=self._cert
-            )
-        except Exception as exc:
-            raise Exception("Failed to call URL '{0}' with '{1}' method.".format(request_url, str(HTTPMethod.POST.name))) from exc
+        response: Response = self._send_http_request(HTTPMethod.POST, request_url)
         if (response.status_code != 201):
             self._handle_non_success_response_status(HTTPMethod.POST, request_url, HTTPStatus(response.status_code), response.text)
     
 
     def _send_delete_request(self, request_url: str) -> None:
+        """Sends an HTTP DELETE request, expecting a 200 status returned to indicate success, or appends the request to the event write-ahead log if one is configured.
+
+        Args:
+            request_url:
+                The URL of the request.
+        """
+        if (self._event_write_ahead_log is not None):
+            self._append_to_event_write_ahead_log(HTTPMethod.DELETE, request_url)
+        else:
+            self._send_delete_request_immediately(request_url)
+
+
+    def _send_delete_request_immediately(self, request_url: str) -> None:
         """Sends an HTTP DELETE request, expecting a 200 status returned to indicate success.
 
         Args:
             request_url:
                 The URL of the request.
         """
-        try:
-            response: Response = requests.request(
-                str(HTTPMethod.DELETE.name), 
-                request_url, 
-                headers=self._headers, 
-                auth=self._auth, 
-                timeout=self._timeout, 
-                proxies=self._proxies, 
-                verify=self._verify, 
-                cert=self._cert
-            )
-        except Exception as exc:
-            raise Exception("Failed to call URL '{0}' with '{1}' method.".format(request_url, str(HTTPMethod.DELETE.name))) from exc
+        response: Response = self._send_http_request(HTTPMethod.DELETE, request_url)
         if (response.status_code != 200):
             self._handle_non_success_response_status(HTTPMethod.DELETE, request_url, HTTPStatus(response.status_code), response.text)
 
 
+    def _send_event_request_immediately(self, http_method: HTTPMethod, request_url: str) -> None:
+        """Sends an HTTP POST or DELETE request representing an event, bypassing the event write-ahead log.
+
+        Args:
+            http_method:
+                The HTTP method of the request.
+            request_url:
+                The URL of the request.
+        """
+        if (http_method == HTTPMethod.POST):
+            self._send_post_request_immediately(request_url)
+        elif (http_method == HTTPMethod.DELETE):
+            self._send_delete_request_immediately(request_url)
+        else:
+            raise ValueError("Parameter 'http_method' with value '{0}' is not an event request method.".format(http_method.name))
+
+
+    def _append_to_event_write_ahead_log(self, http_method: HTTPMethod, request_url: str) -> None:
+        """Appends an event request to the event write-ahead log, and notifies the replayer.
+
+        Args:
+            http_method:
+                The HTTP method of the request.
+            request_url:
+                The URL of the request.
+        """
+        assert self._event_write_ahead_log is not None
+        self._event_write_ahead_log.append(http_method, request_url)
+        if (self._event_write_ahead_log_replayer is not None):
+            self._event_write_ahead_log_replayer.notify_requests_appended()
+
+
     def _initialize_base_url(self, base_url: str) -> None:
         """Adds an appropriate path suffix to the specified 'base_url' constructor parameter.
 
@@ -209,6 +356,54 @@ class AccessManagerClientBase(Generic[TUser, TGroup, TComponent, TAccess], ABC):
         self._base_url: str = base_url + "api/v1/"
 
 
+    def _initialize_response_body_decoders(self, response_body_decoders: Union[List[ResponseBodyDecoderBase], None]) -> None:
+        """Initializes the '_response_body_decoders' and '_accept_header_value' members.
+
+        Args:
+            response_body_decoders:
+                The decoders for binary response body formats in order of preference, or None if only JSON should be accepted.
+        """
+        self._json_response_body_decoder: ResponseBodyDecoderBase = JsonResponseBodyDecoder()
+        self._response_body_decoders: Dict[str, ResponseBodyDecoderBase] = dict()
+        accepted_content_types: List[str] = []
+        if (response_body_decoders is not None):
+            for current_decoder in response_body_decoders:
+                if (current_decoder.content_type in self._response_body_decoders):
+                    raise ValueError("Parameter 'response_body_decoders' contains multiple decoders for content type '{0}'.".format(current_decoder.content_type))
+                self._response_body_decoders[current_decoder.content_type] = current_decoder
+                accepted_content_types.append(current_decoder.content_type)
+        if (self._json_response_body_decoder.content_type not in self._response_body_decoders):
+            self._response_body_decoders[self._json_response_body_decoder.content_type] = self._json_response_body_decoder
+            accepted_content_types.append(self._json_response_body_decoder.content_type)
+
+        # Build an 'Accept' header value with decreasing quality values, e.g. 'application/msgpack, application/json;q=0.9'
+        accept_header_parts: List[str] = []
+        for index, current_content_type in enumerate(accepted_content_types):
+            if (index == 0):
+                accept_header_parts.append(current_content_type)
+            else:
+                accept_header_parts.append("{0};q={1}".format(current_content_type, round(max(1.0 - (0.1 * index), 0.1), 1)))
+        self._accept_header_value: str = ", ".join(accept_header_parts)
+
+
+    def _get_response_body_decoder(self, response: Response) -> ResponseBodyDecoderBase:
+        """Gets the decoder for the body of the specified response, based on its 'Content-Type' header.
+
+        Args:
+            response:
+                The response to get the decoder for.
+
+        Returns:
+            The decoder matching the response content type, or the JSON decoder if the content type is missing or was not requested.
+        """
+        content_type: str = response.headers.get("Content-Type", "")
+        media_type: str = content_type.split(";", 1)[0].strip().lower()
+        if (media_type in self._response_body_decoders):
+            return self._response_body_decoders[media_type]
+        else:
+            return self._json_response_body_decoder
+
+
     def _initialize_status_code_to_exception_throwing_action_map(self) -> None:
         """Initializes the '_status_code_to_exception_throwing_action_map' member.
         """
@@ -218,9 +413,35 @@ class AccessManagerClientBase(Generic[TUser, TGroup, TComponent, TAccess], ABC):
         self._status_code_to_exception_throwing_action_map[HTTPStatus.NOT_FOUND] = self._not_found_exception_throwing_action
 
 
+    def _create_url_route_template(self, template: str) -> UrlRouteTemplate:
+        """Creates a UrlRouteTemplate relative to the base URL, which encodes components using the cache of encoded URL components.
+
+        Args:
+            template:
+                The route template, e.g. 'users/{0}'.
+
+        Returns:
+            The precompiled route template.
+        """
+        return UrlRouteTemplate(self._base_url, template, self._cached_url_component_encoder)
+
+
     def _encode_url_component(self, component: str) -> str:
         """Encodes the specified string for use in a URL.
         
+        Args:
+            component:
+                The string to encode.
+
+        Returns:
+            The encoded string.
+        """
+        return self._cached_url_component_encoder(component)
+
+
+    def _quote_url_component(self, component: str) -> str:
+        """Encodes the specified string for use in a URL, bypassing the cache of encoded URL components.
+        
         Args:
             component:
                 The string to encode.
@@ -0,0 +1,418 @@
+from typing import TypeVar, Iterable, Generic, Set, Tuple, List, Callable, Union
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+from unique_stringifier_base import UniqueStringifierBase
+from access_manager_query_processor import AccessManagerQueryProcessor
+from access_graph import AccessGraph
+
+TUser = TypeVar("TUser")
+TGroup = TypeVar("TGroup")
+TComponent = TypeVar("TComponent")
+TAccess = TypeVar("TAccess")
+
+class AccessManagerLocalReplica(AccessManagerQueryProcessor[TUser, TGroup, TComponent, TAccess], Generic[TUser, TGroup, TComponent, TAccess]):
+    """Thread-safe in-memory copy of the elements and mappings in an AccessManager instance, which answers queries locally without network requests.
+
+    The replica is loaded (and fully reloaded) by calling refresh(), which retrieves the elements and mappings through the query methods of a source AccessManagerQueryProcessor (e.g. an AccessManagerClient), and stores them in an AccessGraph indexed in both directions.  Indirect mappings (e.g. for the 'has_access_*' methods) are resolved locally by traversing the group to group mappings.  Changes made in the AccessManager instance after a refresh are not reflected until the next refresh (or until they are applied via update(), e.g. by a ChangeFeedSynchronizer), and the 'staleness' property reports the time since the replica was last known to be current.
+
+    Generic Paramters:
+        TUser:
+            The type of users in the application.
+        TGroup:
+            The type of groups in the application.
+        TComponent:
+            The type of components in the application to manage access to.
+        TAccess:
+            The type of levels of access which can be assigned to an application component.
+
+    Attributes:
+        users:
+            Returns a collection of all users in the replica.
+        groups:
+            Returns a collection of all groups in the replica.
+        entity_types:
+            Returns a collection of all entity types in the replica.
+        is_loaded:
+            Whether the replica has been loaded.
+        staleness:
+            The time in seconds since the replica was last known to be current (i.e. since the last refresh or update), or None if the replica has not been loaded.
+        refresh_count:
+            The number of times the replica was successfully refreshed.
+    """
+
+    @property
+    def users(self) -> Iterable[TUser]:
+        with self._lock:
+            return self._convert_users(self._get_graph().users)
+
+    @property
+    def groups(self) -> Iterable[TGroup]:
+        with self._lock:
+            return self._convert_groups(self._get_graph().groups)
+
+    @property
+    def entity_types(self) -> Iterable[str]:
+        with self._lock:
+            return self._get_graph().entity_types
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the replica has been loaded."""
+        return self._graph is not None
+
+    @property
+    def staleness(self) -> Union[float, None]:
+        """The time in seconds since the replica was last known to be current (i.e. since the last refresh or update), or None if the replica has not been loaded."""
+        last_update_time: Union[float, None] = self._last_update_time
+        if (last_update_time is None):
+            return None
+        else:
+            return time.monotonic() - last_update_time
+
+    @property
+    def refresh_count(self) -> int:
+        """The number of times the replica was successfully refreshed."""
+        return self._refresh_count
+
+    def __init__(
+            self, 
+            source: AccessManagerQueryProcessor[TUser, TGroup, TComponent, TAccess], 
+            user_stringifier: UniqueStringifierBase[TUser], 
+            group_stringifier: UniqueStringifierBase[TGroup], 
+            application_component_stringifier: UniqueStringifierBase[TComponent], 
+            access_level_stringifier: UniqueStringifierBase[TAccess], 
+            load_concurrency: int=1
+        ) -> None:
+        """Initialises a new instance of the AccessManagerLocalReplica class.
+
+        The replica is empty until refresh() is called, and query methods raise a RuntimeError until then.
+
+        Args:
+            source:
+                The query processor (e.g. an AccessManagerClient) to load the elements and mappings from.
+            user_stringifier:
+                A string converter for users.
+            group_stringifier:
+                A string converter for groups.
+            application_component_stringifier:
+                A string converter for application components.
+            access_level_stringifier:
+                A string converter for access levels.
+            load_concurrency:
+                The number of threads to use to retrieve the mappings of each user, group and entity type from the source during refresh().
+        """
+        if (load_concurrency < 1):
+            raise ValueError("Parameter 'load_concurrency' with value {0} must be greater than or equal to 1.".format(load_concurrency))
+
+        self._source: AccessManagerQueryProcessor[TUser, TGroup, TComponent, TAccess] = source
+        self._user_stringifier: UniqueStringifierBase[TUser] = user_stringifier
+        self._group_stringifier: UniqueStringifierBase[TGroup] = group_stringifier
+        self._application_component_stringifier: UniqueStringifierBase[TComponent] = application_component_stringifier
+        self._access_level_stringifier: UniqueStringifierBase[TAccess] = access_level_stringifier
+        self._load_concurrency: int = load_concurrency
+        self._lock: threading.RLock = threading.RLock()
+        # Serializes refreshes, so that concurrent calls to refresh() don't load in parallel
+        self._refresh_lock: threading.Lock = threading.Lock()
+        self._graph: Union[AccessGraph, None] = None
+        self._last_update_time: Union[float, None] = None
+        self._refresh_count: int = 0
+
+    def refresh(self) -> None:
+        """Fully reloads the replica from the source.  Queries continue to be answered from the existing data until loading completes.
+        """
+        with self._refresh_lock:
+            refresh_start_time: float = time.monotonic()
+            new_graph: AccessGraph = self._load_graph()
+            with self._lock:
+                self._graph = new_graph
+                self._last_update_time = refresh_start_time
+                self._refresh_count += 1
+
+    def update(self, update_action: Callable[[AccessGraph], None]) -> None:
+        """Applies incremental changes to the replica (e.g. from a change feed), and marks the replica as current.
+
+        Args:
+            update_action:
+                Action which modifies the underlying graph, and which is executed while no queries are being answered.
+        """
+        with self._lock:
+            update_action(self._get_graph())
+            self._last_update_time = time.monotonic()
+
+    def load(self, graph: AccessGraph, age: float=0.0) -> None:
+        """Replaces the contents of the replica with an already loaded graph (e.g. read from a snapshot file).
+
+        Args:
+            graph:
+                The graph.
+            age:
+                The time in seconds since the graph was last known to be current, used to set the 'staleness' property.
+        """
+        with self._lock:
+            self._graph = graph
+            self._last_update_time = time.monotonic() - age
+
+    def read(self, read_action: Callable[[AccessGraph], None]) -> None:
+        """Reads the underlying graph consistently (e.g. to write a snapshot), while no changes are being applied.
+
+        Args:
+            read_action:
+                Action which reads the graph.  The action must not modify the graph.
+        """
+        with self._lock:
+            read_action(self._get_graph())
+
+    def contains_user(self, user: TUser) -> bool:
+        with self._lock:
+            return self._get_graph().contains_user(self._user_stringifier.to_string(user))
+
+    def contains_group(self, group: TGroup) -> bool:
+        with self._lock:
+            return self._get_graph().contains_group(self._group_stringifier.to_string(group))
+
+    def get_user_to_group_mappings(self, user: TUser, include_indirect_mappings: bool) -> Iterable[TGroup]:
+        with self._lock:
+            return self._convert_groups(self._get_graph().get_user_to_group_mappings(self._user_stringifier.to_string(user), include_indirect_mappings))
+
+    def get_group_to_user_mappings(self, group: TGroup, include_indirect_mappings: bool) -> Iterable[TUser]:
+        with self._lock:
+            return self._convert_users(self._get_graph().get_group_to_user_mappings(self._group_stringifier.to_string(group), include_indirect_mappings))
+
+    def get_group_to_group_mappings(self, group: TGroup, include_indirect_mappings: bool) -> Iterable[TGroup]:
+        with self._lock:
+            return self._convert_groups(self._get_graph().get_group_to_group_mappings(self._group_stringifier.to_string(group), include_indirect_mappings))
+
+    def get_group_to_group_reverse_mappings(self, group: TGroup, include_indirect_mappings: bool) -> Iterable[TGroup]:
+        with self._lock:
+            return self._convert_groups(self._get_graph().get_group_to_group_reverse_mappings(self._group_stringifier.to_string(group), include_indirect_mappings))
+
+    def get_user_to_application_component_and_access_level_mappings(self, user: TUser) -> Iterable[Tuple[TComponent, TAccess]]:
+        with self._lock:
+            return self._convert_application_components(self._get_graph().get_user_to_application_component_and_access_level_mappings(self._user_stringifier.to_string(user)))
+
+    def get_application_component_and_access_level_to_user_mappings(self, application_component: TComponent, accesss_level: TAccess, include_indirect_mappings: bool) -> Iterable[TUser]:
+        with self._lock:
+            return self._convert_users(self._get_graph().get_application_component_and_access_level_to_user_mappings(
+                self._application_component_stringifier.to_string(application_component), 
+                self._access_level_stringifier.to_string(accesss_level), 
+                include_indirect_mappings
+            ))
+
+    def get_group_to_application_component_and_access_level_mappings(self, group: TGroup) -> Iterable[Tuple[TComponent, TAccess]]:
+        with self._lock:
+            return self._convert_application_components(self._get_graph().get_group_to_application_component_and_access_level_mappings(self._group_stringifier.to_string(group)))
+
+    def get_application_component_and_access_level_to_group_mappings(self, application_component: TComponent, accesss_level: TAccess, include_indirect_mappings: bool) -> Iterable[TGroup]:
+        with self._lock:
+            return self._convert_groups(self._get_graph().get_application_component_and_access_level_to_group_mappings(
+                self._application_component_stringifier.to_string(application_component), 
+                self._access_level_stringifier.to_string(accesss_level), 
+                include_indirect_mappings
+            ))
+
+    def contains_entity_type(self, entity_type: str) -> bool:
+        with self._lock:
+            return self._get_graph().contains_entity_type(entity_type)
+
+    def get_entities(self, entity_type: str) -> Iterable[str]:
+        with self._lock:
+            return self._get_graph().get_entities(entity_type)
+
+    def contains_entity(self, entity_type: str, entity: str) -> bool:
+        with self._lock:
+            return self._get_graph().contains_entity(entity_type, entity)
+
+    def get_user_to_entity_mappings(self, user: TUser) -> Iterable[Tuple[str, str]]:
+        with self._lock:
+            return self._get_graph().get_user_to_entity_mappings(self._user_stringifier.to_string(user))
+
+    def get_user_to_entity_mappings_for_type(self, user: TUser, entity_type: str) -> Iterable[str]:
+        with self._lock:
+            return self._get_graph().get_user_to_entity_mappings_for_type(self._user_stringifier.to_string(user), entity_type)
+
+    def get_entity_to_user_mappings(self, entity_type: str, entity: str, include_indirect_mappings: bool) -> Iterable[TUser]:
+        with self._lock:
+            return self._convert_users(self._get_graph().get_entity_to_user_mappings(entity_type, entity, include_indirect_mappings))
+
+    def get_group_to_entity_mappings(self, group: TGroup) -> Iterable[Tuple[str, str]]:
+        with self._lock:
+            return self._get_graph().get_group_to_entity_mappings(self._group_stringifier.to_string(group))
+
+    def get_group_to_entity_mappings_for_type(self, group: TGroup, entity_type: str) -> Iterable[str]:
+        with self._lock:
+            return self._get_graph().get_group_to_entity_mappings_for_type(self._group_stringifier.to_string(group), entity_type)
+
+    def get_entity_to_group_mappings(self, entity_type: str, entity: str, include_indirect_mappings: bool) -> Iterable[TGroup]:
+        with self._lock:
+            return self._convert_groups(self._get_graph().get_entity_to_group_mappings(entity_type, entity, include_indirect_mappings))
+
+    def has_access_to_application_component(self, user: TUser, application_component: TComponent, access_level: TAccess) -> bool:
+        with self._lock:
+            return self._get_graph().has_access_to_application_component(
+                self._user_stringifier.to_string(user), 
+                self._application_component_stringifier.to_string(application_component), 
+                self._access_level_stringifier.to_string(access_level)
+            )
+
+    def has_access_to_entity(self, user: TUser, entity_type: str, entity: str) -> bool:
+        with self._lock:
+            return self._get_graph().has_access_to_entity(self._user_stringifier.to_string(user), entity_type, entity)
+
+    def get_application_components_accesible_by_user(self, user: TUser) -> Set[Tuple[TComponent, TAccess]]:
+        with self._lock:
+            return set(self._convert_application_components(self._get_graph().get_application_components_accesible_by_user(self._user_stringifier.to_string(user))))
+
+    def get_application_components_accesible_by_group(self, group: TGroup) -> Set[Tuple[TComponent, TAccess]]:
+        with self._lock:
+            return set(self._convert_application_components(self._get_graph().get_application_components_accesible_by_group(self._group_stringifier.to_string(group))))
+
+    def get_entities_accessible_by_user(self, user: TUser) -> Set[Tuple[str, str]]:
+        with self._lock:
+            return self._get_graph().get_entities_accessible_by_user(self._user_stringifier.to_string(user))
+
+    def get_entities_of_type_accessible_by_user(self, user: TUser, entity_type: str) -> Set[str]:
+        with self._lock:
+            return self._get_graph().get_entities_of_type_accessible_by_user(self._user_stringifier.to_string(user), entity_type)
+
+    def get_entities_accessible_by_group(self, group: TGroup) -> Set[Tuple[str, str]]:
+        with self._lock:
+            return self._get_graph().get_entities_accessible_by_group(self._group_stringifier.to_string(group))
+
+    def get_entities_of_type_accessible_by_group(self, group: TGroup, entity_type: str) -> Set[str]:
+        with self._lock:
+            return self._get_graph().get_entities_of_type_accessible_by_group(self._group_stringifier.to_string(group), entity_type)
+
+    #region Private/Protected Methods
+
+    def _get_graph(self) -> AccessGraph:
+        if (self._graph is None):
+            raise RuntimeError("The replica has not been loaded.  Call refresh() to load it.")
+
+        return self._graph
+
+    def _load_graph(self) -> AccessGraph:
+        """Retrieves all elements and mappings from the source into a new AccessGraph.
+
+        Returns:
+            The graph.
+        """
+        graph: AccessGraph = AccessGraph()
+        users: List[TUser] = list(self._source.users)
+        groups: List[TGroup] = list(self._source.groups)
+        entity_types: List[str] = list(self._source.entity_types)
+        # Retrieve the mappings of each element concurrently, but add them to the graph on this thread, as AccessGraph is not thread-safe
+        load_actions: List[Callable[[], Callable[[AccessGraph], None]]] = []
+        load_actions.extend([ self._create_user_load_action(current_user) for current_user in users ])
+        load_actions.extend([ self._create_group_load_action(current_group) for current_group in groups ])
+        load_actions.extend([ self._create_entity_type_load_action(current_entity_type) for current_entity_type in entity_types ])
+        if (self._load_concurrency == 1):
+            for current_load_action in load_actions:
+                current_load_action()(graph)
+        else:
+            with ThreadPoolExecutor(max_workers=self._load_concurrency) as executor:
+                for current_apply_action in executor.map(lambda load_action: load_action(), load_actions):
+                    current_apply_action(graph)
+
+        return graph
+
+    def _create_user_load_action(self, user: TUser) -> Callable[[], Callable[[AccessGraph], None]]:
+        """Creates a function which retrieves the mappings of a user from the source, and returns an action which adds the user and mappings to a graph.
+
+        Args:
+            user:
+                The user.
+
+        Returns:
+            The function.
+        """
+        def load() -> Callable[[AccessGraph], None]:
+            user_string: str = self._user_stringifier.to_string(user)
+            groups: List[str] = [ self._group_stringifier.to_string(current_group) for current_group in self._source.get_user_to_group_mappings(user, False) ]
+            application_components: List[Tuple[str, str]] = self._stringify_application_components(self._source.get_user_to_application_component_and_access_level_mappings(user))
+            entities: List[Tuple[str, str]] = list(self._source.get_user_to_entity_mappings(user))
+
+            def apply(graph: AccessGraph) -> None:
+                graph.add_user(user_string)
+                for current_group in groups:
+                    graph.add_user_to_group_mapping(user_string, current_group)
+                for current_application_component, current_access_level in application_components:
+                    graph.add_user_to_application_component_and_access_level_mapping(user_string, current_application_component, current_access_level)
+                for current_entity_type, current_entity in entities:
+                    graph.add_user_to_entity_mapping(user_string, current_entity_type, current_entity)
+
+            return apply
+
+        return load
+
+    def _create_group_load_action(self, group: TGroup) -> Callable[[], Callable[[AccessGraph], None]]:
+        """Creates a function which retrieves the mappings of a group from the source, and returns an action which adds the group and mappings to a graph.
+
+        Args:
+            group:
+                The group.
+
+        Returns:
+            The function.
+        """
+        def load() -> Callable[[AccessGraph], None]:
+            group_string: str = self._group_stringifier.to_string(group)
+            to_groups: List[str] = [ self._group_stringifier.to_string(current_group) for current_group in self._source.get_group_to_group_mappings(group, False) ]
+            application_components: List[Tuple[str, str]] = self._stringify_application_components(self._source.get_group_to_application_component_and_access_level_mappings(group))
+            entities: List[Tuple[str, str]] = list(self._source.get_group_to_entity_mappings(group))
+
+            def apply(graph: AccessGraph) -> None:
+                graph.add_group(group_string)
+                for current_to_group in to_groups:
+                    graph.add_group_to_group_mapping(group_string, current_to_group)
+                for current_application_component, current_access_level in application_components:
+                    graph.add_group_to_application_component_and_access_level_mapping(group_string, current_application_component, current_access_level)
+                for current_entity_type, current_entity in entities:
+                    graph.add_group_to_entity_mapping(group_string, current_entity_type, current_entity)
+
+            return apply
+
+        return load
+
+    def _create_entity_type_load_action(self, entity_type: str) -> Callable[[], Callable[[AccessGraph], None]]:
+        """Creates a function which retrieves the entities of an entity type from the source, and returns an action which adds the entity type and entities to a graph.
+
+        Args:
+            entity_type:
+                The entity type.
+
+        Returns:
+            The function.
+        """
+        def load() -> Callable[[AccessGraph], None]:
+            entities: List[str] = list(self._source.get_entities(entity_type))
+
+            def apply(graph: AccessGraph) -> None:
+                graph.add_entity_type(entity_type)
+                for current_entity in entities:
+                    graph.add_entity(entity_type, current_entity)
+
+            return apply
+
+        return load
+
+    def _stringify_application_components(self, application_components: Iterable[Tuple[TComponent, TAccess]]) -> List[Tuple[str, str]]:
+        return [
+            (self._application_component_stringifier.to_string(current_application_component), self._access_level_stringifier.to_string(current_access_level))
+            for current_application_component, current_access_level in application_components
+        ]
+
+    def _convert_users(self, users: Iterable[str]) -> List[TUser]:
+        return [ self._user_stringifier.from_string(current_user) for current_user in users ]
+
+    def _convert_groups(self, groups: Iterable[str]) -> List[TGroup]:
+        return [ self._group_stringifier.from_string(current_group) for current_group in groups ]
+
+    def _convert_application_components(self, application_components: Iterable[Tuple[str, str]]) -> List[Tuple[TComponent, TAccess]]:
+        return [
+            (self._application_component_stringifier.from_string(current_application_component), self._access_level_stringifier.from_string(current_access_level))
+            for current_application_component, current_access_level in application_components
+        ]
+
+    #endregion
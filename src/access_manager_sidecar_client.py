@@ -0,0 +1,332 @@
+from typing import TypeVar, Iterable, Generic, Set, Tuple, List, Dict, Any, Union
+import socket
+import threading
+
+from unique_stringifier_base import UniqueStringifierBase
+from access_manager_query_processor import AccessManagerQueryProcessor
+from sidecar_message_serializer import SidecarMessageSerializer
+
+TUser = TypeVar("TUser")
+TGroup = TypeVar("TGroup")
+TComponent = TypeVar("TComponent")
+TAccess = TypeVar("TAccess")
+
+class AccessManagerSidecarClient(AccessManagerQueryProcessor[TUser, TGroup, TComponent, TAccess], Generic[TUser, TGroup, TComponent, TAccess]):
+    """Thread-safe client which answers queries via an AccessManagerSidecarServer running on the same host, over a Unix domain socket.
+
+    The client holds a single connection to the server, which is opened on first use, and reopened on the next query if it fails.  Queries from multiple threads are sent one at a time over the connection.  Multiple queries can be sent in a single request message via execute_batch().
+
+    Generic Paramters:
+        TUser:
+            The type of users in the application.
+        TGroup:
+            The type of groups in the application.
+        TComponent:
+            The type of components in the application to manage access to.
+        TAccess:
+            The type of levels of access which can be assigned to an application component.
+
+    Attributes:
+        users:
+            Returns a collection of all users in the access manager.
+        groups:
+            Returns a collection of all groups in the access manager.
+        entity_types:
+            Returns a collection of all entity types in the access manager.
+    """
+
+    # Maps the name of each query method or property to the types of its parameters and the type of its result
+    _QUERY_TYPES: Dict[str, Tuple[Tuple[str, ...], str]] = {
+        "users": ((), "users"),
+        "groups": ((), "groups"),
+        "entity_types": ((), "strings"),
+        "contains_user": (("user", ), "bool"),
+        "contains_group": (("group", ), "bool"),
+        "get_user_to_group_mappings": (("user", "bool"), "groups"),
+        "get_group_to_user_mappings": (("group", "bool"), "users"),
+        "get_group_to_group_mappings": (("group", "bool"), "groups"),
+        "get_group_to_group_reverse_mappings": (("group", "bool"), "groups"),
+        "get_user_to_application_component_and_access_level_mappings": (("user", ), "application_components"),
+        "get_application_component_and_access_level_to_user_mappings": (("application_component", "access_level", "bool"), "users"),
+        "get_group_to_application_component_and_access_level_mappings": (("group", ), "application_components"),
+        "get_application_component_and_access_level_to_group_mappings": (("application_component", "access_level", "bool"), "groups"),
+        "contains_entity_type": (("str", ), "bool"),
+        "get_entities": (("str", ), "strings"),
+        "contains_entity": (("str", "str"), "bool"),
+        "get_user_to_entity_mappings": (("user", ), "entities"),
+        "get_user_to_entity_mappings_for_type": (("user", "str"), "strings"),
+        "get_entity_to_user_mappings": (("str", "str", "bool"), "users"),
+        "get_group_to_entity_mappings": (("group", ), "entities"),
+        "get_group_to_entity_mappings_for_type": (("group", "str"), "strings"),
+        "get_entity_to_group_mappings": (("str", "str", "bool"), "groups"),
+        "has_access_to_application_component": (("user", "application_component", "access_level"), "bool"),
+        "has_access_to_entity": (("user", "str", "str"), "bool"),
+        "get_application_components_accesible_by_user": (("user", ), "application_component_set"),
+        "get_application_components_accesible_by_group": (("group", ), "application_component_set"),
+        "get_entities_accessible_by_user": (("user", ), "entity_set"),
+        "get_entities_of_type_accessible_by_user": (("user", "str"), "string_set"),
+        "get_entities_accessible_by_group": (("group", ), "entity_set"),
+        "get_entities_of_type_accessible_by_group": (("group", "str"), "string_set")
+    }
+
+    @property
+    def users(self) -> Iterable[TUser]:
+        return self._execute_query("users")
+
+    @property
+    def groups(self) -> Iterable[TGroup]:
+        return self._execute_query("groups")
+
+    @property
+    def entity_types(self) -> Iterable[str]:
+        return self._execute_query("entity_types")
+
+    def __init__(
+            self,
+            socket_path: str,
+            user_stringifier: UniqueStringifierBase[TUser],
+            group_stringifier: UniqueStringifierBase[TGroup],
+            application_component_stringifier: UniqueStringifierBase[TComponent],
+            access_level_stringifier: UniqueStringifierBase[TAccess],
+            timeout: Union[float, None]=None,
+            max_message_size: int=16777216
+        ) -> None:
+        """Initialises a new instance of the AccessManagerSidecarClient class.
+
+        Args:
+            socket_path:
+                The path of the Unix domain socket the AccessManagerSidecarServer listens on.
+            user_stringifier:
+                A string converter for users.
+            group_stringifier:
+                A string converter for groups.
+            application_component_stringifier:
+                A string converter for application components.
+            access_level_stringifier:
+                A string converter for access levels.
+            timeout:
+                The time in seconds to wait for the server to respond, or None to wait indefinitely.
+            max_message_size:
+                The maximum size in bytes of a response message.
+        """
+        self._socket_path: str = socket_path
+        self._stringifiers: Dict[str, UniqueStringifierBase[Any]] = {
+            "user": user_stringifier,
+            "group": group_stringifier,
+            "application_component": application_component_stringifier,
+            "access_level": access_level_stringifier
+        }
+        self._timeout: Union[float, None] = timeout
+        self._serializer: SidecarMessageSerializer = SidecarMessageSerializer(max_message_size)
+        # Serializes use of the connection
+        self._lock: threading.Lock = threading.Lock()
+        self._connection: Union[socket.socket, None] = None
+
+    def execute_batch(self, queries: Iterable[Tuple[Any, ...]]) -> List[Any]:
+        """Executes multiple queries in a single request to the server.
+
+        Args:
+            queries:
+                The queries, each a tuple containing the name of an AccessManagerQueryProcessor method or property (e.g. 'has_access_to_entity') followed by its parameters.
+
+        Returns:
+            The result of each query, of the same type as returned by the corresponding method or property.
+
+        Raises:
+            ValueError: A query has an invalid name or number of parameters, or failed with a ValueError (e.g. an ElementNotFoundError).
+            RuntimeError: A query failed for another reason.
+        """
+        queries = list(queries)
+        request: List[List[Any]] = [ self._serialize_query(current_query) for current_query in queries ]
+        with self._lock:
+            try:
+                connection: socket.socket = self._get_connection()
+                self._serializer.write_message(connection, request)
+                response: Any = self._serializer.read_message(connection)
+                if (response is None):
+                    raise RuntimeError("The sidecar server closed the connection.")
+            except Exception:
+                # The state of the connection is unknown, so reconnect on the next query
+                self._close_connection()
+                raise
+        results: List[Any] = []
+        for current_query, current_response in zip(queries, response):
+            if (current_response[0] != 0):
+                raise self._serializer.deserialize_error(current_response[1])
+            results.append(self._deserialize_result(self._QUERY_TYPES[current_query[0]][1], current_response[1]))
+
+        return results
+
+    def close(self) -> None:
+        """Closes the connection to the server."""
+        with self._lock:
+            self._close_connection()
+
+    def contains_user(self, user: TUser) -> bool:
+        return self._execute_query("contains_user", user)
+
+    def contains_group(self, group: TGroup) -> bool:
+        return self._execute_query("contains_group", group)
+
+    def get_user_to_group_mappings(self, user: TUser, include_indirect_mappings: bool) -> Iterable[TGroup]:
+        return self._execute_query("get_user_to_group_mappings", user, include_indirect_mappings)
+
+    def get_group_to_user_mappings(self, group: TGroup, include_indirect_mappings: bool) -> Iterable[TUser]:
+        return self._execute_query("get_group_to_user_mappings", group, include_indirect_mappings)
+
+    def get_group_to_group_mappings(self, group: TGroup, include_indirect_mappings: bool) -> Iterable[TGroup]:
+        return self._execute_query("get_group_to_group_mappings", group, include_indirect_mappings)
+
+    def get_group_to_group_reverse_mappings(self, group: TGroup, include_indirect_mappings: bool) -> Iterable[TGroup]:
+        return self._execute_query("get_group_to_group_reverse_mappings", group, include_indirect_mappings)
+
+    def get_user_to_application_component_and_access_level_mappings(self, user: TUser) -> Iterable[Tuple[TComponent, TAccess]]:
+        return self._execute_query("get_user_to_application_component_and_access_level_mappings", user)
+
+    def get_application_component_and_access_level_to_user_mappings(self, application_component: TComponent, accesss_level: TAccess, include_indirect_mappings: bool) -> Iterable[TUser]:
+        return self._execute_query("get_application_component_and_access_level_to_user_mappings", application_component, accesss_level, include_indirect_mappings)
+
+    def get_group_to_application_component_and_access_level_mappings(self, group: TGroup) -> Iterable[Tuple[TComponent, TAccess]]:
+        return self._execute_query("get_group_to_application_component_and_access_level_mappings", group)
+
+    def get_application_component_and_access_level_to_group_mappings(self, application_component: TComponent, accesss_level: TAccess, include_indirect_mappings: bool) -> Iterable[TGroup]:
+        return self._execute_query("get_application_component_and_access_level_to_group_mappings", application_component, accesss_level, include_indirect_mappings)
+
+    def contains_entity_type(self, entity_type: str) -> bool:
+        return self._execute_query("contains_entity_type", entity_type)
+
+    def get_entities(self, entity_type: str) -> Iterable[str]:
+        return self._execute_query("get_entities", entity_type)
+
+    def contains_entity(self, entity_type: str, entity: str) -> bool:
+        return self._execute_query("contains_entity", entity_type, entity)
+
+    def get_user_to_entity_mappings(self, user: TUser) -> Iterable[Tuple[str, str]]:
+        return self._execute_query("get_user_to_entity_mappings", user)
+
+    def get_user_to_entity_mappings_for_type(self, user: TUser, entity_type: str) -> Iterable[str]:
+        return self._execute_query("get_user_to_entity_mappings_for_type", user, entity_type)
+
+    def get_entity_to_user_mappings(self, entity_type: str, entity: str, include_indirect_mappings: bool) -> Iterable[TUser]:
+        return self._execute_query("get_entity_to_user_mappings", entity_type, entity, include_indirect_mappings)
+
+    def get_group_to_entity_mappings(self, group: TGroup) -> Iterable[Tuple[str, str]]:
+        return self._execute_query("get_group_to_entity_mappings", group)
+
+    def get_group_to_entity_mappings_for_type(self, group: TGroup, entity_type: str) -> Iterable[str]:
+        return self._execute_query("get_group_to_entity_mappings_for_type", group, entity_type)
+
+    def get_entity_to_group_mappings(self, entity_type: str, entity: str, include_indirect_mappings: bool) -> Iterable[TGroup]:
+        return self._execute_query("get_entity_to_group_mappings", entity_type, entity, include_indirect_mappings)
+
+    def has_access_to_application_component(self, user: TUser, application_component: TComponent, access_level: TAccess) -> bool:
+        return self._execute_query("has_access_to_application_component", user, application_component, access_level)
+
+    def has_access_to_entity(self, user: TUser, entity_type: str, entity: str) -> bool:
+        return self._execute_query("has_access_to_entity", user, entity_type, entity)
+
+    def get_application_components_accesible_by_user(self, user: TUser) -> Set[Tuple[TComponent, TAccess]]:
+        return self._execute_query("get_application_components_accesible_by_user", user)
+
+    def get_application_components_accesible_by_group(self, group: TGroup) -> Set[Tuple[TComponent, TAccess]]:
+        return self._execute_query("get_application_components_accesible_by_group", group)
+
+    def get_entities_accessible_by_user(self, user: TUser) -> Set[Tuple[str, str]]:
+        return self._execute_query("get_entities_accessible_by_user", user)
+
+    def get_entities_of_type_accessible_by_user(self, user: TUser, entity_type: str) -> Set[str]:
+        return self._execute_query("get_entities_of_type_accessible_by_user", user, entity_type)
+
+    def get_entities_accessible_by_group(self, group: TGroup) -> Set[Tuple[str, str]]:
+        return self._execute_query("get_entities_accessible_by_group", group)
+
+    def get_entities_of_type_accessible_by_group(self, group: TGroup, entity_type: str) -> Set[str]:
+        return self._execute_query("get_entities_of_type_accessible_by_group", group, entity_type)
+
+    #region Private/Protected Methods
+
+    def _execute_query(self, query_name: str, *parameters: Any) -> Any:
+        return self.execute_batch([ (query_name, ) + parameters ])[0]
+
+    def _get_connection(self) -> socket.socket:
+        """Gets the connection to the server, connecting if not already connected.  Must be called while holding '_lock'."""
+        if (self._connection is None):
+            connection: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                connection.settimeout(self._timeout)
+                connection.connect(self._socket_path)
+            except Exception:
+                connection.close()
+                raise
+            self._connection = connection
+
+        return self._connection
+
+    def _close_connection(self) -> None:
+        """Closes the connection to the server if connected.  Must be called while holding '_lock'."""
+        if (self._connection is not None):
+            try:
+                self._connection.close()
+            finally:
+                self._connection = None
+
+    def _serialize_query(self, query: Tuple[Any, ...]) -> List[Any]:
+        """Converts a query to the form sent to the server, converting users, groups, application components and access levels to strings.
+
+        Args:
+            query:
+                The name of the query method or property followed by its parameters.
+
+        Returns:
+            The converted query.
+        """
+        if (len(query) == 0 or query[0] not in self._QUERY_TYPES):
+            raise ValueError("Query name {0} is not the name of an AccessManagerQueryProcessor method or property.".format(query[0] if len(query) > 0 else "(none)"))
+        parameter_types: Tuple[str, ...] = self._QUERY_TYPES[query[0]][0]
+        if (len(query) - 1 != len(parameter_types)):
+            raise ValueError("Query '{0}' requires {1} parameter(s) but {2} were provided.".format(query[0], len(parameter_types), len(query) - 1))
+        serialized_query: List[Any] = [ query[0] ]
+        for current_parameter_type, current_parameter in zip(parameter_types, query[1:]):
+            if (current_parameter_type in self._stringifiers):
+                serialized_query.append(self._stringifiers[current_parameter_type].to_string(current_parameter))
+            else:
+                serialized_query.append(current_parameter)
+
+        return serialized_query
+
+    def _deserialize_result(self, result_type: str, result: Any) -> Any:
+        """Converts a query result received from the server to the type returned by the corresponding query method or property.
+
+        Args:
+            result_type:
+                The type of the result.
+            result:
+                The result received.
+
+        Returns:
+            The converted result.
+        """
+        if (result_type == "bool"):
+            return result
+        elif (result_type == "users"):
+            return [ self._stringifiers["user"].from_string(current_element) for current_element in result ]
+        elif (result_type == "groups"):
+            return [ self._stringifiers["group"].from_string(current_element) for current_element in result ]
+        elif (result_type == "strings"):
+            return result
+        elif (result_type == "string_set"):
+            return set(result)
+        elif (result_type == "entities"):
+            return [ (current_element[0], current_element[1]) for current_element in result ]
+        elif (result_type == "entity_set"):
+            return { (current_element[0], current_element[1]) for current_element in result }
+        else:
+            application_components: List[Tuple[Any, Any]] = [
+                (self._stringifiers["application_component"].from_string(current_element[0]), self._stringifiers["access_level"].from_string(current_element[1])) for current_element in result
+            ]
+            if (result_type == "application_component_set"):
+                return set(application_components)
+            else:
+                return application_components
+
+    #endregion
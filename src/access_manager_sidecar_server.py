@@ -0,0 +1,205 @@
+from typing import Any, List, Dict, Tuple, Set, Union
+from concurrent.futures import ThreadPoolExecutor, Future
+import os
+import socketserver
+import threading
+
+from access_manager_query_processor import AccessManagerQueryProcessor
+from sidecar_message_serializer import SidecarMessageSerializer
+from exceptions.deserialization_error import DeserializationError
+
+class AccessManagerSidecarServer():
+    """Serves the queries of the processes on a host from a single shared query processor (e.g. an AccessManagerClient with a connection pool and query result cache), over a Unix domain socket, so that each process doesn't need its own client, connections, and cache.
+
+    Processes connect using an AccessManagerSidecarClient.  Each request message contains a batch of queries, which are executed concurrently (with identical queries in the batch executed once) and answered in a single response message.  The source must be a query processor for string users, groups, application components, and access levels (e.g. an AccessManagerClient created with StringUniqueStringifier instances), as the sidecar clients convert elements to and from strings.
+
+    Attributes:
+        socket_path:
+            The path of the Unix domain socket the server listens on.
+        connection_count:
+            The number of currently connected clients.
+        request_count:
+            The number of request messages (batches) received.
+        query_count:
+            The number of queries received.
+    """
+
+    # The names of the AccessManagerQueryProcessor methods and properties which can be queried
+    _QUERY_NAMES: Set[str] = set(AccessManagerQueryProcessor.__abstractmethods__)
+
+    @property
+    def socket_path(self) -> str:
+        """The path of the Unix domain socket the server listens on."""
+        return self._socket_path
+
+    @property
+    def connection_count(self) -> int:
+        """The number of currently connected clients."""
+        return self._connection_count
+
+    @property
+    def request_count(self) -> int:
+        """The number of request messages (batches) received."""
+        return self._request_count
+
+    @property
+    def query_count(self) -> int:
+        """The number of queries received."""
+        return self._query_count
+
+    def __init__(self, source: AccessManagerQueryProcessor[str, str, str, str], socket_path: str, max_query_concurrency: int=8, max_message_size: int=16777216) -> None:
+        """Initialises a new instance of the AccessManagerSidecarServer class.
+
+        Args:
+            source:
+                The query processor to answer queries from.
+            socket_path:
+                The path of the Unix domain socket to listen on.  Any existing file at the path is removed when the server starts.
+            max_query_concurrency:
+                The maximum number of queries (across all connections) executed against the source at the same time.
+            max_message_size:
+                The maximum size in bytes of a request message.
+        """
+        if (max_query_concurrency < 1):
+            raise ValueError("Parameter 'max_query_concurrency' with value {0} must be greater than or equal to 1.".format(max_query_concurrency))
+
+        self._source: AccessManagerQueryProcessor[str, str, str, str] = source
+        self._socket_path: str = socket_path
+        self._max_query_concurrency: int = max_query_concurrency
+        self._serializer: SidecarMessageSerializer = SidecarMessageSerializer(max_message_size)
+        self._lock: threading.Lock = threading.Lock()
+        self._server: Union[socketserver.ThreadingUnixStreamServer, None] = None
+        self._serve_thread: Union[threading.Thread, None] = None
+        self._executor: Union[ThreadPoolExecutor, None] = None
+        self._connection_count: int = 0
+        self._request_count: int = 0
+        self._query_count: int = 0
+
+    def start(self) -> None:
+        """Starts listening on the socket and serving queries on background threads."""
+        if (os.path.exists(self._socket_path) == True):
+            os.remove(self._socket_path)
+        self._executor = ThreadPoolExecutor(max_workers=self._max_query_concurrency, thread_name_prefix="AccessManagerSidecarQuery")
+        self._server = socketserver.ThreadingUnixStreamServer(self._socket_path, self._create_request_handler_class())
+        self._server.daemon_threads = True
+        self._serve_thread = threading.Thread(target=self._server.serve_forever, name="AccessManagerSidecarServer", daemon=True)
+        self._serve_thread.start()
+
+    def stop(self) -> None:
+        """Stops listening on the socket and removes it.  Queries already being executed are completed."""
+        if (self._server is not None):
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if (self._serve_thread is not None):
+            self._serve_thread.join()
+            self._serve_thread = None
+        if (self._executor is not None):
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if (os.path.exists(self._socket_path) == True):
+            os.remove(self._socket_path)
+
+    #region Private/Protected Methods
+
+    def _create_request_handler_class(self) -> type:
+        """Creates a socketserver request handler class which serves the requests of a single connection from this server."""
+        sidecar_server: AccessManagerSidecarServer = self
+
+        class SidecarRequestHandler(socketserver.BaseRequestHandler):
+            def handle(self) -> None:
+                sidecar_server._handle_connection(self.request)
+
+        return SidecarRequestHandler
+
+    def _handle_connection(self, connection: Any) -> None:
+        """Reads request messages from a connection and writes the response to each, until the connection is closed.
+
+        Args:
+            connection:
+                The connected socket.
+        """
+        with self._lock:
+            self._connection_count += 1
+        try:
+            while (True):
+                request: Any = self._serializer.read_message(connection)
+                if (request is None):
+                    break
+                self._serializer.write_message(connection, self._execute_batch(request))
+        except (OSError, ValueError, DeserializationError):
+            # The client disconnected, or sent a message which couldn't be read (after which the position of the next message in the stream is unknown)
+            pass
+        finally:
+            with self._lock:
+                self._connection_count -= 1
+
+    def _execute_batch(self, queries: Any) -> List[List[Any]]:
+        """Executes a batch of queries concurrently.
+
+        Args:
+            queries:
+                The request message, which should be a list of queries, each a list containing the name of the query method or property followed by its parameters.
+
+        Returns:
+            The response to each query.  A malformed query receives an error response, and a request message which is not a list receives a single error response.
+        """
+        with self._lock:
+            self._request_count += 1
+            if (isinstance(queries, list) == True):
+                self._query_count += len(queries)
+        if (isinstance(queries, list) == False):
+            return [ [ 1, self._serializer.serialize_error(ValueError("Request message must be a list of queries.")) ] ]
+        executor: Union[ThreadPoolExecutor, None] = self._executor
+        if (executor is None):
+            raise ValueError("The server has been stopped.")
+        # Execute identical queries in the batch once
+        futures: Dict[Tuple[Any, ...], Future] = dict()
+        results: List[Union[List[Any], Tuple[Any, ...]]] = []
+        for index, current_query in enumerate(queries):
+            if (self._is_valid_query(current_query) == False):
+                results.append([ 1, self._serializer.serialize_error(ValueError("Query at position {0} must be a list containing a query name followed by its string, number, or boolean parameters.".format(index))) ])
+                continue
+            query_key: Tuple[Any, ...] = tuple(current_query)
+            if (query_key not in futures):
+                futures[query_key] = executor.submit(self._execute_query, query_key)
+            results.append(query_key)
+
+        return [ futures[current_result].result() if isinstance(current_result, tuple) else current_result for current_result in results ]
+
+    def _is_valid_query(self, query: Any) -> bool:
+        """Checks whether a query in a request message is a list of JSON scalar values (i.e. has the form of a query name followed by its parameters).
+        """
+        if (isinstance(query, list) == False or len(query) == 0 or isinstance(query[0], str) == False):
+            return False
+        for current_item in query:
+            if (current_item is not None and isinstance(current_item, (str, int, float, bool)) == False):
+                return False
+
+        return True
+
+    def _execute_query(self, query: Tuple[Any, ...]) -> List[Any]:
+        """Executes a single query against the source.
+
+        Args:
+            query:
+                The name of the query method or property followed by its parameters.
+
+        Returns:
+            A list containing 0 and the JSON-compatible result if the query succeeded, or 1 and the serialized exception if it failed.
+        """
+        try:
+            if (query[0] not in self._QUERY_NAMES):
+                raise ValueError("Query name {0} is not the name of an AccessManagerQueryProcessor method or property.".format(query[0]))
+            if (isinstance(getattr(AccessManagerQueryProcessor, query[0]), property) == True):
+                result: Any = getattr(self._source, query[0])
+            else:
+                result = getattr(self._source, query[0])(*query[1:])
+            if (isinstance(result, bool) == True):
+                return [ 0, result ]
+            else:
+                return [ 0, [ list(current_element) if isinstance(current_element, tuple) else current_element for current_element in result ] ]
+        except Exception as e:
+            return [ 1, self._serializer.serialize_error(e) ]
+
+    #endregion
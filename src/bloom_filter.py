@@ -0,0 +1,97 @@
+from typing import List
+import hashlib
+import math
+
+class BloomFilter():
+    """A probabilistic set of strings, which can report that a string is definitely not in the set, or that it might be (with a configurable false positive rate).
+
+    The number of bits and hash functions are derived from the expected number of strings and the false positive rate, using the standard formulae m = -n ln(p) / (ln 2)^2 and k = (m / n) ln 2.  Hash positions are generated from a single 128 bit BLAKE2b digest using double hashing.
+
+    Attributes:
+        bit_count:
+            The number of bits in the filter.
+        hash_function_count:
+            The number of hash functions (i.e. bits set per string).
+        size_in_bytes:
+            The memory used by the filter's bits.
+        element_count:
+            The number of strings added to the filter.
+    """
+
+    @property
+    def bit_count(self) -> int:
+        """The number of bits in the filter."""
+        return self._bit_count
+
+    @property
+    def hash_function_count(self) -> int:
+        """The number of hash functions (i.e. bits set per string)."""
+        return self._hash_function_count
+
+    @property
+    def size_in_bytes(self) -> int:
+        """The memory used by the filter's bits."""
+        return len(self._bits)
+
+    @property
+    def element_count(self) -> int:
+        """The number of strings added to the filter."""
+        return self._element_count
+
+    def __init__(self, expected_element_count: int, false_positive_rate: float) -> None:
+        """Initialises a new instance of the BloomFilter class.
+
+        Args:
+            expected_element_count:
+                The number of strings expected to be added to the filter.  The false positive rate increases if more strings are added.
+            false_positive_rate:
+                The probability that might_contain() returns True for a string not in the filter, once the expected number of strings have been added.
+        """
+        if (expected_element_count < 1):
+            raise ValueError("Parameter 'expected_element_count' with value {0} must be greater than or equal to 1.".format(expected_element_count))
+        if (false_positive_rate <= 0.0 or false_positive_rate >= 1.0):
+            raise ValueError("Parameter 'false_positive_rate' with value {0} must be greater than 0 and less than 1.".format(false_positive_rate))
+
+        self._bit_count: int = max(8, math.ceil(-expected_element_count * math.log(false_positive_rate) / (math.log(2) ** 2)))
+        self._hash_function_count: int = max(1, round(self._bit_count / expected_element_count * math.log(2)))
+        self._bits: bytearray = bytearray((self._bit_count + 7) // 8)
+        self._element_count: int = 0
+
+    def add(self, element: str) -> None:
+        """Adds a string to the filter.
+
+        Args:
+            element:
+                The string to add.
+        """
+        for current_position in self._get_bit_positions(element):
+            self._bits[current_position >> 3] |= (1 << (current_position & 7))
+        self._element_count += 1
+
+    def might_contain(self, element: str) -> bool:
+        """Checks whether a string might be in the filter.
+
+        Args:
+            element:
+                The string to check for.
+
+        Returns:
+            False if the string is definitely not in the filter, or True if it might be.
+        """
+        for current_position in self._get_bit_positions(element):
+            if ((self._bits[current_position >> 3] & (1 << (current_position & 7))) == 0):
+                return False
+
+        return True
+
+    #region Private/Protected Methods
+
+    def _get_bit_positions(self, element: str) -> List[int]:
+        digest: bytes = hashlib.blake2b(element.encode("utf-8"), digest_size=16).digest()
+        hash_1: int = int.from_bytes(digest[:8], "little")
+        # Ensure the second hash is odd, so successive positions don't repeat when the bit count is even
+        hash_2: int = int.from_bytes(digest[8:], "little") | 1
+
+        return [ (hash_1 + i * hash_2) % self._bit_count for i in range(self._hash_function_count) ]
+
+    #endregion
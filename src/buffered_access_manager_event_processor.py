@@ -0,0 +1,325 @@
+from typing import TypeVar, Generic, Tuple, List, Deque, Any, Union
+from collections import deque
+import threading
+import time
+
+from access_manager_event_processor import AccessManagerEventProcessor
+from event_compactor import EventCompactor
+
+TUser = TypeVar("TUser")
+TGroup = TypeVar("TGroup")
+TComponent = TypeVar("TComponent")
+TAccess = TypeVar("TAccess")
+
+class BufferedAccessManagerEventProcessor(AccessManagerEventProcessor[TUser, TGroup, TComponent, TAccess], Generic[TUser, TGroup, TComponent, TAccess]):
+    """Thread-safe event processor which buffers events in memory and returns immediately, and sends the buffered events in order to a target event processor (e.g. an AccessManagerClient) on a background thread, once 'flush_event_count' events are buffered or the oldest buffered event has been buffered for 'flush_interval' seconds.
+
+    Buffered events are not reflected in queries until they are flushed.  If the target fails to process an event because the AccessManager instance is unavailable, the event and those after it remain buffered and are retried after 'retry_interval' seconds.  Events which the target rejects with a ValueError (e.g. due to a 400 or 404 response status) cannot succeed on retry, and are discarded and counted in 'discarded_event_count'.  When 'max_buffered_event_count' events are buffered or being flushed, event methods block until a flush completes.  Events still buffered when the process terminates are lost, so stop() should be called to flush them before exiting.
+
+    If 'compact_events' is set, each flush first removes events which don't affect the final state of elements and mappings (e.g. an add and subsequent remove of the same mapping, duplicate adds of the same user, or mappings added to a user which is subsequently removed) using an EventCompactor.  Events are never reordered, so entities and their mappings are still sent in order.  As the removed events are never sent, the target may not see intermediate states (e.g. a change feed on the target would not record them).
+
+    Generic Paramters:
+        TUser:
+            The type of users in the application.
+        TGroup:
+            The type of groups in the application.
+        TComponent:
+            The type of components in the application to manage access to.
+        TAccess:
+            The type of levels of access which can be assigned to an application component.
+
+    Attributes:
+        queue_depth:
+            The number of events currently buffered (excluding any being flushed).
+        flush_count:
+            The number of flushes which sent at least one event.
+        flushed_event_count:
+            The number of events successfully sent to the target.
+        discarded_event_count:
+            The number of events discarded because they were rejected by the target.
+        compacted_event_count:
+            The number of events removed by compaction.
+        flush_failure_count:
+            The number of flushes which stopped because the target failed to process an event.
+        last_flush_latency:
+            The time in seconds taken by the most recent flush, or None if no events have been flushed.
+        max_flush_latency:
+            The longest time in seconds taken by a flush, or None if no events have been flushed.
+    """
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of events currently buffered (excluding any being flushed)."""
+        with self._lock:
+            return len(self._events)
+
+    @property
+    def flush_count(self) -> int:
+        """The number of flushes which sent at least one event."""
+        return self._flush_count
+
+    @property
+    def flushed_event_count(self) -> int:
+        """The number of events successfully sent to the target."""
+        return self._flushed_event_count
+
+    @property
+    def discarded_event_count(self) -> int:
+        """The number of events discarded because they were rejected by the target."""
+        return self._discarded_event_count
+
+    @property
+    def compacted_event_count(self) -> int:
+        """The number of events removed by compaction."""
+        return self._compacted_event_count
+
+    @property
+    def flush_failure_count(self) -> int:
+        """The number of flushes which stopped because the target failed to process an event."""
+        return self._flush_failure_count
+
+    @property
+    def last_flush_latency(self) -> Union[float, None]:
+        """The time in seconds taken by the most recent flush, or None if no events have been flushed."""
+        return self._last_flush_latency
+
+    @property
+    def max_flush_latency(self) -> Union[float, None]:
+        """The longest time in seconds taken by a flush, or None if no events have been flushed."""
+        return self._max_flush_latency
+
+    def __init__(
+            self,
+            target: AccessManagerEventProcessor[TUser, TGroup, TComponent, TAccess],
+            flush_event_count: int=100,
+            flush_interval: float=1.0,
+            retry_interval: float=5.0,
+            max_buffered_event_count: int=10000,
+            compact_events: bool=False
+        ) -> None:
+        """Initialises a new instance of the BufferedAccessManagerEventProcessor class.
+
+        Args:
+            target:
+                The event processor to send buffered events to.
+            flush_event_count:
+                The number of buffered events which causes a flush.
+            flush_interval:
+                The maximum time in seconds an event is buffered before a flush is started.
+            retry_interval:
+                The time in seconds to wait before retrying after the target fails to process an event.
+            max_buffered_event_count:
+                The maximum number of events which can be buffered, including events being flushed.  Event methods block while this number of events are buffered.
+            compact_events:
+                Whether to remove events which don't affect the final state of elements and mappings before sending them to the target.
+        """
+        if (flush_event_count < 1):
+            raise ValueError("Parameter 'flush_event_count' with value {0} must be greater than or equal to 1.".format(flush_event_count))
+        if (flush_interval <= 0.0):
+            raise ValueError("Parameter 'flush_interval' with value {0} must be greater than 0.".format(flush_interval))
+        if (retry_interval <= 0.0):
+            raise ValueError("Parameter 'retry_interval' with value {0} must be greater than 0.".format(retry_interval))
+        if (max_buffered_event_count < flush_event_count):
+            raise ValueError("Parameter 'max_buffered_event_count' with value {0} must be greater than or equal to parameter 'flush_event_count' with value {1}.".format(max_buffered_event_count, flush_event_count))
+
+        self._target: AccessManagerEventProcessor[TUser, TGroup, TComponent, TAccess] = target
+        self._flush_event_count: int = flush_event_count
+        self._flush_interval: float = flush_interval
+        self._retry_interval: float = retry_interval
+        self._max_buffered_event_count: int = max_buffered_event_count
+        self._event_compactor: Union[EventCompactor, None] = EventCompactor() if compact_events == True else None
+        self._lock: threading.Lock = threading.Lock()
+        # Notified when a flush completes, or compaction removes events being flushed
+        self._space_available_condition: threading.Condition = threading.Condition(self._lock)
+        # Serializes flushes, so that events are sent in order
+        self._flush_lock: threading.Lock = threading.Lock()
+        # Buffered events, each a tuple containing the name of the event method and its arguments
+        self._events: Deque[Tuple[str, Tuple[Any, ...]]] = deque()
+        # The number of events removed from the buffer by the in-progress flush, which count towards 'max_buffered_event_count' until the flush completes (as unsent events are returned to the buffer if it fails)
+        self._flushing_event_count: int = 0
+        # The time.monotonic() the oldest buffered event was buffered
+        self._oldest_event_time: float = 0.0
+        self._flush_count: int = 0
+        self._flushed_event_count: int = 0
+        self._discarded_event_count: int = 0
+        self._compacted_event_count: int = 0
+        self._flush_failure_count: int = 0
+        self._last_flush_latency: Union[float, None] = None
+        self._max_flush_latency: Union[float, None] = None
+        self._stop_signal: threading.Event = threading.Event()
+        self._flush_signal: threading.Event = threading.Event()
+        self._flush_thread: Union[threading.Thread, None] = None
+
+    def start(self) -> None:
+        """Starts flushing buffered events on a background thread."""
+        self._stop_signal.clear()
+        self._flush_thread = threading.Thread(target=self._flush_loop, name="BufferedAccessManagerEventProcessor", daemon=True)
+        self._flush_thread.start()
+
+    def stop(self) -> None:
+        """Stops flushing on the background thread, and then flushes any remaining buffered events on the calling thread.
+
+        Raises:
+            Exception: The target failed to process an event (the event and those after it remain buffered).
+        """
+        self._stop_signal.set()
+        self._flush_signal.set()
+        if (self._flush_thread is not None):
+            self._flush_thread.join()
+            self._flush_thread = None
+        self.flush()
+
+    def flush(self) -> None:
+        """Sends all buffered events to the target in order, waiting for any in-progress flush to complete first.
+
+        Raises:
+            Exception: The target failed to process an event (the event and those after it remain buffered).
+        """
+        with self._flush_lock:
+            with self._lock:
+                events: List[Tuple[str, Tuple[Any, ...]]] = list(self._events)
+                self._events.clear()
+                self._flushing_event_count = len(events)
+            if (len(events) == 0):
+                return
+            if (self._event_compactor is not None):
+                compacted_events: List[Tuple[str, Tuple[Any, ...]]] = self._event_compactor.compact(events)
+                self._compacted_event_count += len(events) - len(compacted_events)
+                events = compacted_events
+                with self._lock:
+                    self._flushing_event_count = len(events)
+                    self._space_available_condition.notify_all()
+            flush_start_time: float = time.monotonic()
+            sent_count: int = 0
+            try:
+                for event_type, arguments in events:
+                    try:
+                        getattr(self._target, event_type)(*arguments)
+                        self._flushed_event_count += 1
+                    except ValueError:
+                        self._discarded_event_count += 1
+                    sent_count += 1
+            except Exception:
+                self._flush_failure_count += 1
+                with self._lock:
+                    # Return the unsent events to the front of the buffer, ahead of any buffered during the flush
+                    self._events.extendleft(reversed(events[sent_count:]))
+                    self._oldest_event_time = time.monotonic()
+                raise
+            finally:
+                with self._lock:
+                    self._flushing_event_count = 0
+                    self._space_available_condition.notify_all()
+                if (sent_count > 0):
+                    self._record_flush_latency(time.monotonic() - flush_start_time)
+
+    def add_user(self, user: TUser) -> None:
+        self._buffer_event("add_user", user)
+
+    def remove_user(self, user: TUser) -> None:
+        self._buffer_event("remove_user", user)
+
+    def add_group(self, group: TGroup) -> None:
+        self._buffer_event("add_group", group)
+
+    def remove_group(self, group: TGroup) -> None:
+        self._buffer_event("remove_group", group)
+
+    def add_user_to_group_mapping(self, user: TUser, group: TGroup) -> None:
+        self._buffer_event("add_user_to_group_mapping", user, group)
+
+    def remove_user_to_group_mapping(self, user: TUser, group: TGroup) -> None:
+        self._buffer_event("remove_user_to_group_mapping", user, group)
+
+    def add_group_to_group_mapping(self, from_group: TGroup, to_group: TGroup) -> None:
+        self._buffer_event("add_group_to_group_mapping", from_group, to_group)
+
+    def remove_group_to_group_mapping(self, from_group: TGroup, to_group: TGroup) -> None:
+        self._buffer_event("remove_group_to_group_mapping", from_group, to_group)
+
+    def add_user_to_application_component_and_access_level_mapping(self, user: TUser, application_component: TComponent, access_level: TAccess) -> None:
+        self._buffer_event("add_user_to_application_component_and_access_level_mapping", user, application_component, access_level)
+
+    def remove_user_to_application_component_and_access_level_mapping(self, user: TUser, application_component: TComponent, access_level: TAccess) -> None:
+        self._buffer_event("remove_user_to_application_component_and_access_level_mapping", user, application_component, access_level)
+
+    def add_group_to_application_component_and_access_level_mapping(self, group: TGroup, application_component: TComponent, access_level: TAccess) -> None:
+        self._buffer_event("add_group_to_application_component_and_access_level_mapping", group, application_component, access_level)
+
+    def remove_group_to_application_component_and_access_level_mapping(self, group: TGroup, application_component: TComponent, access_level: TAccess) -> None:
+        self._buffer_event("remove_group_to_application_component_and_access_level_mapping", group, application_component, access_level)
+
+    def add_entity_type(self, entity_type: str) -> None:
+        self._buffer_event("add_entity_type", entity_type)
+
+    def remove_entity_type(self, entity_type: str) -> None:
+        self._buffer_event("remove_entity_type", entity_type)
+
+    def add_entity(self, entity_type: str, entity: str) -> None:
+        self._buffer_event("add_entity", entity_type, entity)
+
+    def remove_entity(self, entity_type: str, entity: str) -> None:
+        self._buffer_event("remove_entity", entity_type, entity)
+
+    def add_user_to_entity_mapping(self, user: TUser, entity_type: str, entity: str) -> None:
+        self._buffer_event("add_user_to_entity_mapping", user, entity_type, entity)
+
+    def remove_user_to_entity_mapping(self, user: TUser, entity_type: str, entity: str) -> None:
+        self._buffer_event("remove_user_to_entity_mapping", user, entity_type, entity)
+
+    def add_group_to_entity_mapping(self, group: TGroup, entity_type: str, entity: str) -> None:
+        self._buffer_event("add_group_to_entity_mapping", group, entity_type, entity)
+
+    def remove_group_to_entity_mapping(self, group: TGroup, entity_type: str, entity: str) -> None:
+        self._buffer_event("remove_group_to_entity_mapping", group, entity_type, entity)
+
+    #region Private/Protected Methods
+
+    def _buffer_event(self, event_type: str, *arguments: Any) -> None:
+        """Adds an event to the buffer, waiting for space if the buffer is full, and signals the background thread if the flush event count is reached.
+
+        Args:
+            event_type:
+                The name of the event method.
+            arguments:
+                The arguments of the event method.
+        """
+        with self._lock:
+            self._space_available_condition.wait_for(lambda: len(self._events) + self._flushing_event_count < self._max_buffered_event_count)
+            if (len(self._events) == 0):
+                self._oldest_event_time = time.monotonic()
+            self._events.append((event_type, arguments))
+            buffered_event_count: int = len(self._events)
+        if (buffered_event_count >= self._flush_event_count):
+            self._flush_signal.set()
+
+    def _record_flush_latency(self, flush_latency: float) -> None:
+        self._flush_count += 1
+        self._last_flush_latency = flush_latency
+        if (self._max_flush_latency is None or flush_latency > self._max_flush_latency):
+            self._max_flush_latency = flush_latency
+
+    def _flush_loop(self) -> None:
+        while (self._stop_signal.is_set() == False):
+            with self._lock:
+                if (len(self._events) == 0):
+                    wait_time: float = self._flush_interval
+                elif (len(self._events) >= self._flush_event_count):
+                    wait_time = 0.0
+                else:
+                    wait_time = max(0.0, self._flush_interval - (time.monotonic() - self._oldest_event_time))
+            if (wait_time > 0.0):
+                self._flush_signal.wait(wait_time)
+            self._flush_signal.clear()
+            if (self._stop_signal.is_set() == True):
+                break
+            with self._lock:
+                flush_due: bool = len(self._events) >= self._flush_event_count or (len(self._events) > 0 and time.monotonic() - self._oldest_event_time >= self._flush_interval)
+            if (flush_due == True):
+                try:
+                    self.flush()
+                except Exception:
+                    # Target is unavailable, so wait and retry
+                    self._stop_signal.wait(self._retry_interval)
+
+    #endregion
@@ -0,0 +1,124 @@
+from typing import List, Union, Any
+import threading
+
+from access_manager_client import AccessManagerClient
+from change_feed_base import ChangeFeedBase
+from models.access_manager_change_event import AccessManagerChangeEvent
+
+class CacheInvalidationListener():
+    """Listens for change events on a background thread and invalidates the cached query results of an AccessManagerClient which depend on the elements affected by each event, so that changes made outside of the client (e.g. by other processes) are reflected within seconds, and results can be cached with long time-to-live values.
+
+    The listener waits for events using the change feed's wait_for_events() method (e.g. long-polling an endpoint, or notified immediately by an InMemoryChangeFeed), starting from the latest position of the feed when the listener is started.  If a gap is detected in the feed (i.e. events were missed because they're no longer retained), all cached results are cleared.
+
+    Attributes:
+        position:
+            The position in the change feed of the last event processed, or None if the listener has not been started.
+        invalidation_count:
+            The number of events for which cached results were invalidated.
+        gap_count:
+            The number of times a gap was detected in the change feed, causing all cached results to be cleared.
+        failure_count:
+            The number of times reading from the change feed or invalidating cached results failed.
+    """
+
+    @property
+    def position(self) -> Union[int, None]:
+        """The position in the change feed of the last event processed, or None if the listener has not been started."""
+        return self._position
+
+    @property
+    def invalidation_count(self) -> int:
+        """The number of events for which cached results were invalidated."""
+        return self._invalidation_count
+
+    @property
+    def gap_count(self) -> int:
+        """The number of times a gap was detected in the change feed, causing all cached results to be cleared."""
+        return self._gap_count
+
+    @property
+    def failure_count(self) -> int:
+        """The number of times reading from the change feed or invalidating cached results failed."""
+        return self._failure_count
+
+    def __init__(self, client: AccessManagerClient[Any, Any, Any, Any], change_feed: ChangeFeedBase, wait_timeout: float=30.0, retry_interval: float=5.0, batch_size: int=1000) -> None:
+        """Initialises a new instance of the CacheInvalidationListener class.
+
+        Args:
+            client:
+                The client whose cached results to invalidate.
+            change_feed:
+                The feed to read events from.
+            wait_timeout:
+                The maximum time in seconds to wait for events in each call to the change feed's wait_for_events() method.  Also the maximum time stop() waits for the background thread.
+            retry_interval:
+                The time in seconds to wait before retrying after reading from the change feed or invalidating cached results fails.
+            batch_size:
+                The maximum number of events to read from the change feed at once.
+        """
+        if (wait_timeout <= 0.0):
+            raise ValueError("Parameter 'wait_timeout' with value {0} must be greater than 0.".format(wait_timeout))
+        if (retry_interval <= 0.0):
+            raise ValueError("Parameter 'retry_interval' with value {0} must be greater than 0.".format(retry_interval))
+        if (batch_size < 1):
+            raise ValueError("Parameter 'batch_size' with value {0} must be greater than or equal to 1.".format(batch_size))
+
+        self._client: AccessManagerClient[Any, Any, Any, Any] = client
+        self._change_feed: ChangeFeedBase = change_feed
+        self._wait_timeout: float = wait_timeout
+        self._retry_interval: float = retry_interval
+        self._batch_size: int = batch_size
+        self._position: Union[int, None] = None
+        self._invalidation_count: int = 0
+        self._gap_count: int = 0
+        self._failure_count: int = 0
+        self._stop_signal: threading.Event = threading.Event()
+        self._listen_thread: Union[threading.Thread, None] = None
+
+    def start(self) -> None:
+        """Starts listening for events after the latest position of the change feed on a background thread."""
+        self._position = self._change_feed.latest_position
+        self._stop_signal.clear()
+        self._listen_thread = threading.Thread(target=self._listen_loop, name="CacheInvalidationListener", daemon=True)
+        self._listen_thread.start()
+
+    def stop(self) -> None:
+        """Stops listening, waiting for the background thread to finish processing any events read (and for any in-progress wait for events to complete)."""
+        self._stop_signal.set()
+        if (self._listen_thread is not None):
+            self._listen_thread.join()
+            self._listen_thread = None
+
+    def process_available_events(self) -> None:
+        """Invalidates cached results for all events in the change feed after the last processed position, clearing all cached results if a gap is detected.
+        """
+        if (self._position is None):
+            raise RuntimeError("The listener has not been started.")
+        while (True):
+            events: List[AccessManagerChangeEvent] = self._change_feed.read(self._position, self._batch_size)
+            if (len(events) == 0):
+                break
+            if (events[0].position != self._position + 1):
+                self._gap_count += 1
+                self._client.clear_cached_results()
+            for current_event in events:
+                self._client.invalidate_cached_results(current_event)
+                self._position = current_event.position
+                self._invalidation_count += 1
+            if (len(events) < self._batch_size):
+                break
+
+    #region Private/Protected Methods
+
+    def _listen_loop(self) -> None:
+        while (self._stop_signal.is_set() == False):
+            try:
+                assert self._position is not None
+                if (self._change_feed.wait_for_events(self._position, self._wait_timeout) == True):
+                    self.process_available_events()
+            except Exception:
+                # Change feed is unavailable, or the event could not be processed, so retry after the retry interval
+                self._failure_count += 1
+                self._stop_signal.wait(self._retry_interval)
+
+    #endregion
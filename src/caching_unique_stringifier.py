@@ -0,0 +1,141 @@
+from typing import TypeVar, Generic, Any, Union
+from collections import OrderedDict
+import threading
+
+from unique_stringifier_base import UniqueStringifierBase
+
+T = TypeVar("T")
+
+class CachingUniqueStringifier(UniqueStringifierBase[T], Generic[T]):
+    """Thread-safe decorator for a UniqueStringifierBase implementation, which retains the results of conversions in least-recently-used caches, so that repeatedly converting the same objects and strings (e.g. the elements in each response processed by an AccessManagerClient) doesn't repeat expensive conversion logic.
+
+    Separate caches are held for each direction of conversion, and each conversion populates both caches (e.g. converting an object to a string also caches the conversion of the string back to the object).  Objects are cached as is, so from_string() returns the same object instance for repeated conversions of the same string, and hence objects should be immutable.  Objects which are not hashable are converted by the decorated stringifier without caching.
+
+    Generic Paramters:
+        T:
+            The type of objects to convert.
+
+    Attributes:
+        max_size:
+            The maximum number of conversions held in each direction's cache.
+        to_string_hit_count:
+            The number of calls to to_string() answered from the cache.
+        to_string_miss_count:
+            The number of calls to to_string() which called the decorated stringifier.
+        from_string_hit_count:
+            The number of calls to from_string() answered from the cache.
+        from_string_miss_count:
+            The number of calls to from_string() which called the decorated stringifier.
+    """
+
+    @property
+    def max_size(self) -> int:
+        """The maximum number of conversions held in each direction's cache."""
+        return self._max_size
+
+    @property
+    def to_string_hit_count(self) -> int:
+        """The number of calls to to_string() answered from the cache."""
+        return self._to_string_hit_count
+
+    @property
+    def to_string_miss_count(self) -> int:
+        """The number of calls to to_string() which called the decorated stringifier."""
+        return self._to_string_miss_count
+
+    @property
+    def from_string_hit_count(self) -> int:
+        """The number of calls to from_string() answered from the cache."""
+        return self._from_string_hit_count
+
+    @property
+    def from_string_miss_count(self) -> int:
+        """The number of calls to from_string() which called the decorated stringifier."""
+        return self._from_string_miss_count
+
+    def __init__(self, stringifier: UniqueStringifierBase[T], max_size: int=1024) -> None:
+        """Initialises a new instance of the CachingUniqueStringifier class.
+
+        Args:
+            stringifier:
+                The stringifier to decorate.
+            max_size:
+                The maximum number of conversions held in each direction's cache.
+        """
+        if (max_size < 1):
+            raise ValueError("Parameter 'max_size' with value {0} must be greater than or equal to 1.".format(max_size))
+
+        self._stringifier: UniqueStringifierBase[T] = stringifier
+        self._max_size: int = max_size
+        self._lock: threading.Lock = threading.Lock()
+        # Conversions ordered from least to most recently used
+        self._to_string_cache: OrderedDict[Any, str] = OrderedDict()
+        self._from_string_cache: OrderedDict[str, T] = OrderedDict()
+        self._to_string_hit_count: int = 0
+        self._to_string_miss_count: int = 0
+        self._from_string_hit_count: int = 0
+        self._from_string_miss_count: int = 0
+
+    def to_string(self, input_object: T) -> str:
+        try:
+            hash(input_object)
+        except TypeError:
+            return self._stringifier.to_string(input_object)
+        with self._lock:
+            cached_string: Union[str, None] = self._to_string_cache.get(input_object)
+            if (cached_string is not None):
+                self._to_string_cache.move_to_end(input_object)
+                self._to_string_hit_count += 1
+                return cached_string
+            self._to_string_miss_count += 1
+        # Convert outside the lock, so that slow conversions don't block other threads
+        stringified_object: str = self._stringifier.to_string(input_object)
+        with self._lock:
+            self._add(self._to_string_cache, input_object, stringified_object)
+            self._add(self._from_string_cache, stringified_object, input_object)
+
+        return stringified_object
+
+    def from_string(self, stringified_object: str) -> T:
+        with self._lock:
+            if (stringified_object in self._from_string_cache):
+                self._from_string_cache.move_to_end(stringified_object)
+                self._from_string_hit_count += 1
+                return self._from_string_cache[stringified_object]
+            self._from_string_miss_count += 1
+        converted_object: T = self._stringifier.from_string(stringified_object)
+        with self._lock:
+            self._add(self._from_string_cache, stringified_object, converted_object)
+            try:
+                self._add(self._to_string_cache, converted_object, stringified_object)
+            except TypeError:
+                # The object is not hashable
+                pass
+
+        return converted_object
+
+    def clear(self) -> None:
+        """Removes all conversions from the caches."""
+        with self._lock:
+            self._to_string_cache.clear()
+            self._from_string_cache.clear()
+
+    #region Private/Protected Methods
+
+    def _add(self, cache: OrderedDict, key: Any, value: Any) -> None:
+        """Adds a conversion to a cache, evicting the least recently used conversion if the cache is full.  Must be called while holding '_lock'.
+
+        Args:
+            cache:
+                The cache.
+            key:
+                The converted object or string.
+            value:
+                The result of the conversion.
+        """
+        cache[key] = value
+        cache.move_to_end(key)
+        if (len(cache) > self._max_size):
+            cache.popitem(last=False)
+
+    #endregion
@@ -0,0 +1,25 @@
+from typing import List, Dict, Union, Any
+
+from response_body_decoder_base import ResponseBodyDecoderBase
+
+class CborResponseBodyDecoder(ResponseBodyDecoderBase):
+    """An implementation of ResponseBodyDecoderBase which decodes CBOR response bodies.
+
+    Requires the 'cbor2' package to be installed.
+    """
+
+    def __init__(self) -> None:
+        """Initialises a new instance of the CborResponseBodyDecoder class."""
+        try:
+            import cbor2
+        except ImportError as exc:
+            raise ImportError("Package 'cbor2' must be installed to decode CBOR response bodies.") from exc
+        self._loads = cbor2.loads
+
+    @property
+    def content_type(self) -> str:
+        return "application/cbor"
+
+    def decode(self, response_body: bytes) -> Union[str, bool, List[str], List[Dict[str, Any]], Dict[str, Any]]:
+
+        return self._loads(response_body)
@@ -0,0 +1,53 @@
+from typing import List
+from abc import ABC, abstractmethod
+import time
+
+from models.access_manager_change_event import AccessManagerChangeEvent
+
+class ChangeFeedBase(ABC):
+    """Base for classes which provide an ordered feed of the events which changed the elements or mappings of an AccessManager instance.
+
+    Attributes:
+        latest_position:
+            The position of the most recent event in the feed, or 0 if the feed contains no events.
+    """
+
+    @property
+    @abstractmethod
+    def latest_position(self) -> int:
+        """The position of the most recent event in the feed, or 0 if the feed contains no events."""
+
+    @abstractmethod
+    def read(self, after_position: int, max_count: int) -> List[AccessManagerChangeEvent]:
+        """Reads events from the feed in order of position.
+
+        Args:
+            after_position:
+                The position to read events after.
+            max_count:
+                The maximum number of events to read.
+
+        Returns:
+            The events.  The position of the first event is greater than 'after_position' + 1 if intervening events are no longer retained by the feed.
+        """
+
+    def wait_for_events(self, after_position: int, timeout: float) -> bool:
+        """Waits until the feed contains events after the specified position, e.g. by long-polling or by listening to a server-sent events stream.  The default implementation polls the 'latest_position' property once per second, so implementations which can be notified of new events should override it.
+
+        Args:
+            after_position:
+                The position to wait for events after.
+            timeout:
+                The maximum time in seconds to wait.
+
+        Returns:
+            Whether events after the position are available.
+        """
+        end_time: float = time.monotonic() + timeout
+        while (self.latest_position <= after_position):
+            remaining_time: float = end_time - time.monotonic()
+            if (remaining_time <= 0.0):
+                return False
+            time.sleep(min(1.0, remaining_time))
+
+        return True
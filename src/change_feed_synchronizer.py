@@ -0,0 +1,214 @@
+from typing import List, Set, Union, Any
+import threading
+import time
+
+from access_manager_event_processor import AccessManagerEventProcessor
+from access_manager_local_replica import AccessManagerLocalReplica
+from access_graph import AccessGraph
+from change_feed_base import ChangeFeedBase
+from access_graph_snapshot_serializer import AccessGraphSnapshotSerializer
+from models.access_manager_change_event import AccessManagerChangeEvent
+
+class ChangeFeedSynchronizer():
+    """Keeps an AccessManagerLocalReplica up to date by applying the events from a change feed to it incrementally, falling back to a full reload of the replica only when necessary.
+
+    The synchronizer tracks the position of the last event applied.  A full reload is performed when the replica has not been loaded, when the position is ahead of the latest position of the feed, when a gap is detected in the feed (i.e. the next event read is not at the position after the last applied, because intervening events are no longer retained by the feed), or when an event can't be applied.  The latest position of the feed is recorded before reloading, and events after that position are then applied to the reloaded replica.  Since each event sets the final state of the elements or mappings it affects, applying events which are already reflected in the reloaded data converges to the same state.
+
+    The state of the replica can be saved to a snapshot file along with the current position, allowing a new process to load the snapshot and start answering queries immediately, and then catch up by applying the events after the snapshot's position (or by fully reloading if the events are no longer retained by the feed).
+
+    Attributes:
+        position:
+            The position in the change feed of the last event applied to the replica, or None if the replica has not been synchronized.
+        applied_event_count:
+            The number of events applied incrementally to the replica.
+        full_reload_count:
+            The number of times the replica was fully reloaded.
+        gap_count:
+            The number of times a gap was detected in the change feed.
+        synchronization_failure_count:
+            The number of times synchronizing on the background thread failed (e.g. because the AccessManager instance was unavailable).
+    """
+
+    # The names of the AccessManagerEventProcessor methods which events can correspond to
+    _EVENT_TYPES: Set[str] = { current_name for current_name in dir(AccessManagerEventProcessor) if current_name.startswith("add_") or current_name.startswith("remove_") }
+
+    @property
+    def position(self) -> Union[int, None]:
+        """The position in the change feed of the last event applied to the replica, or None if the replica has not been synchronized."""
+        return self._position
+
+    @property
+    def applied_event_count(self) -> int:
+        """The number of events applied incrementally to the replica."""
+        return self._applied_event_count
+
+    @property
+    def full_reload_count(self) -> int:
+        """The number of times the replica was fully reloaded."""
+        return self._full_reload_count
+
+    @property
+    def gap_count(self) -> int:
+        """The number of times a gap was detected in the change feed."""
+        return self._gap_count
+
+    @property
+    def synchronization_failure_count(self) -> int:
+        """The number of times synchronizing on the background thread failed (e.g. because the AccessManager instance was unavailable)."""
+        return self._synchronization_failure_count
+
+    def __init__(self, replica: AccessManagerLocalReplica[Any, Any, Any, Any], change_feed: ChangeFeedBase, poll_interval: float, batch_size: int=1000) -> None:
+        """Initialises a new instance of the ChangeFeedSynchronizer class.
+
+        Args:
+            replica:
+                The replica to synchronize.
+            change_feed:
+                The feed to read events from.
+            poll_interval:
+                The time in seconds to wait between reads of the change feed when synchronizing on a background thread.
+            batch_size:
+                The maximum number of events to read from the change feed and apply to the replica at once.
+        """
+        if (poll_interval <= 0.0):
+            raise ValueError("Parameter 'poll_interval' with value {0} must be greater than 0.".format(poll_interval))
+        if (batch_size < 1):
+            raise ValueError("Parameter 'batch_size' with value {0} must be greater than or equal to 1.".format(batch_size))
+
+        self._replica: AccessManagerLocalReplica[Any, Any, Any, Any] = replica
+        self._change_feed: ChangeFeedBase = change_feed
+        self._poll_interval: float = poll_interval
+        self._batch_size: int = batch_size
+        self._position: Union[int, None] = None
+        self._applied_event_count: int = 0
+        self._full_reload_count: int = 0
+        self._gap_count: int = 0
+        self._synchronization_failure_count: int = 0
+        # Serializes calls to synchronize() from the background thread and callers
+        self._synchronize_lock: threading.Lock = threading.Lock()
+        self._stop_signal: threading.Event = threading.Event()
+        self._changes_available_signal: threading.Event = threading.Event()
+        self._synchronize_thread: Union[threading.Thread, None] = None
+        self._snapshot_serializer: AccessGraphSnapshotSerializer = AccessGraphSnapshotSerializer()
+
+    def synchronize(self) -> None:
+        """Applies all events in the change feed after the last applied position to the replica, fully reloading the replica if required.
+        """
+        with self._synchronize_lock:
+            if (self._position is None or self._replica.is_loaded == False or self._position > self._change_feed.latest_position):
+                # Position being ahead of the feed indicates the feed was reset, or a snapshot from a different feed was loaded
+                self._reload()
+            while (True):
+                assert self._position is not None
+                events: List[AccessManagerChangeEvent] = self._change_feed.read(self._position, self._batch_size)
+                if (len(events) == 0):
+                    # Mark the replica as current
+                    self._replica.update(lambda graph: None)
+                    break
+                if (self._events_are_contiguous(self._position, events) == False):
+                    self._gap_count += 1
+                    self._reload()
+                    continue
+                try:
+                    self._replica.update(lambda graph: self._apply_events(graph, events))
+                except Exception:
+                    # The replica may be partially updated, so reload it
+                    self._reload()
+                    continue
+                self._position = events[-1].position
+                self._applied_event_count += len(events)
+                if (len(events) < self._batch_size):
+                    break
+
+    def save_snapshot(self, file_path: str) -> None:
+        """Writes the contents of the replica and the position of the last applied event to a snapshot file.
+
+        Args:
+            file_path:
+                The path of the snapshot file.
+        """
+        with self._synchronize_lock:
+            position: Union[int, None] = self._position
+            if (position is None):
+                raise RuntimeError("The replica has not been synchronized.")
+            self._replica.read(lambda graph: self._snapshot_serializer.serialize(graph, position, file_path))
+
+    def load_snapshot(self, file_path: str) -> None:
+        """Replaces the contents of the replica with a snapshot file, and sets the position to the position stored in the snapshot.  The replica then answers queries from the snapshot data, and the next synchronization (e.g. on the background thread after start() is called) applies the events after the snapshot's position.
+
+        Args:
+            file_path:
+                The path of the snapshot file.
+
+        Raises:
+            DeserializationError: The file is not a valid snapshot.
+        """
+        graph, position, creation_time = self._snapshot_serializer.deserialize(file_path)
+        with self._synchronize_lock:
+            self._replica.load(graph, max(0.0, time.time() - creation_time))
+            self._position = position
+
+    def start(self) -> None:
+        """Starts synchronizing the replica on a background thread, every 'poll_interval' seconds or when notify_changes_available() is called."""
+        self._stop_signal.clear()
+        self._synchronize_thread = threading.Thread(target=self._synchronize_loop, name="ChangeFeedSynchronizer", daemon=True)
+        self._synchronize_thread.start()
+
+    def notify_changes_available(self) -> None:
+        """Notifies the synchronizer that events were added to the change feed (e.g. when events are pushed rather than polled)."""
+        self._changes_available_signal.set()
+
+    def stop(self) -> None:
+        """Stops synchronizing the replica, waiting for any in-progress synchronization to complete."""
+        self._stop_signal.set()
+        self._changes_available_signal.set()
+        if (self._synchronize_thread is not None):
+            self._synchronize_thread.join()
+            self._synchronize_thread = None
+
+    #region Private/Protected Methods
+
+    def _reload(self) -> None:
+        """Fully reloads the replica, and sets the position to the latest position of the change feed before the reload started.
+        """
+        latest_position: int = self._change_feed.latest_position
+        self._replica.refresh()
+        self._position = latest_position
+        self._full_reload_count += 1
+
+    def _events_are_contiguous(self, position: int, events: List[AccessManagerChangeEvent]) -> bool:
+        """Checks that events immediately follow the specified position, and have consecutive positions.
+
+        Args:
+            position:
+                The position of the last applied event.
+            events:
+                The events.
+
+        Returns:
+            Whether the events are contiguous.
+        """
+        for current_event in events:
+            position += 1
+            if (current_event.position != position):
+                return False
+
+        return True
+
+    def _apply_events(self, graph: AccessGraph, events: List[AccessManagerChangeEvent]) -> None:
+        for current_event in events:
+            if (current_event.event_type not in self._EVENT_TYPES):
+                raise ValueError("Change event at position {0} has unrecognized type '{1}'.".format(current_event.position, current_event.event_type))
+            getattr(graph, current_event.event_type)(*current_event.arguments)
+
+    def _synchronize_loop(self) -> None:
+        while (self._stop_signal.is_set() == False):
+            self._changes_available_signal.clear()
+            try:
+                self.synchronize()
+            except Exception:
+                # Source or change feed is unavailable, so retry after the poll interval
+                self._synchronization_failure_count += 1
+            self._changes_available_signal.wait(self._poll_interval)
+
+    #endregion
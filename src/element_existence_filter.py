@@ -0,0 +1,169 @@
+from typing import List, Tuple, Iterable, Callable, Union
+import threading
+import time
+
+from bloom_filter import BloomFilter
+
+class ElementExistenceFilter():
+    """Thread-safe filter which records the elements (e.g. users, groups, entity types and entities) which exist in an AccessManager instance in a BloomFilter, allowing lookups of elements which definitely don't exist to be answered without a request.
+
+    Elements are identified by tuples of strings, e.g. ('user', 'user1') or ('entity', 'ClientAccount', 'Company1').  The filter is periodically rebuilt from the full set of elements on a background thread, sized for the larger of 'expected_element_count' and the number of elements loaded.  Elements added by other clients between rebuilds are reported as not existing until the next rebuild, so 'rebuild_interval' bounds the staleness of negative results.  Until the first rebuild completes, all elements are reported as possibly existing.
+
+    Attributes:
+        is_populated:
+            Whether the filter has been built at least once.
+        size_in_bytes:
+            The memory used by the filter's bits.
+        rebuild_count:
+            The number of times the filter was successfully rebuilt.
+        rebuild_failure_count:
+            The number of times rebuilding the filter failed (e.g. because the AccessManager instance was unavailable).
+        last_rebuild_time:
+            The time (as returned by time.monotonic()) the filter was last successfully rebuilt, or None if it has not been built.
+    """
+
+    _ELEMENT_SEPARATOR: str = "\x1f"
+
+    @property
+    def is_populated(self) -> bool:
+        """Whether the filter has been built at least once."""
+        return self._bloom_filter is not None
+
+    @property
+    def size_in_bytes(self) -> int:
+        """The memory used by the filter's bits."""
+        current_bloom_filter: Union[BloomFilter, None] = self._bloom_filter
+        if (current_bloom_filter is None):
+            return 0
+        else:
+            return current_bloom_filter.size_in_bytes
+
+    @property
+    def rebuild_count(self) -> int:
+        """The number of times the filter was successfully rebuilt."""
+        return self._rebuild_count
+
+    @property
+    def rebuild_failure_count(self) -> int:
+        """The number of times rebuilding the filter failed (e.g. because the AccessManager instance was unavailable)."""
+        return self._rebuild_failure_count
+
+    @property
+    def last_rebuild_time(self) -> Union[float, None]:
+        """The time (as returned by time.monotonic()) the filter was last successfully rebuilt, or None if it has not been built."""
+        return self._last_rebuild_time
+
+    def __init__(self, expected_element_count: int, false_positive_rate: float, rebuild_interval: float) -> None:
+        """Initialises a new instance of the ElementExistenceFilter class.
+
+        Args:
+            expected_element_count:
+                The minimum number of elements to size the filter for.  Together with 'false_positive_rate' this determines the memory used by the filter.
+            false_positive_rate:
+                The probability that an element which doesn't exist is reported as possibly existing (resulting in a request to the AccessManager instance).
+            rebuild_interval:
+                The time in seconds between rebuilds of the filter.
+        """
+        if (expected_element_count < 1):
+            raise ValueError("Parameter 'expected_element_count' with value {0} must be greater than or equal to 1.".format(expected_element_count))
+        if (false_positive_rate <= 0.0 or false_positive_rate >= 1.0):
+            raise ValueError("Parameter 'false_positive_rate' with value {0} must be greater than 0 and less than 1.".format(false_positive_rate))
+        if (rebuild_interval <= 0.0):
+            raise ValueError("Parameter 'rebuild_interval' with value {0} must be greater than 0.".format(rebuild_interval))
+
+        self._expected_element_count: int = expected_element_count
+        self._false_positive_rate: float = false_positive_rate
+        self._rebuild_interval: float = rebuild_interval
+        self._lock: threading.Lock = threading.Lock()
+        self._bloom_filter: Union[BloomFilter, None] = None
+        # Elements added while a rebuild is in progress, which must be added to the rebuilt filter as they may not be included in the loaded elements
+        self._elements_added_during_rebuild: Union[List[Tuple[str, ...]], None] = None
+        self._rebuild_count: int = 0
+        self._rebuild_failure_count: int = 0
+        self._last_rebuild_time: Union[float, None] = None
+        self._stop_signal: threading.Event = threading.Event()
+        self._rebuild_thread: Union[threading.Thread, None] = None
+
+    def might_contain(self, element: Tuple[str, ...]) -> bool:
+        """Checks whether an element might exist.
+
+        Args:
+            element:
+                The element to check for.
+
+        Returns:
+            False if the element definitely doesn't exist (as of the last rebuild), or True if it might exist or the filter has not been built.
+        """
+        current_bloom_filter: Union[BloomFilter, None] = self._bloom_filter
+        if (current_bloom_filter is None):
+            return True
+        else:
+            return current_bloom_filter.might_contain(self._ELEMENT_SEPARATOR.join(element))
+
+    def add(self, element: Tuple[str, ...]) -> None:
+        """Records that an element exists (e.g. after it was added via the client).
+
+        Args:
+            element:
+                The element to add.
+        """
+        with self._lock:
+            if (self._bloom_filter is not None):
+                self._bloom_filter.add(self._ELEMENT_SEPARATOR.join(element))
+            if (self._elements_added_during_rebuild is not None):
+                self._elements_added_during_rebuild.append(element)
+
+    def rebuild(self, load_elements_function: Callable[[], Iterable[Tuple[str, ...]]]) -> None:
+        """Rebuilds the filter from the full set of elements.
+
+        Args:
+            load_elements_function:
+                Function which returns all elements which exist in the AccessManager instance.
+        """
+        with self._lock:
+            self._elements_added_during_rebuild = []
+        try:
+            elements: List[Tuple[str, ...]] = list(load_elements_function())
+            new_bloom_filter: BloomFilter = BloomFilter(max(self._expected_element_count, len(elements)), self._false_positive_rate)
+            for current_element in elements:
+                new_bloom_filter.add(self._ELEMENT_SEPARATOR.join(current_element))
+            with self._lock:
+                for current_element in self._elements_added_during_rebuild:
+                    new_bloom_filter.add(self._ELEMENT_SEPARATOR.join(current_element))
+                self._bloom_filter = new_bloom_filter
+                self._rebuild_count += 1
+                self._last_rebuild_time = time.monotonic()
+        finally:
+            with self._lock:
+                self._elements_added_during_rebuild = None
+
+    def start(self, load_elements_function: Callable[[], Iterable[Tuple[str, ...]]]) -> None:
+        """Starts rebuilding the filter on a background thread, immediately and then every 'rebuild_interval' seconds.
+
+        Args:
+            load_elements_function:
+                Function which returns all elements which exist in the AccessManager instance.
+        """
+        self._stop_signal.clear()
+        self._rebuild_thread = threading.Thread(target=self._rebuild_loop, args=(load_elements_function, ), name="ElementExistenceFilter", daemon=True)
+        self._rebuild_thread.start()
+
+    def stop(self) -> None:
+        """Stops rebuilding the filter, waiting for any in-progress rebuild to complete."""
+        self._stop_signal.set()
+        if (self._rebuild_thread is not None):
+            self._rebuild_thread.join()
+            self._rebuild_thread = None
+
+    #region Private/Protected Methods
+
+    def _rebuild_loop(self, load_elements_function: Callable[[], Iterable[Tuple[str, ...]]]) -> None:
+        while (self._stop_signal.is_set() == False):
+            try:
+                self.rebuild(load_elements_function)
+            except Exception:
+                # Keep answering from the previous filter (if any) until the next rebuild succeeds
+                self._rebuild_failure_count += 1
+            self._stop_signal.wait(self._rebuild_interval)
+
+    #endregion
@@ -0,0 +1,166 @@
+from typing import Any, Tuple, List, Dict, Union
+
+class EventCompactor():
+    """Removes redundant events from an ordered sequence of events, such that processing the remaining events results in the same final state of elements and mappings as processing the whole sequence.
+
+    Events are only removed, never reordered, so the ordering constraints between elements and their mappings (e.g. that an entity is added before a mapping to it) are preserved.  Elements may exist before the sequence, and adding a mapping or entity also creates the elements it involves (as on an AccessManager instance which doesn't require elements to be added before they're mapped), so an add event is only removed if any other elements it involves are created by retained events.  The following events are removed:
+        - An add or remove of a mapping which is followed by a later add or remove of the same mapping (the later event determines the final state).
+        - An add of an element which already has an earlier add in the sequence, with no intervening removal of the element.
+        - A remove of an element which already has an earlier remove in the sequence, with no intervening events involving the element.
+        - Mapping events involving an element, and events for entities of an entity type, which precede a removal of the element or entity type (since the removal also removes them).
+        - An add of an element which is followed by a removal of the element, when all events between them involving the element were also removed.  The removal is retained, as the element may have existed before the sequence.
+    Events for group to group mappings are only removed when superseded by a later event for the same mapping with no other group to group mapping events between them, as removing them could change which later group to group mappings are rejected as circular.
+    """
+
+    # Maps the names of the element and mapping types in event method names to functions returning the elements involved in an event of the type, given its arguments
+    _ELEMENT_TYPES: Dict[str, Any] = {
+        "user": lambda arguments: [ ("user", arguments[0]) ],
+        "group": lambda arguments: [ ("group", arguments[0]) ],
+        "entity_type": lambda arguments: [ ("entityType", arguments[0]) ],
+        "entity": lambda arguments: [ ("entity", arguments[0], arguments[1]), ("entityType", arguments[0]) ]
+    }
+    _MAPPING_TYPES: Dict[str, Any] = {
+        "user_to_group_mapping": lambda arguments: [ ("user", arguments[0]), ("group", arguments[1]) ],
+        "group_to_group_mapping": lambda arguments: [ ("group", arguments[0]), ("group", arguments[1]) ],
+        "user_to_application_component_and_access_level_mapping": lambda arguments: [ ("user", arguments[0]) ],
+        "group_to_application_component_and_access_level_mapping": lambda arguments: [ ("group", arguments[0]) ],
+        "user_to_entity_mapping": lambda arguments: [ ("user", arguments[0]), ("entity", arguments[1], arguments[2]), ("entityType", arguments[1]) ],
+        "group_to_entity_mapping": lambda arguments: [ ("group", arguments[0]), ("entity", arguments[1], arguments[2]), ("entityType", arguments[1]) ]
+    }
+    _GROUP_TO_GROUP_MAPPING_TYPE: str = "group_to_group_mapping"
+
+    def compact(self, events: List[Tuple[str, Tuple[Any, ...]]]) -> List[Tuple[str, Tuple[Any, ...]]]:
+        """Removes redundant events from a sequence of events.
+
+        Args:
+            events:
+                The events in order, each a tuple containing the name of the AccessManagerEventProcessor method and its arguments (which must be hashable).
+
+        Returns:
+            The remaining events in order.
+        """
+        parsed_events: List[_ParsedEvent] = [ self._parse_event(current_index, current_event) for current_index, current_event in enumerate(events) ]
+        # Maps the key of each element or mapping to the latest retained event for it
+        latest_events: Dict[Tuple[Any, ...], _ParsedEvent] = dict()
+        for current_event in parsed_events:
+            previous_event: Union[_ParsedEvent, None] = latest_events.get(current_event.key)
+            if (previous_event is not None and previous_event.removed == True):
+                previous_event = None
+            if (current_event.is_mapping == True):
+                if (previous_event is not None and self._can_supersede(parsed_events, previous_event, current_event) == True):
+                    previous_event.removed = True
+            elif (current_event.is_add == True):
+                if (previous_event is not None and previous_event.is_add == True):
+                    current_event.removed = True
+                    continue
+            else:
+                self._remove_events_removed_by_cascade(parsed_events, current_event)
+                if (previous_event is not None and previous_event.is_add == False and self._has_retained_events_involving(parsed_events, previous_event, current_event) == False):
+                    current_event.removed = True
+                    continue
+                if (previous_event is not None and previous_event.is_add == True and self._has_retained_events_involving(parsed_events, previous_event, current_event) == False):
+                    if (self._are_other_elements_created(parsed_events, previous_event, current_event) == True):
+                        previous_event.removed = True
+            latest_events[current_event.key] = current_event
+
+        return [ events[current_event.index] for current_event in parsed_events if current_event.removed == False ]
+
+    #region Private/Protected Methods
+
+    def _parse_event(self, index: int, event: Tuple[str, Tuple[Any, ...]]) -> "_ParsedEvent":
+        event_type, arguments = event
+        if (event_type.startswith("add_") == True):
+            is_add: bool = True
+            type_name: str = event_type[4:]
+        elif (event_type.startswith("remove_") == True):
+            is_add = False
+            type_name = event_type[7:]
+        else:
+            raise ValueError("Event at index {0} has unrecognized type '{1}'.".format(index, event_type))
+        if (type_name in self._MAPPING_TYPES):
+            return _ParsedEvent(index, (type_name, ) + tuple(arguments), is_add, True, type_name == self._GROUP_TO_GROUP_MAPPING_TYPE, self._MAPPING_TYPES[type_name](arguments))
+        elif (type_name in self._ELEMENT_TYPES):
+            return _ParsedEvent(index, (type_name, ) + tuple(arguments), is_add, False, False, self._ELEMENT_TYPES[type_name](arguments))
+        else:
+            raise ValueError("Event at index {0} has unrecognized type '{1}'.".format(index, event_type))
+
+    def _can_supersede(self, parsed_events: List["_ParsedEvent"], previous_event: "_ParsedEvent", current_event: "_ParsedEvent") -> bool:
+        """Checks whether an earlier event for a mapping can be removed because of a later event for the same mapping.
+        """
+        if (previous_event.is_add == True and current_event.is_add == False and self._are_other_elements_created(parsed_events, previous_event, current_event) == False):
+            # The add may be the event which creates the elements of the mapping
+            return False
+        if (current_event.is_group_to_group_mapping == False):
+            return True
+        for current_index in range(previous_event.index + 1, current_event.index):
+            if (parsed_events[current_index].removed == False and parsed_events[current_index].is_group_to_group_mapping == True):
+                return False
+
+        return True
+
+    def _has_retained_events_involving(self, parsed_events: List["_ParsedEvent"], previous_event: "_ParsedEvent", current_event: "_ParsedEvent") -> bool:
+        """Checks whether any retained events between two events for an element involve the element.
+        """
+        element: Tuple[Any, ...] = current_event.elements[0]
+        for current_index in range(previous_event.index + 1, current_event.index):
+            if (parsed_events[current_index].removed == False and element in parsed_events[current_index].elements):
+                return True
+
+        return False
+
+    def _remove_events_removed_by_cascade(self, parsed_events: List["_ParsedEvent"], removal_event: "_ParsedEvent") -> None:
+        """Removes the events preceding the removal of an element whose effect is undone by the removal (i.e. events for mappings involving the element, and for entities of a removed entity type).
+        """
+        element: Tuple[Any, ...] = removal_event.elements[0]
+        for current_index in range(0, removal_event.index):
+            current_event: _ParsedEvent = parsed_events[current_index]
+            if (current_event.removed == True or current_event.is_group_to_group_mapping == True or current_event.key == removal_event.key):
+                continue
+            if (element in current_event.elements):
+                if (current_event.is_add == True and self._are_other_elements_created(parsed_events, current_event, removal_event) == False):
+                    # The event may be the one which creates another element it involves
+                    continue
+                current_event.removed = True
+
+    def _are_other_elements_created(self, parsed_events: List["_ParsedEvent"], add_event: "_ParsedEvent", removal_event: "_ParsedEvent") -> bool:
+        """Checks whether the elements involved in an add event, other than those removed by a later removal of an element, exist due to retained events (other than the add event) preceding the removal.  If the removal is of a mapping, all the elements involved in the add event are checked.
+        """
+        removed_element: Union[Tuple[Any, ...], None] = None if removal_event.is_mapping == True else removal_event.elements[0]
+        for current_element in add_event.elements:
+            if (removed_element is not None and (current_element == removed_element or self._is_removed_by(current_element, removed_element) == True)):
+                continue
+            created: bool = False
+            for current_index in range(0, removal_event.index):
+                current_event: _ParsedEvent = parsed_events[current_index]
+                if (current_event.removed == True or current_event is add_event):
+                    continue
+                if (current_event.is_add == True and current_event.is_group_to_group_mapping == False and current_element in current_event.elements):
+                    # Group to group mappings aren't counted, as they're rejected if circular
+                    created = True
+                elif (current_event.is_add == False and current_event.is_mapping == False and (current_event.elements[0] == current_element or self._is_removed_by(current_element, current_event.elements[0]) == True)):
+                    created = False
+            if (created == False):
+                return False
+
+        return True
+
+    def _is_removed_by(self, element: Tuple[Any, ...], removed_element: Tuple[Any, ...]) -> bool:
+        """Checks whether an element is removed by the removal of a different element (i.e. an entity by the removal of its entity type).
+        """
+        return element[0] == "entity" and removed_element[0] == "entityType" and element[1] == removed_element[1]
+
+    #endregion
+
+class _ParsedEvent():
+    """An event being compacted by an EventCompactor."""
+
+    def __init__(self, index: int, key: Tuple[Any, ...], is_add: bool, is_mapping: bool, is_group_to_group_mapping: bool, elements: List[Tuple[Any, ...]]) -> None:
+        self.index: int = index
+        # Identifies the element or mapping the event is for
+        self.key: Tuple[Any, ...] = key
+        self.is_add: bool = is_add
+        self.is_mapping: bool = is_mapping
+        self.is_group_to_group_mapping: bool = is_group_to_group_mapping
+        # The elements involved in the event, with the element the event is for first for element events
+        self.elements: List[Tuple[Any, ...]] = elements
+        self.removed: bool = False
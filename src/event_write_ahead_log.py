@@ -0,0 +1,135 @@
+from typing import List, Tuple, Union
+import sqlite3
+import threading
+import time
+
+from http_method import HTTPMethod
+
+class EventWriteAheadLog():
+    """Durable, append-only log of event requests (i.e. the HTTP POST and DELETE requests which change the structure of an AccessManager instance), stored in a SQLite database.
+
+    Appended requests are committed (and hence fsync'd to disk) in batches, controlled by the 'fsync_batch_size' and 'fsync_interval' constructor parameters.  Requests appended since the last commit are lost if the process terminates before the next commit.
+
+    Attributes:
+        backlog_size:
+            The number of requests in the log which have not yet been removed (i.e. which are waiting to be replayed).
+    """
+
+    @property
+    def backlog_size(self) -> int:
+        """The number of requests in the log which have not yet been removed (i.e. which are waiting to be replayed)."""
+        with self._lock:
+            return self._backlog_size
+
+    def __init__(self, database_path: str, fsync_batch_size: int=1, fsync_interval: float=0.0) -> None:
+        """Initialises a new instance of the EventWriteAheadLog class.
+
+        Args:
+            database_path:
+                The path to the SQLite database file to store the log in.  Requests remaining in an existing file (e.g. from before a restart) are retained.
+            fsync_batch_size:
+                The number of changes (appended or removed requests) after which pending changes are committed to disk.  Set to 1 to commit every change immediately.
+            fsync_interval:
+                The maximum time in seconds that changes can remain uncommitted, when fewer than 'fsync_batch_size' changes are pending.  Checked on each change and each call to flush_if_due().  Set to 0 for no maximum time, in which case changes are committed only when 'fsync_batch_size' changes are pending, or when flush() or close() is called.
+        """
+        if (fsync_batch_size < 1):
+            raise ValueError("Parameter 'fsync_batch_size' with value {0} must be greater than or equal to 1.".format(fsync_batch_size))
+        if (fsync_interval < 0.0):
+            raise ValueError("Parameter 'fsync_interval' with value {0} must be greater than or equal to 0.".format(fsync_interval))
+
+        self._lock: threading.Lock = threading.Lock()
+        self._fsync_batch_size: int = fsync_batch_size
+        self._fsync_interval: float = fsync_interval
+        self._pending_change_count: int = 0
+        self._first_pending_change_time: float = 0.0
+        self._connection: sqlite3.Connection = sqlite3.connect(database_path, check_same_thread=False, isolation_level="DEFERRED")
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=FULL")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS EventRequests (Id INTEGER PRIMARY KEY AUTOINCREMENT, HttpMethod TEXT NOT NULL, Url TEXT NOT NULL)")
+        self._connection.commit()
+        self._backlog_size: int = self._connection.execute("SELECT COUNT(*) FROM EventRequests").fetchone()[0]
+
+    def append(self, http_method: HTTPMethod, request_url: str) -> None:
+        """Appends a request to the end of the log.
+
+        Args:
+            http_method:
+                The HTTP method of the request.
+            request_url:
+                The URL of the request.
+        """
+        with self._lock:
+            self._connection.execute("INSERT INTO EventRequests (HttpMethod, Url) VALUES (?, ?)", (http_method.name, request_url))
+            self._backlog_size += 1
+            self._record_change()
+
+    def read(self, max_count: int) -> List[Tuple[int, HTTPMethod, str]]:
+        """Reads requests from the start of the log (i.e. in the order they were appended), without removing them.
+
+        Args:
+            max_count:
+                The maximum number of requests to read.
+
+        Returns:
+            Tuples containing the sequence number, HTTP method and URL of each request.
+        """
+        with self._lock:
+            rows = self._connection.execute("SELECT Id, HttpMethod, Url FROM EventRequests ORDER BY Id LIMIT ?", (max_count, )).fetchall()
+
+        return [ (current_row[0], HTTPMethod[current_row[1]], current_row[2]) for current_row in rows ]
+
+    def remove(self, sequence_number: int) -> None:
+        """Removes a request from the log (e.g. after it has been successfully replayed).
+
+        Args:
+            sequence_number:
+                The sequence number of the request (as returned by the read() method).
+        """
+        with self._lock:
+            cursor: sqlite3.Cursor = self._connection.execute("DELETE FROM EventRequests WHERE Id = ?", (sequence_number, ))
+            if (cursor.rowcount > 0):
+                self._backlog_size -= 1
+                self._record_change()
+
+    def flush(self) -> None:
+        """Commits any pending changes to disk."""
+        with self._lock:
+            self._commit()
+
+    def flush_if_due(self) -> None:
+        """Commits any pending changes to disk if the oldest pending change is older than the 'fsync_interval' constructor parameter (never if the interval is 0)."""
+        with self._lock:
+            if (self._pending_change_count > 0 and self._is_fsync_interval_elapsed() == True):
+                self._commit()
+
+    def close(self) -> None:
+        """Commits any pending changes and closes the underlying database."""
+        with self._lock:
+            self._commit()
+            self._connection.close()
+
+    #region Private/Protected Methods
+
+    def _record_change(self) -> None:
+        """Records that a change was made, and commits pending changes if the batch size or interval has been reached.  Must be called while holding '_lock'.
+        """
+        if (self._pending_change_count == 0):
+            self._first_pending_change_time = time.monotonic()
+        self._pending_change_count += 1
+        if (self._pending_change_count >= self._fsync_batch_size or self._is_fsync_interval_elapsed() == True):
+            self._commit()
+
+    def _is_fsync_interval_elapsed(self) -> bool:
+        """Returns whether the oldest pending change is older than the 'fsync_interval' constructor parameter (always False if the interval is 0).  Must be called while holding '_lock'.
+        """
+        if (self._fsync_interval == 0.0):
+            return False
+        return time.monotonic() - self._first_pending_change_time >= self._fsync_interval
+
+    def _commit(self) -> None:
+        """Commits pending changes.  Must be called while holding '_lock'.
+        """
+        self._connection.commit()
+        self._pending_change_count = 0
+
+    #endregion
@@ -0,0 +1,90 @@
+from typing import List, Tuple, Callable, Union
+import threading
+
+from http_method import HTTPMethod
+from event_write_ahead_log import EventWriteAheadLog
+
+class EventWriteAheadLogReplayer():
+    """Replays the requests in an EventWriteAheadLog in order on a background thread, retrying while the AccessManager instance is unavailable.
+
+    Requests are removed from the log after they are successfully sent, hence a request may be sent more than once if the process terminates between sending and the removal being committed.  Requests which are rejected by the AccessManager instance with a ValueError (e.g. due to a 400 or 404 response status) cannot succeed on retry, and are removed and counted in 'discarded_request_count'.
+
+    Attributes:
+        discarded_request_count:
+            The number of requests which were removed from the log without succeeding, because they were rejected by the AccessManager instance.
+    """
+
+    _READ_BATCH_SIZE: int = 100
+
+    @property
+    def discarded_request_count(self) -> int:
+        """The number of requests which were removed from the log without succeeding, because they were rejected by the AccessManager instance."""
+        return self._discarded_request_count
+
+    def __init__(self, write_ahead_log: EventWriteAheadLog, send_request_action: Callable[[HTTPMethod, str], None], retry_interval: float) -> None:
+        """Initialises a new instance of the EventWriteAheadLogReplayer class.
+
+        Args:
+            write_ahead_log:
+                The log to replay requests from.
+            send_request_action:
+                Action which sends a request, accepting the HTTP method and URL of the request, and raising an exception if the request fails.
+            retry_interval:
+                The time in seconds to wait before retrying after a request fails.
+        """
+        if (retry_interval <= 0.0):
+            raise ValueError("Parameter 'retry_interval' with value {0} must be greater than 0.".format(retry_interval))
+
+        self._write_ahead_log: EventWriteAheadLog = write_ahead_log
+        self._send_request_action: Callable[[HTTPMethod, str], None] = send_request_action
+        self._retry_interval: float = retry_interval
+        self._discarded_request_count: int = 0
+        self._stop_signal: threading.Event = threading.Event()
+        self._requests_appended_signal: threading.Event = threading.Event()
+        self._replay_thread: Union[threading.Thread, None] = None
+
+    def start(self) -> None:
+        """Starts replaying requests on a background thread."""
+        self._stop_signal.clear()
+        self._replay_thread = threading.Thread(target=self._replay_loop, name="EventWriteAheadLogReplayer", daemon=True)
+        self._replay_thread.start()
+
+    def notify_requests_appended(self) -> None:
+        """Notifies the replayer that requests were appended to the log."""
+        self._requests_appended_signal.set()
+
+    def stop(self) -> None:
+        """Stops replaying requests, waiting for any in-flight request to complete.  Unsent requests remain in the log."""
+        self._stop_signal.set()
+        self._requests_appended_signal.set()
+        if (self._replay_thread is not None):
+            self._replay_thread.join()
+            self._replay_thread = None
+        self._write_ahead_log.flush()
+
+    #region Private/Protected Methods
+
+    def _replay_loop(self) -> None:
+        while (self._stop_signal.is_set() == False):
+            self._write_ahead_log.flush_if_due()
+            self._requests_appended_signal.clear()
+            requests: List[Tuple[int, HTTPMethod, str]] = self._write_ahead_log.read(self._READ_BATCH_SIZE)
+            if (len(requests) == 0):
+                # Commit any pending removals before waiting
+                self._write_ahead_log.flush()
+                self._requests_appended_signal.wait(self._retry_interval)
+                continue
+            for sequence_number, http_method, request_url in requests:
+                if (self._stop_signal.is_set() == True):
+                    return
+                try:
+                    self._send_request_action(http_method, request_url)
+                except ValueError:
+                    self._discarded_request_count += 1
+                except Exception:
+                    # AccessManager instance is unavailable or failed, so wait and retry from the same request
+                    self._stop_signal.wait(self._retry_interval)
+                    break
+                self._write_ahead_log.remove(sequence_number)
+
+    #endregion
@@ -0,0 +1,36 @@
+class QueueTimeBudgetExceededError(Exception):
+    """The exception that is thrown when a request to an AccessManager instance is rejected because the time it waited for a concurrency slot exceeded the queue time budget.
+
+    Attributes:
+        queue_time:
+            The time in seconds that the request waited before being rejected.
+        queue_time_budget:
+            The maximum time in seconds that a request is allowed to wait.
+    """
+
+    @property
+    def queue_time(self) -> float:
+        """The time in seconds that the request waited before being rejected."""
+        return self._queue_time
+
+    @property
+    def queue_time_budget(self) -> float:
+        """The maximum time in seconds that a request is allowed to wait."""
+        return self._queue_time_budget
+
+    def __init__(self, message: str, queue_time: float, queue_time_budget: float) -> None:
+        """Initialises a new instance of the QueueTimeBudgetExceededError class.
+        
+        Args:
+            message:   
+                The message that describes the error.
+            queue_time:
+                The time in seconds that the request waited before being rejected.
+            queue_time_budget:
+                The maximum time in seconds that a request is allowed to wait.
+        """
+        super().__init__(message)
+        self._queue_time: float = queue_time
+        self._queue_time_budget: float = queue_time_budget
+
+    __doc__ += Exception.__doc__ # type: ignore
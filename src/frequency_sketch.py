@@ -0,0 +1,95 @@
+from typing import Hashable, List
+
+class FrequencySketch():
+    """A count-min sketch which estimates how frequently elements have been accessed, in a fixed amount of memory, for use in cache admission policies (e.g. TinyLFU).
+
+    Counters are capped at 15, and all counters are halved once the number of increments reaches the sample size (10 times the expected number of distinct elements), so that the estimated frequencies reflect recent accesses.  Elements are hashed with hash(), so estimates are only meaningful within a single process.
+
+    Attributes:
+        width:
+            The number of counters in each of the sketch's 4 rows.
+        sample_size:
+            The number of increments after which all counters are halved.
+        reset_count:
+            The number of times the counters were halved.
+    """
+
+    _ROW_COUNT: int = 4
+    _MAX_COUNTER_VALUE: int = 15
+    # Odd 64 bit constants used to derive a different hash for each row
+    _ROW_SEEDS: List[int] = [ 0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93 ]
+    _HASH_MASK: int = 0xFFFFFFFFFFFFFFFF
+
+    @property
+    def width(self) -> int:
+        """The number of counters in each of the sketch's 4 rows."""
+        return self._width
+
+    @property
+    def sample_size(self) -> int:
+        """The number of increments after which all counters are halved."""
+        return self._sample_size
+
+    @property
+    def reset_count(self) -> int:
+        """The number of times the counters were halved."""
+        return self._reset_count
+
+    def __init__(self, expected_element_count: int) -> None:
+        """Initialises a new instance of the FrequencySketch class.
+
+        Args:
+            expected_element_count:
+                The expected number of distinct elements (e.g. the maximum size of the cache using the sketch).
+        """
+        if (expected_element_count < 1):
+            raise ValueError("Parameter 'expected_element_count' with value {0} must be greater than or equal to 1.".format(expected_element_count))
+
+        # Use 4 counters per expected element in each row to limit collisions, rounded up to a power of 2 so row indices can be derived by masking
+        self._width: int = 1 << max(4, (4 * expected_element_count - 1).bit_length())
+        self._sample_size: int = 10 * expected_element_count
+        self._counters: bytearray = bytearray(self._ROW_COUNT * self._width)
+        self._increment_count: int = 0
+        self._reset_count: int = 0
+
+    def increment(self, element: Hashable) -> None:
+        """Records an access to an element.
+
+        Args:
+            element:
+                The element.
+        """
+        for current_index in self._get_counter_indices(element):
+            if (self._counters[current_index] < self._MAX_COUNTER_VALUE):
+                self._counters[current_index] += 1
+        self._increment_count += 1
+        if (self._increment_count >= self._sample_size):
+            self._reset()
+
+    def estimate(self, element: Hashable) -> int:
+        """Estimates the number of times an element was accessed (since the counters were last halved, and capped at 15).
+
+        Args:
+            element:
+                The element.
+
+        Returns:
+            The estimated access count, which may overestimate but never underestimates the (capped and halved) count.
+        """
+        return min(self._counters[current_index] for current_index in self._get_counter_indices(element))
+
+    #region Private/Protected Methods
+
+    def _get_counter_indices(self, element: Hashable) -> List[int]:
+        element_hash: int = hash(element) & self._HASH_MASK
+        mask: int = self._width - 1
+
+        return [ row * self._width + ((((element_hash ^ (element_hash >> 29)) * self._ROW_SEEDS[row]) & self._HASH_MASK) >> 32 & mask) for row in range(self._ROW_COUNT) ]
+
+    def _reset(self) -> None:
+        """Halves all counters."""
+        self._counters = bytearray(current_counter >> 1 for current_counter in self._counters)
+        self._increment_count //= 2
+        self._reset_count += 1
+
+    #endregion
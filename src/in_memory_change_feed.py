@@ -0,0 +1,129 @@
+from typing import List, Deque
+from collections import deque
+import threading
+
+from access_manager_event_processor import AccessManagerEventProcessor
+from change_feed_base import ChangeFeedBase
+from models.access_manager_change_event import AccessManagerChangeEvent
+
+class InMemoryChangeFeed(ChangeFeedBase, AccessManagerEventProcessor[str, str, str, str]):
+    """Thread-safe change feed which records the events passed to its AccessManagerEventProcessor methods in memory, retaining a bounded number of the most recent events.
+
+    Can be used as a local stand-in for a server-side event feed, e.g. by also passing each event sent to an AccessManager instance to the feed.  Callers of wait_for_events() are notified as soon as an event is recorded, in the same way as a long-polling or server-sent events endpoint.
+
+    Attributes:
+        latest_position:
+            The position of the most recent event in the feed, or 0 if the feed contains no events.
+        max_retained_event_count:
+            The maximum number of events retained by the feed.
+    """
+
+    @property
+    def latest_position(self) -> int:
+        with self._lock:
+            return self._latest_position
+
+    @property
+    def max_retained_event_count(self) -> int:
+        """The maximum number of events retained by the feed."""
+        return self._max_retained_event_count
+
+    def __init__(self, max_retained_event_count: int) -> None:
+        """Initialises a new instance of the InMemoryChangeFeed class.
+
+        Args:
+            max_retained_event_count:
+                The maximum number of events retained by the feed.  Older events are discarded.
+        """
+        if (max_retained_event_count < 1):
+            raise ValueError("Parameter 'max_retained_event_count' with value {0} must be greater than or equal to 1.".format(max_retained_event_count))
+
+        self._max_retained_event_count: int = max_retained_event_count
+        self._lock: threading.Lock = threading.Lock()
+        # Notified when an event is recorded
+        self._event_recorded_condition: threading.Condition = threading.Condition(self._lock)
+        self._events: Deque[AccessManagerChangeEvent] = deque(maxlen=max_retained_event_count)
+        self._latest_position: int = 0
+
+    def read(self, after_position: int, max_count: int) -> List[AccessManagerChangeEvent]:
+        with self._lock:
+            if (len(self._events) == 0 or after_position >= self._latest_position):
+                return []
+            first_retained_position: int = self._events[0].position
+            start_index: int = max(0, after_position + 1 - first_retained_position)
+
+            return [ self._events[i] for i in range(start_index, min(len(self._events), start_index + max_count)) ]
+
+    def wait_for_events(self, after_position: int, timeout: float) -> bool:
+        with self._lock:
+            return self._event_recorded_condition.wait_for(lambda: self._latest_position > after_position, timeout)
+
+    def add_user(self, user: str) -> None:
+        self._append("add_user", user)
+
+    def remove_user(self, user: str) -> None:
+        self._append("remove_user", user)
+
+    def add_group(self, group: str) -> None:
+        self._append("add_group", group)
+
+    def remove_group(self, group: str) -> None:
+        self._append("remove_group", group)
+
+    def add_user_to_group_mapping(self, user: str, group: str) -> None:
+        self._append("add_user_to_group_mapping", user, group)
+
+    def remove_user_to_group_mapping(self, user: str, group: str) -> None:
+        self._append("remove_user_to_group_mapping", user, group)
+
+    def add_group_to_group_mapping(self, from_group: str, to_group: str) -> None:
+        self._append("add_group_to_group_mapping", from_group, to_group)
+
+    def remove_group_to_group_mapping(self, from_group: str, to_group: str) -> None:
+        self._append("remove_group_to_group_mapping", from_group, to_group)
+
+    def add_user_to_application_component_and_access_level_mapping(self, user: str, application_component: str, access_level: str) -> None:
+        self._append("add_user_to_application_component_and_access_level_mapping", user, application_component, access_level)
+
+    def remove_user_to_application_component_and_access_level_mapping(self, user: str, application_component: str, access_level: str) -> None:
+        self._append("remove_user_to_application_component_and_access_level_mapping", user, application_component, access_level)
+
+    def add_group_to_application_component_and_access_level_mapping(self, group: str, application_component: str, access_level: str) -> None:
+        self._append("add_group_to_application_component_and_access_level_mapping", group, application_component, access_level)
+
+    def remove_group_to_application_component_and_access_level_mapping(self, group: str, application_component: str, access_level: str) -> None:
+        self._append("remove_group_to_application_component_and_access_level_mapping", group, application_component, access_level)
+
+    def add_entity_type(self, entity_type: str) -> None:
+        self._append("add_entity_type", entity_type)
+
+    def remove_entity_type(self, entity_type: str) -> None:
+        self._append("remove_entity_type", entity_type)
+
+    def add_entity(self, entity_type: str, entity: str) -> None:
+        self._append("add_entity", entity_type, entity)
+
+    def remove_entity(self, entity_type: str, entity: str) -> None:
+        self._append("remove_entity", entity_type, entity)
+
+    def add_user_to_entity_mapping(self, user: str, entity_type: str, entity: str) -> None:
+        self._append("add_user_to_entity_mapping", user, entity_type, entity)
+
+    def remove_user_to_entity_mapping(self, user: str, entity_type: str, entity: str) -> None:
+        self._append("remove_user_to_entity_mapping", user, entity_type, entity)
+
+    def add_group_to_entity_mapping(self, group: str, entity_type: str, entity: str) -> None:
+        self._append("add_group_to_entity_mapping", group, entity_type, entity)
+
+    def remove_group_to_entity_mapping(self, group: str, entity_type: str, entity: str) -> None:
+        self._append("remove_group_to_entity_mapping", group, entity_type, entity)
+
+    #region Private/Protected Methods
+
+    def _append(self, event_type: str, *arguments: str) -> None:
+        with self._lock:
+            self._latest_position += 1
+            self._events.append(AccessManagerChangeEvent(self._latest_position, event_type, arguments))
+            self._event_recorded_condition.notify_all()
+
+    #endregion
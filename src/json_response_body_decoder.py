@@ -0,0 +1,15 @@
+from typing import List, Dict, Union, Any
+import json
+
+from response_body_decoder_base import ResponseBodyDecoderBase
+
+class JsonResponseBodyDecoder(ResponseBodyDecoderBase):
+    """An implementation of ResponseBodyDecoderBase which decodes JSON response bodies."""
+
+    @property
+    def content_type(self) -> str:
+        return "application/json"
+
+    def decode(self, response_body: bytes) -> Union[str, bool, List[str], List[Dict[str, Any]], Dict[str, Any]]:
+
+        return json.loads(response_body)
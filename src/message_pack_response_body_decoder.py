@@ -0,0 +1,25 @@
+from typing import List, Dict, Union, Any
+
+from response_body_decoder_base import ResponseBodyDecoderBase
+
+class MessagePackResponseBodyDecoder(ResponseBodyDecoderBase):
+    """An implementation of ResponseBodyDecoderBase which decodes MessagePack response bodies.
+
+    Requires the 'msgpack' package to be installed.
+    """
+
+    def __init__(self) -> None:
+        """Initialises a new instance of the MessagePackResponseBodyDecoder class."""
+        try:
+            import msgpack
+        except ImportError as exc:
+            raise ImportError("Package 'msgpack' must be installed to decode MessagePack response bodies.") from exc
+        self._unpackb = msgpack.unpackb
+
+    @property
+    def content_type(self) -> str:
+        return "application/msgpack"
+
+    def decode(self, response_body: bytes) -> Union[str, bool, List[str], List[Dict[str, Any]], Dict[str, Any]]:
+
+        return self._unpackb(response_body, raw=False)
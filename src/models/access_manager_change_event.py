@@ -0,0 +1,43 @@
+from typing import Tuple
+
+class AccessManagerChangeEvent:
+    """Container class holding an event which changed the elements or mappings of an AccessManager instance, as read from a change feed.
+
+    Attributes:
+        position:
+            The position of the event in the change feed.  Positions of consecutive events increase by 1.
+        event_type:
+            The name of the AccessManagerEventProcessor method corresponding to the event, e.g. 'add_user_to_group_mapping'.
+        arguments:
+            The stringified arguments of the event, in the order of the parameters of the corresponding AccessManagerEventProcessor method.
+    """
+
+    @property
+    def position(self) -> int:
+        """The position of the event in the change feed.  Positions of consecutive events increase by 1."""
+        return self._position
+
+    @property
+    def event_type(self) -> str:
+        """The name of the AccessManagerEventProcessor method corresponding to the event, e.g. 'add_user_to_group_mapping'."""
+        return self._event_type
+
+    @property
+    def arguments(self) -> Tuple[str, ...]:
+        """The stringified arguments of the event, in the order of the parameters of the corresponding AccessManagerEventProcessor method."""
+        return self._arguments
+
+    def __init__(self, position: int, event_type: str, arguments: Tuple[str, ...]) -> None:
+        """Initialises a new instance of the AccessManagerChangeEvent class.
+
+        Args:
+            position:
+                The position of the event in the change feed.
+            event_type:
+                The name of the AccessManagerEventProcessor method corresponding to the event.
+            arguments:
+                The stringified arguments of the event.
+        """
+        self._position: int = position
+        self._event_type: str = event_type
+        self._arguments: Tuple[str, ...] = arguments
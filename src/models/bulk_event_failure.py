@@ -0,0 +1,43 @@
+from typing import Any
+
+class BulkEventFailure:
+    """Container class holding an item of a bulk event method (e.g. AccessManagerClient.add_users()) whose event failed.
+
+    Attributes:
+        index:
+            The position of the item in the items passed to the bulk event method.
+        item:
+            The item (e.g. a user, or a tuple containing a user and group).
+        error:
+            The exception raised when processing the event for the item.
+    """
+
+    @property
+    def index(self) -> int:
+        """The position of the item in the items passed to the bulk event method."""
+        return self._index
+
+    @property
+    def item(self) -> Any:
+        """The item (e.g. a user, or a tuple containing a user and group)."""
+        return self._item
+
+    @property
+    def error(self) -> Exception:
+        """The exception raised when processing the event for the item."""
+        return self._error
+
+    def __init__(self, index: int, item: Any, error: Exception) -> None:
+        """Initialises a new instance of the BulkEventFailure class.
+
+        Args:
+            index:
+                The position of the item in the items passed to the bulk event method.
+            item:
+                The item.
+            error:
+                The exception raised when processing the event for the item.
+        """
+        self._index: int = index
+        self._item: Any = item
+        self._error: Exception = error
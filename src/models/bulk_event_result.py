@@ -0,0 +1,49 @@
+from typing import List
+
+from models.bulk_event_failure import BulkEventFailure
+
+class BulkEventResult:
+    """Container class holding the outcome of a bulk event method (e.g. AccessManagerClient.add_users()).
+
+    Attributes:
+        item_count:
+            The number of items processed.
+        success_count:
+            The number of items whose event succeeded.
+        failures:
+            The items whose event failed, in the order of the items passed to the bulk event method.
+        succeeded:
+            Whether the events for all items succeeded.
+    """
+
+    @property
+    def item_count(self) -> int:
+        """The number of items processed."""
+        return self._item_count
+
+    @property
+    def success_count(self) -> int:
+        """The number of items whose event succeeded."""
+        return self._item_count - len(self._failures)
+
+    @property
+    def failures(self) -> List[BulkEventFailure]:
+        """The items whose event failed, in the order of the items passed to the bulk event method."""
+        return self._failures
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the events for all items succeeded."""
+        return len(self._failures) == 0
+
+    def __init__(self, item_count: int, failures: List[BulkEventFailure]) -> None:
+        """Initialises a new instance of the BulkEventResult class.
+
+        Args:
+            item_count:
+                The number of items processed.
+            failures:
+                The items whose event failed.
+        """
+        self._item_count: int = item_count
+        self._failures: List[BulkEventFailure] = sorted(failures, key=lambda failure: failure.index)
@@ -0,0 +1,316 @@
+from typing import Any, Tuple, Union, Dict, Set, List
+from collections import OrderedDict, Counter
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+from access_manager_query_processor import AccessManagerQueryProcessor
+
+class QueryPrefetcher():
+    """Learns which queries each user makes and when their sessions typically start from the history of recorded queries, and calls those queries ahead of demand on a bounded pool of background threads, so that the results are already held in the query result cache of the source (e.g. an AccessManagerClient with a 'query_result_cache').
+
+    Queries are recorded by calling record() with the name of a user-based AccessManagerQueryProcessor method and its parameters.  A recorded query for a user who hasn't made a query within 'session_gap' seconds starts a new session for the user, and the user's other most frequent queries are prefetched.  The time of day each session starts is also recorded (in buckets of 'time_of_day_bucket_size' seconds), and calling prefetch_expected_sessions() (e.g. periodically from a scheduler) prefetches the queries of users whose sessions typically start soon.
+
+    A prefetched query is counted as a hit if the same query is recorded within 'usefulness_window' seconds of the prefetch completing (which should not exceed the time-to-live of the source's cache), and as waste otherwise.
+
+    Attributes:
+        prefetch_count:
+            The number of queries successfully prefetched.
+        hit_count:
+            The number of prefetched queries which were subsequently recorded within the usefulness window.
+        waste_count:
+            The number of prefetched queries which were not recorded within the usefulness window.
+        hit_ratio:
+            The ratio of hits to prefetched queries whose outcome is known (i.e. which were either hits or waste), or 0 if no outcomes are known.
+        waste_ratio:
+            The ratio of waste to prefetched queries whose outcome is known, or 0 if no outcomes are known.
+        skipped_count:
+            The number of prefetches not started because the maximum number of pending prefetches was reached.
+        failure_count:
+            The number of prefetches which failed.
+    """
+
+    # The AccessManagerQueryProcessor methods which can be recorded and prefetched, all of which accept a user as their first parameter
+    _PREFETCHABLE_METHODS: Set[str] = {
+        "has_access_to_application_component",
+        "has_access_to_entity",
+        "get_application_components_accesible_by_user",
+        "get_entities_accessible_by_user",
+        "get_entities_of_type_accessible_by_user",
+        "get_user_to_group_mappings",
+        "get_user_to_application_component_and_access_level_mappings",
+        "get_user_to_entity_mappings",
+        "get_user_to_entity_mappings_for_type"
+    }
+    _SECONDS_PER_DAY: int = 86400
+
+    @property
+    def prefetch_count(self) -> int:
+        """The number of queries successfully prefetched."""
+        return self._prefetch_count
+
+    @property
+    def hit_count(self) -> int:
+        """The number of prefetched queries which were subsequently recorded within the usefulness window."""
+        return self._hit_count
+
+    @property
+    def waste_count(self) -> int:
+        """The number of prefetched queries which were not recorded within the usefulness window."""
+        with self._lock:
+            self._remove_expired_prefetches(time.monotonic())
+            return self._waste_count
+
+    @property
+    def hit_ratio(self) -> float:
+        """The ratio of hits to prefetched queries whose outcome is known (i.e. which were either hits or waste), or 0 if no outcomes are known."""
+        with self._lock:
+            self._remove_expired_prefetches(time.monotonic())
+            if (self._hit_count + self._waste_count == 0):
+                return 0.0
+            return self._hit_count / (self._hit_count + self._waste_count)
+
+    @property
+    def waste_ratio(self) -> float:
+        """The ratio of waste to prefetched queries whose outcome is known, or 0 if no outcomes are known."""
+        with self._lock:
+            self._remove_expired_prefetches(time.monotonic())
+            if (self._hit_count + self._waste_count == 0):
+                return 0.0
+            return self._waste_count / (self._hit_count + self._waste_count)
+
+    @property
+    def skipped_count(self) -> int:
+        """The number of prefetches not started because the maximum number of pending prefetches was reached."""
+        return self._skipped_count
+
+    @property
+    def failure_count(self) -> int:
+        """The number of prefetches which failed."""
+        return self._failure_count
+
+    def __init__(
+            self,
+            source: AccessManagerQueryProcessor[Any, Any, Any, Any],
+            max_concurrency: int=4,
+            max_pending_prefetches: int=100,
+            max_queries_per_user: int=20,
+            max_users: int=10000,
+            session_gap: float=1800.0,
+            time_of_day_bucket_size: int=900,
+            usefulness_window: float=300.0
+        ) -> None:
+        """Initialises a new instance of the QueryPrefetcher class.
+
+        Args:
+            source:
+                The query processor (e.g. an AccessManagerClient with a query result cache) to prefetch queries from.
+            max_concurrency:
+                The maximum number of queries prefetched at the same time.
+            max_pending_prefetches:
+                The maximum number of prefetches which can be in progress or waiting to start.  Prefetches which would exceed this are skipped.
+            max_queries_per_user:
+                The number of each user's most frequently recorded queries to prefetch.
+            max_users:
+                The maximum number of users to retain history for (least recently active first).
+            session_gap:
+                The time in seconds without recorded queries after which a user's next recorded query starts a new session.
+            time_of_day_bucket_size:
+                The size in seconds of the time of day intervals that session start times are recorded in.
+            usefulness_window:
+                The time in seconds after a prefetch completes within which recording the same query counts as a hit.
+        """
+        if (max_concurrency < 1):
+            raise ValueError("Parameter 'max_concurrency' with value {0} must be greater than or equal to 1.".format(max_concurrency))
+        if (max_pending_prefetches < 1):
+            raise ValueError("Parameter 'max_pending_prefetches' with value {0} must be greater than or equal to 1.".format(max_pending_prefetches))
+        if (max_queries_per_user < 1):
+            raise ValueError("Parameter 'max_queries_per_user' with value {0} must be greater than or equal to 1.".format(max_queries_per_user))
+        if (max_users < 1):
+            raise ValueError("Parameter 'max_users' with value {0} must be greater than or equal to 1.".format(max_users))
+        if (session_gap <= 0.0):
+            raise ValueError("Parameter 'session_gap' with value {0} must be greater than 0.".format(session_gap))
+        if (time_of_day_bucket_size < 1 or time_of_day_bucket_size > self._SECONDS_PER_DAY):
+            raise ValueError("Parameter 'time_of_day_bucket_size' with value {0} must be between 1 and {1}.".format(time_of_day_bucket_size, self._SECONDS_PER_DAY))
+        if (usefulness_window <= 0.0):
+            raise ValueError("Parameter 'usefulness_window' with value {0} must be greater than 0.".format(usefulness_window))
+
+        self._source: AccessManagerQueryProcessor[Any, Any, Any, Any] = source
+        self._max_pending_prefetches: int = max_pending_prefetches
+        self._max_queries_per_user: int = max_queries_per_user
+        self._max_users: int = max_users
+        self._session_gap: float = session_gap
+        self._time_of_day_bucket_size: int = time_of_day_bucket_size
+        self._usefulness_window: float = usefulness_window
+        self._lock: threading.Lock = threading.Lock()
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="QueryPrefetcher")
+        # Maps users (least recently active first) to the counts of their recorded queries, each stored as a tuple containing the method name and parameters
+        self._user_queries: OrderedDict[Any, Counter] = OrderedDict()
+        # Maps users to the counts of the time of day buckets their sessions started in
+        self._user_session_start_buckets: Dict[Any, Counter] = dict()
+        # Maps users to the time.time() their last query was recorded
+        self._user_last_query_times: Dict[Any, float] = dict()
+        # Queries currently being prefetched or waiting to be
+        self._pending_prefetches: Set[Tuple[Any, ...]] = set()
+        # Maps prefetched queries whose outcome is not yet known to the time.monotonic() the prefetch completed
+        self._prefetched_queries: OrderedDict[Tuple[Any, ...], float] = OrderedDict()
+        self._prefetch_count: int = 0
+        self._hit_count: int = 0
+        self._waste_count: int = 0
+        self._skipped_count: int = 0
+        self._failure_count: int = 0
+
+    def record(self, method_name: str, user: Any, *parameters: Any) -> None:
+        """Records a query made against the source, and prefetches the user's other frequent queries if the query starts a new session for the user.
+
+        Args:
+            method_name:
+                The name of the AccessManagerQueryProcessor method called (e.g. 'has_access_to_entity').
+            user:
+                The user passed to the method.
+            parameters:
+                The remaining parameters passed to the method.  Must be hashable.
+        """
+        if (method_name not in self._PREFETCHABLE_METHODS):
+            raise ValueError("Parameter 'method_name' with value '{0}' must be the name of an AccessManagerQueryProcessor method which accepts a user as its first parameter.".format(method_name))
+        query: Tuple[Any, ...] = (method_name, user) + parameters
+        current_time: float = time.time()
+        queries_to_prefetch: List[Tuple[Any, ...]] = []
+        with self._lock:
+            self._remove_expired_prefetches(time.monotonic())
+            if (self._prefetched_queries.pop(query, None) is not None):
+                self._hit_count += 1
+            last_query_time: Union[float, None] = self._user_last_query_times.get(user)
+            if (last_query_time is None or current_time - last_query_time > self._session_gap):
+                queries_to_prefetch = self._get_frequent_queries(user)
+                self._user_session_start_buckets.setdefault(user, Counter())[self._get_time_of_day_bucket(current_time)] += 1
+            self._user_last_query_times[user] = current_time
+            self._record_query(user, query)
+        self._prefetch([ current_query for current_query in queries_to_prefetch if current_query != query ])
+
+    def prefetch_expected_sessions(self, lookahead: Union[float, None]=None, at_time: Union[float, None]=None) -> int:
+        """Prefetches the frequent queries of users who don't currently have an active session, and whose sessions have previously started in the time of day interval(s) between now and the lookahead time.
+
+        Args:
+            lookahead:
+                The time in seconds to look ahead.  Defaults to the time of day bucket size.
+            at_time:
+                The time (as returned by time.time()) to look ahead from.  Defaults to the current time.
+
+        Returns:
+            The number of queries scheduled to be prefetched.
+        """
+        if (lookahead is None):
+            lookahead = float(self._time_of_day_bucket_size)
+        if (at_time is None):
+            at_time = time.time()
+        expected_buckets: Set[int] = set()
+        bucket_time: float = at_time
+        while (bucket_time <= at_time + lookahead):
+            expected_buckets.add(self._get_time_of_day_bucket(bucket_time))
+            bucket_time += self._time_of_day_bucket_size
+        expected_buckets.add(self._get_time_of_day_bucket(at_time + lookahead))
+        queries_to_prefetch: List[Tuple[Any, ...]] = []
+        with self._lock:
+            for current_user, current_session_start_buckets in self._user_session_start_buckets.items():
+                if (at_time - self._user_last_query_times[current_user] <= self._session_gap):
+                    continue
+                if (expected_buckets.isdisjoint(current_session_start_buckets.keys()) == False):
+                    queries_to_prefetch.extend(self._get_frequent_queries(current_user))
+
+        return self._prefetch(queries_to_prefetch)
+
+    def close(self) -> None:
+        """Waits for any in-progress prefetches to complete, and stops the background threads."""
+        self._executor.shutdown(wait=True)
+
+    #region Private/Protected Methods
+
+    def _get_time_of_day_bucket(self, at_time: float) -> int:
+        local_time: time.struct_time = time.localtime(at_time)
+        seconds_since_midnight: int = local_time.tm_hour * 3600 + local_time.tm_min * 60 + local_time.tm_sec
+
+        return seconds_since_midnight // self._time_of_day_bucket_size
+
+    def _get_frequent_queries(self, user: Any) -> List[Tuple[Any, ...]]:
+        """Gets a user's most frequently recorded queries.  Must be called while holding '_lock'."""
+        user_queries: Union[Counter, None] = self._user_queries.get(user)
+        if (user_queries is None):
+            return []
+
+        return [ current_query for current_query, current_count in user_queries.most_common(self._max_queries_per_user) ]
+
+    def _record_query(self, user: Any, query: Tuple[Any, ...]) -> None:
+        """Adds a query to a user's history, removing the history of the least recently active user if the maximum number of users is exceeded.  Must be called while holding '_lock'.
+        """
+        user_queries: Union[Counter, None] = self._user_queries.get(user)
+        if (user_queries is None):
+            user_queries = Counter()
+            self._user_queries[user] = user_queries
+            if (len(self._user_queries) > self._max_users):
+                evicted_user: Any = self._user_queries.popitem(last=False)[0]
+                self._user_session_start_buckets.pop(evicted_user, None)
+                self._user_last_query_times.pop(evicted_user, None)
+        else:
+            self._user_queries.move_to_end(user)
+        user_queries[query] += 1
+        if (len(user_queries) > self._max_queries_per_user * 2):
+            # Retain the most frequent queries, so that the history of each user is bounded
+            retained_queries: List[Tuple[Tuple[Any, ...], int]] = user_queries.most_common(self._max_queries_per_user)
+            user_queries.clear()
+            user_queries.update(dict(retained_queries))
+
+    def _prefetch(self, queries: List[Tuple[Any, ...]]) -> int:
+        """Schedules queries to be prefetched on the background threads, skipping queries already pending or awaiting an outcome within the usefulness window.
+
+        Args:
+            queries:
+                The queries.
+
+        Returns:
+            The number of queries scheduled.
+        """
+        scheduled_count: int = 0
+        with self._lock:
+            # Expired prefetches are removed so that they are prefetched again, and so that they don't accumulate when outcome statistics aren't read
+            self._remove_expired_prefetches(time.monotonic())
+            for current_query in queries:
+                if (current_query in self._pending_prefetches or current_query in self._prefetched_queries):
+                    continue
+                if (len(self._pending_prefetches) >= self._max_pending_prefetches):
+                    self._skipped_count += 1
+                    continue
+                self._pending_prefetches.add(current_query)
+                self._executor.submit(self._prefetch_query, current_query)
+                scheduled_count += 1
+
+        return scheduled_count
+
+    def _prefetch_query(self, query: Tuple[Any, ...]) -> None:
+        try:
+            getattr(self._source, query[0])(*query[1:])
+            with self._lock:
+                self._prefetched_queries[query] = time.monotonic()
+                self._prefetch_count += 1
+        except Exception:
+            with self._lock:
+                self._failure_count += 1
+        finally:
+            with self._lock:
+                self._pending_prefetches.discard(query)
+
+    def _remove_expired_prefetches(self, current_time: float) -> None:
+        """Counts prefetched queries which were not recorded within the usefulness window as waste.  Must be called while holding '_lock'.
+
+        Args:
+            current_time:
+                The current time as returned by time.monotonic().
+        """
+        while (len(self._prefetched_queries) > 0):
+            query, prefetch_completed_time = next(iter(self._prefetched_queries.items()))
+            if (current_time - prefetch_completed_time <= self._usefulness_window):
+                break
+            del self._prefetched_queries[query]
+            self._waste_count += 1
+
+    #endregion
@@ -0,0 +1,212 @@
+from typing import Any, Tuple, Union, Dict, Set, Iterable
+from collections import OrderedDict
+import threading
+import time
+
+from query_result_cache_base import QueryResultCacheBase
+
+class QueryResultCache(QueryResultCacheBase):
+    """Thread-safe, in-process cache of the results of queries against an AccessManager instance, with a bounded size (evicting the least recently used results) and a time-to-live after which results expire.
+
+    Keys are tuples of strings, e.g. the name of the query followed by the stringified query parameters.  Each result can additionally be associated with a set of tags (also tuples of strings) identifying the elements the result depends on (e.g. ('user', 'user1')), allowing all results dependent on an element to be invalidated when the element changes.
+
+    Attributes:
+        max_size:
+            The maximum number of results held in the cache.
+        time_to_live:
+            The time in seconds after which a cached result expires.
+        count:
+            The number of results currently held in the cache (including any which have expired but not yet been removed).
+        hit_count:
+            The number of lookups which found an unexpired result.
+        miss_count:
+            The number of lookups which did not find an unexpired result.
+    """
+
+    @property
+    def max_size(self) -> int:
+        """The maximum number of results held in the cache."""
+        return self._max_size
+
+    @property
+    def time_to_live(self) -> float:
+        """The time in seconds after which a cached result expires."""
+        return self._time_to_live
+
+    @property
+    def count(self) -> int:
+        """The number of results currently held in the cache (including any which have expired but not yet been removed)."""
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def hit_count(self) -> int:
+        """The number of lookups which found an unexpired result."""
+        with self._lock:
+            return self._hit_count
+
+    @property
+    def miss_count(self) -> int:
+        """The number of lookups which did not find an unexpired result."""
+        with self._lock:
+            return self._miss_count
+
+    def __init__(self, max_size: int, time_to_live: float) -> None:
+        """Initialises a new instance of the QueryResultCache class.
+
+        Args:
+            max_size:
+                The maximum number of results held in the cache.
+            time_to_live:
+                The time in seconds after which a cached result expires.
+        """
+        if (max_size < 1):
+            raise ValueError("Parameter 'max_size' with value {0} must be greater than or equal to 1.".format(max_size))
+        if (time_to_live <= 0.0):
+            raise ValueError("Parameter 'time_to_live' with value {0} must be greater than 0.".format(time_to_live))
+
+        self._max_size: int = max_size
+        self._time_to_live: float = time_to_live
+        self._lock: threading.Lock = threading.Lock()
+        # Maps keys to tuples containing the result, the time.monotonic() it expires, and its tags, ordered from least to most recently used
+        self._entries: OrderedDict[Tuple[str, ...], Tuple[Any, float, Tuple[Tuple[str, ...], ...]]] = OrderedDict()
+        # Maps tags to the keys of the results associated with them
+        self._tag_index: Dict[Tuple[str, ...], Set[Tuple[str, ...]]] = dict()
+        self._hit_count: int = 0
+        self._miss_count: int = 0
+
+    def try_get(self, key: Tuple[str, ...]) -> Tuple[bool, Any]:
+        """Attempts to get an unexpired result from the cache.
+
+        Args:
+            key:
+                The key of the result.
+
+        Returns:
+            A tuple containing a boolean indicating whether an unexpired result was found, and the result (or None if not found).
+        """
+        with self._lock:
+            entry: Union[Tuple[Any, float, Tuple[Tuple[str, ...], ...]], None] = self._entries.get(key)
+            if (entry is not None):
+                if (time.monotonic() < entry[1]):
+                    self._entries.move_to_end(key)
+                    self._hit_count += 1
+                    return (True, entry[0])
+                else:
+                    self._remove_entry(key)
+            self._miss_count += 1
+
+            return (False, None)
+
+    def try_peek(self, key: Tuple[str, ...]) -> Tuple[bool, Any]:
+        """Attempts to get an unexpired result from the cache, without updating the hit and miss counts or the least recently used order.
+
+        Args:
+            key:
+                The key of the result.
+
+        Returns:
+            A tuple containing a boolean indicating whether an unexpired result was found, and the result (or None if not found).
+        """
+        with self._lock:
+            entry: Union[Tuple[Any, float, Tuple[Tuple[str, ...], ...]], None] = self._entries.get(key)
+            if (entry is not None and time.monotonic() < entry[1]):
+                return (True, entry[0])
+
+            return (False, None)
+
+    def set(self, key: Tuple[str, ...], result: Any, tags: Iterable[Tuple[str, ...]]=(), time_to_live: Union[float, None]=None) -> None:
+        """Adds a result to the cache, replacing any existing result with the same key, and evicting the least recently used result if the cache is full.
+
+        Args:
+            key:
+                The key of the result.
+            result:
+                The result.
+            tags:
+                Tags identifying the elements the result depends on.
+            time_to_live:
+                The time in seconds after which the result expires, or None to use the cache's time-to-live.
+        """
+        with self._lock:
+            if (key in self._entries):
+                self._remove_entry(key)
+            elif (len(self._entries) >= self._max_size):
+                self._remove_entry(next(iter(self._entries)))
+            self._add_entry(key, result, tags, time_to_live)
+
+    def remove(self, key: Tuple[str, ...]) -> None:
+        """Removes a result from the cache if it exists.
+
+        Args:
+            key:
+                The key of the result.
+        """
+        with self._lock:
+            if (key in self._entries):
+                self._remove_entry(key)
+
+    def invalidate(self, tags: Iterable[Tuple[str, ...]]) -> int:
+        """Removes all results associated with any of the specified tags.
+
+        Args:
+            tags:
+                The tags to invalidate.
+
+        Returns:
+            The number of results removed.
+        """
+        removed_count: int = 0
+        with self._lock:
+            for current_tag in tags:
+                keys: Union[Set[Tuple[str, ...]], None] = self._tag_index.get(current_tag)
+                if (keys is not None):
+                    for current_key in list(keys):
+                        self._remove_entry(current_key)
+                        removed_count += 1
+
+        return removed_count
+
+    def clear(self) -> None:
+        """Removes all results from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._tag_index.clear()
+
+    #region Private/Protected Methods
+
+    def _add_entry(self, key: Tuple[str, ...], result: Any, tags: Iterable[Tuple[str, ...]], time_to_live: Union[float, None]) -> None:
+        """Adds a result as the most recently used, and adds its tag index entries.  Must be called while holding '_lock'.
+
+        Args:
+            key:
+                The key of the result (which must not exist in the cache).
+            result:
+                The result.
+            tags:
+                Tags identifying the elements the result depends on.
+            time_to_live:
+                The time in seconds after which the result expires, or None to use the cache's time-to-live.
+        """
+        unique_tags: Tuple[Tuple[str, ...], ...] = tuple(set(tags))
+        self._entries[key] = (result, time.monotonic() + (self._time_to_live if time_to_live is None else time_to_live), unique_tags)
+        for current_tag in unique_tags:
+            if (current_tag not in self._tag_index):
+                self._tag_index[current_tag] = set()
+            self._tag_index[current_tag].add(key)
+
+    def _remove_entry(self, key: Tuple[str, ...]) -> None:
+        """Removes the result with the specified key, and its tag index entries.  Must be called while holding '_lock'.
+
+        Args:
+            key:
+                The key of the result (which must exist in the cache).
+        """
+        entry: Tuple[Any, float, Tuple[Tuple[str, ...], ...]] = self._entries.pop(key)
+        for current_tag in entry[2]:
+            keys: Set[Tuple[str, ...]] = self._tag_index[current_tag]
+            keys.discard(key)
+            if (len(keys) == 0):
+                del self._tag_index[current_tag]
+
+    #endregion
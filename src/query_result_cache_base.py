@@ -0,0 +1,109 @@
+from typing import Any, Tuple, Iterable, Union
+from abc import ABC, abstractmethod
+
+class QueryResultCacheBase(ABC):
+    """Base for caches of the results of queries against an AccessManager instance.
+
+    Keys are tuples of strings, e.g. the name of the query followed by the stringified query parameters.  Each result can additionally be associated with a set of tags (also tuples of strings) identifying the elements the result depends on (e.g. ('user', 'user1')), allowing all results dependent on an element to be invalidated when the element changes.
+
+    Attributes:
+        max_size:
+            The maximum number of results held in the cache.
+        time_to_live:
+            The time in seconds after which a cached result expires (unless a different time-to-live is specified when the result is stored).
+        count:
+            The number of results currently held in the cache (including any which have expired but not yet been removed).
+        hit_count:
+            The number of lookups which found an unexpired result.
+        miss_count:
+            The number of lookups which did not find an unexpired result.
+    """
+
+    @property
+    @abstractmethod
+    def max_size(self) -> int:
+        """The maximum number of results held in the cache."""
+
+    @property
+    @abstractmethod
+    def time_to_live(self) -> float:
+        """The time in seconds after which a cached result expires."""
+
+    @property
+    @abstractmethod
+    def count(self) -> int:
+        """The number of results currently held in the cache (including any which have expired but not yet been removed)."""
+
+    @property
+    @abstractmethod
+    def hit_count(self) -> int:
+        """The number of lookups which found an unexpired result."""
+
+    @property
+    @abstractmethod
+    def miss_count(self) -> int:
+        """The number of lookups which did not find an unexpired result."""
+
+    @abstractmethod
+    def try_get(self, key: Tuple[str, ...]) -> Tuple[bool, Any]:
+        """Attempts to get an unexpired result from the cache.
+
+        Args:
+            key:
+                The key of the result.
+
+        Returns:
+            A tuple containing a boolean indicating whether an unexpired result was found, and the result (or None if not found).
+        """
+
+    @abstractmethod
+    def try_peek(self, key: Tuple[str, ...]) -> Tuple[bool, Any]:
+        """Attempts to get an unexpired result from the cache, without updating the hit and miss counts or the eviction order.
+
+        Args:
+            key:
+                The key of the result.
+
+        Returns:
+            A tuple containing a boolean indicating whether an unexpired result was found, and the result (or None if not found).
+        """
+
+    @abstractmethod
+    def set(self, key: Tuple[str, ...], result: Any, tags: Iterable[Tuple[str, ...]]=(), time_to_live: Union[float, None]=None) -> None:
+        """Adds a result to the cache, replacing any existing result with the same key, and evicting another result if the cache is full.
+
+        Args:
+            key:
+                The key of the result.
+            result:
+                The result.
+            tags:
+                Tags identifying the elements the result depends on.
+            time_to_live:
+                The time in seconds after which the result expires, or None to use the cache's time-to-live.
+        """
+
+    @abstractmethod
+    def remove(self, key: Tuple[str, ...]) -> None:
+        """Removes a result from the cache if it exists.
+
+        Args:
+            key:
+                The key of the result.
+        """
+
+    @abstractmethod
+    def invalidate(self, tags: Iterable[Tuple[str, ...]]) -> int:
+        """Removes all results associated with any of the specified tags.
+
+        Args:
+            tags:
+                The tags to invalidate.
+
+        Returns:
+            The number of results removed, or 0 if the cache invalidates results lazily (i.e. when they're next looked up) and doesn't know the number.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes all results from the cache."""
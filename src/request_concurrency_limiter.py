@@ -0,0 +1,128 @@
+import threading
+import time
+
+from exceptions.queue_time_budget_exceeded_error import QueueTimeBudgetExceededError
+
+class RequestConcurrencyLimiter():
+    """Limits the number of concurrent requests to an AccessManager instance, and sheds load by rejecting requests which wait longer than a budgeted time for a concurrency slot.
+
+    A single instance can be shared between multiple clients to apply a combined limit.
+
+    Attributes:
+        max_concurrent_requests:
+            The maximum number of requests which can be in progress at the same time.
+        queue_time_budget:
+            The maximum time in seconds that a request can wait for a concurrency slot before it is rejected.
+        in_progress_request_count:
+            The number of requests currently holding a concurrency slot.
+        completed_wait_count:
+            The number of requests which successfully acquired a concurrency slot.
+        rejected_request_count:
+            The number of requests rejected because their queue time exceeded the budget.
+        total_queue_time:
+            The total time in seconds that requests which acquired a concurrency slot spent waiting for it.
+        max_queue_time:
+            The longest time in seconds that a request which acquired a concurrency slot spent waiting for it.
+    """
+
+    @property
+    def max_concurrent_requests(self) -> int:
+        """The maximum number of requests which can be in progress at the same time."""
+        return self._max_concurrent_requests
+
+    @property
+    def queue_time_budget(self) -> float:
+        """The maximum time in seconds that a request can wait for a concurrency slot before it is rejected."""
+        return self._queue_time_budget
+
+    @property
+    def in_progress_request_count(self) -> int:
+        """The number of requests currently holding a concurrency slot."""
+        with self._statistics_lock:
+            return self._in_progress_request_count
+
+    @property
+    def completed_wait_count(self) -> int:
+        """The number of requests which successfully acquired a concurrency slot."""
+        with self._statistics_lock:
+            return self._completed_wait_count
+
+    @property
+    def rejected_request_count(self) -> int:
+        """The number of requests rejected because their queue time exceeded the budget."""
+        with self._statistics_lock:
+            return self._rejected_request_count
+
+    @property
+    def total_queue_time(self) -> float:
+        """The total time in seconds that requests which acquired a concurrency slot spent waiting for it."""
+        with self._statistics_lock:
+            return self._total_queue_time
+
+    @property
+    def max_queue_time(self) -> float:
+        """The longest time in seconds that a request which acquired a concurrency slot spent waiting for it."""
+        with self._statistics_lock:
+            return self._max_queue_time
+
+    def __init__(self, max_concurrent_requests: int, queue_time_budget: float) -> None:
+        """Initialises a new instance of the RequestConcurrencyLimiter class.
+
+        Args:
+            max_concurrent_requests:
+                The maximum number of requests which can be in progress at the same time.
+            queue_time_budget:
+                The maximum time in seconds that a request can wait for a concurrency slot before it is rejected with a QueueTimeBudgetExceededError.  Set to 0 to reject requests immediately when no slot is free.
+        """
+        if (max_concurrent_requests < 1):
+            raise ValueError("Parameter 'max_concurrent_requests' with value {0} must be greater than or equal to 1.".format(max_concurrent_requests))
+        if (queue_time_budget < 0.0):
+            raise ValueError("Parameter 'queue_time_budget' with value {0} must be greater than or equal to 0.".format(queue_time_budget))
+
+        self._max_concurrent_requests: int = max_concurrent_requests
+        self._queue_time_budget: float = queue_time_budget
+        self._semaphore: threading.BoundedSemaphore = threading.BoundedSemaphore(max_concurrent_requests)
+        self._statistics_lock: threading.Lock = threading.Lock()
+        self._in_progress_request_count: int = 0
+        self._completed_wait_count: int = 0
+        self._rejected_request_count: int = 0
+        self._total_queue_time: float = 0.0
+        self._max_queue_time: float = 0.0
+
+    def acquire(self, request_description: str) -> None:
+        """Waits for a concurrency slot, for up to the queue time budget.  Each successful call must be followed by a call to release().
+
+        Args:
+            request_description:
+                A description of the request (e.g. its method and URL), included in the message of any exception thrown.
+
+        Raises:
+            QueueTimeBudgetExceededError: A concurrency slot did not become available within the queue time budget.
+        """
+        start_time: float = time.perf_counter()
+        if (self._queue_time_budget == 0.0):
+            acquired: bool = self._semaphore.acquire(blocking=False)
+        else:
+            acquired = self._semaphore.acquire(timeout=self._queue_time_budget)
+        queue_time: float = time.perf_counter() - start_time
+        with self._statistics_lock:
+            if (acquired == True):
+                self._in_progress_request_count += 1
+                self._completed_wait_count += 1
+                self._total_queue_time += queue_time
+                if (queue_time > self._max_queue_time):
+                    self._max_queue_time = queue_time
+            else:
+                self._rejected_request_count += 1
+        if (acquired == False):
+            raise QueueTimeBudgetExceededError(
+                "{0} was rejected after waiting {1:.3f} seconds for a concurrency slot, exceeding the queue time budget of {2} seconds.".format(request_description, queue_time, self._queue_time_budget), 
+                queue_time, 
+                self._queue_time_budget
+            )
+
+    def release(self) -> None:
+        """Releases a concurrency slot acquired by the acquire() method."""
+        with self._statistics_lock:
+            self._in_progress_request_count -= 1
+        self._semaphore.release()
@@ -0,0 +1,27 @@
+from typing import List, Dict, Union, Any
+from abc import ABC, abstractmethod
+
+class ResponseBodyDecoderBase(ABC):
+    """Base class for decoding the body of an HTTP response received from an AccessManager instance into JSON-compatible types (i.e. the same types created by json.loads()).
+
+    Attributes:
+        content_type:
+            The media type (e.g. 'application/json') of response bodies which the decoder can decode.
+    """
+
+    @property
+    @abstractmethod
+    def content_type(self) -> str:
+        """The media type (e.g. 'application/json') of response bodies which the decoder can decode."""
+
+    @abstractmethod
+    def decode(self, response_body: bytes) -> Union[str, bool, List[str], List[Dict[str, Any]], Dict[str, Any]]:
+        """Decodes the specified response body.
+        
+        Args:
+            response_body:
+                The raw bytes of the response body.
+        
+        Returns:
+            The response body decoded to a JSON-compatible type.
+        """
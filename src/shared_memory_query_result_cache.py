@@ -0,0 +1,385 @@
+from typing import Any, Tuple, Union, Iterable, Dict, List
+from multiprocessing import shared_memory
+import hashlib
+import multiprocessing
+import pickle
+import struct
+import sys
+import time
+import zlib
+
+from query_result_cache_base import QueryResultCacheBase
+
+class SharedMemoryQueryResultCache(QueryResultCacheBase):
+    """Cache of the results of queries against an AccessManager instance, held in a shared memory block so that one copy of the results (and a single eviction policy) is shared by all processes on a host.
+
+    The cache should be created in a parent process before worker processes are started.  Forked workers inherit it, and workers started by the 'spawn' method attach to the same shared memory when the cache is passed to them (e.g. as an argument of multiprocessing.Process).  The creating process should call unlink() once all processes have finished using the cache.
+
+    Results are stored in a hash table of fixed size slots, grouped into buckets of 8 slots.  A result is stored in the bucket selected by the hash of its key, replacing the least recently used result in the bucket if the bucket is full.  Writes are serialized by a lock shared between processes, while lookups are lock-free, using a per-slot sequence number (seqlock) and checksum to detect and retry reads which overlap a write.  Results are serialized with pickle, so all processes sharing the cache must trust each other, and results whose serialized size exceeds 'max_entry_size' are not cached.
+
+    Tags are invalidated by incrementing a generation number held in shared memory for each tag (tags are hashed to a fixed number of generation numbers, so occasionally a result is invalidated unnecessarily).  Each result records the generations of its tags when it was stored, and is treated as not found if any of them have since changed.
+
+    Attributes:
+        max_size:
+            The maximum number of results held in the cache.
+        time_to_live:
+            The time in seconds after which a cached result expires.
+        count:
+            The number of results currently held in the cache (including any which have expired or been invalidated but not yet been replaced).
+        hit_count:
+            The number of lookups in this process which found an unexpired result.
+        miss_count:
+            The number of lookups in this process which did not find an unexpired result.
+        oversized_result_count:
+            The number of results in this process which were not cached because their serialized size exceeded 'max_entry_size'.
+        name:
+            The name of the shared memory block.
+    """
+
+    _BUCKET_SIZE: int = 8
+    # The number of tag generation numbers per slot
+    _TAG_GENERATIONS_PER_SLOT: int = 4
+    # Entry count, followed by padding to 64 bytes
+    _HEADER_SIZE: int = 64
+    _COUNT_FORMAT: str = "<q"
+    _GENERATION_FORMAT: str = "<Q"
+    # Sequence number, key hash (0 for an empty slot), expiry time and last access time (nanoseconds from time.monotonic_ns()), payload length, payload checksum
+    _SLOT_HEADER_FORMAT: str = "<QQqqII"
+    _LAST_ACCESS_TIME_OFFSET: int = 24
+    # The maximum number of times to retry reading a slot which is being written
+    _MAX_READ_ATTEMPTS: int = 100
+
+    @property
+    def max_size(self) -> int:
+        """The maximum number of results held in the cache."""
+        return self._slot_count
+
+    @property
+    def time_to_live(self) -> float:
+        """The time in seconds after which a cached result expires."""
+        return self._time_to_live
+
+    @property
+    def count(self) -> int:
+        """The number of results currently held in the cache (including any which have expired or been invalidated but not yet been replaced)."""
+        return struct.unpack_from(self._COUNT_FORMAT, self._buffer, 0)[0]
+
+    @property
+    def hit_count(self) -> int:
+        """The number of lookups in this process which found an unexpired result."""
+        return self._hit_count
+
+    @property
+    def miss_count(self) -> int:
+        """The number of lookups in this process which did not find an unexpired result."""
+        return self._miss_count
+
+    @property
+    def oversized_result_count(self) -> int:
+        """The number of results in this process which were not cached because their serialized size exceeded 'max_entry_size'."""
+        return self._oversized_result_count
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory block."""
+        return self._shared_memory.name
+
+    def __init__(self, max_size: int, time_to_live: float, max_entry_size: int=4096, lock: Any=None) -> None:
+        """Initialises a new instance of the SharedMemoryQueryResultCache class, creating a new shared memory block.
+
+        Args:
+            max_size:
+                The maximum number of results held in the cache.  Rounded up to a multiple of 8.
+            time_to_live:
+                The time in seconds after which a cached result expires.
+            max_entry_size:
+                The maximum size in bytes of a serialized result (including its key and tag generations).  Each slot occupies this size, so together with 'max_size' this determines the size of the shared memory block.
+            lock:
+                An optional lock shared between the processes using the cache (e.g. created by multiprocessing.Lock(), or by the Lock() method of the multiprocessing context used to start the processes), used to serialize writes.  A new lock is created from the default context if not set.
+        """
+        if (max_size < 1):
+            raise ValueError("Parameter 'max_size' with value {0} must be greater than or equal to 1.".format(max_size))
+        if (time_to_live <= 0.0):
+            raise ValueError("Parameter 'time_to_live' with value {0} must be greater than 0.".format(time_to_live))
+        if (max_entry_size < 1):
+            raise ValueError("Parameter 'max_entry_size' with value {0} must be greater than or equal to 1.".format(max_entry_size))
+
+        self._slot_count: int = -(-max_size // self._BUCKET_SIZE) * self._BUCKET_SIZE
+        self._time_to_live: float = time_to_live
+        self._max_entry_size: int = max_entry_size
+        self._lock: Any = lock if lock is not None else multiprocessing.Lock()
+        self._shared_memory: shared_memory.SharedMemory = shared_memory.SharedMemory(create=True, size=self._calculate_size())
+        self._initialize_process_state()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "slot_count": self._slot_count,
+            "time_to_live": self._time_to_live,
+            "max_entry_size": self._max_entry_size,
+            "lock": self._lock,
+            "name": self._shared_memory.name
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._slot_count = state["slot_count"]
+        self._time_to_live = state["time_to_live"]
+        self._max_entry_size = state["max_entry_size"]
+        self._lock = state["lock"]
+        self._shared_memory = self._attach_shared_memory(state["name"])
+        self._initialize_process_state()
+
+    def try_get(self, key: Tuple[str, ...]) -> Tuple[bool, Any]:
+        found, result, slot_index = self._find(key)
+        if (found == True):
+            # Recorded without the lock, as a lost or overwritten update only affects which result is evicted
+            struct.pack_into("<q", self._buffer, self._get_slot_offset(slot_index) + self._LAST_ACCESS_TIME_OFFSET, time.monotonic_ns())
+            self._hit_count += 1
+        else:
+            self._miss_count += 1
+
+        return (found, result)
+
+    def try_peek(self, key: Tuple[str, ...]) -> Tuple[bool, Any]:
+        found, result, slot_index = self._find(key)
+
+        return (found, result)
+
+    def set(self, key: Tuple[str, ...], result: Any, tags: Iterable[Tuple[str, ...]]=(), time_to_live: Union[float, None]=None) -> None:
+        key_hash: int = self._hash_key(key)
+        tag_generation_indices: List[int] = sorted(set(self._hash_key(current_tag) % self._tag_generation_count for current_tag in tags))
+        with self._lock:
+            tag_generations: Tuple[Tuple[int, int], ...] = tuple((current_index, self._read_generation(current_index)) for current_index in tag_generation_indices)
+            payload: bytes = pickle.dumps((key, result, tag_generations), pickle.HIGHEST_PROTOCOL)
+            if (len(payload) > self._max_entry_size):
+                self._oversized_result_count += 1
+                # Remove any previous result, which would otherwise be returned in place of the new one
+                self._remove_slot(self._find_slot(key, key_hash))
+                return
+            slot_index: int = self._select_slot(key_hash)
+            current_time: int = time.monotonic_ns()
+            offset: int = self._get_slot_offset(slot_index)
+            sequence, existing_key_hash = struct.unpack_from("<QQ", self._buffer, offset)
+            struct.pack_into("<Q", self._buffer, offset, sequence + 1)
+            expiry_time: int = current_time + int((self._time_to_live if time_to_live is None else time_to_live) * 1e9)
+            struct.pack_into(self._SLOT_HEADER_FORMAT, self._buffer, offset, sequence + 1, key_hash, expiry_time, current_time, len(payload), zlib.crc32(payload))
+            payload_offset: int = offset + self._slot_header_size
+            self._buffer[payload_offset:payload_offset + len(payload)] = payload
+            struct.pack_into("<Q", self._buffer, offset, sequence + 2)
+            if (existing_key_hash == 0):
+                self._add_to_count(1)
+
+    def remove(self, key: Tuple[str, ...]) -> None:
+        with self._lock:
+            self._remove_slot(self._find_slot(key, self._hash_key(key)))
+
+    def invalidate(self, tags: Iterable[Tuple[str, ...]]) -> int:
+        tag_generation_indices: List[int] = sorted(set(self._hash_key(current_tag) % self._tag_generation_count for current_tag in tags))
+        with self._lock:
+            for current_index in tag_generation_indices:
+                struct.pack_into(self._GENERATION_FORMAT, self._buffer, self._get_generation_offset(current_index), self._read_generation(current_index) + 1)
+
+        return 0
+
+    def clear(self) -> None:
+        with self._lock:
+            for current_slot_index in range(self._slot_count):
+                self._remove_slot(current_slot_index)
+
+    def close(self) -> None:
+        """Detaches the cache from the shared memory block in this process.  The cache can't be used in this process after calling this method."""
+        self._shared_memory.close()
+
+    def unlink(self) -> None:
+        """Frees the shared memory block.  Should be called once, by the creating process, after all processes have finished using the cache."""
+        self._shared_memory.unlink()
+
+    #region Private/Protected Methods
+
+    def _initialize_process_state(self) -> None:
+        """Initialises the state which is local to the current process (e.g. after attaching to the shared memory in a spawned process)."""
+        self._tag_generation_count: int = self._slot_count * self._TAG_GENERATIONS_PER_SLOT
+        self._slot_header_size: int = struct.calcsize(self._SLOT_HEADER_FORMAT)
+        # Keep the slots 8 byte aligned
+        self._slot_size: int = self._slot_header_size + -(-self._max_entry_size // 8) * 8
+        self._slots_offset: int = self._HEADER_SIZE + self._tag_generation_count * struct.calcsize(self._GENERATION_FORMAT)
+        self._buffer: memoryview = self._shared_memory.buf
+        self._hit_count: int = 0
+        self._miss_count: int = 0
+        self._oversized_result_count: int = 0
+
+    def _calculate_size(self) -> int:
+        slot_size: int = struct.calcsize(self._SLOT_HEADER_FORMAT) + -(-self._max_entry_size // 8) * 8
+
+        return self._HEADER_SIZE + self._slot_count * self._TAG_GENERATIONS_PER_SLOT * struct.calcsize(self._GENERATION_FORMAT) + self._slot_count * slot_size
+
+    def _attach_shared_memory(self, name: str) -> shared_memory.SharedMemory:
+        """Attaches to an existing shared memory block, without registering it to be freed when the current process exits.
+
+        Args:
+            name:
+                The name of the shared memory block.
+
+        Returns:
+            The shared memory block.
+        """
+        if (sys.version_info >= (3, 13)):
+            return shared_memory.SharedMemory(name=name, track=False)
+        attached_memory: shared_memory.SharedMemory = shared_memory.SharedMemory(name=name)
+        if (sys.platform != "win32"):
+            # Prior to Python 3.13 attaching registers the block with the resource tracker, which would free it when the process exits
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(attached_memory._name, "shared_memory")  # type: ignore[attr-defined]
+
+        return attached_memory
+
+    def _hash_key(self, key: Tuple[str, ...]) -> int:
+        """Hashes a key or tag consistently across processes (unlike hash(), which is randomized per process).
+
+        Args:
+            key:
+                The key or tag.
+
+        Returns:
+            A non-zero 64 bit hash.
+        """
+        key_hash: int = int.from_bytes(hashlib.blake2b("\x1f".join(key).encode("utf-8"), digest_size=8).digest(), "little")
+
+        return key_hash if key_hash != 0 else 1
+
+    def _get_slot_offset(self, slot_index: int) -> int:
+        return self._slots_offset + slot_index * self._slot_size
+
+    def _get_generation_offset(self, generation_index: int) -> int:
+        return self._HEADER_SIZE + generation_index * struct.calcsize(self._GENERATION_FORMAT)
+
+    def _read_generation(self, generation_index: int) -> int:
+        return struct.unpack_from(self._GENERATION_FORMAT, self._buffer, self._get_generation_offset(generation_index))[0]
+
+    def _add_to_count(self, increment: int) -> None:
+        """Adds to the count of stored results.  Must be called while holding '_lock'."""
+        struct.pack_into(self._COUNT_FORMAT, self._buffer, 0, self.count + increment)
+
+    def _get_bucket_slot_indices(self, key_hash: int) -> range:
+        first_slot_index: int = (key_hash % (self._slot_count // self._BUCKET_SIZE)) * self._BUCKET_SIZE
+
+        return range(first_slot_index, first_slot_index + self._BUCKET_SIZE)
+
+    def _read_slot(self, slot_index: int, key_hash: int) -> Union[Tuple[int, bytes], None]:
+        """Reads the expiry time and payload of a slot if it holds a result with the specified key hash, retrying if the slot is written during the read.
+
+        Args:
+            slot_index:
+                The index of the slot.
+            key_hash:
+                The hash of the key of the result.
+
+        Returns:
+            A tuple containing the time the result expires and its serialized payload, or None if the slot doesn't hold a result with the key hash (or couldn't be read consistently).
+        """
+        offset: int = self._get_slot_offset(slot_index)
+        for current_attempt in range(self._MAX_READ_ATTEMPTS):
+            sequence, slot_key_hash, expiry_time, last_access_time, payload_length, checksum = struct.unpack_from(self._SLOT_HEADER_FORMAT, self._buffer, offset)
+            if (sequence % 2 == 1):
+                # Slot is being written
+                time.sleep(0)
+                continue
+            if (slot_key_hash != key_hash):
+                if (struct.unpack_from("<Q", self._buffer, offset)[0] == sequence):
+                    return None
+                continue
+            payload_offset: int = offset + self._slot_header_size
+            payload: bytes = bytes(self._buffer[payload_offset:payload_offset + min(payload_length, self._max_entry_size)])
+            if (struct.unpack_from("<Q", self._buffer, offset)[0] == sequence and zlib.crc32(payload) == checksum):
+                return (expiry_time, payload)
+
+        return None
+
+    def _find(self, key: Tuple[str, ...]) -> Tuple[bool, Any, int]:
+        """Finds an unexpired result which has not been invalidated.
+
+        Args:
+            key:
+                The key of the result.
+
+        Returns:
+            A tuple containing a boolean indicating whether the result was found, the result (or None if not found), and the index of the slot holding it (or -1 if not found).
+        """
+        key_hash: int = self._hash_key(key)
+        for current_slot_index in self._get_bucket_slot_indices(key_hash):
+            slot_contents: Union[Tuple[int, bytes], None] = self._read_slot(current_slot_index, key_hash)
+            if (slot_contents is None):
+                continue
+            stored_key, result, tag_generations = pickle.loads(slot_contents[1])
+            if (stored_key != key):
+                continue
+            if (time.monotonic_ns() >= slot_contents[0]):
+                break
+            for current_index, current_generation in tag_generations:
+                if (self._read_generation(current_index) != current_generation):
+                    return (False, None, -1)
+            return (True, result, current_slot_index)
+
+        return (False, None, -1)
+
+    def _find_slot(self, key: Tuple[str, ...], key_hash: int) -> int:
+        """Finds the slot holding a result with the specified key (whether or not it has expired or been invalidated).  Must be called while holding '_lock'.
+
+        Returns:
+            The index of the slot, or -1 if the key isn't stored.
+        """
+        for current_slot_index in self._get_bucket_slot_indices(key_hash):
+            slot_contents: Union[Tuple[int, bytes], None] = self._read_slot(current_slot_index, key_hash)
+            if (slot_contents is not None and pickle.loads(slot_contents[1])[0] == key):
+                return current_slot_index
+
+        return -1
+
+    def _select_slot(self, key_hash: int) -> int:
+        """Selects the slot to store a result in, preferring a slot holding a result with the same key hash, then an empty slot, then the slot holding the least recently used result (where expired results are considered less recently used than all unexpired).  Must be called while holding '_lock'.
+
+        Args:
+            key_hash:
+                The hash of the key of the result.
+
+        Returns:
+            The index of the slot.
+        """
+        current_time: int = time.monotonic_ns()
+        empty_slot_index: int = -1
+        selected_slot_index: int = -1
+        selected_last_access_time: Union[Tuple[bool, int], None] = None
+        for current_slot_index in self._get_bucket_slot_indices(key_hash):
+            sequence, slot_key_hash, expiry_time, last_access_time, payload_length, checksum = struct.unpack_from(self._SLOT_HEADER_FORMAT, self._buffer, self._get_slot_offset(current_slot_index))
+            if (slot_key_hash == key_hash):
+                return current_slot_index
+            if (slot_key_hash == 0):
+                if (empty_slot_index == -1):
+                    empty_slot_index = current_slot_index
+                continue
+            current_last_access_time: Tuple[bool, int] = (expiry_time > current_time, last_access_time)
+            if (selected_last_access_time is None or current_last_access_time < selected_last_access_time):
+                selected_slot_index = current_slot_index
+                selected_last_access_time = current_last_access_time
+        if (empty_slot_index != -1):
+            return empty_slot_index
+
+        return selected_slot_index
+
+    def _remove_slot(self, slot_index: int) -> None:
+        """Removes the result held in a slot (if any).  Must be called while holding '_lock'.
+
+        Args:
+            slot_index:
+                The index of the slot, or -1 to do nothing.
+        """
+        if (slot_index == -1):
+            return
+        offset: int = self._get_slot_offset(slot_index)
+        sequence, slot_key_hash = struct.unpack_from("<QQ", self._buffer, offset)
+        if (slot_key_hash == 0):
+            return
+        struct.pack_into("<QQ", self._buffer, offset, sequence + 1, 0)
+        struct.pack_into("<Q", self._buffer, offset, sequence + 2)
+        self._add_to_count(-1)
+
+    #endregion
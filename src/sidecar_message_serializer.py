@@ -0,0 +1,142 @@
+from typing import Any, Dict, Union
+import json
+import socket
+import struct
+
+from exceptions.not_found_error import NotFoundError
+from exceptions.element_not_found_error import ElementNotFoundError
+from exceptions.deserialization_error import DeserializationError
+
+class SidecarMessageSerializer():
+    """Reads and writes the messages exchanged between an AccessManagerSidecarServer and AccessManagerSidecarClient over a stream socket.
+
+    Each message is a JSON document encoded as UTF-8, preceded by its length as a 4 byte big-endian unsigned integer.  A request message is a list of queries, each a list containing the name of an AccessManagerQueryProcessor method (or property) followed by its stringified parameters.  A response message is a list of the same length, each item either [0, result] where the query succeeded, or [1, error] where it raised an exception, and 'error' is the exception converted by serialize_error().
+    """
+
+    _LENGTH_FORMAT: str = ">I"
+    _LENGTH_SIZE: int = 4
+
+    def __init__(self, max_message_size: int=16777216) -> None:
+        """Initialises a new instance of the SidecarMessageSerializer class.
+
+        Args:
+            max_message_size:
+                The maximum size in bytes of a message which can be read.
+        """
+        if (max_message_size < 1):
+            raise ValueError("Parameter 'max_message_size' with value {0} must be greater than or equal to 1.".format(max_message_size))
+
+        self._max_message_size: int = max_message_size
+
+    def write_message(self, stream: socket.socket, message: Any) -> None:
+        """Writes a message to a socket.
+
+        Args:
+            stream:
+                The socket.
+            message:
+                The message, which must be JSON-compatible.
+        """
+        message_bytes: bytes = json.dumps(message, separators=(",", ":")).encode("utf-8")
+        stream.sendall(struct.pack(self._LENGTH_FORMAT, len(message_bytes)) + message_bytes)
+
+    def read_message(self, stream: socket.socket) -> Union[Any, None]:
+        """Reads a message from a socket.
+
+        Args:
+            stream:
+                The socket.
+
+        Returns:
+            The message, or None if the socket was closed before any of the message was read.
+
+        Raises:
+            DeserializationError: The socket was closed part way through the message, or the message is larger than the maximum message size or is not valid JSON.
+        """
+        length_bytes: Union[bytes, None] = self._read_bytes(stream, self._LENGTH_SIZE, True)
+        if (length_bytes is None):
+            return None
+        message_length: int = struct.unpack(self._LENGTH_FORMAT, length_bytes)[0]
+        if (message_length > self._max_message_size):
+            raise DeserializationError("Message length {0} exceeds the maximum message size {1}.".format(message_length, self._max_message_size))
+        message_bytes: Union[bytes, None] = self._read_bytes(stream, message_length, False)
+        assert message_bytes is not None
+        try:
+            return json.loads(message_bytes.decode("utf-8"))
+        except ValueError as e:
+            raise DeserializationError("Failed to deserialize message.") from e
+
+    def serialize_error(self, error: Exception) -> Dict[str, Any]:
+        """Converts an exception raised by a query into a JSON-compatible form.
+
+        Args:
+            error:
+                The exception.
+
+        Returns:
+            The converted exception.
+        """
+        serialized_error: Dict[str, Any] = { "message": str(error) }
+        if (isinstance(error, ElementNotFoundError) == True):
+            serialized_error["type"] = "ElementNotFoundError"
+            serialized_error["elementType"] = error.element_type
+            serialized_error["elementValue"] = error.element_value
+        elif (isinstance(error, NotFoundError) == True):
+            serialized_error["type"] = "NotFoundError"
+            serialized_error["resourceId"] = error.resource_id
+        elif (isinstance(error, ValueError) == True):
+            serialized_error["type"] = "ValueError"
+        else:
+            serialized_error["type"] = "RuntimeError"
+
+        return serialized_error
+
+    def deserialize_error(self, serialized_error: Dict[str, Any]) -> Exception:
+        """Converts an exception converted by serialize_error() back to an exception.  Exceptions other than ValueError and its subclasses are converted to RuntimeError.
+
+        Args:
+            serialized_error:
+                The converted exception.
+
+        Returns:
+            The exception.
+        """
+        error_type: str = serialized_error["type"]
+        message: str = serialized_error["message"]
+        if (error_type == "ElementNotFoundError"):
+            return ElementNotFoundError(message, serialized_error["elementType"], serialized_error["elementValue"])
+        elif (error_type == "NotFoundError"):
+            return NotFoundError(message, serialized_error["resourceId"])
+        elif (error_type == "ValueError"):
+            return ValueError(message)
+        else:
+            return RuntimeError(message)
+
+    #region Private/Protected Methods
+
+    def _read_bytes(self, stream: socket.socket, count: int, allow_end_of_stream: bool) -> Union[bytes, None]:
+        """Reads an exact number of bytes from a socket.
+
+        Args:
+            stream:
+                The socket.
+            count:
+                The number of bytes to read.
+            allow_end_of_stream:
+                Whether to return None rather than raising an exception if the socket is closed before any bytes are read.
+
+        Returns:
+            The bytes.
+        """
+        buffer: bytearray = bytearray()
+        while (len(buffer) < count):
+            chunk: bytes = stream.recv(count - len(buffer))
+            if (len(chunk) == 0):
+                if (len(buffer) == 0 and allow_end_of_stream == True):
+                    return None
+                raise DeserializationError("Socket closed after reading {0} of {1} bytes.".format(len(buffer), count))
+            buffer.extend(chunk)
+
+        return bytes(buffer)
+
+    #endregion
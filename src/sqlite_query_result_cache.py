@@ -0,0 +1,254 @@
+from typing import Any, Tuple, Union, Iterable, Dict, List
+import json
+import sqlite3
+import threading
+import time
+
+from query_result_cache_base import QueryResultCacheBase
+
+class SqliteQueryResultCache(QueryResultCacheBase):
+    """Cache of the results of queries against an AccessManager instance, stored in a SQLite database so that results survive process restarts (and can be shared by the processes on a host).
+
+    Results must be JSON-compatible (as the deserialized response bodies cached by AccessManagerClient are).  Each result is stored with its expiry time (as returned by time.time(), so that it remains meaningful after a restart), and with its tags in a separate indexed table.  Added results are written to the database in batches, controlled by the 'write_batch_size' and 'write_interval' constructor parameters, and are returned from memory by this instance until written.  Removal and invalidation are written immediately.  When the number of results exceeds 'max_size', expired results and then the results closest to expiry are removed.
+
+    Intended as the second tier of a TwoTierQueryResultCache, behind a faster in-process cache.
+
+    Attributes:
+        max_size:
+            The maximum number of results held in the cache.
+        time_to_live:
+            The time in seconds after which a cached result expires.
+        count:
+            The number of results currently held in the cache (including any which have expired but not yet been removed).
+        hit_count:
+            The number of lookups by this instance which found an unexpired result.
+        miss_count:
+            The number of lookups by this instance which did not find an unexpired result.
+    """
+
+    @property
+    def max_size(self) -> int:
+        """The maximum number of results held in the cache."""
+        return self._max_size
+
+    @property
+    def time_to_live(self) -> float:
+        """The time in seconds after which a cached result expires."""
+        return self._time_to_live
+
+    @property
+    def count(self) -> int:
+        """The number of results currently held in the cache (including any which have expired but not yet been removed)."""
+        with self._lock:
+            stored_count: int = self._connection.execute("SELECT COUNT(*) FROM QueryResults").fetchone()[0]
+            for current_serialized_key in self._pending_results.keys():
+                if (self._connection.execute("SELECT 1 FROM QueryResults WHERE CacheKey = ?", (current_serialized_key, )).fetchone() is None):
+                    stored_count += 1
+
+            return stored_count
+
+    @property
+    def hit_count(self) -> int:
+        """The number of lookups by this instance which found an unexpired result."""
+        with self._lock:
+            return self._hit_count
+
+    @property
+    def miss_count(self) -> int:
+        """The number of lookups by this instance which did not find an unexpired result."""
+        with self._lock:
+            return self._miss_count
+
+    def __init__(self, database_path: str, max_size: int, time_to_live: float, write_batch_size: int=100, write_interval: float=1.0) -> None:
+        """Initialises a new instance of the SqliteQueryResultCache class.
+
+        Args:
+            database_path:
+                The path to the SQLite database file to store the results in.  Unexpired results in an existing file (e.g. from before a restart) are retained.
+            max_size:
+                The maximum number of results held in the cache.
+            time_to_live:
+                The time in seconds after which a cached result expires.
+            write_batch_size:
+                The number of added results after which pending results are written to the database.  Set to 1 to write every result immediately.
+            write_interval:
+                The maximum time in seconds that added results can remain unwritten, when fewer than 'write_batch_size' results are pending.  Checked on each lookup and each added result, and by flush_if_due().
+        """
+        if (max_size < 1):
+            raise ValueError("Parameter 'max_size' with value {0} must be greater than or equal to 1.".format(max_size))
+        if (time_to_live <= 0.0):
+            raise ValueError("Parameter 'time_to_live' with value {0} must be greater than 0.".format(time_to_live))
+        if (write_batch_size < 1):
+            raise ValueError("Parameter 'write_batch_size' with value {0} must be greater than or equal to 1.".format(write_batch_size))
+        if (write_interval < 0.0):
+            raise ValueError("Parameter 'write_interval' with value {0} must be greater than or equal to 0.".format(write_interval))
+
+        self._max_size: int = max_size
+        self._time_to_live: float = time_to_live
+        self._write_batch_size: int = write_batch_size
+        self._write_interval: float = write_interval
+        self._lock: threading.Lock = threading.Lock()
+        # Maps serialized keys to tuples containing the serialized result, its expiry time, and its serialized tags, for results not yet written to the database
+        self._pending_results: Dict[str, Tuple[str, float, List[str]]] = dict()
+        self._first_pending_result_time: float = 0.0
+        self._hit_count: int = 0
+        self._miss_count: int = 0
+        self._connection: sqlite3.Connection = sqlite3.connect(database_path, check_same_thread=False, isolation_level="DEFERRED")
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS QueryResults (CacheKey TEXT PRIMARY KEY, Result TEXT NOT NULL, ExpiryTime REAL NOT NULL)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS QueryResultsExpiryTimeIndex ON QueryResults (ExpiryTime)")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS QueryResultTags (Tag TEXT NOT NULL, CacheKey TEXT NOT NULL)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS QueryResultTagsTagIndex ON QueryResultTags (Tag)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS QueryResultTagsCacheKeyIndex ON QueryResultTags (CacheKey)")
+        self._connection.commit()
+
+    def try_get(self, key: Tuple[str, ...]) -> Tuple[bool, Any]:
+        with self._lock:
+            found, result = self._find(key)
+            if (found == True):
+                self._hit_count += 1
+            else:
+                self._miss_count += 1
+            self._write_if_due()
+
+            return (found, result)
+
+    def try_peek(self, key: Tuple[str, ...]) -> Tuple[bool, Any]:
+        with self._lock:
+            return self._find(key)
+
+    def set(self, key: Tuple[str, ...], result: Any, tags: Iterable[Tuple[str, ...]]=(), time_to_live: Union[float, None]=None) -> None:
+        serialized_tags: List[str] = list(set(self._serialize_key(current_tag) for current_tag in tags))
+        with self._lock:
+            if (len(self._pending_results) == 0):
+                self._first_pending_result_time = time.monotonic()
+            self._pending_results[self._serialize_key(key)] = (json.dumps(result), time.time() + (self._time_to_live if time_to_live is None else time_to_live), serialized_tags)
+            if (len(self._pending_results) >= self._write_batch_size):
+                self._write_pending_results()
+            else:
+                self._write_if_due()
+
+    def remove(self, key: Tuple[str, ...]) -> None:
+        with self._lock:
+            serialized_key: str = self._serialize_key(key)
+            self._pending_results.pop(serialized_key, None)
+            self._delete_results([ serialized_key ])
+            self._connection.commit()
+
+    def invalidate(self, tags: Iterable[Tuple[str, ...]]) -> int:
+        serialized_tags: List[str] = list(set(self._serialize_key(current_tag) for current_tag in tags))
+        with self._lock:
+            # Write pending results first, so they're invalidated along with the stored results
+            self._write_pending_results()
+            serialized_keys: List[str] = []
+            for current_serialized_tag in serialized_tags:
+                serialized_keys.extend(current_row[0] for current_row in self._connection.execute("SELECT CacheKey FROM QueryResultTags WHERE Tag = ?", (current_serialized_tag, )))
+            removed_count: int = self._delete_results(list(set(serialized_keys)))
+            self._connection.commit()
+
+            return removed_count
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending_results.clear()
+            self._connection.execute("DELETE FROM QueryResults")
+            self._connection.execute("DELETE FROM QueryResultTags")
+            self._connection.commit()
+
+    def flush(self) -> None:
+        """Writes any pending results to the database."""
+        with self._lock:
+            self._write_pending_results()
+
+    def flush_if_due(self) -> None:
+        """Writes any pending results to the database if the oldest pending result is older than the 'write_interval' constructor parameter."""
+        with self._lock:
+            self._write_if_due()
+
+    def close(self) -> None:
+        """Writes any pending results and closes the underlying database."""
+        with self._lock:
+            self._write_pending_results()
+            self._connection.close()
+
+    #region Private/Protected Methods
+
+    def _serialize_key(self, key: Tuple[str, ...]) -> str:
+        return json.dumps(key, separators=(",", ":"))
+
+    def _find(self, key: Tuple[str, ...]) -> Tuple[bool, Any]:
+        """Finds an unexpired result in the pending results or the database.  Must be called while holding '_lock'.
+
+        Args:
+            key:
+                The key of the result.
+
+        Returns:
+            A tuple containing a boolean indicating whether an unexpired result was found, and the result (or None if not found).
+        """
+        serialized_key: str = self._serialize_key(key)
+        pending_result: Union[Tuple[str, float, List[str]], None] = self._pending_results.get(serialized_key)
+        if (pending_result is not None):
+            serialized_result, expiry_time = pending_result[0], pending_result[1]
+        else:
+            row = self._connection.execute("SELECT Result, ExpiryTime FROM QueryResults WHERE CacheKey = ?", (serialized_key, )).fetchone()
+            if (row is None):
+                return (False, None)
+            serialized_result, expiry_time = row[0], row[1]
+        if (time.time() >= expiry_time):
+            return (False, None)
+
+        return (True, json.loads(serialized_result))
+
+    def _write_if_due(self) -> None:
+        """Writes pending results if the oldest pending result is older than the write interval.  Must be called while holding '_lock'.
+        """
+        if (len(self._pending_results) > 0 and time.monotonic() - self._first_pending_result_time >= self._write_interval):
+            self._write_pending_results()
+
+    def _write_pending_results(self) -> None:
+        """Writes pending results to the database in a single transaction, then removes expired and excess results.  Must be called while holding '_lock'.
+        """
+        if (len(self._pending_results) == 0):
+            return
+        serialized_keys: List[str] = list(self._pending_results.keys())
+        self._connection.executemany("DELETE FROM QueryResultTags WHERE CacheKey = ?", [ (current_serialized_key, ) for current_serialized_key in serialized_keys ])
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO QueryResults (CacheKey, Result, ExpiryTime) VALUES (?, ?, ?)",
+            [ (current_serialized_key, current_result[0], current_result[1]) for current_serialized_key, current_result in self._pending_results.items() ]
+        )
+        self._connection.executemany(
+            "INSERT INTO QueryResultTags (Tag, CacheKey) VALUES (?, ?)",
+            [ (current_serialized_tag, current_serialized_key) for current_serialized_key, current_result in self._pending_results.items() for current_serialized_tag in current_result[2] ]
+        )
+        self._pending_results.clear()
+        self._evict()
+        self._connection.commit()
+
+    def _evict(self) -> None:
+        """Removes expired results, and then the results closest to expiry if the number of results exceeds the maximum size.  Must be called while holding '_lock'.
+        """
+        self._delete_results([ current_row[0] for current_row in self._connection.execute("SELECT CacheKey FROM QueryResults WHERE ExpiryTime <= ?", (time.time(), )) ])
+        excess_count: int = self._connection.execute("SELECT COUNT(*) FROM QueryResults").fetchone()[0] - self._max_size
+        if (excess_count > 0):
+            self._delete_results([ current_row[0] for current_row in self._connection.execute("SELECT CacheKey FROM QueryResults ORDER BY ExpiryTime LIMIT ?", (excess_count, )) ])
+
+    def _delete_results(self, serialized_keys: List[str]) -> int:
+        """Deletes results and their tags from the database.  Must be called while holding '_lock'.
+
+        Args:
+            serialized_keys:
+                The serialized keys of the results.
+
+        Returns:
+            The number of results deleted.
+        """
+        deleted_count: int = 0
+        for current_serialized_key in serialized_keys:
+            deleted_count += self._connection.execute("DELETE FROM QueryResults WHERE CacheKey = ?", (current_serialized_key, )).rowcount
+            self._connection.execute("DELETE FROM QueryResultTags WHERE CacheKey = ?", (current_serialized_key, ))
+
+        return deleted_count
+
+    #endregion
@@ -0,0 +1,77 @@
+import os
+import tempfile
+import time
+import unittest
+
+from exceptions.deserialization_error import DeserializationError
+from access_graph import AccessGraph
+from access_graph_snapshot_serializer import AccessGraphSnapshotSerializer
+
+class AccessGraphSnapshotSerializerTests(unittest.TestCase):
+    """Unit tests for the AccessGraphSnapshotSerializer class."""
+
+    def setUp(self):
+        self._temporary_directory = tempfile.TemporaryDirectory()
+        self._snapshot_file_path = os.path.join(self._temporary_directory.name, "snapshot.bin")
+        self._test_serializer = AccessGraphSnapshotSerializer()
+
+
+    def tearDown(self):
+        self._temporary_directory.cleanup()
+
+
+    def test_serialize_and_deserialize(self):
+        graph = AccessGraph()
+        graph.add_user("user0")
+        graph.add_user_to_group_mapping("user1", "group1")
+        graph.add_group_to_group_mapping("group1", "group2")
+        graph.add_user_to_application_component_and_access_level_mapping("user1", "OrderScreen", "View")
+        graph.add_group_to_application_component_and_access_level_mapping("group2", "SummaryScreen", "Modify")
+        graph.add_entity_type("BusinessUnit")
+        graph.add_user_to_entity_mapping("user1", "ClientAccount", "Company1")
+        graph.add_group_to_entity_mapping("group2", "ClientAccount", "Companyé")
+        graph.add_entity("ClientAccount", "Company3")
+
+        self._test_serializer.serialize(graph, 42, self._snapshot_file_path)
+        result, position, creation_time = self._test_serializer.deserialize(self._snapshot_file_path)
+
+        self.assertEqual(42, position)
+        self.assertLess(abs(time.time() - creation_time), 60.0)
+        self.assertEqual({ "user0", "user1" }, set(result.users))
+        self.assertEqual({ "group1", "group2" }, set(result.groups))
+        self.assertEqual({ "BusinessUnit", "ClientAccount" }, set(result.entity_types))
+        self.assertEqual(set(), set(result.get_entities("BusinessUnit")))
+        self.assertEqual({ "Company1", "Companyé", "Company3" }, set(result.get_entities("ClientAccount")))
+        self.assertEqual({ "group1", "group2" }, set(result.get_user_to_group_mappings("user1", True)))
+        self.assertEqual({ ("OrderScreen", "View"), ("SummaryScreen", "Modify") }, result.get_application_components_accesible_by_user("user1"))
+        self.assertEqual({ ("ClientAccount", "Company1"), ("ClientAccount", "Companyé") }, result.get_entities_accessible_by_user("user1"))
+        self.assertFalse(os.path.exists(self._snapshot_file_path + ".tmp"))
+
+
+    def test_deserialize_file_which_isnt_a_snapshot(self):
+        with open(self._snapshot_file_path, "wb") as snapshot_file:
+            snapshot_file.write(b"NOTASNAPSHOT" * 4)
+
+        with self.assertRaises(DeserializationError) as result:
+            self._test_serializer.deserialize(self._snapshot_file_path)
+
+        self.assertEqual("Failed to deserialize snapshot.  The file does not contain a snapshot.", str(result.exception))
+
+
+    def test_deserialize_truncated_snapshot(self):
+        graph = AccessGraph()
+        graph.add_user_to_group_mapping("user1", "group1")
+        self._test_serializer.serialize(graph, 1, self._snapshot_file_path)
+        with open(self._snapshot_file_path, "rb") as snapshot_file:
+            snapshot_bytes: bytes = snapshot_file.read()
+        for current_length in [ 0, 10, 40, len(snapshot_bytes) - 4 ]:
+            with open(self._snapshot_file_path, "wb") as snapshot_file:
+                snapshot_file.write(snapshot_bytes[:current_length])
+
+            with self.assertRaises(DeserializationError) as result:
+                self._test_serializer.deserialize(self._snapshot_file_path)
+
+            self.assertEqual("Failed to deserialize snapshot file '{0}'.  The file is empty, truncated or corrupt.".format(self._snapshot_file_path), str(result.exception))
+
+if __name__ == "__main__":
+    unittest.main()
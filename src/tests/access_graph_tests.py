@@ -0,0 +1,93 @@
+from typing import Set
+import unittest
+
+from exceptions.element_not_found_error import ElementNotFoundError
+from access_graph import AccessGraph
+
+class AccessGraphTests(unittest.TestCase):
+    """Unit tests for the AccessGraph class."""
+
+    def setUp(self):
+        # user1 -> group1 -> group2 -> group3, user2 -> group3
+        self._test_access_graph = AccessGraph()
+        self._test_access_graph.add_user_to_group_mapping("user1", "group1")
+        self._test_access_graph.add_user_to_group_mapping("user2", "group3")
+        self._test_access_graph.add_group_to_group_mapping("group1", "group2")
+        self._test_access_graph.add_group_to_group_mapping("group2", "group3")
+        self._test_access_graph.add_group_to_application_component_and_access_level_mapping("group3", "OrderScreen", "View")
+        self._test_access_graph.add_user_to_application_component_and_access_level_mapping("user2", "SummaryScreen", "Modify")
+        self._test_access_graph.add_entity_type("ClientAccount")
+        self._test_access_graph.add_group_to_entity_mapping("group2", "ClientAccount", "Company1")
+        self._test_access_graph.add_user_to_entity_mapping("user2", "ClientAccount", "Company2")
+
+
+    def test_mapping_adds_elements(self):
+        self.assertEqual({ "user1", "user2" }, set(self._test_access_graph.users))
+        self.assertEqual({ "group1", "group2", "group3" }, set(self._test_access_graph.groups))
+        self.assertEqual({ "Company1", "Company2" }, set(self._test_access_graph.get_entities("ClientAccount")))
+
+
+    def test_indirect_group_mappings(self):
+        self.assertEqual({ "group1" }, set(self._test_access_graph.get_user_to_group_mappings("user1", False)))
+        self.assertEqual({ "group1", "group2", "group3" }, set(self._test_access_graph.get_user_to_group_mappings("user1", True)))
+        self.assertEqual({ "group2", "group3" }, set(self._test_access_graph.get_group_to_group_mappings("group1", True)))
+        self.assertEqual({ "group1", "group2" }, set(self._test_access_graph.get_group_to_group_reverse_mappings("group3", True)))
+        self.assertEqual({ "user1", "user2" }, set(self._test_access_graph.get_group_to_user_mappings("group3", True)))
+        self.assertEqual({ "user2" }, set(self._test_access_graph.get_group_to_user_mappings("group3", False)))
+
+
+    def test_indirect_application_component_and_entity_mappings(self):
+        self.assertEqual({ "user1", "user2" }, set(self._test_access_graph.get_application_component_and_access_level_to_user_mappings("OrderScreen", "View", True)))
+        self.assertEqual(set(), set(self._test_access_graph.get_application_component_and_access_level_to_user_mappings("OrderScreen", "View", False)))
+        self.assertEqual({ "group1", "group2", "group3" }, set(self._test_access_graph.get_application_component_and_access_level_to_group_mappings("OrderScreen", "View", True)))
+        self.assertEqual({ "user1" }, set(self._test_access_graph.get_entity_to_user_mappings("ClientAccount", "Company1", True)))
+        self.assertEqual({ "group1", "group2" }, set(self._test_access_graph.get_entity_to_group_mappings("ClientAccount", "Company1", True)))
+
+
+    def test_has_access(self):
+        self.assertTrue(self._test_access_graph.has_access_to_application_component("user1", "OrderScreen", "View"))
+        self.assertFalse(self._test_access_graph.has_access_to_application_component("user1", "SummaryScreen", "Modify"))
+        self.assertTrue(self._test_access_graph.has_access_to_application_component("user2", "SummaryScreen", "Modify"))
+        self.assertTrue(self._test_access_graph.has_access_to_entity("user1", "ClientAccount", "Company1"))
+        self.assertFalse(self._test_access_graph.has_access_to_entity("user2", "ClientAccount", "Company1"))
+        self.assertFalse(self._test_access_graph.has_access_to_entity("user3", "ClientAccount", "Company1"))
+
+
+    def test_accessible_by(self):
+        self.assertEqual({ ("OrderScreen", "View"), ("SummaryScreen", "Modify") }, self._test_access_graph.get_application_components_accesible_by_user("user2"))
+        self.assertEqual({ ("OrderScreen", "View") }, self._test_access_graph.get_application_components_accesible_by_group("group1"))
+        self.assertEqual({ ("ClientAccount", "Company1") }, self._test_access_graph.get_entities_accessible_by_user("user1"))
+        self.assertEqual({ "Company1" }, self._test_access_graph.get_entities_of_type_accessible_by_group("group1", "ClientAccount"))
+        self.assertEqual(set(), self._test_access_graph.get_entities_accessible_by_group("group3"))
+
+
+    def test_remove_group_removes_mappings(self):
+        self._test_access_graph.remove_group("group2")
+
+        self.assertEqual({ "group1" }, set(self._test_access_graph.get_user_to_group_mappings("user1", True)))
+        self.assertEqual(set(), set(self._test_access_graph.get_group_to_group_reverse_mappings("group3", False)))
+        self.assertFalse(self._test_access_graph.has_access_to_application_component("user1", "OrderScreen", "View"))
+        self.assertEqual(set(), set(self._test_access_graph.get_entity_to_group_mappings("ClientAccount", "Company1", False)))
+
+
+    def test_remove_entity_type_removes_mappings(self):
+        self._test_access_graph.remove_entity_type("ClientAccount")
+
+        self.assertFalse(self._test_access_graph.contains_entity_type("ClientAccount"))
+        self.assertEqual(set(), set(self._test_access_graph.get_user_to_entity_mappings("user2")))
+        self.assertEqual(set(), set(self._test_access_graph.get_group_to_entity_mappings("group2")))
+
+
+    def test_query_for_element_which_doesnt_exist(self):
+        with self.assertRaises(ElementNotFoundError) as result:
+            self._test_access_graph.get_user_to_group_mappings("user3", False)
+
+        self.assertEqual("User 'user3' does not exist.", str(result.exception))
+        self.assertEqual("User", result.exception.element_type)
+        self.assertEqual("user3", result.exception.element_value)
+        with self.assertRaises(ElementNotFoundError) as result:
+            self._test_access_graph.get_entities("BusinessUnit")
+        self.assertEqual("EntityType", result.exception.element_type)
+
+if __name__ == "__main__":
+    unittest.main()
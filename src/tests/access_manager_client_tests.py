@@ -0,0 +1,796 @@
+from typing import List, Dict, Union, Any
+import json
+import importlib.util
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from string_unique_stringifier import StringUniqueStringifier
+from response_body_decoder_base import ResponseBodyDecoderBase
+from message_pack_response_body_decoder import MessagePackResponseBodyDecoder
+from event_write_ahead_log import EventWriteAheadLog
+from request_concurrency_limiter import RequestConcurrencyLimiter
+from exceptions.queue_time_budget_exceeded_error import QueueTimeBudgetExceededError
+from query_result_cache import QueryResultCache
+from element_existence_filter import ElementExistenceFilter
+from access_manager_client import AccessManagerClient
+from models.access_manager_change_event import AccessManagerChangeEvent
+from stub_access_manager_server import StubAccessManagerServer, StubResponse
+
+class AccessManagerClientTests(unittest.TestCase):
+    """Unit tests for the AccessManagerClient class which run against a local StubAccessManagerServer."""
+
+    def setUp(self):
+        self._stub_server = StubAccessManagerServer()
+        self._stub_server.start()
+        self._test_access_manager_client = self._create_client()
+
+
+    def tearDown(self):
+        self._stub_server.stop()
+
+
+    def test_accept_header_json_only_by_default(self):
+        self._stub_server.set_response("GET", "api/v1/users", self._json_response([ "user1", "user2" ]))
+
+        result: List[str] = list(self._test_access_manager_client.users)
+
+        self.assertEqual([ "user1", "user2" ], result)
+        self.assertEqual("application/json", self._stub_server.requests[0].headers["Accept"])
+
+
+    def test_accept_header_lists_decoders_in_order_of_preference(self):
+        test_client = self._create_client(response_body_decoders=[ self._CountingTestFormatDecoder("application/x-test-1"), self._CountingTestFormatDecoder("application/x-test-2") ])
+        self._stub_server.set_response("GET", "api/v1/users", self._json_response([ "user1" ]))
+
+        list(test_client.users)
+
+        self.assertEqual("application/x-test-1, application/x-test-2;q=0.9, application/json;q=0.8", self._stub_server.requests[0].headers["Accept"])
+
+
+    def test_duplicate_decoder_content_type(self):
+        with self.assertRaises(ValueError) as result:
+            self._create_client(response_body_decoders=[ self._CountingTestFormatDecoder("application/x-test"), self._CountingTestFormatDecoder("application/x-test") ])
+
+        self.assertEqual("Parameter 'response_body_decoders' contains multiple decoders for content type 'application/x-test'.", str(result.exception))
+
+
+    def test_binary_response_decoded_with_matching_decoder(self):
+        test_decoder = self._CountingTestFormatDecoder("application/x-test")
+        test_client = self._create_client(response_body_decoders=[ test_decoder ])
+        test_body: List[Dict[str, str]] = [ 
+            { "applicationComponent": "OrderScreen", "accessLevel": "View" }, 
+            { "applicationComponent": "SummaryScreen", "accessLevel": "Modify" }
+        ]
+        self._stub_server.set_response(
+            "GET", 
+            "api/v1/userToApplicationComponentAndAccessLevelMappings/user/user1?includeIndirectMappings=false", 
+            StubResponse(200, json.dumps(test_body).encode(), { "Content-Type": "application/x-test; charset=utf-8" })
+        )
+
+        result = list(test_client.get_user_to_application_component_and_access_level_mappings("user1"))
+
+        self.assertEqual([ ("OrderScreen", "View"), ("SummaryScreen", "Modify") ], result)
+        self.assertEqual(1, test_decoder.decode_count)
+
+
+    def test_json_fallback_when_server_ignores_accept_header(self):
+        test_decoder = self._CountingTestFormatDecoder("application/x-test")
+        test_client = self._create_client(response_body_decoders=[ test_decoder ])
+        self._stub_server.set_response("GET", "api/v1/groups", self._json_response([ "group1", "group2" ]))
+
+        result: List[str] = list(test_client.groups)
+
+        self.assertEqual([ "group1", "group2" ], result)
+        self.assertEqual(0, test_decoder.decode_count)
+
+
+    def test_decode_failure(self):
+        test_client = self._create_client(response_body_decoders=[ self._CountingTestFormatDecoder("application/x-test") ])
+        self._stub_server.set_response("GET", "api/v1/users", StubResponse(200, b"\x00\x01", { "Content-Type": "application/x-test" }))
+
+        with self.assertRaises(Exception) as result:
+            list(test_client.users)
+
+        self.assertEqual("Failed to call URL '{0}api/v1/users' with 'GET' method.  Error deserializing response body with content type 'application/x-test'.".format(self._stub_server.base_url), str(result.exception))
+
+
+    @unittest.skipUnless(importlib.util.find_spec("msgpack") is not None, "Package 'msgpack' is not installed.")
+    def test_message_pack_response(self):
+        import msgpack
+        test_client = self._create_client(response_body_decoders=[ MessagePackResponseBodyDecoder() ])
+        self._stub_server.set_response(
+            "GET", 
+            "api/v1/userToGroupMappings/user/user1?includeIndirectMappings=true", 
+            StubResponse(200, msgpack.packb([ { "group": "group1" }, { "group": "group2" } ]), { "Content-Type": "application/msgpack" })
+        )
+
+        result: List[str] = list(test_client.get_user_to_group_mappings("user1", True))
+
+        self.assertEqual([ "group1", "group2" ], result)
+        self.assertEqual("application/msgpack, application/json;q=0.9", self._stub_server.requests[0].headers["Accept"])
+
+
+    def test_event_write_ahead_log_replays_requests_in_order_after_outage(self):
+        temporary_directory = tempfile.TemporaryDirectory()
+        test_write_ahead_log = EventWriteAheadLog(os.path.join(temporary_directory.name, "events.db"))
+        test_client = self._create_client(event_write_ahead_log=test_write_ahead_log, event_write_ahead_log_retry_interval=0.05)
+        try:
+            self._stub_server.set_response("POST", "api/v1/users/user1", StubResponse(503))
+
+            test_client.add_user("user1")
+            test_client.add_group("group1")
+            test_client.add_user_to_group_mapping("user1", "group1")
+            test_client.remove_user("user2")
+
+            self.assertGreater(test_write_ahead_log.backlog_size, 0)
+            self._stub_server.set_response("POST", "api/v1/users/user1", StubResponse(201))
+            self._stub_server.set_response("POST", "api/v1/groups/group1", StubResponse(201))
+            self._stub_server.set_response("POST", "api/v1/userToGroupMappings/user/user1/group/group1", StubResponse(201))
+            self._stub_server.set_response("DELETE", "api/v1/users/user2", StubResponse(200))
+            self._wait_until(lambda: test_write_ahead_log.backlog_size == 0)
+
+            successful_requests: List[str] = []
+            for current_request in self._stub_server.requests:
+                if (len(successful_requests) == 0 or successful_requests[-1] != current_request.method + " " + current_request.path):
+                    successful_requests.append(current_request.method + " " + current_request.path)
+            self.assertEqual(
+                [ 
+                    "POST /api/v1/users/user1", 
+                    "POST /api/v1/groups/group1", 
+                    "POST /api/v1/userToGroupMappings/user/user1/group/group1", 
+                    "DELETE /api/v1/users/user2" 
+                ], 
+                successful_requests
+            )
+        finally:
+            test_client.close()
+            test_write_ahead_log.close()
+            temporary_directory.cleanup()
+
+
+    def test_event_write_ahead_log_discards_rejected_requests(self):
+        temporary_directory = tempfile.TemporaryDirectory()
+        test_write_ahead_log = EventWriteAheadLog(os.path.join(temporary_directory.name, "events.db"))
+        test_client = self._create_client(event_write_ahead_log=test_write_ahead_log, event_write_ahead_log_retry_interval=0.05)
+        try:
+            self._stub_server.set_response("POST", "api/v1/users/user1", self._json_response({ "error": { "code": "ArgumentException", "message": "Invalid user." } }, 400))
+            self._stub_server.set_response("POST", "api/v1/users/user2", StubResponse(201))
+
+            test_client.add_user("user1")
+            test_client.add_user("user2")
+            self._wait_until(lambda: test_write_ahead_log.backlog_size == 0)
+
+            assert test_client._event_write_ahead_log_replayer is not None
+            self.assertEqual(1, test_client._event_write_ahead_log_replayer.discarded_request_count)
+            self.assertEqual([ "/api/v1/users/user1", "/api/v1/users/user2" ], [ current_request.path for current_request in self._stub_server.requests ])
+        finally:
+            test_client.close()
+            test_write_ahead_log.close()
+            temporary_directory.cleanup()
+
+
+    def test_event_write_ahead_log_results_not_cached_until_requests_replayed(self):
+        temporary_directory = tempfile.TemporaryDirectory()
+        test_write_ahead_log = EventWriteAheadLog(os.path.join(temporary_directory.name, "events.db"))
+        test_client = self._create_client(event_write_ahead_log=test_write_ahead_log, event_write_ahead_log_retry_interval=0.05, query_result_cache=QueryResultCache(100, 60.0))
+        try:
+            self._stub_server.set_response("GET", "api/v1/userToGroupMappings/user/user1?includeIndirectMappings=false", self._json_response([ { "group": "group1" } ]))
+            self._stub_server.set_response("DELETE", "api/v1/userToGroupMappings/user/user1/group/group1", StubResponse(503))
+            test_client.remove_user_to_group_mapping("user1", "group1")
+
+            # The request hasn't been replayed, so results retrieved before it is aren't cached
+            self.assertEqual([ "group1" ], list(test_client.get_user_to_group_mappings("user1", False)))
+            self.assertEqual([ "group1" ], list(test_client.get_user_to_group_mappings("user1", False)))
+            self._stub_server.set_response("DELETE", "api/v1/userToGroupMappings/user/user1/group/group1", StubResponse(200))
+            self._stub_server.set_response("GET", "api/v1/userToGroupMappings/user/user1?includeIndirectMappings=false", self._json_response([]))
+            self._wait_until(lambda: test_write_ahead_log.backlog_size == 0)
+            self._stub_server.clear_requests()
+
+            self.assertEqual([], list(test_client.get_user_to_group_mappings("user1", False)))
+            self.assertEqual([], list(test_client.get_user_to_group_mappings("user1", False)))
+            self.assertEqual(1, len(self._stub_server.requests))
+        finally:
+            test_client.close()
+            test_write_ahead_log.close()
+            temporary_directory.cleanup()
+
+
+    def test_request_concurrency_limiter_rejects_request_exceeding_queue_time_budget(self):
+        test_limiter = RequestConcurrencyLimiter(1, 0.0)
+        test_client = self._create_client(request_concurrency_limiter=test_limiter)
+        self._stub_server.set_response("GET", "api/v1/users/user1", StubResponse(200))
+        test_limiter.acquire("Test")
+
+        with self.assertRaises(QueueTimeBudgetExceededError):
+            test_client.contains_user("user1")
+
+        self.assertEqual(0, len(self._stub_server.requests))
+        test_limiter.release()
+        self.assertTrue(test_client.contains_user("user1"))
+        self.assertEqual(0, test_limiter.in_progress_request_count)
+
+
+    def test_conditional_requests_reuse_result_when_not_modified(self):
+        test_decoder = self._CountingTestFormatDecoder("application/x-test")
+        test_client = self._create_client(conditional_request_cache_size=10, response_body_decoders=[ test_decoder ])
+        self._stub_server.set_conditional_response("api/v1/users", StubResponse(200, json.dumps([ "user1", "user2" ]).encode(), { "Content-Type": "application/x-test" }))
+        self._stub_server.set_conditional_response("api/v1/entityTypes/ClientAccount/entities", StubResponse(200, json.dumps([ { "entityType": "ClientAccount", "entity": "Company1" } ]).encode(), { "Content-Type": "application/x-test" }))
+
+        self.assertEqual([ "user1", "user2" ], list(test_client.users))
+        self.assertEqual([ "user1", "user2" ], list(test_client.users))
+        self.assertEqual([ "Company1" ], list(test_client.get_entities("ClientAccount")))
+        self.assertEqual([ "Company1" ], list(test_client.get_entities("ClientAccount")))
+
+        self.assertEqual(
+            [ False, True, False, True ], 
+            [ "If-None-Match" in current_request.headers for current_request in self._stub_server.requests ]
+        )
+        # Only the first response for each URL has a body to decode
+        self.assertEqual(2, test_decoder.decode_count)
+
+
+    def test_conditional_requests_refresh_result_when_modified(self):
+        test_decoder = self._CountingTestFormatDecoder("application/x-test")
+        test_client = self._create_client(conditional_request_cache_size=10, response_body_decoders=[ test_decoder ])
+        self._stub_server.set_conditional_response("api/v1/groups", StubResponse(200, json.dumps([ "group1" ]).encode(), { "Content-Type": "application/x-test" }))
+
+        self.assertEqual([ "group1" ], list(test_client.groups))
+        self._stub_server.set_conditional_response("api/v1/groups", StubResponse(200, json.dumps([ "group1", "group2" ]).encode(), { "Content-Type": "application/x-test" }))
+        self.assertEqual([ "group1", "group2" ], list(test_client.groups))
+        self.assertEqual([ "group1", "group2" ], list(test_client.groups))
+
+        self.assertEqual(2, test_decoder.decode_count)
+
+
+    def test_conditional_requests_disabled_by_default(self):
+        self._stub_server.set_conditional_response("api/v1/entityTypes", self._json_response([ "ClientAccount" ]))
+
+        list(self._test_access_manager_client.entity_types)
+        list(self._test_access_manager_client.entity_types)
+
+        self.assertEqual(
+            [ False, False ], 
+            [ "If-None-Match" in current_request.headers for current_request in self._stub_server.requests ]
+        )
+
+
+    def test_has_access_results_cached(self):
+        test_client = self._create_client(query_result_cache=QueryResultCache(100, 60.0))
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/applicationComponent/user/user1/applicationComponent/OrderScreen/accessLevel/View", self._json_response(True))
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/entity/user/user1/entityType/ClientAccount/entity/Company%201", self._json_response(False))
+
+        for i in range(3):
+            self.assertTrue(test_client.has_access_to_application_component("user1", "OrderScreen", "View"))
+            self.assertFalse(test_client.has_access_to_entity("user1", "ClientAccount", "Company 1"))
+
+        self.assertEqual(2, len(self._stub_server.requests))
+
+
+    def test_has_access_bypass_cache(self):
+        test_client = self._create_client(query_result_cache=QueryResultCache(100, 60.0))
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/applicationComponent/user/user1/applicationComponent/OrderScreen/accessLevel/View", self._json_response(True))
+        test_client.has_access_to_application_component("user1", "OrderScreen", "View")
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/applicationComponent/user/user1/applicationComponent/OrderScreen/accessLevel/View", self._json_response(False))
+
+        self.assertTrue(test_client.has_access_to_application_component("user1", "OrderScreen", "View"))
+        self.assertFalse(test_client.has_access_to_application_component("user1", "OrderScreen", "View", bypass_cache=True))
+        self.assertFalse(test_client.has_access_to_application_component("user1", "OrderScreen", "View"))
+        self.assertEqual(2, len(self._stub_server.requests))
+
+
+    def test_event_invalidates_dependent_cached_results(self):
+        test_client = self._create_client(query_result_cache=QueryResultCache(100, 60.0))
+        self._stub_server.set_response("GET", "api/v1/userToGroupMappings/user/user1?includeIndirectMappings=false", self._json_response([ { "group": "group1" } ]))
+        self._stub_server.set_response("GET", "api/v1/userToGroupMappings/user/user2?includeIndirectMappings=false", self._json_response([ { "group": "group2" } ]))
+        self._stub_server.set_response("GET", "api/v1/userToGroupMappings/group/group1?includeIndirectMappings=false", self._json_response([ { "user": "user1" } ]))
+        self._stub_server.set_response("GET", "api/v1/userToApplicationComponentAndAccessLevelMappings/user/user2?includeIndirectMappings=false", self._json_response([ { "applicationComponent": "OrderScreen", "accessLevel": "View" } ]))
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/entity/user/user2/entityType/ClientAccount/entity/Company1", self._json_response(True))
+        self._stub_server.set_response("DELETE", "api/v1/userToGroupMappings/user/user1/group/group1", StubResponse(200))
+        queries = [
+            lambda: list(test_client.get_user_to_group_mappings("user1", False)), 
+            lambda: list(test_client.get_user_to_group_mappings("user2", False)), 
+            lambda: list(test_client.get_group_to_user_mappings("group1", False)), 
+            lambda: list(test_client.get_user_to_application_component_and_access_level_mappings("user2")), 
+            lambda: test_client.has_access_to_entity("user2", "ClientAccount", "Company1")
+        ]
+        for current_query in queries:
+            current_query()
+        self.assertEqual(5, len(self._stub_server.requests))
+        self._stub_server.clear_requests()
+
+        test_client.remove_user_to_group_mapping("user1", "group1")
+        for current_query in queries:
+            current_query()
+
+        # The has_access_to_entity() result for 'user2' doesn't depend on the groups of 'user1', so isn't invalidated
+        self.assertEqual(
+            [ 
+                "DELETE /api/v1/userToGroupMappings/user/user1/group/group1", 
+                "GET /api/v1/userToGroupMappings/user/user1?includeIndirectMappings=false", 
+                "GET /api/v1/userToGroupMappings/group/group1?includeIndirectMappings=false" 
+            ], 
+            [ current_request.method + " " + current_request.path for current_request in self._stub_server.requests ]
+        )
+
+
+    def test_group_mapping_change_invalidates_only_results_of_dependent_users(self):
+        test_client = self._create_client(query_result_cache=QueryResultCache(100, 60.0))
+        self._stub_server.set_response("GET", "api/v1/userToGroupMappings/user/user1?includeIndirectMappings=true", self._json_response([ { "group": "group1" }, { "group": "group3" } ]))
+        self._stub_server.set_response("GET", "api/v1/userToGroupMappings/user/user2?includeIndirectMappings=true", self._json_response([ { "group": "group2" } ]))
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/applicationComponent/user/user1/applicationComponent/OrderScreen/accessLevel/View", self._json_response(True))
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/applicationComponent/user/user2/applicationComponent/OrderScreen/accessLevel/View", self._json_response(False))
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/applicationComponent/user/user3/applicationComponent/OrderScreen/accessLevel/View", self._json_response(False))
+        self._stub_server.set_response("POST", "api/v1/groupToApplicationComponentAndAccessLevelMappings/group/group2/applicationComponent/OrderScreen/accessLevel/View", StubResponse(201))
+        self._stub_server.set_response("POST", "api/v1/groupToApplicationComponentAndAccessLevelMappings/group/group3/applicationComponent/OrderScreen/accessLevel/View", StubResponse(201))
+        list(test_client.get_user_to_group_mappings("user1", True))
+        list(test_client.get_user_to_group_mappings("user2", True))
+        queries = [
+            lambda: test_client.has_access_to_application_component("user1", "OrderScreen", "View"), 
+            lambda: test_client.has_access_to_application_component("user2", "OrderScreen", "View"), 
+            lambda: test_client.has_access_to_application_component("user3", "OrderScreen", "View")
+        ]
+        for current_query in queries:
+            current_query()
+        self._stub_server.clear_requests()
+
+        test_client.add_group_to_application_component_and_access_level_mapping("group2", "OrderScreen", "View")
+        for current_query in queries:
+            current_query()
+
+        # The groups of 'user3' aren't known, so its result is invalidated by any group mapping change
+        self.assertEqual(
+            [ 
+                "POST /api/v1/groupToApplicationComponentAndAccessLevelMappings/group/group2/applicationComponent/OrderScreen/accessLevel/View", 
+                "GET /api/v1/dataElementAccess/applicationComponent/user/user2/applicationComponent/OrderScreen/accessLevel/View", 
+                "GET /api/v1/dataElementAccess/applicationComponent/user/user3/applicationComponent/OrderScreen/accessLevel/View" 
+            ], 
+            [ current_request.method + " " + current_request.path for current_request in self._stub_server.requests ]
+        )
+        self._stub_server.clear_requests()
+
+        # 'user1' is indirectly mapped to 'group3'
+        test_client.add_group_to_application_component_and_access_level_mapping("group3", "OrderScreen", "View")
+        queries[0]()
+        queries[1]()
+
+        self.assertEqual(
+            [ 
+                "POST /api/v1/groupToApplicationComponentAndAccessLevelMappings/group/group3/applicationComponent/OrderScreen/accessLevel/View", 
+                "GET /api/v1/dataElementAccess/applicationComponent/user/user1/applicationComponent/OrderScreen/accessLevel/View" 
+            ], 
+            [ current_request.method + " " + current_request.path for current_request in self._stub_server.requests ]
+        )
+
+
+    def test_track_group_dependencies_retrieves_groups_of_user(self):
+        test_client = self._create_client(query_result_cache=QueryResultCache(100, 60.0), track_group_dependencies=True)
+        self._stub_server.set_response("GET", "api/v1/userToGroupMappings/user/user1?includeIndirectMappings=true", self._json_response([ { "group": "group1" } ]))
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/entity/user/user1/entityType/ClientAccount/entity/Company1", self._json_response(True))
+        self._stub_server.set_response("DELETE", "api/v1/groupToEntityMappings/group/group2/entityType/ClientAccount/entity/Company2", StubResponse(200))
+
+        test_client.has_access_to_entity("user1", "ClientAccount", "Company1")
+        test_client.remove_group_to_entity_mapping("group2", "ClientAccount", "Company2")
+        test_client.has_access_to_entity("user1", "ClientAccount", "Company1")
+
+        self.assertEqual(
+            [ 
+                "GET /api/v1/dataElementAccess/entity/user/user1/entityType/ClientAccount/entity/Company1", 
+                "GET /api/v1/userToGroupMappings/user/user1?includeIndirectMappings=true", 
+                "DELETE /api/v1/groupToEntityMappings/group/group2/entityType/ClientAccount/entity/Company2" 
+            ], 
+            [ current_request.method + " " + current_request.path for current_request in self._stub_server.requests ]
+        )
+
+
+    def test_element_existence_filter_answers_definite_misses_locally(self):
+        self._stub_server.set_response("GET", "api/v1/users", self._json_response([ "user1" ]))
+        self._stub_server.set_response("GET", "api/v1/groups", self._json_response([ "group1" ]))
+        self._stub_server.set_response("GET", "api/v1/entityTypes", self._json_response([ "ClientAccount" ]))
+        self._stub_server.set_response("GET", "api/v1/entityTypes/ClientAccount/entities", self._json_response([ "Company1" ]))
+        self._stub_server.set_response("GET", "api/v1/users/user1", StubResponse(200))
+        self._stub_server.set_response("GET", "api/v1/entityTypes/ClientAccount/entities/Company1", StubResponse(200))
+        self._stub_server.set_response("POST", "api/v1/users/user2", StubResponse(201))
+        test_filter = ElementExistenceFilter(100, 0.001, 60.0)
+        test_client = self._create_client(element_existence_filter=test_filter)
+        try:
+            self._wait_until(lambda: test_filter.is_populated)
+            self._stub_server.clear_requests()
+
+            self.assertTrue(test_client.contains_user("user1"))
+            self.assertTrue(test_client.contains_entity("ClientAccount", "Company1"))
+            self.assertFalse(test_client.contains_user("garbage"))
+            self.assertFalse(test_client.contains_group("garbage"))
+            self.assertFalse(test_client.contains_entity_type("garbage"))
+            self.assertFalse(test_client.contains_entity("ClientAccount", "garbage"))
+            test_client.add_user("user2")
+            self.assertFalse(test_client.contains_user("user2"))
+        finally:
+            test_client.close()
+
+        # Elements added via the client are recorded in the filter, so 'user2' is checked against the AccessManager instance (which returns 404 from the stub)
+        self.assertEqual(
+            [ 
+                "GET /api/v1/users/user1", 
+                "GET /api/v1/entityTypes/ClientAccount/entities/Company1", 
+                "POST /api/v1/users/user2", 
+                "GET /api/v1/users/user2" 
+            ], 
+            [ current_request.method + " " + current_request.path for current_request in self._stub_server.requests ]
+        )
+
+
+    def test_contains_negative_result_cache(self):
+        self._stub_server.set_response("POST", "api/v1/groups/group1", StubResponse(201))
+        test_client = self._create_client(contains_negative_result_cache=QueryResultCache(100, 60.0))
+
+        self.assertFalse(test_client.contains_group("group1"))
+        self.assertFalse(test_client.contains_group("group1"))
+        test_client.add_group("group1")
+        self._stub_server.set_response("GET", "api/v1/groups/group1", StubResponse(200))
+        self.assertTrue(test_client.contains_group("group1"))
+        self.assertTrue(test_client.contains_group("group1"))
+
+        self.assertEqual(
+            [ 
+                "GET /api/v1/groups/group1", 
+                "POST /api/v1/groups/group1", 
+                "GET /api/v1/groups/group1", 
+                "GET /api/v1/groups/group1" 
+            ], 
+            [ current_request.method + " " + current_request.path for current_request in self._stub_server.requests ]
+        )
+
+
+    def test_removing_element_invalidates_results_containing_it(self):
+        test_client = self._create_client(query_result_cache=QueryResultCache(100, 60.0))
+        self._stub_server.set_response("GET", "api/v1/groupToEntityMappings/group/group1?includeIndirectMappings=false", self._json_response([ { "entityType": "ClientAccount", "entity": "Company1" } ]))
+        self._stub_server.set_response("GET", "api/v1/groupToEntityMappings/group/group2?includeIndirectMappings=false", self._json_response([ { "entityType": "ClientAccount", "entity": "Company2" } ]))
+        self._stub_server.set_response("DELETE", "api/v1/entityTypes/ClientAccount/entities/Company1", StubResponse(200))
+        list(test_client.get_group_to_entity_mappings("group1"))
+        list(test_client.get_group_to_entity_mappings("group2"))
+        self._stub_server.clear_requests()
+
+        test_client.remove_entity("ClientAccount", "Company1")
+        list(test_client.get_group_to_entity_mappings("group1"))
+        list(test_client.get_group_to_entity_mappings("group2"))
+
+        self.assertEqual(
+            [ "/api/v1/entityTypes/ClientAccount/entities/Company1", "/api/v1/groupToEntityMappings/group/group1?includeIndirectMappings=false" ], 
+            [ current_request.path for current_request in self._stub_server.requests ]
+        )
+
+
+    def test_failed_event_still_invalidates_cached_results(self):
+        test_client = self._create_client(query_result_cache=QueryResultCache(100, 60.0))
+        self._stub_server.set_response("GET", "api/v1/userToApplicationComponentAndAccessLevelMappings/user/user1?includeIndirectMappings=true", self._json_response([]))
+        self._stub_server.set_response("POST", "api/v1/userToApplicationComponentAndAccessLevelMappings/user/user1/applicationComponent/OrderScreen/accessLevel/View", StubResponse(500))
+        test_client.get_application_components_accesible_by_user("user1")
+
+        with self.assertRaises(RuntimeError):
+            test_client.add_user_to_application_component_and_access_level_mapping("user1", "OrderScreen", "View")
+        test_client.get_application_components_accesible_by_user("user1")
+
+        self.assertEqual(3, len(self._stub_server.requests))
+
+
+    def test_result_not_cached_when_invalidated_while_request_in_flight(self):
+        test_client = self._create_client(query_result_cache=QueryResultCache(100, 60.0), degraded_mode_result_cache=QueryResultCache(100, 60.0))
+        request_received_signal: threading.Event = threading.Event()
+        event_processed_signal: threading.Event = threading.Event()
+
+        def handle_request(request):
+            request_received_signal.set()
+            event_processed_signal.wait(5.0)
+            return self._json_response([ { "group": "group1" } ])
+
+        self._stub_server.set_handler("GET", "api/v1/userToGroupMappings/user/user1?includeIndirectMappings=false", handle_request)
+        self._stub_server.set_response("DELETE", "api/v1/userToGroupMappings/user/user1/group/group1", StubResponse(200))
+        query_thread: threading.Thread = threading.Thread(target=lambda: list(test_client.get_user_to_group_mappings("user1", False)))
+        query_thread.start()
+        request_received_signal.wait(5.0)
+
+        test_client.remove_user_to_group_mapping("user1", "group1")
+        event_processed_signal.set()
+        query_thread.join(5.0)
+        self._stub_server.set_response("GET", "api/v1/userToGroupMappings/user/user1?includeIndirectMappings=false", self._json_response([]))
+
+        self.assertEqual([], list(test_client.get_user_to_group_mappings("user1", False)))
+        self.assertEqual(3, len(self._stub_server.requests))
+
+
+    def test_refresh_ahead_time_not_less_than_cache_time_to_live(self):
+        with self.assertRaises(ValueError) as result:
+            self._create_client(query_result_cache=QueryResultCache(100, 1.0), refresh_ahead_time=1.0, stale_while_revalidate_time=0.5)
+
+        self.assertEqual("Parameter 'refresh_ahead_time' with value 1.0 must be less than the time-to-live of parameter 'query_result_cache'.", str(result.exception))
+
+
+    def test_stale_while_revalidate_returns_stale_result_and_refreshes_in_background(self):
+        test_client = self._create_client(query_result_cache=QueryResultCache(100, 0.2), stale_while_revalidate_time=5.0)
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/applicationComponent/user/user1/applicationComponent/OrderScreen/accessLevel/View", self._json_response(True))
+        test_client.has_access_to_application_component("user1", "OrderScreen", "View")
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/applicationComponent/user/user1/applicationComponent/OrderScreen/accessLevel/View", self._json_response(False))
+        time.sleep(0.25)
+
+        self.assertTrue(test_client.has_access_to_application_component("user1", "OrderScreen", "View"))
+        self._wait_until(lambda: test_client.background_refresh_count == 1)
+        self.assertFalse(test_client.has_access_to_application_component("user1", "OrderScreen", "View"))
+        self.assertEqual(1, test_client.stale_result_count)
+        self.assertEqual(2, len(self._stub_server.requests))
+        test_client.close()
+
+
+    def test_stale_result_not_returned_after_stale_while_revalidate_time(self):
+        test_client = self._create_client(query_result_cache=QueryResultCache(100, 0.1), stale_while_revalidate_time=0.1)
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/entity/user/user1/entityType/ClientAccount/entity/Company1", self._json_response(True))
+        test_client.has_access_to_entity("user1", "ClientAccount", "Company1")
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/entity/user/user1/entityType/ClientAccount/entity/Company1", self._json_response(False))
+        time.sleep(0.25)
+
+        self.assertFalse(test_client.has_access_to_entity("user1", "ClientAccount", "Company1"))
+        self.assertEqual(0, test_client.stale_result_count)
+        test_client.close()
+
+
+    def test_refresh_ahead_refreshes_result_before_stale(self):
+        test_client = self._create_client(query_result_cache=QueryResultCache(100, 5.0), refresh_ahead_time=4.8)
+        self._stub_server.set_response("GET", "api/v1/userToApplicationComponentAndAccessLevelMappings/user/user1?includeIndirectMappings=true", self._json_response([]))
+        test_client.get_application_components_accesible_by_user("user1")
+        self._stub_server.set_response("GET", "api/v1/userToApplicationComponentAndAccessLevelMappings/user/user1?includeIndirectMappings=true", self._json_response([ { "applicationComponent": "OrderScreen", "accessLevel": "View" } ]))
+
+        # Result isn't yet due for refresh
+        self.assertEqual(set(), set(test_client.get_application_components_accesible_by_user("user1")))
+        time.sleep(0.25)
+        self.assertEqual(set(), set(test_client.get_application_components_accesible_by_user("user1")))
+        self._wait_until(lambda: test_client.background_refresh_count == 1)
+        self.assertEqual({ ("OrderScreen", "View") }, set(test_client.get_application_components_accesible_by_user("user1")))
+        self.assertEqual(0, test_client.stale_result_count)
+        self.assertEqual(2, len(self._stub_server.requests))
+        test_client.close()
+
+
+    def test_background_refresh_concurrency_limited(self):
+        test_client = self._create_client(query_result_cache=QueryResultCache(100, 0.2), stale_while_revalidate_time=5.0, max_background_refresh_concurrency=1)
+        refresh_signal: threading.Event = threading.Event()
+        for current_user in [ "user1", "user2" ]:
+            self._stub_server.set_response("GET", "api/v1/dataElementAccess/applicationComponent/user/{0}/applicationComponent/OrderScreen/accessLevel/View".format(current_user), self._json_response(True))
+            test_client.has_access_to_application_component(current_user, "OrderScreen", "View")
+
+            def handle_request(request, response=self._json_response(False)):
+                refresh_signal.wait(5.0)
+                return response
+
+            self._stub_server.set_handler("GET", "api/v1/dataElementAccess/applicationComponent/user/{0}/applicationComponent/OrderScreen/accessLevel/View".format(current_user), handle_request)
+        time.sleep(0.25)
+        self._stub_server.clear_requests()
+
+        for i in range(3):
+            self.assertTrue(test_client.has_access_to_application_component("user1", "OrderScreen", "View"))
+            self.assertTrue(test_client.has_access_to_application_component("user2", "OrderScreen", "View"))
+        refresh_signal.set()
+        self._wait_until(lambda: test_client.background_refresh_count == 1)
+        test_client.close()
+
+        self.assertEqual([ "/api/v1/dataElementAccess/applicationComponent/user/user1/applicationComponent/OrderScreen/accessLevel/View" ], [ current_request.path for current_request in self._stub_server.requests ])
+        self.assertFalse(test_client.has_access_to_application_component("user1", "OrderScreen", "View"))
+        self.assertEqual(6, test_client.stale_result_count)
+
+
+    def test_degraded_mode_returns_retained_result_when_unavailable(self):
+        test_client = self._create_client(degraded_mode_result_cache=QueryResultCache(100, 60.0), degraded_mode_failure_threshold=1, degraded_mode_retry_interval=0.1)
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/applicationComponent/user/user1/applicationComponent/OrderScreen/accessLevel/View", self._json_response(True))
+        self.assertTrue(test_client.has_access_to_application_component("user1", "OrderScreen", "View"))
+        self.assertFalse(test_client.last_result_was_degraded)
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/applicationComponent/user/user1/applicationComponent/OrderScreen/accessLevel/View", StubResponse(503))
+
+        self.assertTrue(test_client.has_access_to_application_component("user1", "OrderScreen", "View"))
+
+        self.assertTrue(test_client.is_degraded)
+        self.assertTrue(test_client.last_result_was_degraded)
+        self.assertEqual(1, test_client.degraded_result_count)
+        # No retained result for user2
+        with self.assertRaises(RuntimeError):
+            test_client.has_access_to_application_component("user2", "OrderScreen", "View")
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/applicationComponent/user/user1/applicationComponent/OrderScreen/accessLevel/View", self._json_response(False))
+        time.sleep(0.15)
+        self.assertFalse(test_client.has_access_to_application_component("user1", "OrderScreen", "View"))
+        self.assertFalse(test_client.is_degraded)
+        self.assertFalse(test_client.last_result_was_degraded)
+
+
+    def test_degraded_mode_does_not_return_results_exceeding_maximum_staleness(self):
+        test_client = self._create_client(degraded_mode_result_cache=QueryResultCache(100, 0.05), degraded_mode_failure_threshold=1)
+        self._stub_server.set_response("GET", "api/v1/userToApplicationComponentAndAccessLevelMappings/user/user1?includeIndirectMappings=true", self._json_response([ { "applicationComponent": "OrderScreen", "accessLevel": "View" } ]))
+        test_client.get_application_components_accesible_by_user("user1")
+        self._stub_server.set_response("GET", "api/v1/userToApplicationComponentAndAccessLevelMappings/user/user1?includeIndirectMappings=true", StubResponse(500))
+        time.sleep(0.06)
+
+        with self.assertRaises(RuntimeError):
+            test_client.get_application_components_accesible_by_user("user1")
+        self.assertTrue(test_client.is_degraded)
+        self.assertEqual(0, test_client.degraded_result_count)
+
+
+    def test_degraded_mode_answers_from_retained_results_with_periodic_trial_requests(self):
+        test_client = self._create_client(degraded_mode_result_cache=QueryResultCache(100, 60.0), degraded_mode_failure_threshold=2, degraded_mode_retry_interval=0.2)
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/entity/user/user1/entityType/ClientAccount/entity/Company1", self._json_response(True))
+        test_client.has_access_to_entity("user1", "ClientAccount", "Company1")
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/entity/user/user1/entityType/ClientAccount/entity/Company1", StubResponse(503))
+        self._stub_server.clear_requests()
+
+        for i in range(2):
+            self.assertFalse(test_client.is_degraded)
+            self.assertTrue(test_client.has_access_to_entity("user1", "ClientAccount", "Company1"))
+        self.assertTrue(test_client.is_degraded)
+        for i in range(5):
+            self.assertTrue(test_client.has_access_to_entity("user1", "ClientAccount", "Company1"))
+        self.assertEqual(2, len(self._stub_server.requests))
+        self.assertEqual(7, test_client.degraded_result_count)
+
+        # A trial request is sent after the retry interval, and ends degraded mode when it succeeds
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/entity/user/user1/entityType/ClientAccount/entity/Company1", self._json_response(False))
+        time.sleep(0.25)
+        self.assertFalse(test_client.has_access_to_entity("user1", "ClientAccount", "Company1"))
+        self.assertFalse(test_client.is_degraded)
+        self.assertFalse(test_client.last_result_was_degraded)
+        self.assertEqual(3, len(self._stub_server.requests))
+
+
+    def test_degraded_mode_not_used_when_request_rejected_or_result_invalidated(self):
+        test_client = self._create_client(degraded_mode_result_cache=QueryResultCache(100, 60.0))
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/entity/user/user1/entityType/ClientAccount/entity/Company1", self._json_response(True))
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/entity/user/user2/entityType/ClientAccount/entity/Company1", self._json_response(True))
+        self._stub_server.set_response("DELETE", "api/v1/userToEntityMappings/user/user2/entityType/ClientAccount/entity/Company1", StubResponse(200))
+        test_client.has_access_to_entity("user1", "ClientAccount", "Company1")
+        test_client.has_access_to_entity("user2", "ClientAccount", "Company1")
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/entity/user/user1/entityType/ClientAccount/entity/Company1", self._json_response({ "error": { "code": "ArgumentException", "message": "Invalid entity." } }, 400))
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/entity/user/user2/entityType/ClientAccount/entity/Company1", StubResponse(500))
+
+        test_client.remove_user_to_entity_mapping("user2", "ClientAccount", "Company1")
+
+        with self.assertRaises(ValueError):
+            test_client.has_access_to_entity("user1", "ClientAccount", "Company1")
+        with self.assertRaises(RuntimeError):
+            test_client.has_access_to_entity("user2", "ClientAccount", "Company1")
+        self.assertEqual(0, test_client.degraded_result_count)
+
+
+    def test_invalidate_cached_results_for_external_event(self):
+        test_client = self._create_client(query_result_cache=QueryResultCache(100, 3600.0))
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/entity/user/user1/entityType/ClientAccount/entity/Company1", self._json_response(True))
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/entity/user/user2/entityType/ClientAccount/entity/Company2", self._json_response(True))
+        test_client.has_access_to_entity("user1", "ClientAccount", "Company1")
+        test_client.has_access_to_entity("user2", "ClientAccount", "Company2")
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/entity/user/user1/entityType/ClientAccount/entity/Company1", self._json_response(False))
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/entity/user/user2/entityType/ClientAccount/entity/Company2", self._json_response(False))
+        self._stub_server.clear_requests()
+
+        test_client.invalidate_cached_results(AccessManagerChangeEvent(1, "remove_user_to_entity_mapping", ("user1", "ClientAccount", "Company1")))
+
+        # The event is not sent to the AccessManager instance
+        self.assertEqual(0, len(self._stub_server.requests))
+        self.assertFalse(test_client.has_access_to_entity("user1", "ClientAccount", "Company1"))
+        self.assertTrue(test_client.has_access_to_entity("user2", "ClientAccount", "Company2"))
+        with self.assertRaises(ValueError) as result:
+            test_client.invalidate_cached_results(AccessManagerChangeEvent(2, "has_access_to_entity", ("user1", "ClientAccount", "Company1")))
+        self.assertEqual("Change event at position 2 has unrecognized type 'has_access_to_entity'.", str(result.exception))
+        test_client.clear_cached_results()
+        self.assertFalse(test_client.has_access_to_entity("user2", "ClientAccount", "Company2"))
+
+    def test_invalidate_cached_results_records_elements_added_by_external_event(self):
+        for current_path in [ "api/v1/users", "api/v1/groups", "api/v1/entityTypes" ]:
+            self._stub_server.set_response("GET", current_path, self._json_response([]))
+        test_filter = ElementExistenceFilter(100, 0.001, 60.0)
+        test_client = self._create_client(element_existence_filter=test_filter, query_result_cache=QueryResultCache(100, 3600.0))
+        try:
+            self._wait_until(lambda: test_filter.is_populated)
+            self._stub_server.clear_requests()
+
+            test_client.invalidate_cached_results(AccessManagerChangeEvent(1, "add_user_to_group_mapping", ("user2", "group2")))
+            test_client.invalidate_cached_results(AccessManagerChangeEvent(2, "remove_group", ("group3", )))
+            self.assertEqual(0, len(self._stub_server.requests))
+
+            self.assertFalse(test_client.contains_user("user2"))
+            self.assertFalse(test_client.contains_group("group3"))
+        finally:
+            test_client.close()
+
+        # Only 'user2' may exist according to the filter, so is checked against the AccessManager instance (which returns 404 from the stub)
+        self.assertEqual([ "GET /api/v1/users/user2" ], [ current_request.method + " " + current_request.path for current_request in self._stub_server.requests ])
+
+
+    def test_bulk_event_max_concurrency_less_than_1(self):
+        with self.assertRaises(ValueError) as result:
+            self._test_access_manager_client.add_users([ "user1" ], max_concurrency=0)
+
+        self.assertEqual("Parameter 'max_concurrency' with value 0 must be greater than or equal to 1.", str(result.exception))
+
+
+    def test_bulk_event_failures_reported_per_item(self):
+        for i in range(1, 21):
+            self._stub_server.set_response("POST", "api/v1/users/user" + str(i), StubResponse(201))
+        self._stub_server.set_response("POST", "api/v1/users/user5", self._json_response({ "error": { "code": "ArgumentException", "message": "Invalid user." } }, 400))
+        self._stub_server.set_response("POST", "api/v1/users/user12", StubResponse(500))
+
+        result = self._test_access_manager_client.add_users(("user" + str(i) for i in range(1, 21)), max_concurrency=4)
+
+        self.assertEqual(20, result.item_count)
+        self.assertEqual(18, result.success_count)
+        self.assertFalse(result.succeeded)
+        self.assertEqual([ 4, 11 ], [ current_failure.index for current_failure in result.failures ])
+        self.assertEqual([ "user5", "user12" ], [ current_failure.item for current_failure in result.failures ])
+        self.assertIsInstance(result.failures[0].error, ValueError)
+        self.assertIsInstance(result.failures[1].error, RuntimeError)
+        self.assertEqual(20, len([ current_request for current_request in self._stub_server.requests if current_request.method == "POST" ]))
+
+
+    def test_bulk_mapping_events(self):
+        for i in range(1, 4):
+            self._stub_server.set_response("POST", "api/v1/userToEntityMappings/user/user" + str(i) + "/entityType/ClientAccount/entity/Company1", StubResponse(201))
+            self._stub_server.set_response("POST", "api/v1/entityTypes/ClientAccount/entities/Company" + str(i), StubResponse(201))
+
+        entities_result = self._test_access_manager_client.add_entities("ClientAccount", [ "Company1", "Company2", "Company3" ])
+        mappings_result = self._test_access_manager_client.add_user_to_entity_mappings([ ("user" + str(i), "ClientAccount", "Company1") for i in range(1, 4) ], max_concurrency=1)
+
+        self.assertTrue(entities_result.succeeded)
+        self.assertTrue(mappings_result.succeeded)
+        self.assertEqual(3, mappings_result.item_count)
+        self.assertEqual(
+            [ "/api/v1/userToEntityMappings/user/user" + str(i) + "/entityType/ClientAccount/entity/Company1" for i in range(1, 4) ], 
+            [ current_request.path for current_request in self._stub_server.requests[3:] ]
+        )
+
+    #region Private/Protected Methods
+
+    def _wait_until(self, condition, timeout: float=5.0) -> None:
+        end_time: float = time.monotonic() + timeout
+        while (condition() == False):
+            if (time.monotonic() > end_time):
+                self.fail("Condition was not met within {0} seconds.".format(timeout))
+            time.sleep(0.01)
+
+
+    def _create_client(self, **kwargs) -> AccessManagerClient[str, str, str, str]:
+        return AccessManagerClient[str, str, str, str](
+            self._stub_server.base_url, 
+            StringUniqueStringifier(), 
+            StringUniqueStringifier(), 
+            StringUniqueStringifier(), 
+            StringUniqueStringifier(), 
+            **kwargs
+        )
+
+
+    def _json_response(self, body: Any, status: int=200) -> StubResponse:
+        return StubResponse(status, json.dumps(body).encode(), { "Content-Type": "application/json; charset=utf-8" })
+
+    #endregion
+
+    #region Inner Classes
+
+    class _CountingTestFormatDecoder(ResponseBodyDecoderBase):
+        """Decoder for a test content type whose bodies are JSON, which counts the number of calls to the decode() method."""
+
+        @property
+        def content_type(self) -> str:
+            return self._content_type
+
+        @property
+        def decode_count(self) -> int:
+            return self._decode_count
+
+        def __init__(self, content_type: str) -> None:
+            self._content_type: str = content_type
+            self._decode_count: int = 0
+
+        def decode(self, response_body: bytes) -> Union[str, bool, List[str], List[Dict[str, Any]], Dict[str, Any]]:
+            self._decode_count += 1
+            return json.loads(response_body)
+
+    #endregion
+
+if __name__ == "__main__":
+    unittest.main()
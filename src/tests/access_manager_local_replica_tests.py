@@ -0,0 +1,86 @@
+import time
+import unittest
+
+from string_unique_stringifier import StringUniqueStringifier
+from access_graph import AccessGraph
+from access_manager_local_replica import AccessManagerLocalReplica
+
+class AccessManagerLocalReplicaTests(unittest.TestCase):
+    """Unit tests for the AccessManagerLocalReplica class."""
+
+    def setUp(self):
+        # An AccessGraph implements AccessManagerQueryProcessor, so stands in for an AccessManagerClient as the source
+        self._source = AccessGraph()
+        self._source.add_user_to_group_mapping("user1", "group1")
+        self._source.add_group_to_group_mapping("group1", "group2")
+        self._source.add_group_to_application_component_and_access_level_mapping("group2", "OrderScreen", "View")
+        self._source.add_user_to_entity_mapping("user1", "ClientAccount", "Company1")
+        self._source.add_entity("BusinessUnit", "Sales")
+        self._source.add_user("user2")
+
+
+    def test_constructor_load_concurrency_less_than_1(self):
+        with self.assertRaises(ValueError) as result:
+            self._create_replica(0)
+
+        self.assertEqual("Parameter 'load_concurrency' with value 0 must be greater than or equal to 1.", str(result.exception))
+
+
+    def test_query_before_refresh(self):
+        test_replica = self._create_replica()
+
+        self.assertFalse(test_replica.is_loaded)
+        self.assertIsNone(test_replica.staleness)
+        with self.assertRaises(RuntimeError) as result:
+            test_replica.contains_user("user1")
+        self.assertEqual("The replica has not been loaded.  Call refresh() to load it.", str(result.exception))
+
+
+    def test_refresh_loads_all_elements_and_mappings(self):
+        for load_concurrency in [ 1, 4 ]:
+            test_replica = self._create_replica(load_concurrency)
+
+            test_replica.refresh()
+
+            self.assertEqual({ "user1", "user2" }, set(test_replica.users))
+            self.assertEqual({ "group1", "group2" }, set(test_replica.groups))
+            self.assertEqual({ "ClientAccount", "BusinessUnit" }, set(test_replica.entity_types))
+            self.assertEqual({ "Sales" }, set(test_replica.get_entities("BusinessUnit")))
+            self.assertTrue(test_replica.has_access_to_application_component("user1", "OrderScreen", "View"))
+            self.assertFalse(test_replica.has_access_to_application_component("user2", "OrderScreen", "View"))
+            self.assertTrue(test_replica.has_access_to_entity("user1", "ClientAccount", "Company1"))
+            self.assertEqual({ "group1", "group2" }, set(test_replica.get_user_to_group_mappings("user1", True)))
+            self.assertEqual({ ("OrderScreen", "View") }, test_replica.get_application_components_accesible_by_group("group1"))
+
+
+    def test_refresh_replaces_data_and_resets_staleness(self):
+        test_replica = self._create_replica()
+        test_replica.refresh()
+        time.sleep(0.02)
+        first_staleness = test_replica.staleness
+
+        self._source.remove_user_to_group_mapping("user1", "group1")
+        self.assertTrue(test_replica.has_access_to_application_component("user1", "OrderScreen", "View"))
+        test_replica.refresh()
+
+        self.assertFalse(test_replica.has_access_to_application_component("user1", "OrderScreen", "View"))
+        self.assertGreaterEqual(first_staleness, 0.02)
+        self.assertLess(test_replica.staleness, first_staleness)
+        self.assertEqual(2, test_replica.refresh_count)
+
+    #region Private/Protected Methods
+
+    def _create_replica(self, load_concurrency: int=1) -> AccessManagerLocalReplica[str, str, str, str]:
+        return AccessManagerLocalReplica[str, str, str, str](
+            self._source, 
+            StringUniqueStringifier(), 
+            StringUniqueStringifier(), 
+            StringUniqueStringifier(), 
+            StringUniqueStringifier(), 
+            load_concurrency
+        )
+
+    #endregion
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import os
+import shutil
+import socket
+import socketserver
+import struct
+import tempfile
+import unittest
+from unittest import mock
+
+from string_unique_stringifier import StringUniqueStringifier
+from access_graph import AccessGraph
+from access_manager_sidecar_server import AccessManagerSidecarServer
+from access_manager_sidecar_client import AccessManagerSidecarClient
+from sidecar_message_serializer import SidecarMessageSerializer
+from exceptions.element_not_found_error import ElementNotFoundError
+
+class AccessManagerSidecarTests(unittest.TestCase):
+    """Unit tests for the AccessManagerSidecarServer and AccessManagerSidecarClient classes."""
+
+    def setUp(self):
+        # An AccessGraph implements AccessManagerQueryProcessor, so stands in for an AccessManagerClient as the source
+        self._source = AccessGraph()
+        self._source.add_user_to_group_mapping("user1", "group1")
+        self._source.add_group_to_application_component_and_access_level_mapping("group1", "OrderScreen", "View")
+        self._source.add_user_to_entity_mapping("user1", "ClientAccount", "Company1")
+        self._source.add_entity("ClientAccount", "Company2")
+        self._temporary_directory = tempfile.mkdtemp()
+        self._socket_path = os.path.join(self._temporary_directory, "sidecar.sock")
+        self._test_server = AccessManagerSidecarServer(self._source, self._socket_path)
+        self._test_server.start()
+        self._test_client = AccessManagerSidecarClient[str, str, str, str](
+            self._socket_path, 
+            StringUniqueStringifier(), 
+            StringUniqueStringifier(), 
+            StringUniqueStringifier(), 
+            StringUniqueStringifier(), 
+            timeout=10.0
+        )
+
+
+    def tearDown(self):
+        self._test_client.close()
+        self._test_server.stop()
+        shutil.rmtree(self._temporary_directory)
+
+
+    def test_server_constructor_max_query_concurrency_less_than_1(self):
+        with self.assertRaises(ValueError) as result:
+            AccessManagerSidecarServer(self._source, self._socket_path, max_query_concurrency=0)
+
+        self.assertEqual("Parameter 'max_query_concurrency' with value 0 must be greater than or equal to 1.", str(result.exception))
+
+
+    def test_queries(self):
+        self.assertEqual({ "user1" }, set(self._test_client.users))
+        self.assertEqual([ "ClientAccount" ], list(self._test_client.entity_types))
+        self.assertTrue(self._test_client.contains_user("user1"))
+        self.assertFalse(self._test_client.contains_group("group2"))
+        self.assertEqual([ "group1" ], self._test_client.get_user_to_group_mappings("user1", True))
+        self.assertTrue(self._test_client.has_access_to_application_component("user1", "OrderScreen", "View"))
+        self.assertFalse(self._test_client.has_access_to_entity("user1", "ClientAccount", "Company2"))
+        self.assertEqual({ ("OrderScreen", "View") }, self._test_client.get_application_components_accesible_by_user("user1"))
+        self.assertEqual([ ("OrderScreen", "View") ], self._test_client.get_group_to_application_component_and_access_level_mappings("group1"))
+        self.assertEqual({ ("ClientAccount", "Company1") }, self._test_client.get_entities_accessible_by_user("user1"))
+        self.assertEqual({ "Company1" }, self._test_client.get_entities_of_type_accessible_by_user("user1", "ClientAccount"))
+        self.assertEqual(11, self._test_server.request_count)
+
+
+    def test_execute_batch(self):
+        results = self._test_client.execute_batch([
+            ("has_access_to_entity", "user1", "ClientAccount", "Company1"), 
+            ("has_access_to_entity", "user1", "ClientAccount", "Company2"), 
+            ("has_access_to_entity", "user1", "ClientAccount", "Company1"), 
+            ("get_entities", "ClientAccount")
+        ])
+
+        self.assertEqual([ True, False, True ], results[0:3])
+        self.assertEqual({ "Company1", "Company2" }, set(results[3]))
+        self.assertEqual(1, self._test_server.request_count)
+        self.assertEqual(4, self._test_server.query_count)
+        self.assertEqual(1, self._test_server.connection_count)
+
+
+    def test_execute_batch_invalid_query(self):
+        with self.assertRaises(ValueError) as result:
+            self._test_client.execute_batch([ ("add_user", "user2") ])
+        self.assertEqual("Query name add_user is not the name of an AccessManagerQueryProcessor method or property.", str(result.exception))
+
+        with self.assertRaises(ValueError) as result:
+            self._test_client.execute_batch([ ("contains_user", ) ])
+        self.assertEqual("Query 'contains_user' requires 1 parameter(s) but 0 were provided.", str(result.exception))
+
+
+    def test_malformed_request_messages(self):
+        serializer = SidecarMessageSerializer()
+        with mock.patch.object(socketserver.BaseServer, "handle_error") as handle_error, socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(self._socket_path)
+
+            serializer.write_message(connection, { "query": "contains_user" })
+            response = serializer.read_message(connection)
+            self.assertEqual(1, len(response))
+            self.assertEqual("Request message must be a list of queries.", str(serializer.deserialize_error(response[0][1])))
+
+            serializer.write_message(connection, [ [ "contains_user", [ "user1" ] ], "contains_user", [], [ "contains_user", "user1" ] ])
+            response = serializer.read_message(connection)
+            self.assertEqual([ 1, 1, 1, 0 ], [ current_item[0] for current_item in response ])
+            self.assertEqual("Query at position 0 must be a list containing a query name followed by its string, number, or boolean parameters.", str(serializer.deserialize_error(response[0][1])))
+            self.assertTrue(response[3][1])
+
+            # A message which isn't JSON closes the connection
+            connection.sendall(struct.pack(">I", 3) + b"abc")
+            self.assertEqual(b"", connection.recv(1))
+
+            self.assertEqual(0, handle_error.call_count)
+        # The server still accepts connections
+        self.assertTrue(self._test_client.contains_user("user1"))
+
+
+    def test_error_returned_from_source(self):
+        with self.assertRaises(ElementNotFoundError) as result:
+            self._test_client.get_user_to_group_mappings("user2", False)
+
+        self.assertEqual("User", result.exception.element_type)
+        self.assertEqual("user2", result.exception.element_value)
+        # The connection remains usable
+        self.assertTrue(self._test_client.contains_user("user1"))
+
+
+    def test_client_reconnects_after_server_restart(self):
+        self.assertTrue(self._test_client.contains_user("user1"))
+        self._test_server.stop()
+        self._test_server = AccessManagerSidecarServer(self._source, self._socket_path)
+        self._test_server.start()
+
+        try:
+            self._test_client.contains_user("user1")
+        except Exception:
+            # The request on the existing connection may fail
+            pass
+
+        self.assertTrue(self._test_client.contains_user("user1"))
+
+if __name__ == "__main__":
+    unittest.main()
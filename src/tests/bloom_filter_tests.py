@@ -0,0 +1,55 @@
+import unittest
+
+from bloom_filter import BloomFilter
+
+class BloomFilterTests(unittest.TestCase):
+    """Unit tests for the BloomFilter class."""
+
+    def test_constructor_expected_element_count_less_than_1(self):
+        with self.assertRaises(ValueError) as result:
+            BloomFilter(0, 0.01)
+
+        self.assertEqual("Parameter 'expected_element_count' with value 0 must be greater than or equal to 1.", str(result.exception))
+
+
+    def test_constructor_false_positive_rate_out_of_range(self):
+        with self.assertRaises(ValueError) as result:
+            BloomFilter(100, 1.0)
+
+        self.assertEqual("Parameter 'false_positive_rate' with value 1.0 must be greater than 0 and less than 1.", str(result.exception))
+
+
+    def test_constructor_sizes_filter(self):
+        test_bloom_filter = BloomFilter(1000, 0.01)
+
+        # m = -1000 * ln(0.01) / (ln 2)^2 = 9585.06, k = 9586 / 1000 * ln 2 = 6.64
+        self.assertEqual(9586, test_bloom_filter.bit_count)
+        self.assertEqual(7, test_bloom_filter.hash_function_count)
+        self.assertEqual(1199, test_bloom_filter.size_in_bytes)
+
+
+    def test_added_elements_always_found(self):
+        test_bloom_filter = BloomFilter(1000, 0.01)
+
+        for i in range(1000):
+            test_bloom_filter.add("user" + str(i))
+
+        self.assertEqual(1000, test_bloom_filter.element_count)
+        for i in range(1000):
+            self.assertTrue(test_bloom_filter.might_contain("user" + str(i)))
+
+
+    def test_false_positive_rate(self):
+        test_bloom_filter = BloomFilter(1000, 0.01)
+        for i in range(1000):
+            test_bloom_filter.add("user" + str(i))
+
+        false_positive_count: int = 0
+        for i in range(10000):
+            if (test_bloom_filter.might_contain("group" + str(i)) == True):
+                false_positive_count += 1
+
+        self.assertLess(false_positive_count, 200)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,213 @@
+from typing import List, Tuple, Union
+import threading
+import time
+import unittest
+
+from in_memory_change_feed import InMemoryChangeFeed
+from buffered_access_manager_event_processor import BufferedAccessManagerEventProcessor
+
+class FailingChangeFeed(InMemoryChangeFeed):
+    """InMemoryChangeFeed which raises an exception when adding specified users, and can block until signalled when adding users."""
+
+    def __init__(self) -> None:
+        super().__init__(1000)
+        self.unavailable: bool = False
+        self.add_user_started_signal: threading.Event = threading.Event()
+        self.add_user_continue_signal: Union[threading.Event, None] = None
+
+    def add_user(self, user: str) -> None:
+        self.add_user_started_signal.set()
+        if (self.add_user_continue_signal is not None):
+            self.add_user_continue_signal.wait()
+        if (user == "invalid"):
+            raise ValueError("Invalid user.")
+        if (self.unavailable == True):
+            raise RuntimeError("Unavailable.")
+        super().add_user(user)
+
+class BufferedAccessManagerEventProcessorTests(unittest.TestCase):
+    """Unit tests for the BufferedAccessManagerEventProcessor class."""
+
+    def setUp(self):
+        # An InMemoryChangeFeed records the events passed to it in order, so stands in for an AccessManagerClient as the target
+        self._target = FailingChangeFeed()
+        self._test_processors = []
+
+
+    def tearDown(self):
+        if (self._target.add_user_continue_signal is not None):
+            # Don't block flushes by stop() if a test failed while the target was blocked
+            self._target.add_user_continue_signal.set()
+        for current_processor in self._test_processors:
+            current_processor.stop()
+
+
+    def test_constructor_max_buffered_event_count_less_than_flush_event_count(self):
+        with self.assertRaises(ValueError) as result:
+            BufferedAccessManagerEventProcessor[str, str, str, str](self._target, flush_event_count=10, max_buffered_event_count=9)
+
+        self.assertEqual("Parameter 'max_buffered_event_count' with value 9 must be greater than or equal to parameter 'flush_event_count' with value 10.", str(result.exception))
+
+
+    def test_flush_sends_events_in_order(self):
+        test_processor = self._create_processor()
+        test_processor.add_user("user1")
+        test_processor.add_user_to_group_mapping("user1", "group1")
+        test_processor.add_entity("ClientAccount", "Company1")
+        test_processor.remove_user("user1")
+        self.assertEqual(4, test_processor.queue_depth)
+        self.assertEqual(0, self._target.latest_position)
+
+        test_processor.flush()
+
+        self.assertEqual(
+            [ ("add_user", ("user1", )), ("add_user_to_group_mapping", ("user1", "group1")), ("add_entity", ("ClientAccount", "Company1")), ("remove_user", ("user1", )) ], 
+            self._read_target_events()
+        )
+        self.assertEqual(0, test_processor.queue_depth)
+        self.assertEqual(4, test_processor.flushed_event_count)
+        self.assertEqual(1, test_processor.flush_count)
+        self.assertIsNotNone(test_processor.last_flush_latency)
+        self.assertGreaterEqual(test_processor.max_flush_latency, test_processor.last_flush_latency)
+
+
+    def test_flush_triggered_by_event_count(self):
+        test_processor = self._create_processor(flush_event_count=3, flush_interval=60.0)
+        test_processor.start()
+
+        for i in range(5):
+            test_processor.add_user("user" + str(i))
+
+        self._wait_until(lambda: self._target.latest_position >= 3)
+        self.assertEqual([ "user0", "user1", "user2" ], [ current_event[1][0] for current_event in self._read_target_events()[0:3] ])
+        test_processor.stop()
+        self.assertEqual(5, self._target.latest_position)
+
+
+    def test_flush_triggered_by_interval(self):
+        test_processor = self._create_processor(flush_event_count=100, flush_interval=0.05)
+        test_processor.start()
+
+        test_processor.add_user("user1")
+        start_time = time.monotonic()
+        self._wait_until(lambda: self._target.latest_position == 1)
+
+        self.assertGreaterEqual(time.monotonic() - start_time, 0.03)
+        test_processor.stop()
+
+
+    def test_rejected_events_discarded_and_failed_events_retained(self):
+        test_processor = self._create_processor()
+        test_processor.add_user("user1")
+        test_processor.add_user("invalid")
+        test_processor.add_user("user2")
+        test_processor.add_user("user3")
+
+        self._target.unavailable = True
+        with self.assertRaises(RuntimeError):
+            test_processor.flush()
+        self.assertEqual(4, test_processor.queue_depth)
+        self.assertEqual(1, test_processor.flush_failure_count)
+        self._target.unavailable = False
+        test_processor.add_user("user4")
+        test_processor.flush()
+
+        self.assertEqual([ "user1", "user2", "user3", "user4" ], [ current_event[1][0] for current_event in self._read_target_events() ])
+        self.assertEqual(1, test_processor.discarded_event_count)
+        self.assertEqual(4, test_processor.flushed_event_count)
+
+
+    def test_event_methods_block_while_buffer_full(self):
+        test_processor = self._create_processor(flush_event_count=2, max_buffered_event_count=2)
+        test_processor.add_user("user1")
+        test_processor.add_user("user2")
+        buffering_thread = threading.Thread(target=lambda: test_processor.add_user("user3"))
+
+        buffering_thread.start()
+        buffering_thread.join(0.05)
+        self.assertTrue(buffering_thread.is_alive())
+        test_processor.flush()
+        buffering_thread.join(5.0)
+
+        self.assertFalse(buffering_thread.is_alive())
+        self.assertEqual(1, test_processor.queue_depth)
+
+
+    def test_events_being_flushed_count_towards_max_buffered_event_count(self):
+        test_processor = self._create_processor(flush_event_count=2, max_buffered_event_count=2)
+        test_processor.add_user("user1")
+        test_processor.add_user("user2")
+        self._target.unavailable = True
+        self._target.add_user_continue_signal = threading.Event()
+        flush_errors: List[Exception] = []
+
+        def flush() -> None:
+            try:
+                test_processor.flush()
+            except Exception as e:
+                flush_errors.append(e)
+
+        flushing_thread = threading.Thread(target=flush)
+        flushing_thread.start()
+        self.assertTrue(self._target.add_user_started_signal.wait(5.0))
+        buffering_thread = threading.Thread(target=lambda: test_processor.add_user("user3"))
+        buffering_thread.start()
+        buffering_thread.join(0.05)
+        # The buffer is empty, but the events being flushed could be returned to it
+        self.assertTrue(buffering_thread.is_alive())
+        self._target.add_user_continue_signal.set()
+        flushing_thread.join(5.0)
+
+        self.assertEqual(1, len(flush_errors))
+        self.assertEqual(2, test_processor.queue_depth)
+        self.assertTrue(buffering_thread.is_alive())
+        self._target.unavailable = False
+        test_processor.flush()
+        buffering_thread.join(5.0)
+        self.assertFalse(buffering_thread.is_alive())
+        test_processor.flush()
+        self.assertEqual([ "user1", "user2", "user3" ], [ current_event[1][0] for current_event in self._read_target_events() ])
+
+
+    def test_flush_compacts_events(self):
+        test_processor = self._create_processor(compact_events=True)
+        test_processor.add_group("group1")
+        test_processor.add_user("user1")
+        test_processor.add_user("user1")
+        test_processor.add_user_to_group_mapping("user1", "group1")
+        test_processor.remove_user_to_group_mapping("user1", "group1")
+        test_processor.add_user("user2")
+        test_processor.add_user_to_group_mapping("user2", "group1")
+        test_processor.remove_user("user2")
+
+        test_processor.flush()
+
+        self.assertEqual(
+            [ ("add_group", ("group1", )), ("add_user", ("user1", )), ("remove_user_to_group_mapping", ("user1", "group1")), ("remove_user", ("user2", )) ], 
+            self._read_target_events()
+        )
+        self.assertEqual(4, test_processor.flushed_event_count)
+        self.assertEqual(4, test_processor.compacted_event_count)
+
+    #region Private/Protected Methods
+
+    def _create_processor(self, **kwargs) -> BufferedAccessManagerEventProcessor[str, str, str, str]:
+        test_processor = BufferedAccessManagerEventProcessor[str, str, str, str](self._target, **kwargs)
+        self._test_processors.append(test_processor)
+
+        return test_processor
+
+    def _read_target_events(self) -> List[Tuple[str, Tuple[str, ...]]]:
+        return [ (current_event.event_type, current_event.arguments) for current_event in self._target.read(0, 1000) ]
+
+    def _wait_until(self, condition, timeout: float=5.0) -> None:
+        end_time: float = time.monotonic() + timeout
+        while (condition() == False):
+            if (time.monotonic() > end_time):
+                self.fail("Condition was not met within {0} seconds.".format(timeout))
+            time.sleep(0.005)
+
+    #endregion
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import json
+import time
+import unittest
+
+from string_unique_stringifier import StringUniqueStringifier
+from query_result_cache import QueryResultCache
+from in_memory_change_feed import InMemoryChangeFeed
+from access_manager_client import AccessManagerClient
+from cache_invalidation_listener import CacheInvalidationListener
+from stub_access_manager_server import StubAccessManagerServer, StubResponse
+
+class CacheInvalidationListenerTests(unittest.TestCase):
+    """Unit tests for the CacheInvalidationListener class which run against a local StubAccessManagerServer."""
+
+    def setUp(self):
+        self._stub_server = StubAccessManagerServer()
+        self._stub_server.start()
+        self._test_client = AccessManagerClient[str, str, str, str](
+            self._stub_server.base_url, 
+            StringUniqueStringifier(), 
+            StringUniqueStringifier(), 
+            StringUniqueStringifier(), 
+            StringUniqueStringifier(), 
+            query_result_cache=QueryResultCache(100, 3600.0)
+        )
+        self._change_feed = InMemoryChangeFeed(2)
+        self._test_listener = CacheInvalidationListener(self._test_client, self._change_feed, wait_timeout=0.1, retry_interval=0.1, batch_size=10)
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/applicationComponent/user/user1/applicationComponent/OrderScreen/accessLevel/View", self._json_response(True))
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/applicationComponent/user/user2/applicationComponent/OrderScreen/accessLevel/View", self._json_response(True))
+
+
+    def tearDown(self):
+        self._test_listener.stop()
+        self._test_client.close()
+        self._stub_server.stop()
+
+
+    def test_constructor_wait_timeout_not_greater_than_0(self):
+        with self.assertRaises(ValueError) as result:
+            CacheInvalidationListener(self._test_client, self._change_feed, wait_timeout=0.0)
+
+        self.assertEqual("Parameter 'wait_timeout' with value 0.0 must be greater than 0.", str(result.exception))
+
+
+    def test_process_available_events_before_start(self):
+        with self.assertRaises(RuntimeError) as result:
+            self._test_listener.process_available_events()
+
+        self.assertEqual("The listener has not been started.", str(result.exception))
+
+
+    def test_event_invalidates_cached_results(self):
+        self._change_feed.add_user("user3")
+        self._test_listener.start()
+        self.assertEqual(1, self._test_listener.position)
+        self.assertTrue(self._test_client.has_access_to_application_component("user1", "OrderScreen", "View"))
+        self.assertTrue(self._test_client.has_access_to_application_component("user2", "OrderScreen", "View"))
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/applicationComponent/user/user1/applicationComponent/OrderScreen/accessLevel/View", self._json_response(False))
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/applicationComponent/user/user2/applicationComponent/OrderScreen/accessLevel/View", self._json_response(False))
+
+        self._change_feed.remove_user_to_application_component_and_access_level_mapping("user1", "OrderScreen", "View")
+        self._wait_until(lambda: self._test_listener.invalidation_count == 1)
+
+        self.assertFalse(self._test_client.has_access_to_application_component("user1", "OrderScreen", "View"))
+        self.assertTrue(self._test_client.has_access_to_application_component("user2", "OrderScreen", "View"))
+        self.assertEqual(2, self._test_listener.position)
+        self.assertEqual(0, self._test_listener.gap_count)
+
+
+    def test_gap_clears_cached_results(self):
+        self._test_listener.start()
+        self._test_listener.stop()
+        self.assertTrue(self._test_client.has_access_to_application_component("user2", "OrderScreen", "View"))
+        self._stub_server.set_response("GET", "api/v1/dataElementAccess/applicationComponent/user/user2/applicationComponent/OrderScreen/accessLevel/View", self._json_response(False))
+        # The feed retains only 2 events, so the first is missed
+        self._change_feed.add_user("user3")
+        self._change_feed.add_user("user4")
+        self._change_feed.add_user("user5")
+
+        self._test_listener.process_available_events()
+
+        self.assertEqual(1, self._test_listener.gap_count)
+        self.assertEqual(2, self._test_listener.invalidation_count)
+        self.assertEqual(3, self._test_listener.position)
+        self.assertFalse(self._test_client.has_access_to_application_component("user2", "OrderScreen", "View"))
+
+    #region Private/Protected Methods
+
+    def _wait_until(self, condition, timeout: float=5.0) -> None:
+        end_time: float = time.monotonic() + timeout
+        while (condition() == False):
+            if (time.monotonic() > end_time):
+                self.fail("Condition was not met within {0} seconds.".format(timeout))
+            time.sleep(0.01)
+
+
+    def _json_response(self, body, status: int=200) -> StubResponse:
+        return StubResponse(status, json.dumps(body).encode(), { "Content-Type": "application/json; charset=utf-8" })
+
+    #endregion
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+from typing import List
+import unittest
+
+from unique_stringifier_base import UniqueStringifierBase
+from counting_string_unique_stringifier import CountingStringUniqueStringifier
+from caching_unique_stringifier import CachingUniqueStringifier
+from src.json_array_to_iterable_converter import JsonArrayToIterableConverter
+
+class CachingUniqueStringifierTests(unittest.TestCase):
+    """Unit tests for the CachingUniqueStringifier class."""
+
+    def setUp(self):
+        self._counting_stringifier = CountingStringUniqueStringifier()
+
+
+    def test_constructor_max_size_less_than_1(self):
+        with self.assertRaises(ValueError) as result:
+            CachingUniqueStringifier[str](self._counting_stringifier, 0)
+
+        self.assertEqual("Parameter 'max_size' with value 0 must be greater than or equal to 1.", str(result.exception))
+
+
+    def test_repeated_conversions_answered_from_cache(self):
+        test_stringifier = CachingUniqueStringifier[str](self._counting_stringifier)
+
+        self.assertEqual("OrderScreen", test_stringifier.from_string("OrderScreen"))
+        self.assertEqual("OrderScreen", test_stringifier.from_string("OrderScreen"))
+        self.assertEqual("SummaryScreen", test_stringifier.to_string("SummaryScreen"))
+        self.assertEqual("SummaryScreen", test_stringifier.to_string("SummaryScreen"))
+
+        self.assertEqual(1, self._counting_stringifier.from_string_count)
+        self.assertEqual(1, self._counting_stringifier.to_string_count)
+        self.assertEqual(1, test_stringifier.from_string_hit_count)
+        self.assertEqual(1, test_stringifier.from_string_miss_count)
+        self.assertEqual(1, test_stringifier.to_string_hit_count)
+        self.assertEqual(1, test_stringifier.to_string_miss_count)
+
+
+    def test_conversion_populates_both_directions(self):
+        test_stringifier = CachingUniqueStringifier[str](self._counting_stringifier)
+
+        test_stringifier.from_string("OrderScreen")
+        test_stringifier.to_string("OrderScreen")
+        test_stringifier.to_string("SummaryScreen")
+        test_stringifier.from_string("SummaryScreen")
+
+        self.assertEqual(1, self._counting_stringifier.from_string_count)
+        self.assertEqual(1, self._counting_stringifier.to_string_count)
+
+
+    def test_least_recently_used_conversion_evicted(self):
+        test_stringifier = CachingUniqueStringifier[str](self._counting_stringifier, 2)
+        test_stringifier.from_string("View")
+        test_stringifier.from_string("Modify")
+        test_stringifier.from_string("View")
+
+        test_stringifier.from_string("Create")
+        test_stringifier.from_string("View")
+        test_stringifier.from_string("Modify")
+
+        self.assertEqual(4, self._counting_stringifier.from_string_count)
+
+
+    def test_unhashable_objects_not_cached(self):
+        test_stringifier = CachingUniqueStringifier[List[str]](ListUniqueStringifier())
+
+        self.assertEqual("a,b", test_stringifier.to_string([ "a", "b" ]))
+        self.assertEqual("a,b", test_stringifier.to_string([ "a", "b" ]))
+        self.assertEqual([ "a", "b" ], test_stringifier.from_string("a,b"))
+
+        self.assertEqual(0, test_stringifier.to_string_hit_count)
+        self.assertEqual(0, test_stringifier.to_string_miss_count)
+
+
+    def test_wraps_stringifier_used_by_converter(self):
+        test_input_list = [ { "applicationComponent": "OrderScreen", "accessLevel": "View" } for i in range(100) ]
+        test_stringifier = CachingUniqueStringifier[str](self._counting_stringifier)
+
+        result: List[str] = list(JsonArrayToIterableConverter().convert_to_iterable(test_input_list, test_stringifier, "accessLevel"))
+
+        self.assertEqual([ "View" ] * 100, result)
+        self.assertEqual(1, self._counting_stringifier.from_string_count)
+        self.assertEqual(99, test_stringifier.from_string_hit_count)
+
+class ListUniqueStringifier(UniqueStringifierBase[List[str]]):
+    """Stringifier for lists of strings, used to test unhashable objects."""
+
+    def to_string(self, input_object):
+
+        return ",".join(input_object)
+
+    def from_string(self, stringified_object):
+
+        return stringified_object.split(",")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,195 @@
+from typing import List
+import os
+import tempfile
+import time
+import unittest
+
+from string_unique_stringifier import StringUniqueStringifier
+from access_graph import AccessGraph
+from access_manager_local_replica import AccessManagerLocalReplica
+from in_memory_change_feed import InMemoryChangeFeed
+from change_feed_base import ChangeFeedBase
+from change_feed_synchronizer import ChangeFeedSynchronizer
+from models.access_manager_change_event import AccessManagerChangeEvent
+
+class ChangeFeedSynchronizerTests(unittest.TestCase):
+    """Unit tests for the ChangeFeedSynchronizer class."""
+
+    def setUp(self):
+        # Events are applied to both the source (standing in for an AccessManager instance) and the change feed
+        self._source = AccessGraph()
+        self._change_feed = InMemoryChangeFeed(5)
+        self._test_replica = AccessManagerLocalReplica[str, str, str, str](
+            self._source, 
+            StringUniqueStringifier(), 
+            StringUniqueStringifier(), 
+            StringUniqueStringifier(), 
+            StringUniqueStringifier()
+        )
+        self._test_synchronizer = ChangeFeedSynchronizer(self._test_replica, self._change_feed, 60.0, 2)
+
+
+    def test_constructor_batch_size_less_than_1(self):
+        with self.assertRaises(ValueError) as result:
+            ChangeFeedSynchronizer(self._test_replica, self._change_feed, 60.0, 0)
+
+        self.assertEqual("Parameter 'batch_size' with value 0 must be greater than or equal to 1.", str(result.exception))
+
+
+    def test_first_synchronize_loads_replica(self):
+        self._add_user_to_group_mapping("user1", "group1")
+
+        self._test_synchronizer.synchronize()
+
+        self.assertEqual([ "group1" ], list(self._test_replica.get_user_to_group_mappings("user1", False)))
+        self.assertEqual(1, self._test_synchronizer.position)
+        self.assertEqual(1, self._test_synchronizer.full_reload_count)
+
+
+    def test_events_applied_incrementally(self):
+        self._test_synchronizer.synchronize()
+        self._add_user_to_group_mapping("user1", "group1")
+        self._add_group_to_application_component_mapping("group1", "OrderScreen", "View")
+        self._add_user_to_group_mapping("user2", "group1")
+        self._remove_user_to_group_mapping("user1", "group1")
+
+        self._test_synchronizer.synchronize()
+
+        self.assertFalse(self._test_replica.has_access_to_application_component("user1", "OrderScreen", "View"))
+        self.assertTrue(self._test_replica.has_access_to_application_component("user2", "OrderScreen", "View"))
+        self.assertEqual(4, self._test_synchronizer.position)
+        self.assertEqual(4, self._test_synchronizer.applied_event_count)
+        self.assertEqual(1, self._test_synchronizer.full_reload_count)
+        self.assertEqual(0, self._test_synchronizer.gap_count)
+
+
+    def test_gap_causes_full_reload(self):
+        self._test_synchronizer.synchronize()
+        # The feed retains 5 events, so the first event is discarded
+        for i in range(6):
+            self._add_user_to_group_mapping("user" + str(i), "group1")
+
+        self._test_synchronizer.synchronize()
+
+        self.assertEqual(1, self._test_synchronizer.gap_count)
+        self.assertEqual(2, self._test_synchronizer.full_reload_count)
+        self.assertEqual(6, self._test_synchronizer.position)
+        self.assertEqual({ "user" + str(i) for i in range(6) }, set(self._test_replica.get_group_to_user_mappings("group1", False)))
+
+
+    def test_unrecognized_event_causes_full_reload(self):
+        self._test_synchronizer = ChangeFeedSynchronizer(self._test_replica, self._StubChangeFeed([ AccessManagerChangeEvent(1, "close", ()) ]), 60.0)
+        self._source.add_user("user1")
+
+        self._test_synchronizer.synchronize()
+
+        self.assertEqual(2, self._test_synchronizer.full_reload_count)
+        self.assertTrue(self._test_replica.contains_user("user1"))
+
+    def test_background_synchronization(self):
+        self._test_synchronizer = ChangeFeedSynchronizer(self._test_replica, self._change_feed, 60.0)
+        self._test_synchronizer.start()
+        try:
+            self._wait_until(lambda: self._test_replica.is_loaded)
+            self._add_user_to_group_mapping("user1", "group1")
+            self._test_synchronizer.notify_changes_available()
+            self._wait_until(lambda: self._test_synchronizer.position == 1)
+        finally:
+            self._test_synchronizer.stop()
+
+        self.assertTrue(self._test_replica.contains_group("group1"))
+
+    def test_load_snapshot_then_catch_up(self):
+        self._add_user_to_group_mapping("user1", "group1")
+        self._test_synchronizer.synchronize()
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            snapshot_file_path: str = os.path.join(temporary_directory, "snapshot.bin")
+            self._test_synchronizer.save_snapshot(snapshot_file_path)
+            self._add_user_to_group_mapping("user2", "group1")
+            # Simulate a new process starting from the snapshot
+            new_replica = AccessManagerLocalReplica[str, str, str, str](
+                self._source, 
+                StringUniqueStringifier(), 
+                StringUniqueStringifier(), 
+                StringUniqueStringifier(), 
+                StringUniqueStringifier()
+            )
+            new_synchronizer = ChangeFeedSynchronizer(new_replica, self._change_feed, 60.0)
+
+            new_synchronizer.load_snapshot(snapshot_file_path)
+
+            self.assertEqual(1, new_synchronizer.position)
+            self.assertEqual({ "user1" }, set(new_replica.get_group_to_user_mappings("group1", False)))
+            new_synchronizer.synchronize()
+            self.assertEqual({ "user1", "user2" }, set(new_replica.get_group_to_user_mappings("group1", False)))
+            self.assertEqual(0, new_synchronizer.full_reload_count)
+            self.assertEqual(1, new_synchronizer.applied_event_count)
+
+
+    def test_snapshot_ahead_of_change_feed_causes_full_reload(self):
+        for i in range(3):
+            self._add_user_to_group_mapping("user" + str(i), "group1")
+        self._test_synchronizer.synchronize()
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            snapshot_file_path: str = os.path.join(temporary_directory, "snapshot.bin")
+            self._test_synchronizer.save_snapshot(snapshot_file_path)
+            new_synchronizer = ChangeFeedSynchronizer(self._test_replica, InMemoryChangeFeed(5), 60.0)
+
+            new_synchronizer.load_snapshot(snapshot_file_path)
+            new_synchronizer.synchronize()
+
+        self.assertEqual(1, new_synchronizer.full_reload_count)
+        self.assertEqual(0, new_synchronizer.position)
+
+    #region Private/Protected Methods
+
+    def _add_user_to_group_mapping(self, user: str, group: str) -> None:
+        self._source.add_user_to_group_mapping(user, group)
+        self._change_feed.add_user_to_group_mapping(user, group)
+
+
+    def _remove_user_to_group_mapping(self, user: str, group: str) -> None:
+        self._source.remove_user_to_group_mapping(user, group)
+        self._change_feed.remove_user_to_group_mapping(user, group)
+
+
+    def _add_group_to_application_component_mapping(self, group: str, application_component: str, access_level: str) -> None:
+        self._source.add_group_to_application_component_and_access_level_mapping(group, application_component, access_level)
+        self._change_feed.add_group_to_application_component_and_access_level_mapping(group, application_component, access_level)
+
+
+    def _wait_until(self, condition, timeout: float=5.0) -> None:
+        end_time: float = time.monotonic() + timeout
+        while (condition() == False):
+            if (time.monotonic() > end_time):
+                self.fail("Condition was not met within {0} seconds.".format(timeout))
+            time.sleep(0.01)
+
+    #endregion
+
+    #region Inner Classes
+
+    class _StubChangeFeed(ChangeFeedBase):
+        """Change feed which returns a fixed list of events once, and whose latest position is the position of the last event once they have been read."""
+
+        @property
+        def latest_position(self) -> int:
+            if (self._read == True):
+                return self._events[-1].position
+            else:
+                return 0
+
+        def __init__(self, events: List[AccessManagerChangeEvent]) -> None:
+            self._events: List[AccessManagerChangeEvent] = events
+            self._read = False
+
+        def read(self, after_position: int, max_count: int) -> List[AccessManagerChangeEvent]:
+            if (self._read == True):
+                return []
+            self._read = True
+            return self._events
+
+    #endregion
+
+if __name__ == "__main__":
+    unittest.main()
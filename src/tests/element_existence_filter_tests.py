@@ -0,0 +1,75 @@
+from typing import List, Tuple
+import threading
+import unittest
+
+from element_existence_filter import ElementExistenceFilter
+
+class ElementExistenceFilterTests(unittest.TestCase):
+    """Unit tests for the ElementExistenceFilter class."""
+
+    def test_constructor_rebuild_interval_not_greater_than_0(self):
+        with self.assertRaises(ValueError) as result:
+            ElementExistenceFilter(100, 0.01, 0.0)
+
+        self.assertEqual("Parameter 'rebuild_interval' with value 0.0 must be greater than 0.", str(result.exception))
+
+
+    def test_might_contain_before_rebuild(self):
+        test_filter = ElementExistenceFilter(100, 0.01, 60.0)
+
+        self.assertFalse(test_filter.is_populated)
+        self.assertTrue(test_filter.might_contain(("user", "user1")))
+        self.assertEqual(0, test_filter.size_in_bytes)
+
+
+    def test_rebuild(self):
+        test_filter = ElementExistenceFilter(100, 0.01, 60.0)
+
+        test_filter.rebuild(lambda: [ ("user", "user1"), ("entity", "ClientAccount", "Company1") ])
+
+        self.assertTrue(test_filter.is_populated)
+        self.assertEqual(1, test_filter.rebuild_count)
+        self.assertTrue(test_filter.might_contain(("user", "user1")))
+        self.assertTrue(test_filter.might_contain(("entity", "ClientAccount", "Company1")))
+        self.assertFalse(test_filter.might_contain(("user", "user2")))
+        self.assertFalse(test_filter.might_contain(("group", "user1")))
+        test_filter.add(("user", "user2"))
+        self.assertTrue(test_filter.might_contain(("user", "user2")))
+
+
+    def test_rebuild_includes_elements_added_during_rebuild(self):
+        test_filter = ElementExistenceFilter(100, 0.01, 60.0)
+
+        def load_elements() -> List[Tuple[str, ...]]:
+            # Simulate an element being added by the client after the elements were loaded from the AccessManager instance
+            test_filter.add(("user", "user2"))
+            return [ ("user", "user1") ]
+
+        test_filter.rebuild(load_elements)
+
+        self.assertTrue(test_filter.might_contain(("user", "user2")))
+
+
+    def test_rebuild_failure_keeps_previous_filter(self):
+        test_filter = ElementExistenceFilter(100, 0.01, 0.01)
+        rebuild_attempts: List[int] = []
+        failed_signal: threading.Event = threading.Event()
+
+        def load_elements() -> List[Tuple[str, ...]]:
+            rebuild_attempts.append(1)
+            if (len(rebuild_attempts) > 1):
+                failed_signal.set()
+                raise RuntimeError("AccessManager instance unavailable.")
+            return [ ("user", "user1") ]
+
+        test_filter.start(load_elements)
+        self.assertTrue(failed_signal.wait(5.0))
+        test_filter.stop()
+
+        self.assertEqual(1, test_filter.rebuild_count)
+        self.assertGreaterEqual(test_filter.rebuild_failure_count, 1)
+        self.assertTrue(test_filter.might_contain(("user", "user1")))
+        self.assertFalse(test_filter.might_contain(("user", "user2")))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+import unittest
+
+from event_compactor import EventCompactor
+
+class EventCompactorTests(unittest.TestCase):
+    """Unit tests for the EventCompactor class."""
+
+    def setUp(self):
+        self._test_event_compactor = EventCompactor()
+
+
+    def test_compact_unrecognized_event_type(self):
+        with self.assertRaises(ValueError) as result:
+            self._test_event_compactor.compact([ ("add_user", ("user1", )), ("rename_user", ("user1", "user2")) ])
+
+        self.assertEqual("Event at index 1 has unrecognized type 'rename_user'.", str(result.exception))
+
+
+    def test_compact_no_redundant_events(self):
+        events = [
+            ("add_user", ("user1", )),
+            ("add_group", ("group1", )),
+            ("add_user_to_group_mapping", ("user1", "group1")),
+            ("add_entity_type", ("ClientAccount", )),
+            ("add_entity", ("ClientAccount", "Company1")),
+            ("add_group_to_entity_mapping", ("group1", "ClientAccount", "Company1")),
+            ("remove_user", ("user2", ))
+        ]
+
+        result = self._test_event_compactor.compact(events)
+
+        self.assertEqual(events, result)
+
+
+    def test_compact_mapping_events_superseded(self):
+        events = [
+            ("add_user", ("user1", )),
+            ("add_group", ("group1", )),
+            ("add_user_to_group_mapping", ("user1", "group1")),
+            ("add_user_to_application_component_and_access_level_mapping", ("user1", "Order", "View")),
+            ("remove_user_to_group_mapping", ("user1", "group1")),
+            ("remove_user_to_application_component_and_access_level_mapping", ("user1", "Order", "View")),
+            ("add_user_to_application_component_and_access_level_mapping", ("user1", "Order", "View")),
+            ("add_user_to_entity_mapping", ("user1", "ClientAccount", "Company1")),
+            ("add_user_to_entity_mapping", ("user1", "ClientAccount", "Company1"))
+        ]
+
+        result = self._test_event_compactor.compact(events)
+
+        self.assertEqual(
+            [
+                ("add_user", ("user1", )),
+                ("add_group", ("group1", )),
+                ("remove_user_to_group_mapping", ("user1", "group1")),
+                ("add_user_to_application_component_and_access_level_mapping", ("user1", "Order", "View")),
+                ("add_user_to_entity_mapping", ("user1", "ClientAccount", "Company1"))
+            ],
+            result
+        )
+
+
+    def test_compact_mapping_add_creating_elements_not_superseded(self):
+        # Adding the mapping also creates 'user1' and 'group1', which aren't otherwise created
+        events = [
+            ("add_user_to_group_mapping", ("user1", "group1")),
+            ("remove_user_to_group_mapping", ("user1", "group1"))
+        ]
+
+        result = self._test_event_compactor.compact(events)
+
+        self.assertEqual(events, result)
+
+
+    def test_compact_duplicate_element_events(self):
+        events = [
+            ("add_user", ("user1", )),
+            ("add_user_to_group_mapping", ("user1", "group1")),
+            ("add_user", ("user1", )),
+            ("remove_group", ("group2", )),
+            ("remove_group", ("group2", )),
+            ("remove_user", ("user2", )),
+            ("add_user_to_group_mapping", ("user2", "group1")),
+            ("remove_user", ("user2", ))
+        ]
+
+        result = self._test_event_compactor.compact(events)
+
+        self.assertEqual(
+            [
+                ("add_user", ("user1", )),
+                ("add_user_to_group_mapping", ("user1", "group1")),
+                ("remove_group", ("group2", )),
+                ("remove_user", ("user2", ))
+            ],
+            result
+        )
+
+
+    def test_compact_element_removal_removes_preceding_events(self):
+        events = [
+            ("add_user", ("user1", )),
+            ("add_user_to_group_mapping", ("user1", "group1")),
+            ("add_user_to_application_component_and_access_level_mapping", ("user1", "Order", "View")),
+            ("add_user_to_group_mapping", ("user2", "group1")),
+            ("remove_user", ("user1", )),
+            ("add_entity_type", ("ClientAccount", )),
+            ("add_entity", ("ClientAccount", "Company1")),
+            ("add_group_to_entity_mapping", ("group1", "ClientAccount", "Company1")),
+            ("remove_entity_type", ("ClientAccount", ))
+        ]
+
+        result = self._test_event_compactor.compact(events)
+
+        # 'group1' is created by the mapping to 'user2', so the mappings to 'group1' are removed
+        self.assertEqual(
+            [
+                ("add_user_to_group_mapping", ("user2", "group1")),
+                ("remove_user", ("user1", )),
+                ("remove_entity_type", ("ClientAccount", ))
+            ],
+            result
+        )
+
+
+    def test_compact_element_removal_retains_mappings_creating_other_elements(self):
+        # Adding a mapping also creates 'group1' and 'Company1', which aren't otherwise created
+        events = [
+            ("add_user", ("user1", )),
+            ("add_user_to_group_mapping", ("user1", "group1")),
+            ("remove_user", ("user1", )),
+            ("add_entity_type", ("ClientAccount", )),
+            ("add_user_to_entity_mapping", ("user2", "ClientAccount", "Company1")),
+            ("remove_user", ("user2", ))
+        ]
+
+        result = self._test_event_compactor.compact(events)
+
+        self.assertEqual(events, result)
+
+
+    def test_compact_element_added_and_removed(self):
+        # 'group1' may exist before the events, so its removal is retained
+        events = [
+            ("add_group", ("group1", )),
+            ("remove_group", ("group1", )),
+            ("add_entity", ("ClientAccount", "Company1")),
+            ("remove_entity", ("ClientAccount", "Company1"))
+        ]
+
+        result = self._test_event_compactor.compact(events)
+
+        # Adding 'Company1' also creates its entity type, so is retained
+        self.assertEqual(
+            [
+                ("remove_group", ("group1", )),
+                ("add_entity", ("ClientAccount", "Company1")),
+                ("remove_entity", ("ClientAccount", "Company1"))
+            ],
+            result
+        )
+
+
+    def test_compact_element_readded_after_removal(self):
+        # The removal also removes any mappings to the user which existed before the events, so must be retained
+        events = [
+            ("remove_user", ("user1", )),
+            ("add_user", ("user1", )),
+            ("add_user_to_group_mapping", ("user1", "group1"))
+        ]
+
+        result = self._test_event_compactor.compact(events)
+
+        self.assertEqual(events, result)
+
+
+    def test_compact_group_to_group_mapping_events(self):
+        events = [
+            ("add_group", ("group3", )),
+            ("add_group", ("group4", )),
+            ("remove_group_to_group_mapping", ("group2", "group1")),
+            ("add_group_to_group_mapping", ("group1", "group2")),
+            ("add_group_to_group_mapping", ("group2", "group1")),
+            ("add_group_to_group_mapping", ("group3", "group4")),
+            ("remove_group_to_group_mapping", ("group3", "group4")),
+            ("add_group_to_group_mapping", ("group1", "group3")),
+            ("remove_group", ("group1", ))
+        ]
+
+        result = self._test_event_compactor.compact(events)
+
+        self.assertEqual(
+            [
+                ("add_group", ("group3", )),
+                ("add_group", ("group4", )),
+                ("remove_group_to_group_mapping", ("group2", "group1")),
+                ("add_group_to_group_mapping", ("group1", "group2")),
+                ("add_group_to_group_mapping", ("group2", "group1")),
+                ("remove_group_to_group_mapping", ("group3", "group4")),
+                ("add_group_to_group_mapping", ("group1", "group3")),
+                ("remove_group", ("group1", ))
+            ],
+            result
+        )
+
+if __name__ == "__main__":
+    unittest.main()
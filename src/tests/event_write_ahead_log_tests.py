@@ -0,0 +1,108 @@
+from typing import List, Tuple
+import os
+import tempfile
+import time
+import unittest
+
+from http_method import HTTPMethod
+from event_write_ahead_log import EventWriteAheadLog
+
+class EventWriteAheadLogTests(unittest.TestCase):
+    """Unit tests for the EventWriteAheadLog class."""
+
+    def setUp(self):
+        self._temporary_directory = tempfile.TemporaryDirectory()
+        self._database_path: str = os.path.join(self._temporary_directory.name, "events.db")
+
+
+    def tearDown(self):
+        self._temporary_directory.cleanup()
+
+
+    def test_constructor_fsync_batch_size_less_than_1(self):
+        with self.assertRaises(ValueError) as result:
+            EventWriteAheadLog(self._database_path, fsync_batch_size=0)
+
+        self.assertEqual("Parameter 'fsync_batch_size' with value 0 must be greater than or equal to 1.", str(result.exception))
+
+
+    def test_constructor_fsync_interval_less_than_0(self):
+        with self.assertRaises(ValueError) as result:
+            EventWriteAheadLog(self._database_path, fsync_interval=-1.0)
+
+        self.assertEqual("Parameter 'fsync_interval' with value -1.0 must be greater than or equal to 0.", str(result.exception))
+
+
+    def test_append_read_and_remove(self):
+        test_write_ahead_log = EventWriteAheadLog(self._database_path)
+        test_write_ahead_log.append(HTTPMethod.POST, "http://127.0.0.1/api/v1/users/user1")
+        test_write_ahead_log.append(HTTPMethod.DELETE, "http://127.0.0.1/api/v1/users/user2")
+        test_write_ahead_log.append(HTTPMethod.POST, "http://127.0.0.1/api/v1/groups/group1")
+
+        self.assertEqual(3, test_write_ahead_log.backlog_size)
+        result: List[Tuple[int, HTTPMethod, str]] = test_write_ahead_log.read(2)
+
+        self.assertEqual(2, len(result))
+        self.assertEqual((HTTPMethod.POST, "http://127.0.0.1/api/v1/users/user1"), result[0][1:])
+        self.assertEqual((HTTPMethod.DELETE, "http://127.0.0.1/api/v1/users/user2"), result[1][1:])
+
+        test_write_ahead_log.remove(result[0][0])
+        test_write_ahead_log.remove(result[0][0])
+
+        self.assertEqual(2, test_write_ahead_log.backlog_size)
+        result = test_write_ahead_log.read(10)
+        self.assertEqual([ "http://127.0.0.1/api/v1/users/user2", "http://127.0.0.1/api/v1/groups/group1" ], [ current_request[2] for current_request in result ])
+        test_write_ahead_log.close()
+
+
+    def test_committed_requests_retained_after_reopen(self):
+        test_write_ahead_log = EventWriteAheadLog(self._database_path, fsync_batch_size=2, fsync_interval=3600.0)
+        test_write_ahead_log.append(HTTPMethod.POST, "http://127.0.0.1/api/v1/users/user1")
+        test_write_ahead_log.append(HTTPMethod.POST, "http://127.0.0.1/api/v1/users/user2")
+        test_write_ahead_log.append(HTTPMethod.POST, "http://127.0.0.1/api/v1/users/user3")
+
+        # Only the first batch of 2 has been committed, so a second connection can't see the third request yet
+        second_write_ahead_log = EventWriteAheadLog(self._database_path)
+        self.assertEqual(2, second_write_ahead_log.backlog_size)
+        second_write_ahead_log.close()
+
+        test_write_ahead_log.close()
+        test_write_ahead_log = EventWriteAheadLog(self._database_path)
+
+        result: List[Tuple[int, HTTPMethod, str]] = test_write_ahead_log.read(10)
+        self.assertEqual(3, test_write_ahead_log.backlog_size)
+        self.assertEqual([ "http://127.0.0.1/api/v1/users/user1", "http://127.0.0.1/api/v1/users/user2", "http://127.0.0.1/api/v1/users/user3" ], [ current_request[2] for current_request in result ])
+        test_write_ahead_log.close()
+
+
+    def test_fsync_interval_0_commits_by_batch_size(self):
+        test_write_ahead_log = EventWriteAheadLog(self._database_path, fsync_batch_size=3)
+        test_write_ahead_log.append(HTTPMethod.POST, "http://127.0.0.1/api/v1/users/user1")
+        test_write_ahead_log.append(HTTPMethod.POST, "http://127.0.0.1/api/v1/users/user2")
+        test_write_ahead_log.flush_if_due()
+
+        second_write_ahead_log = EventWriteAheadLog(self._database_path)
+        self.assertEqual(0, second_write_ahead_log.backlog_size)
+        second_write_ahead_log.close()
+
+        test_write_ahead_log.append(HTTPMethod.POST, "http://127.0.0.1/api/v1/users/user3")
+
+        second_write_ahead_log = EventWriteAheadLog(self._database_path)
+        self.assertEqual(3, second_write_ahead_log.backlog_size)
+        second_write_ahead_log.close()
+        test_write_ahead_log.close()
+
+
+    def test_flush_if_due(self):
+        test_write_ahead_log = EventWriteAheadLog(self._database_path, fsync_batch_size=100, fsync_interval=0.05)
+        test_write_ahead_log.append(HTTPMethod.POST, "http://127.0.0.1/api/v1/users/user1")
+        time.sleep(0.1)
+        test_write_ahead_log.flush_if_due()
+
+        second_write_ahead_log = EventWriteAheadLog(self._database_path)
+        self.assertEqual(1, second_write_ahead_log.backlog_size)
+        second_write_ahead_log.close()
+        test_write_ahead_log.close()
+
+if __name__ == "__main__":
+    unittest.main()
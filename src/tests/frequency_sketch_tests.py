@@ -0,0 +1,56 @@
+import unittest
+
+from frequency_sketch import FrequencySketch
+
+class FrequencySketchTests(unittest.TestCase):
+    """Unit tests for the FrequencySketch class."""
+
+    def test_constructor_expected_element_count_less_than_1(self):
+        with self.assertRaises(ValueError) as result:
+            FrequencySketch(0)
+
+        self.assertEqual("Parameter 'expected_element_count' with value 0 must be greater than or equal to 1.", str(result.exception))
+
+
+    def test_constructor_sizes_sketch(self):
+        test_sketch = FrequencySketch(1000)
+
+        self.assertEqual(4096, test_sketch.width)
+        self.assertEqual(10000, test_sketch.sample_size)
+
+
+    def test_estimate(self):
+        test_sketch = FrequencySketch(100)
+
+        for i in range(5):
+            test_sketch.increment(("key1", ))
+        test_sketch.increment(("key2", ))
+
+        self.assertGreaterEqual(test_sketch.estimate(("key1", )), 5)
+        self.assertGreaterEqual(test_sketch.estimate(("key2", )), 1)
+        self.assertLess(test_sketch.estimate(("key2", )), 5)
+        self.assertEqual(0, test_sketch.estimate(("key3", )))
+
+
+    def test_estimate_capped_at_15(self):
+        test_sketch = FrequencySketch(100)
+
+        for i in range(50):
+            test_sketch.increment(("key1", ))
+
+        self.assertEqual(15, test_sketch.estimate(("key1", )))
+
+
+    def test_counters_halved_after_sample_size_increments(self):
+        test_sketch = FrequencySketch(1)
+        for i in range(9):
+            test_sketch.increment(("key1", ))
+
+        self.assertEqual(9, test_sketch.estimate(("key1", )))
+        test_sketch.increment(("key1", ))
+
+        self.assertEqual(1, test_sketch.reset_count)
+        self.assertEqual(5, test_sketch.estimate(("key1", )))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import threading
+import time
+import unittest
+
+from in_memory_change_feed import InMemoryChangeFeed
+
+class InMemoryChangeFeedTests(unittest.TestCase):
+    """Unit tests for the InMemoryChangeFeed class."""
+
+    def test_constructor_max_retained_event_count_less_than_1(self):
+        with self.assertRaises(ValueError) as result:
+            InMemoryChangeFeed(0)
+
+        self.assertEqual("Parameter 'max_retained_event_count' with value 0 must be greater than or equal to 1.", str(result.exception))
+
+
+    def test_read(self):
+        test_change_feed = InMemoryChangeFeed(10)
+        self.assertEqual(0, test_change_feed.latest_position)
+        self.assertEqual([], test_change_feed.read(0, 10))
+        test_change_feed.add_user("user1")
+        test_change_feed.add_user_to_group_mapping("user1", "group1")
+        test_change_feed.remove_entity("ClientAccount", "Company1")
+
+        result = test_change_feed.read(1, 1)
+
+        self.assertEqual(1, len(result))
+        self.assertEqual(2, result[0].position)
+        self.assertEqual("add_user_to_group_mapping", result[0].event_type)
+        self.assertEqual(("user1", "group1"), result[0].arguments)
+        self.assertEqual([ 2, 3 ], [ current_event.position for current_event in test_change_feed.read(1, 10) ])
+        self.assertEqual([], test_change_feed.read(3, 10))
+
+
+    def test_read_after_events_discarded(self):
+        test_change_feed = InMemoryChangeFeed(2)
+        for i in range(5):
+            test_change_feed.add_group("group" + str(i))
+
+        result = test_change_feed.read(0, 10)
+
+        self.assertEqual(5, test_change_feed.latest_position)
+        self.assertEqual([ 4, 5 ], [ current_event.position for current_event in result ])
+
+
+    def test_wait_for_events(self):
+        test_change_feed = InMemoryChangeFeed(10)
+        test_change_feed.add_user("user1")
+        self.assertTrue(test_change_feed.wait_for_events(0, 0.0))
+        self.assertFalse(test_change_feed.wait_for_events(1, 0.01))
+        timer = threading.Timer(0.05, lambda: test_change_feed.add_user("user2"))
+        start_time = time.monotonic()
+        timer.start()
+
+        result = test_change_feed.wait_for_events(1, 10.0)
+
+        self.assertTrue(result)
+        self.assertLess(time.monotonic() - start_time, 5.0)
+        timer.join()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+from typing import List, Tuple, Any
+import time
+import unittest
+
+from access_graph import AccessGraph
+from query_prefetcher import QueryPrefetcher
+
+class RecordingAccessGraph(AccessGraph):
+    """AccessGraph which records the calls to its 'has_access_*' methods."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: List[Tuple[Any, ...]] = []
+
+    def has_access_to_application_component(self, user, application_component, access_level):
+        self.calls.append(("has_access_to_application_component", user, application_component, access_level))
+        return super().has_access_to_application_component(user, application_component, access_level)
+
+    def has_access_to_entity(self, user, entity_type, entity):
+        self.calls.append(("has_access_to_entity", user, entity_type, entity))
+        if (entity == "Invalid"):
+            raise ValueError("Invalid entity.")
+        return super().has_access_to_entity(user, entity_type, entity)
+
+class QueryPrefetcherTests(unittest.TestCase):
+    """Unit tests for the QueryPrefetcher class."""
+
+    def setUp(self):
+        self._source = RecordingAccessGraph()
+        self._test_prefetchers = []
+
+
+    def tearDown(self):
+        for current_prefetcher in self._test_prefetchers:
+            current_prefetcher.close()
+
+
+    def test_constructor_max_concurrency_less_than_1(self):
+        with self.assertRaises(ValueError) as result:
+            QueryPrefetcher(self._source, max_concurrency=0)
+
+        self.assertEqual("Parameter 'max_concurrency' with value 0 must be greater than or equal to 1.", str(result.exception))
+
+
+    def test_record_unsupported_method(self):
+        test_prefetcher = self._create_prefetcher()
+
+        with self.assertRaises(ValueError) as result:
+            test_prefetcher.record("get_entities", "ClientAccount")
+
+        self.assertEqual("Parameter 'method_name' with value 'get_entities' must be the name of an AccessManagerQueryProcessor method which accepts a user as its first parameter.", str(result.exception))
+
+
+    def test_new_session_prefetches_users_frequent_queries(self):
+        test_prefetcher = self._create_prefetcher(session_gap=0.05)
+        test_prefetcher.record("has_access_to_application_component", "user1", "OrderScreen", "View")
+        test_prefetcher.record("has_access_to_entity", "user1", "ClientAccount", "Company1")
+        test_prefetcher.record("has_access_to_entity", "user1", "ClientAccount", "Company2")
+        test_prefetcher.record("has_access_to_entity", "user2", "ClientAccount", "Company1")
+        self.assertEqual([], self._source.calls)
+        time.sleep(0.06)
+
+        test_prefetcher.record("has_access_to_entity", "user1", "ClientAccount", "Company1")
+        test_prefetcher.close()
+
+        self.assertEqual(
+            { ("has_access_to_application_component", "user1", "OrderScreen", "View"), ("has_access_to_entity", "user1", "ClientAccount", "Company2") },
+            set(self._source.calls)
+        )
+        self.assertEqual(2, test_prefetcher.prefetch_count)
+
+
+    def test_hit_and_waste_ratios(self):
+        test_prefetcher = self._create_prefetcher(session_gap=0.05, usefulness_window=0.1)
+        test_prefetcher.record("has_access_to_entity", "user1", "ClientAccount", "Company1")
+        test_prefetcher.record("has_access_to_entity", "user1", "ClientAccount", "Company2")
+        test_prefetcher.record("has_access_to_entity", "user1", "ClientAccount", "Invalid")
+        time.sleep(0.06)
+        test_prefetcher.record("has_access_to_entity", "user1", "ClientAccount", "Company1")
+        self._wait_until(lambda: test_prefetcher.prefetch_count + test_prefetcher.failure_count == 2)
+
+        test_prefetcher.record("has_access_to_entity", "user1", "ClientAccount", "Company2")
+
+        self.assertEqual(1, test_prefetcher.hit_count)
+        self.assertEqual(1, test_prefetcher.failure_count)
+        self.assertEqual(1.0, test_prefetcher.hit_ratio)
+        self.assertEqual(0.0, test_prefetcher.waste_ratio)
+        # Prefetch again in a new session, without the result being used
+        time.sleep(0.06)
+        test_prefetcher.record("has_access_to_entity", "user1", "ClientAccount", "Company1")
+        self._wait_until(lambda: test_prefetcher.prefetch_count == 2)
+        time.sleep(0.11)
+        self.assertEqual(1, test_prefetcher.waste_count)
+        self.assertEqual(0.5, test_prefetcher.hit_ratio)
+        self.assertEqual(0.5, test_prefetcher.waste_ratio)
+
+
+    def test_expired_prefetch_prefetched_again(self):
+        test_prefetcher = self._create_prefetcher(session_gap=0.05, usefulness_window=0.05)
+        test_prefetcher.record("has_access_to_entity", "user1", "ClientAccount", "Company1")
+        test_prefetcher.record("has_access_to_entity", "user1", "ClientAccount", "Company2")
+        time.sleep(0.06)
+        test_prefetcher.record("has_access_to_entity", "user1", "ClientAccount", "Company1")
+        self._wait_until(lambda: test_prefetcher.prefetch_count == 1)
+
+        # The prefetch expires unused, so is prefetched again at the start of the next session rather than treated as awaiting an outcome
+        time.sleep(0.06)
+        test_prefetcher.record("has_access_to_entity", "user1", "ClientAccount", "Company1")
+        self._wait_until(lambda: test_prefetcher.prefetch_count == 2)
+
+        self.assertEqual(2, self._source.calls.count(("has_access_to_entity", "user1", "ClientAccount", "Company2")))
+        self.assertEqual(0, test_prefetcher.hit_count)
+
+
+    def test_prefetch_expected_sessions(self):
+        test_prefetcher = self._create_prefetcher()
+        test_prefetcher.record("has_access_to_entity", "user1", "ClientAccount", "Company1")
+        test_prefetcher.record("has_access_to_application_component", "user1", "OrderScreen", "View")
+
+        # Sessions are expected to start at the same time of day on the following day
+        self.assertEqual(0, test_prefetcher.prefetch_expected_sessions(at_time=time.time() + 43200))
+        scheduled_count = test_prefetcher.prefetch_expected_sessions(at_time=time.time() + 86400 - 600)
+        test_prefetcher.close()
+
+        self.assertEqual(2, scheduled_count)
+        self.assertEqual(
+            { ("has_access_to_application_component", "user1", "OrderScreen", "View"), ("has_access_to_entity", "user1", "ClientAccount", "Company1") },
+            set(self._source.calls)
+        )
+
+
+    def test_pending_prefetches_bounded(self):
+        test_prefetcher = self._create_prefetcher(max_pending_prefetches=1)
+        test_prefetcher.record("has_access_to_entity", "user1", "ClientAccount", "Company1")
+        test_prefetcher.record("has_access_to_entity", "user1", "ClientAccount", "Company2")
+        test_prefetcher.record("has_access_to_entity", "user1", "ClientAccount", "Company3")
+
+        scheduled_count = test_prefetcher.prefetch_expected_sessions(at_time=time.time() + 86400 - 600)
+
+        self.assertEqual(1, scheduled_count)
+        self.assertEqual(2, test_prefetcher.skipped_count)
+
+    #region Private/Protected Methods
+
+    def _create_prefetcher(self, **kwargs) -> QueryPrefetcher:
+        test_prefetcher = QueryPrefetcher(self._source, **kwargs)
+        self._test_prefetchers.append(test_prefetcher)
+
+        return test_prefetcher
+
+    def _wait_until(self, condition, timeout=5.0):
+        end_time = time.monotonic() + timeout
+        while (condition() == False):
+            if (time.monotonic() > end_time):
+                self.fail("Condition not met within {0} seconds.".format(timeout))
+            time.sleep(0.005)
+
+    #endregion
+
+if __name__ == "__main__":
+    unittest.main()
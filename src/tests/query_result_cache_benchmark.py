@@ -0,0 +1,56 @@
+"""Trace-driven benchmark comparing the hit rates of the least recently used QueryResultCache against the WindowTinyLfuQueryResultCache, on a workload of interactive lookups with skewed (Zipf distributed) popularity, interleaved with batch jobs which look up every user once.
+
+Run manually, e.g. 'python query_result_cache_benchmark.py'.
+"""
+
+from typing import List, Tuple
+import itertools
+import random
+
+from query_result_cache import QueryResultCache
+from query_result_cache_base import QueryResultCacheBase
+from window_tiny_lfu_query_result_cache import WindowTinyLfuQueryResultCache
+
+_INTERACTIVE_USER_COUNT: int = 10000
+_ZIPF_EXPONENT: float = 0.9
+_BATCH_USER_COUNT: int = 20000
+_INTERACTIVE_LOOKUPS_PER_BATCH: int = 20000
+_BATCH_COUNT: int = 10
+_CACHE_SIZES: List[int] = [ 500, 1000, 2000 ]
+_SEED: int = 1
+
+
+def _create_trace() -> List[Tuple[bool, Tuple[str, ...]]]:
+    """Creates the trace, as tuples containing whether the lookup is interactive, and the key looked up."""
+    random_generator = random.Random(_SEED)
+    cumulative_weights: List[float] = list(itertools.accumulate(1.0 / (rank ** _ZIPF_EXPONENT) for rank in range(1, _INTERACTIVE_USER_COUNT + 1)))
+    trace: List[Tuple[bool, Tuple[str, ...]]] = []
+    for current_batch in range(_BATCH_COUNT):
+        for current_user in random_generator.choices(range(_INTERACTIVE_USER_COUNT), cum_weights=cumulative_weights, k=_INTERACTIVE_LOOKUPS_PER_BATCH):
+            trace.append((True, ("getApplicationComponentsAccessibleByUser", "user" + str(current_user))))
+        for current_user in range(_BATCH_USER_COUNT):
+            trace.append((False, ("getApplicationComponentsAccessibleByUser", "batchUser" + str(current_user))))
+
+    return trace
+
+
+def _run(name: str, cache: QueryResultCacheBase, trace: List[Tuple[bool, Tuple[str, ...]]]) -> None:
+    interactive_lookup_count: int = 0
+    interactive_hit_count: int = 0
+    for is_interactive, key in trace:
+        found, result = cache.try_get(key)
+        if (found == False):
+            cache.set(key, [])
+        if (is_interactive == True):
+            interactive_lookup_count += 1
+            if (found == True):
+                interactive_hit_count += 1
+    print("{0:<40}{1:>10.1%}{2:>12.1%}".format(name, interactive_hit_count / interactive_lookup_count, cache.hit_count / (cache.hit_count + cache.miss_count)))
+
+
+if __name__ == "__main__":
+    trace: List[Tuple[bool, Tuple[str, ...]]] = _create_trace()
+    print("{0:<40}{1:>10}{2:>12}".format("Cache", "Interactive", "Overall"))
+    for current_size in _CACHE_SIZES:
+        _run("LRU, size {0}".format(current_size), QueryResultCache(current_size, 3600.0), trace)
+        _run("W-TinyLFU, size {0}".format(current_size), WindowTinyLfuQueryResultCache(current_size, 3600.0), trace)
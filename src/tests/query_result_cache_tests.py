@@ -0,0 +1,158 @@
+from typing import Any, Tuple
+import threading
+import time
+import unittest
+
+from query_result_cache import QueryResultCache
+
+class QueryResultCacheTests(unittest.TestCase):
+    """Unit tests for the QueryResultCache class."""
+
+    def test_constructor_max_size_less_than_1(self):
+        with self.assertRaises(ValueError) as result:
+            QueryResultCache(0, 10.0)
+
+        self.assertEqual("Parameter 'max_size' with value 0 must be greater than or equal to 1.", str(result.exception))
+
+
+    def test_constructor_time_to_live_not_greater_than_0(self):
+        with self.assertRaises(ValueError) as result:
+            QueryResultCache(10, 0.0)
+
+        self.assertEqual("Parameter 'time_to_live' with value 0.0 must be greater than 0.", str(result.exception))
+
+
+    def test_try_get_and_set(self):
+        test_cache = QueryResultCache(10, 60.0)
+
+        result: Tuple[bool, Any] = test_cache.try_get(("hasAccessToEntity", "user1", "ClientAccount", "Company1"))
+
+        self.assertEqual((False, None), result)
+        test_cache.set(("hasAccessToEntity", "user1", "ClientAccount", "Company1"), False)
+        result = test_cache.try_get(("hasAccessToEntity", "user1", "ClientAccount", "Company1"))
+        self.assertEqual((True, False), result)
+        self.assertEqual(1, test_cache.hit_count)
+        self.assertEqual(1, test_cache.miss_count)
+
+
+    def test_try_peek(self):
+        test_cache = QueryResultCache(2, 60.0)
+        test_cache.set(("key1", ), 1)
+        test_cache.set(("key2", ), 2)
+
+        self.assertEqual((True, 1), test_cache.try_peek(("key1", )))
+        self.assertEqual((False, None), test_cache.try_peek(("key3", )))
+        test_cache.set(("key3", ), 3)
+
+        # Peeking doesn't update the least recently used order, so 'key1' was evicted
+        self.assertEqual((False, None), test_cache.try_peek(("key1", )))
+        self.assertEqual(0, test_cache.hit_count)
+        self.assertEqual(0, test_cache.miss_count)
+
+
+    def test_least_recently_used_result_evicted(self):
+        test_cache = QueryResultCache(2, 60.0)
+        test_cache.set(("key1", ), 1)
+        test_cache.set(("key2", ), 2)
+        test_cache.try_get(("key1", ))
+
+        test_cache.set(("key3", ), 3)
+
+        self.assertEqual(2, test_cache.count)
+        self.assertEqual((True, 1), test_cache.try_get(("key1", )))
+        self.assertEqual((False, None), test_cache.try_get(("key2", )))
+        self.assertEqual((True, 3), test_cache.try_get(("key3", )))
+
+
+    def test_set_existing_key_does_not_evict(self):
+        test_cache = QueryResultCache(2, 60.0)
+        test_cache.set(("key1", ), 1)
+        test_cache.set(("key2", ), 2)
+
+        test_cache.set(("key1", ), 10)
+
+        self.assertEqual((True, 10), test_cache.try_get(("key1", )))
+        self.assertEqual((True, 2), test_cache.try_get(("key2", )))
+
+
+    def test_result_expires(self):
+        test_cache = QueryResultCache(10, 0.05)
+        test_cache.set(("key1", ), True)
+
+        time.sleep(0.06)
+
+        self.assertEqual((False, None), test_cache.try_get(("key1", )))
+        self.assertEqual(0, test_cache.count)
+
+
+    def test_result_with_specified_time_to_live(self):
+        test_cache = QueryResultCache(10, 0.05)
+        test_cache.set(("key1", ), True, time_to_live=60.0)
+        test_cache.set(("key2", ), True)
+
+        time.sleep(0.06)
+
+        self.assertEqual((True, True), test_cache.try_get(("key1", )))
+        self.assertEqual((False, None), test_cache.try_get(("key2", )))
+
+
+    def test_remove_and_clear(self):
+        test_cache = QueryResultCache(10, 60.0)
+        test_cache.set(("key1", ), 1)
+        test_cache.set(("key2", ), 2)
+
+        test_cache.remove(("key1", ))
+        test_cache.remove(("key3", ))
+
+        self.assertEqual((False, None), test_cache.try_get(("key1", )))
+        test_cache.clear()
+        self.assertEqual(0, test_cache.count)
+
+
+    def test_invalidate(self):
+        test_cache = QueryResultCache(10, 60.0)
+        test_cache.set(("hasAccessToEntity", "user1", "ClientAccount", "Company1"), True, [ ("user", "user1"), ("entity", "ClientAccount", "Company1") ])
+        test_cache.set(("hasAccessToEntity", "user2", "ClientAccount", "Company1"), True, [ ("user", "user2"), ("entity", "ClientAccount", "Company1") ])
+        test_cache.set(("hasAccessToEntity", "user2", "ClientAccount", "Company2"), True, [ ("user", "user2"), ("entity", "ClientAccount", "Company2") ])
+        test_cache.set(("users", ), [ "user1", "user2" ])
+
+        result: int = test_cache.invalidate([ ("user", "user1"), ("entity", "ClientAccount", "Company2"), ("user", "user3") ])
+
+        self.assertEqual(2, result)
+        self.assertEqual((False, None), test_cache.try_get(("hasAccessToEntity", "user1", "ClientAccount", "Company1")))
+        self.assertEqual((True, True), test_cache.try_get(("hasAccessToEntity", "user2", "ClientAccount", "Company1")))
+        self.assertEqual((False, None), test_cache.try_get(("hasAccessToEntity", "user2", "ClientAccount", "Company2")))
+        self.assertEqual((True, [ "user1", "user2" ]), test_cache.try_get(("users", )))
+
+
+    def test_invalidate_after_eviction_and_replacement(self):
+        test_cache = QueryResultCache(2, 60.0)
+        test_cache.set(("key1", ), 1, [ ("user", "user1") ])
+        test_cache.set(("key1", ), 2, [ ("user", "user2") ])
+        test_cache.set(("key2", ), 3, [ ("user", "user1") ])
+        test_cache.set(("key3", ), 4, [ ("user", "user1") ])
+
+        self.assertEqual(0, test_cache.invalidate([ ("user", "user2") ]))
+        self.assertEqual(2, test_cache.invalidate([ ("user", "user1") ]))
+        self.assertEqual(0, test_cache.count)
+
+
+    def test_concurrent_access(self):
+        test_cache = QueryResultCache(50, 60.0)
+
+        def access(thread_number: int):
+            for i in range(2000):
+                test_cache.set(("key", str((thread_number * i) % 100)), i)
+                test_cache.try_get(("key", str(i % 100)))
+
+        threads = [ threading.Thread(target=access, args=(i, )) for i in range(8) ]
+        for current_thread in threads:
+            current_thread.start()
+        for current_thread in threads:
+            current_thread.join()
+
+        self.assertEqual(50, test_cache.count)
+        self.assertEqual(16000, test_cache.hit_count + test_cache.miss_count)
+
+if __name__ == "__main__":
+    unittest.main()
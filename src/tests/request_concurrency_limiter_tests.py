@@ -0,0 +1,76 @@
+import threading
+import unittest
+
+from exceptions.queue_time_budget_exceeded_error import QueueTimeBudgetExceededError
+from request_concurrency_limiter import RequestConcurrencyLimiter
+
+class RequestConcurrencyLimiterTests(unittest.TestCase):
+    """Unit tests for the RequestConcurrencyLimiter class."""
+
+    def test_constructor_max_concurrent_requests_less_than_1(self):
+        with self.assertRaises(ValueError) as result:
+            RequestConcurrencyLimiter(0, 1.0)
+
+        self.assertEqual("Parameter 'max_concurrent_requests' with value 0 must be greater than or equal to 1.", str(result.exception))
+
+
+    def test_constructor_queue_time_budget_less_than_0(self):
+        with self.assertRaises(ValueError) as result:
+            RequestConcurrencyLimiter(1, -0.5)
+
+        self.assertEqual("Parameter 'queue_time_budget' with value -0.5 must be greater than or equal to 0.", str(result.exception))
+
+
+    def test_acquire_and_release(self):
+        test_limiter = RequestConcurrencyLimiter(2, 0.0)
+
+        test_limiter.acquire("Request 1")
+        test_limiter.acquire("Request 2")
+
+        self.assertEqual(2, test_limiter.in_progress_request_count)
+        self.assertEqual(2, test_limiter.completed_wait_count)
+        test_limiter.release()
+        test_limiter.release()
+        self.assertEqual(0, test_limiter.in_progress_request_count)
+        self.assertEqual(0, test_limiter.rejected_request_count)
+
+
+    def test_acquire_zero_budget_rejects_immediately_when_no_slot_free(self):
+        test_limiter = RequestConcurrencyLimiter(1, 0.0)
+        test_limiter.acquire("Request 1")
+
+        with self.assertRaises(QueueTimeBudgetExceededError) as result:
+            test_limiter.acquire("Request 2")
+
+        self.assertEqual(0.0, result.exception.queue_time_budget)
+        self.assertTrue(str(result.exception).startswith("Request 2 was rejected after waiting "))
+        self.assertEqual(1, test_limiter.rejected_request_count)
+        self.assertEqual(1, test_limiter.in_progress_request_count)
+
+
+    def test_acquire_rejects_after_budget(self):
+        test_limiter = RequestConcurrencyLimiter(1, 0.05)
+        test_limiter.acquire("Request 1")
+
+        with self.assertRaises(QueueTimeBudgetExceededError) as result:
+            test_limiter.acquire("Request 2")
+
+        self.assertGreaterEqual(result.exception.queue_time, 0.04)
+        self.assertEqual(0.05, result.exception.queue_time_budget)
+
+
+    def test_acquire_waits_for_slot_within_budget(self):
+        test_limiter = RequestConcurrencyLimiter(1, 5.0)
+        test_limiter.acquire("Request 1")
+        release_timer = threading.Timer(0.05, test_limiter.release)
+        release_timer.start()
+
+        test_limiter.acquire("Request 2")
+
+        release_timer.join()
+        self.assertEqual(2, test_limiter.completed_wait_count)
+        self.assertGreater(test_limiter.max_queue_time, 0.0)
+        self.assertGreaterEqual(test_limiter.total_queue_time, test_limiter.max_queue_time)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+from typing import Any, Tuple
+import multiprocessing
+import time
+import unittest
+
+from shared_memory_query_result_cache import SharedMemoryQueryResultCache
+
+def _set_and_get_in_child_process(test_cache: SharedMemoryQueryResultCache, result_queue: Any) -> None:
+    test_cache.set(("hasAccessToEntity", "user2", "ClientAccount", "Company1"), False, [ ("user", "user2") ])
+    result_queue.put(test_cache.try_get(("hasAccessToEntity", "user1", "ClientAccount", "Company1")))
+    test_cache.invalidate([ ("user", "user1") ])
+    test_cache.close()
+
+class SharedMemoryQueryResultCacheTests(unittest.TestCase):
+    """Unit tests for the SharedMemoryQueryResultCache class."""
+
+    def setUp(self):
+        self._test_caches = []
+
+
+    def tearDown(self):
+        for current_cache in self._test_caches:
+            current_cache.close()
+            current_cache.unlink()
+
+
+    def test_constructor_max_size_less_than_1(self):
+        with self.assertRaises(ValueError) as result:
+            SharedMemoryQueryResultCache(0, 10.0)
+
+        self.assertEqual("Parameter 'max_size' with value 0 must be greater than or equal to 1.", str(result.exception))
+
+
+    def test_constructor_max_entry_size_less_than_1(self):
+        with self.assertRaises(ValueError) as result:
+            SharedMemoryQueryResultCache(10, 10.0, max_entry_size=0)
+
+        self.assertEqual("Parameter 'max_entry_size' with value 0 must be greater than or equal to 1.", str(result.exception))
+
+
+    def test_try_get_and_set(self):
+        test_cache = self._create_cache(10, 60.0)
+
+        result: Tuple[bool, Any] = test_cache.try_get(("getApplicationComponentsAccessibleByUser", "user1"))
+
+        self.assertEqual((False, None), result)
+        test_cache.set(("getApplicationComponentsAccessibleByUser", "user1"), [ { "applicationComponent": "OrderScreen", "accessLevel": "View" } ])
+        result = test_cache.try_get(("getApplicationComponentsAccessibleByUser", "user1"))
+        self.assertEqual((True, [ { "applicationComponent": "OrderScreen", "accessLevel": "View" } ]), result)
+        self.assertEqual((True, [ { "applicationComponent": "OrderScreen", "accessLevel": "View" } ]), test_cache.try_peek(("getApplicationComponentsAccessibleByUser", "user1")))
+        self.assertEqual(1, test_cache.hit_count)
+        self.assertEqual(1, test_cache.miss_count)
+        self.assertEqual(1, test_cache.count)
+        self.assertEqual(16, test_cache.max_size)
+
+
+    def test_set_existing_key(self):
+        test_cache = self._create_cache(8, 60.0)
+        test_cache.set(("key1", ), 1)
+
+        test_cache.set(("key1", ), 10)
+
+        self.assertEqual((True, 10), test_cache.try_get(("key1", )))
+        self.assertEqual(1, test_cache.count)
+
+
+    def test_least_recently_used_result_evicted(self):
+        # A size of 8 results in a single bucket
+        test_cache = self._create_cache(8, 60.0)
+        for i in range(8):
+            test_cache.set(("key" + str(i), ), i)
+        for i in range(1, 8):
+            test_cache.try_get(("key" + str(i), ))
+
+        test_cache.set(("key8", ), 8)
+
+        self.assertEqual(8, test_cache.count)
+        self.assertEqual((False, None), test_cache.try_get(("key0", )))
+        for i in range(1, 9):
+            self.assertEqual((True, i), test_cache.try_get(("key" + str(i), )))
+
+
+    def test_result_expires(self):
+        test_cache = self._create_cache(10, 0.05)
+        test_cache.set(("key1", ), True)
+
+        time.sleep(0.06)
+
+        self.assertEqual((False, None), test_cache.try_get(("key1", )))
+
+
+    def test_result_with_specified_time_to_live(self):
+        test_cache = self._create_cache(10, 0.05)
+        test_cache.set(("key1", ), True, time_to_live=60.0)
+        test_cache.set(("key2", ), True)
+
+        time.sleep(0.06)
+
+        self.assertEqual((True, True), test_cache.try_get(("key1", )))
+        self.assertEqual((False, None), test_cache.try_get(("key2", )))
+
+
+    def test_oversized_result_not_cached(self):
+        test_cache = self._create_cache(10, 60.0, max_entry_size=128)
+        test_cache.set(("users", ), [ "user1" ])
+
+        test_cache.set(("users", ), [ "user" + str(i) for i in range(100) ])
+
+        self.assertEqual((False, None), test_cache.try_get(("users", )))
+        self.assertEqual(1, test_cache.oversized_result_count)
+        self.assertEqual(0, test_cache.count)
+
+
+    def test_remove_and_clear(self):
+        test_cache = self._create_cache(10, 60.0)
+        test_cache.set(("key1", ), 1)
+        test_cache.set(("key2", ), 2)
+
+        test_cache.remove(("key1", ))
+        test_cache.remove(("key3", ))
+
+        self.assertEqual((False, None), test_cache.try_get(("key1", )))
+        self.assertEqual(1, test_cache.count)
+        test_cache.clear()
+        self.assertEqual((False, None), test_cache.try_get(("key2", )))
+        self.assertEqual(0, test_cache.count)
+
+
+    def test_invalidate(self):
+        test_cache = self._create_cache(10, 60.0)
+        test_cache.set(("hasAccessToEntity", "user1", "ClientAccount", "Company1"), True, [ ("user", "user1"), ("entity", "ClientAccount", "Company1") ])
+        test_cache.set(("hasAccessToEntity", "user2", "ClientAccount", "Company1"), True, [ ("user", "user2"), ("entity", "ClientAccount", "Company1") ])
+        test_cache.set(("hasAccessToEntity", "user2", "ClientAccount", "Company2"), True, [ ("user", "user2"), ("entity", "ClientAccount", "Company2") ])
+        test_cache.set(("users", ), [ "user1", "user2" ])
+
+        test_cache.invalidate([ ("user", "user1"), ("entity", "ClientAccount", "Company2"), ("user", "user3") ])
+
+        self.assertEqual((False, None), test_cache.try_get(("hasAccessToEntity", "user1", "ClientAccount", "Company1")))
+        self.assertEqual((True, True), test_cache.try_get(("hasAccessToEntity", "user2", "ClientAccount", "Company1")))
+        self.assertEqual((False, None), test_cache.try_get(("hasAccessToEntity", "user2", "ClientAccount", "Company2")))
+        self.assertEqual((True, [ "user1", "user2" ]), test_cache.try_get(("users", )))
+        # Results stored after invalidation are found
+        test_cache.set(("hasAccessToEntity", "user1", "ClientAccount", "Company1"), False, [ ("user", "user1"), ("entity", "ClientAccount", "Company1") ])
+        self.assertEqual((True, False), test_cache.try_get(("hasAccessToEntity", "user1", "ClientAccount", "Company1")))
+
+
+    def test_shared_between_processes(self):
+        # Use 'spawn' so the child process attaches to the shared memory by name rather than inheriting it
+        context = multiprocessing.get_context("spawn")
+        test_cache = self._create_cache(10, 60.0, lock=context.Lock())
+        test_cache.set(("hasAccessToEntity", "user1", "ClientAccount", "Company1"), True, [ ("user", "user1") ])
+        result_queue = context.Queue()
+        child_process = context.Process(target=_set_and_get_in_child_process, args=(test_cache, result_queue))
+
+        child_process.start()
+        child_result: Tuple[bool, Any] = result_queue.get(timeout=30)
+        child_process.join(30)
+
+        self.assertEqual(0, child_process.exitcode)
+        self.assertEqual((True, True), child_result)
+        self.assertEqual((True, False), test_cache.try_get(("hasAccessToEntity", "user2", "ClientAccount", "Company1")))
+        self.assertEqual((False, None), test_cache.try_get(("hasAccessToEntity", "user1", "ClientAccount", "Company1")))
+
+    #region Private/Protected Methods
+
+    def _create_cache(self, max_size: int, time_to_live: float, **kwargs) -> SharedMemoryQueryResultCache:
+        test_cache = SharedMemoryQueryResultCache(max_size, time_to_live, **kwargs)
+        self._test_caches.append(test_cache)
+
+        return test_cache
+
+    #endregion
+
+if __name__ == "__main__":
+    unittest.main()
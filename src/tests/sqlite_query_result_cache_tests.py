@@ -0,0 +1,127 @@
+from typing import Any, Tuple
+import os
+import tempfile
+import time
+import unittest
+
+from sqlite_query_result_cache import SqliteQueryResultCache
+
+class SqliteQueryResultCacheTests(unittest.TestCase):
+    """Unit tests for the SqliteQueryResultCache class."""
+
+    def setUp(self):
+        self._temporary_directory = tempfile.TemporaryDirectory()
+        self._database_path: str = os.path.join(self._temporary_directory.name, "results.db")
+
+
+    def tearDown(self):
+        self._temporary_directory.cleanup()
+
+
+    def test_constructor_write_batch_size_less_than_1(self):
+        with self.assertRaises(ValueError) as result:
+            SqliteQueryResultCache(self._database_path, 10, 60.0, write_batch_size=0)
+
+        self.assertEqual("Parameter 'write_batch_size' with value 0 must be greater than or equal to 1.", str(result.exception))
+
+
+    def test_try_get_and_set(self):
+        test_cache = SqliteQueryResultCache(self._database_path, 10, 60.0)
+
+        result: Tuple[bool, Any] = test_cache.try_get(("getApplicationComponentsAccessibleByUser", "user1"))
+
+        self.assertEqual((False, None), result)
+        test_cache.set(("getApplicationComponentsAccessibleByUser", "user1"), [ { "applicationComponent": "OrderScreen", "accessLevel": "View" } ])
+        # Returned from the pending results before being written
+        result = test_cache.try_get(("getApplicationComponentsAccessibleByUser", "user1"))
+        self.assertEqual((True, [ { "applicationComponent": "OrderScreen", "accessLevel": "View" } ]), result)
+        test_cache.flush()
+        result = test_cache.try_peek(("getApplicationComponentsAccessibleByUser", "user1"))
+        self.assertEqual((True, [ { "applicationComponent": "OrderScreen", "accessLevel": "View" } ]), result)
+        self.assertEqual(1, test_cache.hit_count)
+        self.assertEqual(1, test_cache.miss_count)
+        self.assertEqual(1, test_cache.count)
+        test_cache.close()
+
+
+    def test_results_written_in_batches_and_retained_after_reopen(self):
+        test_cache = SqliteQueryResultCache(self._database_path, 10, 60.0, write_batch_size=2, write_interval=3600.0)
+        test_cache.set(("key1", ), 1)
+        other_cache = SqliteQueryResultCache(self._database_path, 10, 60.0)
+
+        self.assertEqual((False, None), other_cache.try_get(("key1", )))
+        test_cache.set(("key2", ), 2)
+        self.assertEqual((True, 1), other_cache.try_get(("key1", )))
+        test_cache.set(("key3", ), 3)
+        test_cache.close()
+        other_cache.close()
+
+        reopened_cache = SqliteQueryResultCache(self._database_path, 10, 60.0)
+        self.assertEqual((True, 2), reopened_cache.try_get(("key2", )))
+        self.assertEqual((True, 3), reopened_cache.try_get(("key3", )))
+        reopened_cache.close()
+
+
+    def test_result_expires(self):
+        test_cache = SqliteQueryResultCache(self._database_path, 10, 0.05, write_batch_size=1)
+        test_cache.set(("key1", ), True)
+
+        time.sleep(0.06)
+
+        self.assertEqual((False, None), test_cache.try_get(("key1", )))
+        test_cache.set(("key2", ), True)
+        # Expired result removed when pending results are written
+        self.assertEqual(1, test_cache.count)
+        test_cache.close()
+
+
+    def test_results_closest_to_expiry_evicted(self):
+        test_cache = SqliteQueryResultCache(self._database_path, 2, 60.0, write_batch_size=1)
+        test_cache.set(("key1", ), 1)
+        test_cache.set(("key2", ), 2)
+
+        test_cache.set(("key3", ), 3)
+
+        self.assertEqual(2, test_cache.count)
+        self.assertEqual((False, None), test_cache.try_get(("key1", )))
+        self.assertEqual((True, 2), test_cache.try_get(("key2", )))
+        self.assertEqual((True, 3), test_cache.try_get(("key3", )))
+        test_cache.close()
+
+
+    def test_remove_and_clear(self):
+        test_cache = SqliteQueryResultCache(self._database_path, 10, 60.0)
+        test_cache.set(("key1", ), 1)
+        test_cache.set(("key2", ), 2)
+
+        test_cache.remove(("key1", ))
+        test_cache.remove(("key3", ))
+
+        self.assertEqual((False, None), test_cache.try_get(("key1", )))
+        self.assertEqual(1, test_cache.count)
+        test_cache.clear()
+        self.assertEqual(0, test_cache.count)
+        test_cache.close()
+
+
+    def test_invalidate(self):
+        test_cache = SqliteQueryResultCache(self._database_path, 10, 60.0)
+        test_cache.set(("hasAccessToEntity", "user1", "ClientAccount", "Company1"), True, [ ("user", "user1"), ("entity", "ClientAccount", "Company1") ])
+        test_cache.set(("hasAccessToEntity", "user2", "ClientAccount", "Company1"), True, [ ("user", "user2"), ("entity", "ClientAccount", "Company1") ])
+        test_cache.flush()
+        test_cache.set(("hasAccessToEntity", "user2", "ClientAccount", "Company2"), True, [ ("user", "user2"), ("entity", "ClientAccount", "Company2") ])
+        test_cache.set(("users", ), [ "user1", "user2" ])
+        # Replacing a result replaces its tags
+        test_cache.set(("hasAccessToEntity", "user2", "ClientAccount", "Company1"), True, [ ("user", "user2") ])
+
+        result: int = test_cache.invalidate([ ("user", "user1"), ("entity", "ClientAccount", "Company1"), ("entity", "ClientAccount", "Company2"), ("user", "user3") ])
+
+        self.assertEqual(2, result)
+        self.assertEqual((False, None), test_cache.try_get(("hasAccessToEntity", "user1", "ClientAccount", "Company1")))
+        self.assertEqual((True, True), test_cache.try_get(("hasAccessToEntity", "user2", "ClientAccount", "Company1")))
+        self.assertEqual((False, None), test_cache.try_get(("hasAccessToEntity", "user2", "ClientAccount", "Company2")))
+        self.assertEqual((True, [ "user1", "user2" ]), test_cache.try_get(("users", )))
+        test_cache.close()
+
+if __name__ == "__main__":
+    unittest.main()
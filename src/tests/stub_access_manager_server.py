@@ -0,0 +1,174 @@
+from typing import Dict, List, Tuple, Callable, Union
+import hashlib
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+class StubRequest():
+    """A request received by a StubAccessManagerServer.
+
+    Attributes:
+        method:
+            The HTTP method of the request.
+        path:
+            The path (including any query string) of the request.
+        headers:
+            The headers of the request.
+    """
+
+    def __init__(self, method: str, path: str, headers: Dict[str, str]) -> None:
+        self.method: str = method
+        self.path: str = path
+        self.headers: Dict[str, str] = headers
+
+
+class StubResponse():
+    """A response returned by a StubAccessManagerServer.
+
+    Attributes:
+        status:
+            The HTTP status code of the response.
+        body:
+            The body of the response.
+        headers:
+            The headers of the response.
+    """
+
+    def __init__(self, status: int, body: bytes=b"", headers: Union[Dict[str, str], None]=None) -> None:
+        self.status: int = status
+        self.body: bytes = body
+        self.headers: Dict[str, str] = dict() if headers is None else headers
+
+
+class StubAccessManagerServer():
+    """HTTP server used for testing which returns preconfigured responses for request paths, and records the requests it receives.
+
+    Attributes:
+        base_url:
+            The base URL of the server (including a trailing forward slash), suitable for passing to the AccessManagerClient constructor.
+        requests:
+            The requests received by the server, in the order they were received.
+    """
+
+    @property
+    def base_url(self) -> str:
+        """The base URL of the server (including a trailing forward slash), suitable for passing to the AccessManagerClient constructor."""
+        return "http://127.0.0.1:{0}/".format(self._server.server_address[1])
+
+    @property
+    def requests(self) -> List[StubRequest]:
+        """The requests received by the server, in the order they were received."""
+        with self._lock:
+            return list(self._requests)
+
+    def __init__(self) -> None:
+        """Initialises a new instance of the StubAccessManagerServer class."""
+        self._lock: threading.Lock = threading.Lock()
+        self._requests: List[StubRequest] = []
+        self._handlers: Dict[Tuple[str, str], Callable[[StubRequest], StubResponse]] = dict()
+        self._server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), self._create_request_handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread = threading.Thread(target=self._server.serve_forever, kwargs={ "poll_interval": 0.05 }, daemon=True)
+
+    def start(self) -> None:
+        """Starts the server on a background thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the server."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def set_response(self, method: str, path: str, response: StubResponse) -> None:
+        """Sets a fixed response to return for the specified method and path.
+
+        Args:
+            method:
+                The HTTP method.
+            path:
+                The path (including any query string) relative to the base URL, e.g. 'api/v1/users'.
+            response:
+                The response to return.
+        """
+        self.set_handler(method, path, lambda request: response)
+
+    def set_conditional_response(self, path: str, response: StubResponse) -> None:
+        """Sets a response to return for GET requests to the specified path, emulating an AccessManager instance which supports conditional requests.  The response is returned with an 'ETag' header derived from its body, and a 304 status is returned instead if the request's 'If-None-Match' header matches the ETag.
+
+        Args:
+            path:
+                The path (including any query string) relative to the base URL, e.g. 'api/v1/users'.
+            response:
+                The response to return.
+        """
+        etag: str = "\"" + hashlib.sha256(response.body).hexdigest()[:16] + "\""
+        headers: Dict[str, str] = dict(response.headers)
+        headers["ETag"] = etag
+        response_with_etag: StubResponse = StubResponse(response.status, response.body, headers)
+
+        def handle_request(request: StubRequest) -> StubResponse:
+            if (request.headers.get("If-None-Match") == etag):
+                return StubResponse(304, b"", { "ETag": etag })
+            else:
+                return response_with_etag
+
+        self.set_handler("GET", path, handle_request)
+
+    def set_handler(self, method: str, path: str, handler: Callable[[StubRequest], StubResponse]) -> None:
+        """Sets a function which creates the response for the specified method and path.
+
+        Args:
+            method:
+                The HTTP method.
+            path:
+                The path (including any query string) relative to the base URL, e.g. 'api/v1/users'.
+            handler:
+                Function which accepts the received request and returns the response.
+        """
+        with self._lock:
+            self._handlers[(method, "/" + path)] = handler
+
+    def clear_requests(self) -> None:
+        """Clears the recorded requests."""
+        with self._lock:
+            self._requests.clear()
+
+    #region Private/Protected Methods
+
+    def _handle_request(self, request: StubRequest) -> StubResponse:
+        with self._lock:
+            self._requests.append(request)
+            handler: Union[Callable[[StubRequest], StubResponse], None] = self._handlers.get((request.method, request.path))
+        if (handler is None):
+            return StubResponse(404)
+        else:
+            return handler(request)
+
+    def _create_request_handler_class(self) -> type:
+        server: StubAccessManagerServer = self
+
+        class _RequestHandler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                self._respond("GET")
+
+            def do_POST(self):
+                self._respond("POST")
+
+            def do_DELETE(self):
+                self._respond("DELETE")
+
+            def log_message(self, format, *args):
+                pass
+
+            def _respond(self, method: str) -> None:
+                response: StubResponse = server._handle_request(StubRequest(method, self.path, dict(self.headers.items())))
+                self.send_response(response.status)
+                for name, value in response.headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(response.body)))
+                self.end_headers()
+                self.wfile.write(response.body)
+
+        return _RequestHandler
+
+    #endregion
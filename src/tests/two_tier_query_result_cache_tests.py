@@ -0,0 +1,111 @@
+from typing import Callable, Union
+import os
+import tempfile
+import unittest
+
+from query_result_cache import QueryResultCache
+from sqlite_query_result_cache import SqliteQueryResultCache
+from two_tier_query_result_cache import TwoTierQueryResultCache
+
+class InterleavingQueryResultCache(QueryResultCache):
+    """QueryResultCache which calls a specified function after each lookup, to interleave other operations with reads of the cache."""
+
+    def __init__(self, max_size: int, time_to_live: float) -> None:
+        super().__init__(max_size, time_to_live)
+        self.after_try_get: Union[Callable[[], None], None] = None
+
+    def try_get(self, key):
+        result = super().try_get(key)
+        if (self.after_try_get is not None):
+            self.after_try_get()
+        return result
+
+class TwoTierQueryResultCacheTests(unittest.TestCase):
+    """Unit tests for the TwoTierQueryResultCache class."""
+
+    def setUp(self):
+        self._temporary_directory = tempfile.TemporaryDirectory()
+        self._database_path: str = os.path.join(self._temporary_directory.name, "results.db")
+
+
+    def tearDown(self):
+        self._temporary_directory.cleanup()
+
+
+    def test_try_get_and_set(self):
+        l2_cache = SqliteQueryResultCache(self._database_path, 100, 60.0)
+        test_cache = TwoTierQueryResultCache(QueryResultCache(10, 30.0), l2_cache)
+
+        self.assertEqual((False, None), test_cache.try_get(("hasAccessToEntity", "user1", "ClientAccount", "Company1")))
+        test_cache.set(("hasAccessToEntity", "user1", "ClientAccount", "Company1"), True, [ ("user", "user1") ])
+
+        self.assertEqual((True, True), test_cache.try_get(("hasAccessToEntity", "user1", "ClientAccount", "Company1")))
+        self.assertEqual((True, True), test_cache.try_peek(("hasAccessToEntity", "user1", "ClientAccount", "Company1")))
+        self.assertEqual(1, test_cache.hit_count)
+        self.assertEqual(1, test_cache.miss_count)
+        self.assertEqual(1, test_cache.count)
+        self.assertEqual(100, test_cache.max_size)
+        self.assertEqual(90.0, test_cache.time_to_live)
+        self.assertEqual(0, l2_cache.hit_count)
+        l2_cache.close()
+
+
+    def test_result_not_copied_to_l1_when_invalidated_during_l2_read(self):
+        l1_cache = QueryResultCache(10, 30.0)
+        l2_cache = InterleavingQueryResultCache(10, 60.0)
+        test_cache = TwoTierQueryResultCache(l1_cache, l2_cache)
+        test_cache.set(("hasAccessToEntity", "user1", "ClientAccount", "Company1"), True, [ ("user", "user1") ])
+        l1_cache.clear()
+
+        def invalidate() -> None:
+            l2_cache.after_try_get = None
+            test_cache.invalidate([ ("user", "user1") ])
+
+        l2_cache.after_try_get = invalidate
+
+        # The result read before the invalidation is returned, but not retained
+        self.assertEqual((True, True), test_cache.try_get(("hasAccessToEntity", "user1", "ClientAccount", "Company1")))
+        self.assertEqual((False, None), test_cache.try_get(("hasAccessToEntity", "user1", "ClientAccount", "Company1")))
+        self.assertEqual((False, None), l1_cache.try_peek(("hasAccessToEntity", "user1", "ClientAccount", "Company1")))
+
+
+    def test_l1_warmed_from_l2_after_restart(self):
+        l2_cache = SqliteQueryResultCache(self._database_path, 100, 60.0)
+        test_cache = TwoTierQueryResultCache(QueryResultCache(10, 60.0), l2_cache)
+        test_cache.set(("getApplicationComponentsAccessibleByUser", "user1"), [ { "applicationComponent": "OrderScreen", "accessLevel": "View" } ], [ ("user", "user1"), ("unresolvedGroupDependencies", ) ])
+        l2_cache.close()
+        l2_cache = SqliteQueryResultCache(self._database_path, 100, 60.0)
+        test_cache = TwoTierQueryResultCache(QueryResultCache(10, 60.0), l2_cache)
+
+        result = test_cache.try_get(("getApplicationComponentsAccessibleByUser", "user1"))
+
+        self.assertEqual((True, [ { "applicationComponent": "OrderScreen", "accessLevel": "View" } ]), result)
+        self.assertEqual(1, l2_cache.hit_count)
+        self.assertEqual(1, test_cache.l1_cache.count)
+        self.assertEqual((True, [ { "applicationComponent": "OrderScreen", "accessLevel": "View" } ]), test_cache.try_get(("getApplicationComponentsAccessibleByUser", "user1")))
+        self.assertEqual(1, l2_cache.hit_count)
+        self.assertEqual(1, test_cache.l1_cache.hit_count)
+        # The tags copied to the L1 tier with the result allow it to be invalidated
+        self.assertEqual(1, test_cache.invalidate([ ("unresolvedGroupDependencies", ) ]))
+        self.assertEqual(0, test_cache.l1_cache.count)
+        self.assertEqual((False, None), test_cache.try_get(("getApplicationComponentsAccessibleByUser", "user1")))
+        l2_cache.close()
+
+
+    def test_remove_and_clear(self):
+        l2_cache = SqliteQueryResultCache(self._database_path, 100, 60.0)
+        test_cache = TwoTierQueryResultCache(QueryResultCache(10, 60.0), l2_cache)
+        test_cache.set(("key1", ), 1)
+        test_cache.set(("key2", ), 2)
+
+        test_cache.remove(("key1", ))
+
+        self.assertEqual((False, None), test_cache.try_get(("key1", )))
+        test_cache.clear()
+        self.assertEqual((False, None), test_cache.try_get(("key2", )))
+        self.assertEqual(0, test_cache.l1_cache.count)
+        self.assertEqual(0, test_cache.l2_cache.count)
+        l2_cache.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""Microbenchmark comparing the per-call overhead of building AccessManagerClient request URLs with str.format() and urllib.parse.quote() on every call, against precompiled UrlRouteTemplate instances using a cache of encoded URL components.
+
+Run manually, e.g. 'python url_building_benchmark.py'.
+"""
+
+from typing import Callable
+import functools
+import timeit
+import urllib.parse
+
+from url_route_template import UrlRouteTemplate
+
+_BASE_URL: str = "http://127.0.0.1:5170/api/v1/"
+_TEMPLATE: str = "dataElementAccess/applicationComponent/user/{0}/applicationComponent/{1}/accessLevel/{2}"
+_USER: str = "user.name@example.com"
+_APPLICATION_COMPONENT: str = "Order Screen / Summary"
+_ACCESS_LEVEL: str = "Modify"
+_ITERATIONS: int = 200000
+
+
+def _encode_url_component(component: str) -> str:
+    return urllib.parse.quote(component, safe="")
+
+
+def _build_url_uncached() -> str:
+    return _BASE_URL + _TEMPLATE.format(
+        _encode_url_component(_USER), 
+        _encode_url_component(_APPLICATION_COMPONENT), 
+        _encode_url_component(_ACCESS_LEVEL)
+    )
+
+
+def _run(name: str, function: Callable[[], str]) -> None:
+    elapsed_seconds: float = min(timeit.repeat(function, number=_ITERATIONS, repeat=5))
+    print("{0:<40}{1:>10.0f} ns/call".format(name, elapsed_seconds / _ITERATIONS * 1e9))
+
+
+if __name__ == "__main__":
+    cached_encoder: Callable[[str], str] = functools.lru_cache(maxsize=4096)(_encode_url_component)
+    route_template = UrlRouteTemplate(_BASE_URL, _TEMPLATE, cached_encoder)
+    uncached_route_template = UrlRouteTemplate(_BASE_URL, _TEMPLATE, _encode_url_component)
+    assert _build_url_uncached() == route_template.build(_USER, _APPLICATION_COMPONENT, _ACCESS_LEVEL)
+
+    _run("str.format() + quote() per call", _build_url_uncached)
+    _run("UrlRouteTemplate, uncached encoding", lambda: uncached_route_template.build(_USER, _APPLICATION_COMPONENT, _ACCESS_LEVEL))
+    _run("UrlRouteTemplate, cached encoding", lambda: route_template.build(_USER, _APPLICATION_COMPONENT, _ACCESS_LEVEL))
@@ -0,0 +1,63 @@
+from typing import List
+import urllib.parse
+import unittest
+
+from url_route_template import UrlRouteTemplate
+
+class UrlRouteTemplateTests(unittest.TestCase):
+    """Unit tests for the UrlRouteTemplate class."""
+
+    def setUp(self):
+        self._encoded_components: List[str] = []
+
+
+    def test_constructor_non_positional_replacement_field(self):
+        with self.assertRaises(ValueError) as result:
+            UrlRouteTemplate("http://127.0.0.1/api/v1/", "users/{user}", self._encode)
+
+        self.assertEqual("Parameter 'template' with value 'users/{user}' contains replacement field 'user' which is not a positional index.", str(result.exception))
+
+
+    def test_constructor_missing_positional_replacement_field(self):
+        with self.assertRaises(ValueError) as result:
+            UrlRouteTemplate("http://127.0.0.1/api/v1/", "userToGroupMappings/user/{0}/group/{2}", self._encode)
+
+        self.assertEqual("Parameter 'template' with value 'userToGroupMappings/user/{0}/group/{2}' must contain each positional replacement field from '{0}' exactly once.", str(result.exception))
+
+
+    def test_build_incorrect_component_count(self):
+        test_route_template = UrlRouteTemplate("http://127.0.0.1/api/v1/", "userToGroupMappings/user/{0}/group/{1}", self._encode)
+
+        with self.assertRaises(ValueError) as result:
+            test_route_template.build("user1")
+
+        self.assertEqual("Route template 'userToGroupMappings/user/{0}/group/{1}' requires 2 components but 1 were provided.", str(result.exception))
+
+
+    def test_build(self):
+        test_route_template = UrlRouteTemplate("http://127.0.0.1/api/v1/", "userToGroupMappings/user/{0}?includeIndirectMappings={1}", self._encode)
+
+        result: str = test_route_template.build("user/1 ?&", "true")
+
+        self.assertEqual("http://127.0.0.1/api/v1/userToGroupMappings/user/user%2F1%20%3F%26?includeIndirectMappings=true", result)
+        self.assertEqual([ "user/1 ?&", "true" ], self._encoded_components)
+
+
+    def test_build_no_components(self):
+        test_route_template = UrlRouteTemplate("http://127.0.0.1/api/v1/", "entityTypes", self._encode)
+
+        result: str = test_route_template.build()
+
+        self.assertEqual("http://127.0.0.1/api/v1/entityTypes", result)
+
+
+    #region Private/Protected Methods
+
+    def _encode(self, component: str) -> str:
+        self._encoded_components.append(component)
+        return urllib.parse.quote(component, safe="")
+
+    #endregion
+
+if __name__ == "__main__":
+    unittest.main()
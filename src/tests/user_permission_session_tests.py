@@ -0,0 +1,182 @@
+import json
+import time
+import unittest
+
+from access_graph import AccessGraph
+from string_unique_stringifier import StringUniqueStringifier
+from query_result_cache import QueryResultCache
+from access_manager_client import AccessManagerClient
+from user_permission_session import UserPermissionSession
+from stub_access_manager_server import StubAccessManagerServer, StubResponse
+
+class CountingAccessGraph(AccessGraph):
+    """AccessGraph which counts the calls to the methods used by UserPermissionSession."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.application_component_query_count: int = 0
+        self.entity_query_count: int = 0
+
+    def get_application_components_accesible_by_user(self, user):
+        self.application_component_query_count += 1
+        return super().get_application_components_accesible_by_user(user)
+
+    def get_entities_accessible_by_user(self, user):
+        self.entity_query_count += 1
+        return super().get_entities_accessible_by_user(user)
+
+class UserPermissionSessionTests(unittest.TestCase):
+    """Unit tests for the UserPermissionSession class."""
+
+    def setUp(self):
+        # An AccessGraph implements AccessManagerQueryProcessor, so stands in for an AccessManagerClient as the source
+        self._source = CountingAccessGraph()
+        self._source.add_user_to_group_mapping("user1", "group1")
+        self._source.add_group_to_application_component_and_access_level_mapping("group1", "OrderScreen", "View")
+        self._source.add_user_to_application_component_and_access_level_mapping("user1", "SummaryScreen", "Modify")
+        self._source.add_group_to_entity_mapping("group1", "ClientAccount", "Company1")
+        self._source.add_entity("ClientAccount", "Company2")
+        self._version = 1
+
+
+    def test_constructor_version_check_interval_less_than_0(self):
+        with self.assertRaises(ValueError) as result:
+            UserPermissionSession[str, str, str](self._source, "user1", version_check_interval=-1.0)
+
+        self.assertEqual("Parameter 'version_check_interval' with value -1.0 must be greater than or equal to 0.", str(result.exception))
+
+
+    def test_access_check_before_refresh(self):
+        test_session = UserPermissionSession[str, str, str](self._source, "user1")
+
+        self.assertFalse(test_session.is_loaded)
+        with self.assertRaises(RuntimeError) as result:
+            test_session.has_access_to_entity("ClientAccount", "Company1")
+        self.assertEqual("The session has not been loaded.  Call refresh() to load it.", str(result.exception))
+
+
+    def test_access_checks_answered_locally(self):
+        test_session = UserPermissionSession[str, str, str](self._source, "user1")
+
+        test_session.refresh()
+
+        self.assertTrue(test_session.has_access_to_application_component("OrderScreen", "View"))
+        self.assertTrue(test_session.has_access_to_application_component("SummaryScreen", "Modify"))
+        self.assertFalse(test_session.has_access_to_application_component("OrderScreen", "Modify"))
+        self.assertTrue(test_session.has_access_to_entity("ClientAccount", "Company1"))
+        self.assertFalse(test_session.has_access_to_entity("ClientAccount", "Company2"))
+        self.assertEqual({ ("OrderScreen", "View"), ("SummaryScreen", "Modify") }, test_session.application_components)
+        self.assertEqual({ ("ClientAccount", "Company1") }, test_session.entities)
+        self.assertEqual(1, self._source.application_component_query_count)
+        self.assertEqual(1, self._source.entity_query_count)
+        self.assertEqual(1, test_session.refresh_count)
+        self.assertIsNone(test_session.version)
+
+
+    def test_version_change_causes_refresh(self):
+        test_session = UserPermissionSession[str, str, str](self._source, "user1", version_provider=lambda: self._version)
+        test_session.refresh()
+        self._source.add_group_to_entity_mapping("group1", "ClientAccount", "Company2")
+
+        self.assertFalse(test_session.has_access_to_entity("ClientAccount", "Company2"))
+        self._version = 2
+        self.assertTrue(test_session.has_access_to_entity("ClientAccount", "Company2"))
+
+        self.assertEqual(2, test_session.version)
+        self.assertEqual(2, test_session.refresh_count)
+
+
+    def test_version_not_checked_within_interval(self):
+        test_session = UserPermissionSession[str, str, str](self._source, "user1", version_provider=lambda: self._version, version_check_interval=60.0)
+        test_session.refresh()
+        self._source.add_group_to_entity_mapping("group1", "ClientAccount", "Company2")
+        self._version = 2
+
+        self.assertFalse(test_session.has_access_to_entity("ClientAccount", "Company2"))
+
+        self.assertEqual(1, test_session.refresh_count)
+
+
+    def test_version_change_refresh_bypasses_client_query_result_cache(self):
+        stub_server = StubAccessManagerServer()
+        stub_server.start()
+        try:
+            test_client = AccessManagerClient[str, str, str, str](
+                stub_server.base_url, 
+                StringUniqueStringifier(), 
+                StringUniqueStringifier(), 
+                StringUniqueStringifier(), 
+                StringUniqueStringifier(), 
+                query_result_cache=QueryResultCache(100, 60.0)
+            )
+            stub_server.set_response("GET", "api/v1/userToApplicationComponentAndAccessLevelMappings/user/user1?includeIndirectMappings=true", self._json_response([]))
+            stub_server.set_response("GET", "api/v1/userToEntityMappings/user/user1?includeIndirectMappings=true", self._json_response([]))
+            test_session = UserPermissionSession[str, str, str](test_client, "user1", version_provider=lambda: self._version)
+            test_session.refresh()
+            # The change is made outside the client, so the client's cached results aren't invalidated
+            stub_server.set_response("GET", "api/v1/userToApplicationComponentAndAccessLevelMappings/user/user1?includeIndirectMappings=true", self._json_response([ { "applicationComponent": "OrderScreen", "accessLevel": "View" } ]))
+            stub_server.set_response("GET", "api/v1/userToEntityMappings/user/user1?includeIndirectMappings=true", self._json_response([ { "entityType": "ClientAccount", "entity": "Company1" } ]))
+
+            self.assertFalse(test_session.has_access_to_application_component("OrderScreen", "View"))
+            self._version = 2
+            self.assertTrue(test_session.has_access_to_application_component("OrderScreen", "View"))
+            self.assertTrue(test_session.has_access_to_entity("ClientAccount", "Company1"))
+
+            self.assertEqual(2, test_session.refresh_count)
+            # The results received by the refresh are stored in the client's cache
+            self.assertEqual({ ("OrderScreen", "View") }, test_client.get_application_components_accesible_by_user("user1"))
+            test_client.close()
+        finally:
+            stub_server.stop()
+
+
+    def test_version_change_refresh_with_degraded_results_does_not_update_version(self):
+        application_components_path: str = "api/v1/userToApplicationComponentAndAccessLevelMappings/user/user1?includeIndirectMappings=true"
+        entities_path: str = "api/v1/userToEntityMappings/user/user1?includeIndirectMappings=true"
+        stub_server = StubAccessManagerServer()
+        stub_server.start()
+        try:
+            test_client = AccessManagerClient[str, str, str, str](
+                stub_server.base_url, 
+                StringUniqueStringifier(), 
+                StringUniqueStringifier(), 
+                StringUniqueStringifier(), 
+                StringUniqueStringifier(), 
+                degraded_mode_result_cache=QueryResultCache(100, 60.0), 
+                degraded_mode_failure_threshold=1, 
+                degraded_mode_retry_interval=0.1
+            )
+            stub_server.set_response("GET", application_components_path, self._json_response([]))
+            stub_server.set_response("GET", entities_path, self._json_response([]))
+            test_session = UserPermissionSession[str, str, str](test_client, "user1", version_provider=lambda: self._version)
+            test_session.refresh()
+            self.assertEqual(1, test_session.version)
+            stub_server.set_response("GET", application_components_path, StubResponse(503))
+            stub_server.set_response("GET", entities_path, StubResponse(503))
+            self._version = 2
+
+            # The refresh receives the results retained for degraded mode
+            self.assertFalse(test_session.has_access_to_application_component("OrderScreen", "View"))
+            self.assertEqual(1, test_session.version)
+            self.assertEqual(2, test_session.refresh_count)
+
+            stub_server.set_response("GET", application_components_path, self._json_response([ { "applicationComponent": "OrderScreen", "accessLevel": "View" } ]))
+            stub_server.set_response("GET", entities_path, self._json_response([]))
+            # Wait until the client sends a trial request again.  Only one of the queries in the next refresh is sent as the trial request, so the version is updated by the refresh after it.
+            time.sleep(0.2)
+            test_session.has_access_to_application_component("OrderScreen", "View")
+            self.assertTrue(test_session.has_access_to_application_component("OrderScreen", "View"))
+            self.assertEqual(2, test_session.version)
+            test_client.close()
+        finally:
+            stub_server.stop()
+
+    #region Private/Protected Methods
+
+    def _json_response(self, body, status: int=200) -> StubResponse:
+        return StubResponse(status, json.dumps(body).encode(), { "Content-Type": "application/json; charset=utf-8" })
+
+    #endregion
+
+if __name__ == "__main__":
+    unittest.main()
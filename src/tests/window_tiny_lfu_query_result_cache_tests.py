@@ -0,0 +1,78 @@
+import unittest
+
+from window_tiny_lfu_query_result_cache import WindowTinyLfuQueryResultCache
+
+class WindowTinyLfuQueryResultCacheTests(unittest.TestCase):
+    """Unit tests for the WindowTinyLfuQueryResultCache class."""
+
+    def test_constructor_window_fraction_out_of_range(self):
+        with self.assertRaises(ValueError) as result:
+            WindowTinyLfuQueryResultCache(100, 60.0, window_fraction=1.0)
+
+        self.assertEqual("Parameter 'window_fraction' with value 1.0 must be greater than 0 and less than 1.", str(result.exception))
+
+
+    def test_try_get_and_set(self):
+        test_cache = WindowTinyLfuQueryResultCache(10, 60.0)
+
+        self.assertEqual((False, None), test_cache.try_get(("hasAccessToEntity", "user1", "ClientAccount", "Company1")))
+        test_cache.set(("hasAccessToEntity", "user1", "ClientAccount", "Company1"), True, [ ("user", "user1") ])
+        self.assertEqual((True, True), test_cache.try_get(("hasAccessToEntity", "user1", "ClientAccount", "Company1")))
+        test_cache.set(("hasAccessToEntity", "user1", "ClientAccount", "Company1"), False, [ ("user", "user1") ])
+        self.assertEqual((True, False), test_cache.try_get(("hasAccessToEntity", "user1", "ClientAccount", "Company1")))
+        self.assertEqual(1, test_cache.count)
+        self.assertEqual(1, test_cache.invalidate([ ("user", "user1") ]))
+        self.assertEqual((False, None), test_cache.try_get(("hasAccessToEntity", "user1", "ClientAccount", "Company1")))
+
+
+    def test_frequently_used_results_retained_during_scan(self):
+        test_cache = WindowTinyLfuQueryResultCache(100, 60.0)
+        for i in range(5):
+            for j in range(20):
+                key = ("getApplicationComponentsAccessibleByUser", "user" + str(j))
+                found, result = test_cache.try_get(key)
+                if (found == False):
+                    test_cache.set(key, [ j ])
+
+        # Look up each user of a batch once
+        for i in range(200):
+            key = ("getApplicationComponentsAccessibleByUser", "batchUser" + str(i))
+            test_cache.try_get(key)
+            test_cache.set(key, [ i ])
+
+        self.assertEqual(100, test_cache.count)
+        for j in range(20):
+            self.assertEqual((True, [ j ]), test_cache.try_get(("getApplicationComponentsAccessibleByUser", "user" + str(j))))
+        self.assertGreater(test_cache.rejected_count, 0)
+
+
+    def test_frequently_used_new_result_admitted(self):
+        test_cache = WindowTinyLfuQueryResultCache(4, 60.0, window_fraction=0.25)
+        for i in range(4):
+            test_cache.set(("key" + str(i), ), i)
+
+        for i in range(3):
+            test_cache.try_get(("key4", ))
+        test_cache.set(("key4", ), 4)
+        test_cache.set(("key5", ), 5)
+
+        self.assertEqual(4, test_cache.count)
+        self.assertEqual(1, test_cache.admitted_count)
+        self.assertEqual((True, 4), test_cache.try_peek(("key4", )))
+
+
+    def test_remove_and_clear(self):
+        test_cache = WindowTinyLfuQueryResultCache(10, 60.0)
+        test_cache.set(("key1", ), 1)
+        test_cache.set(("key2", ), 2)
+
+        test_cache.remove(("key1", ))
+
+        self.assertEqual((False, None), test_cache.try_get(("key1", )))
+        test_cache.clear()
+        self.assertEqual(0, test_cache.count)
+        test_cache.set(("key3", ), 3)
+        self.assertEqual((True, 3), test_cache.try_get(("key3", )))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+from typing import Any, Tuple, Iterable, List, Union
+import threading
+
+from query_result_cache_base import QueryResultCacheBase
+
+class TwoTierQueryResultCache(QueryResultCacheBase):
+    """Cache of the results of queries against an AccessManager instance, consisting of a fast first tier (L1, e.g. an in-process QueryResultCache) in front of a larger or persistent second tier (L2, e.g. a SqliteQueryResultCache or SharedMemoryQueryResultCache).
+
+    Results are stored in both tiers.  Lookups which miss the L1 tier are answered from the L2 tier where possible, and the result is then stored in the L1 tier (so e.g. a restarted process is warmed from a persistent L2 tier rather than from the AccessManager instance).  The tags of each result are stored with it in the L2 tier, so that results copied to the L1 tier can still be invalidated.  A result isn't copied to the L1 tier if the cache was changed (e.g. invalidated) while it was being read from the L2 tier, as it may be out of date.  As the L1 tier applies its own time-to-live to copied results, a result can be returned for up to the sum of the tiers' time-to-live values after it was stored.
+
+    Attributes:
+        max_size:
+            The maximum number of results held in the cache (i.e. in the L2 tier).
+        time_to_live:
+            The maximum time in seconds after which a cached result expires (i.e. the sum of the tiers' time-to-live values).
+        count:
+            The number of results currently held in the L2 tier.
+        hit_count:
+            The number of lookups which found an unexpired result in either tier.
+        miss_count:
+            The number of lookups which did not find an unexpired result in either tier.
+        l1_cache:
+            The first tier.
+        l2_cache:
+            The second tier.
+    """
+
+    @property
+    def max_size(self) -> int:
+        """The maximum number of results held in the cache (i.e. in the L2 tier)."""
+        return self._l2_cache.max_size
+
+    @property
+    def time_to_live(self) -> float:
+        """The maximum time in seconds after which a cached result expires (i.e. the sum of the tiers' time-to-live values)."""
+        return self._l1_cache.time_to_live + self._l2_cache.time_to_live
+
+    @property
+    def count(self) -> int:
+        """The number of results currently held in the L2 tier."""
+        return self._l2_cache.count
+
+    @property
+    def hit_count(self) -> int:
+        """The number of lookups which found an unexpired result in either tier."""
+        return self._l1_cache.hit_count + self._l2_cache.hit_count
+
+    @property
+    def miss_count(self) -> int:
+        """The number of lookups which did not find an unexpired result in either tier."""
+        return self._l2_cache.miss_count
+
+    @property
+    def l1_cache(self) -> QueryResultCacheBase:
+        """The first tier."""
+        return self._l1_cache
+
+    @property
+    def l2_cache(self) -> QueryResultCacheBase:
+        """The second tier."""
+        return self._l2_cache
+
+    def __init__(self, l1_cache: QueryResultCacheBase, l2_cache: QueryResultCacheBase) -> None:
+        """Initialises a new instance of the TwoTierQueryResultCache class.
+
+        Args:
+            l1_cache:
+                The first tier.
+            l2_cache:
+                The second tier.
+        """
+        self._l1_cache: QueryResultCacheBase = l1_cache
+        self._l2_cache: QueryResultCacheBase = l2_cache
+        # Serializes copying results to the L1 tier with changes to the change sequence number
+        self._lock: threading.Lock = threading.Lock()
+        # Incremented before each change to the cache, so that a result read from the L2 tier before a change isn't copied to the L1 tier after it
+        self._change_sequence_number: int = 0
+
+    def try_get(self, key: Tuple[str, ...]) -> Tuple[bool, Any]:
+        found, result = self._l1_cache.try_get(key)
+        if (found == True):
+            return (True, result)
+        with self._lock:
+            change_sequence_number: int = self._change_sequence_number
+        found, stored_result = self._l2_cache.try_get(key)
+        if (found == False):
+            return (False, None)
+        result, tags = self._unwrap_result(stored_result)
+        with self._lock:
+            if (self._change_sequence_number == change_sequence_number):
+                self._l1_cache.set(key, result, tags)
+
+        return (True, result)
+
+    def try_peek(self, key: Tuple[str, ...]) -> Tuple[bool, Any]:
+        found, result = self._l1_cache.try_peek(key)
+        if (found == True):
+            return (True, result)
+        found, stored_result = self._l2_cache.try_peek(key)
+        if (found == False):
+            return (False, None)
+
+        return (True, self._unwrap_result(stored_result)[0])
+
+    def set(self, key: Tuple[str, ...], result: Any, tags: Iterable[Tuple[str, ...]]=(), time_to_live: Union[float, None]=None) -> None:
+        tags = list(tags)
+        self._record_change()
+        self._l2_cache.set(key, [ result, [ list(current_tag) for current_tag in tags ] ], tags, time_to_live)
+        self._l1_cache.set(key, result, tags, time_to_live)
+
+    def remove(self, key: Tuple[str, ...]) -> None:
+        self._record_change()
+        self._l2_cache.remove(key)
+        self._l1_cache.remove(key)
+
+    def invalidate(self, tags: Iterable[Tuple[str, ...]]) -> int:
+        tags = list(tags)
+        self._record_change()
+        # Results can be held in both tiers, so return the larger count rather than the sum
+        l2_removed_count: int = self._l2_cache.invalidate(tags)
+        l1_removed_count: int = self._l1_cache.invalidate(tags)
+
+        return max(l1_removed_count, l2_removed_count)
+
+    def clear(self) -> None:
+        self._record_change()
+        self._l2_cache.clear()
+        self._l1_cache.clear()
+
+    #region Private/Protected Methods
+
+    def _record_change(self) -> None:
+        """Increments the change sequence number, preventing results being read from the L2 tier from being copied to the L1 tier.  Must be called before the change is made to the L1 tier.
+        """
+        with self._lock:
+            self._change_sequence_number += 1
+
+    def _unwrap_result(self, stored_result: Any) -> Tuple[Any, List[Tuple[str, ...]]]:
+        """Separates a result stored in the L2 tier from its tags.
+
+        Args:
+            stored_result:
+                The stored result, containing the result and its tags (converted to lists so they can be stored in JSON-compatible form).
+
+        Returns:
+            A tuple containing the result and its tags.
+        """
+        return (stored_result[0], [ tuple(current_tag) for current_tag in stored_result[1] ])
+
+    #endregion
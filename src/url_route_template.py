@@ -0,0 +1,55 @@
+from typing import Callable, List
+from string import Formatter
+
+class UrlRouteTemplate():
+    """A URL route template (e.g. 'userToGroupMappings/user/{0}/group/{1}') which is precompiled once against a base URL, and subsequently builds request URLs by encoding and inserting path components.
+
+    Attributes:
+        template:
+            The route template (excluding the base URL).
+    """
+
+    @property
+    def template(self) -> str:
+        """The route template (excluding the base URL)."""
+        return self._template
+
+    def __init__(self, base_url: str, template: str, component_encoder: Callable[[str], str]) -> None:
+        """Initialises a new instance of the UrlRouteTemplate class.
+
+        Args:
+            base_url:
+                The base URL to prefix the route with.
+            template:
+                The route template, containing positional replacement fields (e.g. '{0}') for each path or query component.
+            component_encoder:
+                Function used to encode each component before it is inserted into the URL.
+        """
+        field_indices: List[int] = []
+        for _, field_name, format_spec, conversion in Formatter().parse(template):
+            if (field_name is not None):
+                if (field_name.isdigit() == False or format_spec != "" or conversion is not None):
+                    raise ValueError("Parameter 'template' with value '{0}' contains replacement field '{1}' which is not a positional index.".format(template, field_name))
+                field_indices.append(int(field_name))
+        if (sorted(field_indices) != list(range(len(field_indices)))):
+            raise ValueError("Parameter 'template' with value '{0}' must contain each positional replacement field from '{{0}}' exactly once.".format(template))
+
+        self._template: str = template
+        self._component_count: int = len(field_indices)
+        self._format: Callable[..., str] = (base_url + template).format
+        self._component_encoder: Callable[[str], str] = component_encoder
+
+    def build(self, *components: str) -> str:
+        """Builds a URL from the template.
+
+        Args:
+            components:
+                The (unencoded) components to insert into the template, in order of the template's positional replacement fields.
+
+        Returns:
+            The URL.
+        """
+        if (len(components) != self._component_count):
+            raise ValueError("Route template '{0}' requires {1} components but {2} were provided.".format(self._template, self._component_count, len(components)))
+
+        return self._format(*map(self._component_encoder, components))
@@ -0,0 +1,224 @@
+from typing import TypeVar, Generic, Set, Tuple, Callable, Any, Union
+from concurrent.futures import ThreadPoolExecutor, Future
+import threading
+import time
+
+from access_manager_query_processor import AccessManagerQueryProcessor
+from access_manager_client import AccessManagerClient
+
+TUser = TypeVar("TUser")
+TComponent = TypeVar("TComponent")
+TAccess = TypeVar("TAccess")
+
+class UserPermissionSession(Generic[TUser, TComponent, TAccess]):
+    """Thread-safe, session-scoped copy of the application components and entities accessible by a single user, which answers access checks locally with set lookups.
+
+    Calling refresh() (e.g. at login) retrieves the application components and entities accessible by the user from a source AccessManagerQueryProcessor (e.g. an AccessManagerClient) in parallel.  Subsequent calls to has_access_to_application_component() and has_access_to_entity() are answered without network requests.  If a version provider is specified (e.g. a function returning the latest position of a ChangeFeedBase), the version is checked before answering, at most once every 'version_check_interval' seconds, and the session is refreshed if the version changed since the last refresh.  When the source is an AccessManagerClient, a refresh caused by a version change bypasses the client's query result cache, as the cached results may predate the change.  If the client returns a result retained for degraded mode (see its 'last_result_was_degraded' property), the session is loaded with it but the version is not updated, so that the next version check refreshes the session again.
+
+    Generic Paramters:
+        TUser:
+            The type of users in the application.
+        TComponent:
+            The type of components in the application to manage access to.
+        TAccess:
+            The type of levels of access which can be assigned to an application component.
+
+    Attributes:
+        user:
+            The user the session holds permissions for.
+        is_loaded:
+            Whether the session has been loaded.
+        version:
+            The version returned by the version provider before the last refresh which did not return degraded results, or None if no version provider was specified or the session has not been loaded.
+        application_components:
+            The application components and access levels accessible by the user.
+        entities:
+            The entities accessible by the user, as tuples containing the entity type and entity.
+        refresh_count:
+            The number of times the session was successfully refreshed.
+    """
+
+    @property
+    def user(self) -> TUser:
+        """The user the session holds permissions for."""
+        return self._user
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the session has been loaded."""
+        return self._application_components is not None
+
+    @property
+    def version(self) -> Any:
+        """The version returned by the version provider before the last refresh which did not return degraded results, or None if no version provider was specified or the session has not been loaded."""
+        return self._version
+
+    @property
+    def application_components(self) -> Set[Tuple[TComponent, TAccess]]:
+        """The application components and access levels accessible by the user."""
+        with self._lock:
+            return set(self._get_application_components())
+
+    @property
+    def entities(self) -> Set[Tuple[str, str]]:
+        """The entities accessible by the user, as tuples containing the entity type and entity."""
+        with self._lock:
+            return set(self._get_entities())
+
+    @property
+    def refresh_count(self) -> int:
+        """The number of times the session was successfully refreshed."""
+        return self._refresh_count
+
+    def __init__(
+            self,
+            source: AccessManagerQueryProcessor[TUser, Any, TComponent, TAccess],
+            user: TUser,
+            version_provider: Union[Callable[[], Any], None]=None,
+            version_check_interval: float=0.0
+        ) -> None:
+        """Initialises a new instance of the UserPermissionSession class.
+
+        The session is empty until refresh() is called, and access checks raise a RuntimeError until then.
+
+        Args:
+            source:
+                The query processor (e.g. an AccessManagerClient) to retrieve the user's permissions from.
+            user:
+                The user to hold permissions for.
+            version_provider:
+                Optional function which returns a value which changes when the elements or mappings in the AccessManager instance change (e.g. the latest position of a change feed).
+            version_check_interval:
+                The minimum time in seconds between calls to the version provider.  0 checks the version before every access check.
+        """
+        if (version_check_interval < 0.0):
+            raise ValueError("Parameter 'version_check_interval' with value {0} must be greater than or equal to 0.".format(version_check_interval))
+
+        self._source: AccessManagerQueryProcessor[TUser, Any, TComponent, TAccess] = source
+        self._user: TUser = user
+        self._version_provider: Union[Callable[[], Any], None] = version_provider
+        self._version_check_interval: float = version_check_interval
+        self._lock: threading.Lock = threading.Lock()
+        # Serializes refreshes, so that concurrent version checks don't load in parallel
+        self._refresh_lock: threading.Lock = threading.Lock()
+        self._application_components: Union[Set[Tuple[TComponent, TAccess]], None] = None
+        self._entities: Union[Set[Tuple[str, str]], None] = None
+        self._version: Any = None
+        self._last_version_check_time: float = 0.0
+        self._refresh_count: int = 0
+
+    def refresh(self) -> None:
+        """Retrieves the application components and entities accessible by the user from the source in parallel, replacing any existing permissions once both are retrieved.
+        """
+        with self._refresh_lock:
+            self._refresh()
+
+    def has_access_to_application_component(self, application_component: TComponent, access_level: TAccess) -> bool:
+        """Checks whether the user has access to an application component at the specified level of access.
+
+        Args:
+            application_component:
+                The application component.
+            access_level:
+                The level of access to the component.
+
+        Returns:
+            True if the user has access the component.  False otherwise.
+        """
+        self._check_version()
+        with self._lock:
+            return (application_component, access_level) in self._get_application_components()
+
+    def has_access_to_entity(self, entity_type: str, entity: str) -> bool:
+        """Checks whether the user has access to the specified entity.
+
+        Args:
+            entity_type:
+                The type of the entity.
+            entity:
+                The entity.
+
+        Returns:
+            True if the user has access the entity.  False otherwise.
+        """
+        self._check_version()
+        with self._lock:
+            return (entity_type, entity) in self._get_entities()
+
+    #region Private/Protected Methods
+
+    def _refresh(self, bypass_source_cache: bool=False) -> None:
+        """Retrieves the user's permissions from the source.  Must be called while holding '_refresh_lock'.
+
+        Args:
+            bypass_source_cache:
+                Whether to bypass the query result cache of the source if it is an AccessManagerClient.
+        """
+        version: Any = None
+        refresh_start_time: float = time.monotonic()
+        if (self._version_provider is not None):
+            # Read the version before retrieving the permissions, so that changes made during the retrieval cause a further refresh
+            version = self._version_provider()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            application_components_future: Future = executor.submit(self._query_source, "get_application_components_accesible_by_user", bypass_source_cache)
+            entities_future: Future = executor.submit(self._query_source, "get_entities_accessible_by_user", bypass_source_cache)
+            application_components_result, application_components_degraded = application_components_future.result()
+            entities_result, entities_degraded = entities_future.result()
+        with self._lock:
+            self._application_components = set(application_components_result)
+            self._entities = set(entities_result)
+            if (application_components_degraded == False and entities_degraded == False):
+                self._version = version
+            self._last_version_check_time = refresh_start_time
+            self._refresh_count += 1
+
+    def _query_source(self, method_name: str, bypass_source_cache: bool) -> Tuple[Any, bool]:
+        """Calls a query method of the source for the user.
+
+        Args:
+            method_name:
+                The name of the AccessManagerQueryProcessor method, which accepts the user as its only parameter.
+            bypass_source_cache:
+                Whether to bypass the query result cache of the source if it is an AccessManagerClient.
+
+        Returns:
+            A tuple containing the result, and whether the result was returned in degraded mode by an AccessManagerClient source.
+        """
+        if (isinstance(self._source, AccessManagerClient) == False):
+            return (getattr(self._source, method_name)(self._user), False)
+        if (bypass_source_cache == True):
+            result: Any = getattr(self._source, method_name)(self._user, True)
+        else:
+            result = getattr(self._source, method_name)(self._user)
+
+        # 'last_result_was_degraded' is specific to the calling thread, so is read on the same thread as the query
+        return (result, self._source.last_result_was_degraded)
+
+    def _check_version(self) -> None:
+        """Refreshes the session if the version returned by the version provider differs from the version at the last refresh.
+        """
+        if (self._version_provider is None or self.is_loaded == False):
+            return
+        if (time.monotonic() - self._last_version_check_time < self._version_check_interval):
+            return
+        with self._refresh_lock:
+            # Another thread may have checked while this thread waited for the lock
+            if (time.monotonic() - self._last_version_check_time < self._version_check_interval):
+                return
+            self._last_version_check_time = time.monotonic()
+            if (self._version_provider() != self._version):
+                self._refresh(True)
+
+    def _get_application_components(self) -> Set[Tuple[TComponent, TAccess]]:
+        if (self._application_components is None):
+            raise RuntimeError("The session has not been loaded.  Call refresh() to load it.")
+
+        return self._application_components
+
+    def _get_entities(self) -> Set[Tuple[str, str]]:
+        if (self._entities is None):
+            raise RuntimeError("The session has not been loaded.  Call refresh() to load it.")
+
+        return self._entities
+
+    #endregion
@@ -0,0 +1,161 @@
+from typing import Any, Tuple, Union, Iterable
+from collections import OrderedDict
+import time
+
+from query_result_cache import QueryResultCache
+from frequency_sketch import FrequencySketch
+
+class WindowTinyLfuQueryResultCache(QueryResultCache):
+    """Thread-safe, in-process cache of the results of queries against an AccessManager instance, which uses the W-TinyLFU policy to decide which results to retain, so that results which are only used once (e.g. by a batch job which checks every user) don't evict frequently used results.
+
+    New results are added to a small 'window' segment, managed as least recently used.  When a result is evicted from the window, it's only admitted to the main segment if it has been accessed more frequently than the result the main segment would evict to make room for it (according to a FrequencySketch of recent lookups).  The main segment is divided into 'probation' and 'protected' segments, with results promoted to the protected segment when they're used again while in the probation segment.
+
+    Attributes:
+        max_size:
+            The maximum number of results held in the cache.
+        time_to_live:
+            The time in seconds after which a cached result expires.
+        count:
+            The number of results currently held in the cache (including any which have expired but not yet been removed).
+        hit_count:
+            The number of lookups which found an unexpired result.
+        miss_count:
+            The number of lookups which did not find an unexpired result.
+        admitted_count:
+            The number of results evicted from the window segment which were admitted to the main segment in place of another result.
+        rejected_count:
+            The number of results evicted from the window segment which were not admitted to the main segment.
+    """
+
+    @property
+    def admitted_count(self) -> int:
+        """The number of results evicted from the window segment which were admitted to the main segment in place of another result."""
+        with self._lock:
+            return self._admitted_count
+
+    @property
+    def rejected_count(self) -> int:
+        """The number of results evicted from the window segment which were not admitted to the main segment."""
+        with self._lock:
+            return self._rejected_count
+
+    def __init__(self, max_size: int, time_to_live: float, window_fraction: float=0.01, protected_fraction: float=0.8) -> None:
+        """Initialises a new instance of the WindowTinyLfuQueryResultCache class.
+
+        Args:
+            max_size:
+                The maximum number of results held in the cache.
+            time_to_live:
+                The time in seconds after which a cached result expires.
+            window_fraction:
+                The fraction of 'max_size' used for the window segment (at least 1 result).
+            protected_fraction:
+                The fraction of the main segment used for the protected segment.
+        """
+        super().__init__(max_size, time_to_live)
+        if (window_fraction <= 0.0 or window_fraction >= 1.0):
+            raise ValueError("Parameter 'window_fraction' with value {0} must be greater than 0 and less than 1.".format(window_fraction))
+        if (protected_fraction < 0.0 or protected_fraction >= 1.0):
+            raise ValueError("Parameter 'protected_fraction' with value {0} must be greater than or equal to 0 and less than 1.".format(protected_fraction))
+
+        self._window_max_size: int = min(max_size, max(1, round(max_size * window_fraction)))
+        self._main_max_size: int = max_size - self._window_max_size
+        self._protected_max_size: int = int(self._main_max_size * protected_fraction)
+        self._frequency_sketch: FrequencySketch = FrequencySketch(max_size)
+        # The keys in each segment, ordered from least to most recently used
+        self._window: OrderedDict[Tuple[str, ...], None] = OrderedDict()
+        self._probation: OrderedDict[Tuple[str, ...], None] = OrderedDict()
+        self._protected: OrderedDict[Tuple[str, ...], None] = OrderedDict()
+        self._admitted_count: int = 0
+        self._rejected_count: int = 0
+
+    def try_get(self, key: Tuple[str, ...]) -> Tuple[bool, Any]:
+        with self._lock:
+            self._frequency_sketch.increment(key)
+            entry: Union[Tuple[Any, float, Tuple[Tuple[str, ...], ...]], None] = self._entries.get(key)
+            if (entry is not None):
+                if (time.monotonic() < entry[1]):
+                    self._record_use(key)
+                    self._hit_count += 1
+                    return (True, entry[0])
+                else:
+                    self._remove_entry(key)
+            self._miss_count += 1
+
+            return (False, None)
+
+    def set(self, key: Tuple[str, ...], result: Any, tags: Iterable[Tuple[str, ...]]=(), time_to_live: Union[float, None]=None) -> None:
+        with self._lock:
+            if (key in self._entries):
+                # Replace the result, retaining its segment
+                segment: OrderedDict[Tuple[str, ...], None] = self._get_segment(key)
+                self._remove_entry(key)
+                self._add_entry(key, result, tags, time_to_live)
+                segment[key] = None
+                return
+            self._add_entry(key, result, tags, time_to_live)
+            self._window[key] = None
+            if (len(self._window) > self._window_max_size):
+                self._evict_from_window()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tag_index.clear()
+            self._window.clear()
+            self._probation.clear()
+            self._protected.clear()
+
+    #region Private/Protected Methods
+
+    def _get_segment(self, key: Tuple[str, ...]) -> OrderedDict:
+        """Gets the segment containing the specified key.  Must be called while holding '_lock'."""
+        if (key in self._window):
+            return self._window
+        elif (key in self._probation):
+            return self._probation
+        else:
+            return self._protected
+
+    def _record_use(self, key: Tuple[str, ...]) -> None:
+        """Updates the segments after a result is used, promoting it from the probation to the protected segment if required.  Must be called while holding '_lock'.
+
+        Args:
+            key:
+                The key of the result.
+        """
+        if (key in self._window):
+            self._window.move_to_end(key)
+        elif (key in self._probation):
+            del self._probation[key]
+            self._protected[key] = None
+            if (len(self._protected) > self._protected_max_size):
+                # Demote the least recently used protected result
+                self._probation[self._protected.popitem(last=False)[0]] = None
+        else:
+            self._protected.move_to_end(key)
+
+    def _evict_from_window(self) -> None:
+        """Moves the least recently used result out of the window segment, and either admits it to the main segment (evicting another result if the main segment is full), or evicts it.  Must be called while holding '_lock'.
+        """
+        candidate_key: Tuple[str, ...] = self._window.popitem(last=False)[0]
+        if (len(self._probation) + len(self._protected) < self._main_max_size):
+            self._probation[candidate_key] = None
+            return
+        if (self._main_max_size > 0):
+            victim_key: Tuple[str, ...] = next(iter(self._probation)) if (len(self._probation) > 0) else next(iter(self._protected))
+            if (self._frequency_sketch.estimate(candidate_key) > self._frequency_sketch.estimate(victim_key)):
+                self._remove_entry(victim_key)
+                self._probation[candidate_key] = None
+                self._admitted_count += 1
+                return
+        self._remove_entry(candidate_key)
+        self._rejected_count += 1
+
+    def _remove_entry(self, key: Tuple[str, ...]) -> None:
+        super()._remove_entry(key)
+        self._window.pop(key, None)
+        self._probation.pop(key, None)
+        self._protected.pop(key, None)
+
+    #endregion